@@ -13,6 +13,7 @@ from .errors import Warning, Error, InterfaceError, DatabaseError
 from .errors import DataError, OperationalError, IntegrityError
 from .errors import InternalError, ProgrammingError, NotSupportedError
 from ._column import Column
+from .pipeline import AsyncPipeline, Pipeline
 from .connection import BaseConnection, AsyncConnection, Connection, Notify
 from .transaction import Rollback, Transaction, AsyncTransaction
 from .server_cursor import AsyncServerCursor, ServerCursor
@@ -42,6 +43,7 @@ __all__ = [
     "AsyncConnection",
     "AsyncCopy",
     "AsyncCursor",
+    "AsyncPipeline",
     "AsyncServerCursor",
     "AsyncTransaction",
     "BaseConnection",
@@ -51,6 +53,7 @@ __all__ = [
     "Copy",
     "Cursor",
     "Notify",
+    "Pipeline",
     "Rollback",
     "ServerCursor",
     "Transaction",
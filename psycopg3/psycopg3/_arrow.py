@@ -0,0 +1,146 @@
+"""
+Support for converting query results into Apache Arrow record batches.
+
+The module requires the `pyarrow` package to be installed.
+"""
+
+# Copyright (C) 2021 The Psycopg Team
+
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .pq import Format
+from .oids import postgres_types as builtins
+from ._columnar import fill_buffer, has_default_loader
+
+if TYPE_CHECKING:
+    from .cursor import BaseCursor
+    from .pq.proto import PGresult
+
+# The types whose binary values are copied straight from the result buffers.
+FIXED_TYPES: Dict[int, "pa.DataType"] = {
+    builtins["bool"].oid: pa.bool_(),
+    builtins["int2"].oid: pa.int16(),
+    builtins["int4"].oid: pa.int32(),
+    builtins["int8"].oid: pa.int64(),
+    builtins["float4"].oid: pa.float32(),
+    builtins["float8"].oid: pa.float64(),
+}
+
+# The Arrow types to convert the Python objects returned by the loaders into,
+# so that all the batches of a stream have the same schema. Types not listed
+# are inferred from the values.
+ARROW_TYPES: Dict[int, "pa.DataType"] = {
+    **FIXED_TYPES,
+    builtins["text"].oid: pa.string(),
+    builtins["varchar"].oid: pa.string(),
+    builtins["bpchar"].oid: pa.string(),
+    builtins["name"].oid: pa.string(),
+    builtins["date"].oid: pa.date32(),
+    builtins["timestamp"].oid: pa.timestamp("us"),
+    builtins["timestamptz"].oid: pa.timestamp("us", tz="UTC"),
+}
+
+
+def record_batch(
+    cursor: "BaseCursor[Any]", results: Sequence["PGresult"], row0: int = 0
+) -> "pa.RecordBatch":
+    """
+    Convert the rows of a cursor's results into an Arrow record batch.
+
+    *results* must all have the shape of the cursor's current result and the
+    cursor's transformer must have its loaders set for them. The rows
+    converted start from *row0* in the first result.
+    """
+    names = [c.name for c in cursor.description or ()]
+    if len(results) == 1:
+        res = results[0]
+        arrays = [
+            _load_column(cursor, res, col, row0, res.ntuples)
+            for col in range(len(names))
+        ]
+        return pa.RecordBatch.from_arrays(arrays, names=names)
+
+    # Several results, e.g. one per row in single row mode: merge their
+    # values column by column.
+    tx = cursor._tx
+    columns: List[List[Any]] = [[] for _ in names]
+    for res in results:
+        tx.set_pgresult(res, set_loaders=False)
+        for col, values in enumerate(columns):
+            values.extend(tx.load_column(col, row0, res.ntuples))
+        row0 = 0
+
+    res = results[-1]
+    arrays = [
+        pa.array(values, type=_arrow_type(cursor, res, col))
+        for col, values in enumerate(columns)
+    ]
+    return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+def _load_column(
+    cursor: "BaseCursor[Any]", res: "PGresult", col: int, row0: int, row1: int
+) -> "pa.Array":
+    oid = res.ftype(col)
+    if (
+        res.fformat(col) == Format.BINARY
+        and oid in FIXED_TYPES
+        and has_default_loader(cursor._tx, oid)
+    ):
+        return _load_fixed(res, col, row0, row1, FIXED_TYPES[oid])
+
+    values = cursor._tx.load_column(col, row0, row1)
+    return pa.array(values, type=_arrow_type(cursor, res, col))
+
+
+def _arrow_type(
+    cursor: "BaseCursor[Any]", res: "PGresult", col: int
+) -> Optional["pa.DataType"]:
+    """
+    Return the Arrow type to convert the values of a column into.
+
+    Return `!None` if the type should be inferred from the values, e.g.
+    because a custom loader is used for the fixed-width types.
+    """
+    oid = res.ftype(col)
+    if oid in FIXED_TYPES and res.fformat(col) == Format.BINARY:
+        if not has_default_loader(cursor._tx, oid):
+            return None
+    return ARROW_TYPES.get(oid)
+
+
+def _load_fixed(
+    res: "PGresult", col: int, row0: int, row1: int, type: "pa.DataType"
+) -> "pa.Array":
+    """
+    Copy a fixed-width binary column into an Arrow array.
+
+    No Python object is created for the values.
+    """
+    nrows = row1 - row0
+    # Arrow booleans are bits: load them as bytes and convert them later
+    is_bool = type == pa.bool_()
+    itemsize = 1 if is_bool else type.bit_width // 8
+    data = bytearray(nrows * itemsize)
+    mask = bytearray(nrows)
+    nnulls = fill_buffer(res, col, row0, row1, itemsize, data, mask)
+
+    validity = None
+    if nnulls:
+        nulls = pa.Array.from_buffers(
+            pa.uint8(), nrows, [None, pa.py_buffer(mask)]
+        )
+        validity = pc.equal(nulls, 0).buffers()[1]
+
+    rv = pa.Array.from_buffers(
+        pa.uint8() if is_bool else type,
+        nrows,
+        [validity, pa.py_buffer(data)],
+        null_count=nnulls,
+    )
+    if is_bool:
+        rv = rv.cast(pa.bool_())
+    return rv
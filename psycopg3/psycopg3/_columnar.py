@@ -0,0 +1,137 @@
+"""
+Support for loading results by column, used by Cursor.fetch_columns()
+"""
+
+# Copyright (C) 2021 The Psycopg Team
+
+import sys
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from . import pq
+from . import errors as e
+from .adapt import AdaptersMap, Loader
+from .oids import postgres_types as builtins
+from .proto import Transformer
+from .pq.proto import PGresult
+from .types.numeric import Int2BinaryLoader, Int4BinaryLoader
+from .types.numeric import Int8BinaryLoader
+from .types.numeric import Float4BinaryLoader, Float8BinaryLoader
+from .types.singletons import BoolBinaryLoader
+
+# The array typecodes to load fixed-width binary values into.
+# Booleans are not included: they would be loaded as 0 and 1, not as bool.
+ARRAY_TYPECODES: Dict[int, str] = {
+    builtins["int2"].oid: "h",
+    builtins["int4"].oid: "i",
+    builtins["int8"].oid: "q",
+    builtins["float4"].oid: "f",
+    builtins["float8"].oid: "d",
+}
+
+# The builtin loaders of the fixed-width types. The values of a column are
+# copied from the result only if its loader is one of these: other loaders
+# may return different objects.
+DEFAULT_LOADERS: Dict[int, Type[Loader]] = {
+    builtins["bool"].oid: BoolBinaryLoader,
+    builtins["int2"].oid: Int2BinaryLoader,
+    builtins["int4"].oid: Int4BinaryLoader,
+    builtins["int8"].oid: Int8BinaryLoader,
+    builtins["float4"].oid: Float4BinaryLoader,
+    builtins["float8"].oid: Float8BinaryLoader,
+}
+
+fill_buffer: Callable[[PGresult, int, int, int, int, Any, Any], int]
+
+
+def load_array(
+    pgresult: PGresult, col: int, row0: int, row1: int, typecode: str
+) -> Optional["array[Any]"]:
+    """
+    Return the values of a binary column in an `!array.array` of *typecode*.
+
+    Return `!None` if the column contains NULL values, which cannot be
+    represented in the array.
+    """
+    rv = array(typecode, [0]) * (row1 - row0)
+    if fill_buffer(pgresult, col, row0, row1, rv.itemsize, rv, None) < 0:
+        return None
+    return rv
+
+
+def has_default_loader(tx: Transformer, oid: int) -> bool:
+    """
+    Return `!True` if *tx* loads the binary values of *oid* using its builtin
+    loader, so that they can be copied from the result instead.
+    """
+    cls = DEFAULT_LOADERS.get(oid)
+    if not cls:
+        return False
+    loader = tx.get_loader(oid, pq.Format.BINARY)
+    return type(loader) is AdaptersMap._get_optimised(cls)
+
+
+def _fill_buffer(
+    pgresult: PGresult,
+    col: int,
+    row0: int,
+    row1: int,
+    itemsize: int,
+    data: Any,
+    mask: Any = None,
+) -> int:
+    """
+    Copy the values of a fixed-width binary column into a buffer.
+
+    *data* is a writable buffer receiving the values of the rows from *row0*
+    to *row1*, converted to the native byte order; every value in the result
+    must be *itemsize* bytes long.
+
+    If *mask* is a writable buffer, its items are set to 1 for the NULL
+    values, and the corresponding *data* items are set to zero. Return the
+    number of NULL values found. If *mask* is `!None`, return -1 as soon as a
+    NULL value is found.
+    """
+    nulls: List[int] = []
+    values: List[bytes] = []
+    zero = bytes(itemsize)
+    get_value = pgresult.get_value
+    for row in range(row0, row1):
+        val = get_value(row, col)
+        if val is None:
+            if mask is None:
+                return -1
+            nulls.append(row - row0)
+            val = zero
+        elif len(val) != itemsize:
+            raise e.InterfaceError(
+                f"expected values of {itemsize} bytes, got {len(val)}"
+            )
+        values.append(val)
+
+    buf = array(_UINT_TYPECODES[itemsize], b"".join(values))
+    if sys.byteorder == "little":
+        buf.byteswap()
+    out = memoryview(data).cast("B")
+    out[: len(buf) * itemsize] = memoryview(buf).cast("B")
+
+    if nulls:
+        mview = memoryview(mask).cast("B")
+        one = memoryview(b"\x01")
+        for i in nulls:
+            mview[i : i + 1] = one
+
+    return len(nulls)
+
+
+_UINT_TYPECODES = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+
+# Override functions with fast versions if available
+if pq.__impl__ == "c":
+    from psycopg3_c import _psycopg3
+
+    fill_buffer = _psycopg3.fill_buffer
+
+else:
+    fill_buffer = _fill_buffer
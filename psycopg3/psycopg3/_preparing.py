@@ -5,8 +5,9 @@ Support for prepared statements
 # Copyright (C) 2020-2021 The Psycopg Team
 
 from enum import IntEnum, auto
-from typing import Optional, Sequence, Tuple, TYPE_CHECKING, Union
-from collections import OrderedDict
+from typing import Deque, Iterator, Optional, Sequence, Tuple, TYPE_CHECKING
+from typing import Union
+from collections import OrderedDict, deque
 
 from .pq import ExecStatus
 from ._queries import PostgresQuery
@@ -42,6 +43,11 @@ class PrepareManager:
         # Counter to generate prepared statements names
         self._prepared_idx = 0
 
+        # Commands to run on the server to align its prepared statements to
+        # the cache, such as the DEALLOCATE of the statements evicted. They
+        # are sent, if possible, together with the next query.
+        self._maint_commands: Deque[bytes] = deque()
+
     def get(
         self, query: PostgresQuery, prepare: Optional[bool] = None
     ) -> Tuple[Prepare, bytes]:
@@ -73,11 +79,15 @@ class PrepareManager:
         results: Sequence["PGresult"],
         prep: Prepare,
         name: bytes,
-    ) -> Optional[bytes]:
-        """Maintain the cache of the prepared statements."""
+    ) -> None:
+        """Maintain the cache of the prepared statements.
+
+        Commands to execute on the server, if needed, can be obtained with
+        `get_maintenance_commands()`.
+        """
         # don't do anything if prepared statements are disabled
         if self.prepare_threshold is None:
-            return None
+            return
 
         key = (query.query, query.types)
 
@@ -89,13 +99,20 @@ class PrepareManager:
                     self._prepared[key] = name
                 else:
                     self._prepared[key] += 1  # type: ignore  # operator
+            elif prep is Prepare.SHOULD:
+                # The query was prepared more than once, which can happen if
+                # it was queued several times in a pipeline before receiving
+                # the first result. Keep the first statement only.
+                self._prepared.move_to_end(key)
+                self._maint_commands.append(b"DEALLOCATE " + name)
+                return
             self._prepared.move_to_end(key)
-            return None
+            return
 
         # The query is not in cache. Let's see if we must add it
         if len(results) != 1:
             # We cannot prepare a multiple statement
-            return None
+            return
 
         result = results[0]
         if (
@@ -103,7 +120,7 @@ class PrepareManager:
             and result.status != ExecStatus.COMMAND_OK
         ):
             # We don't prepare failed queries or other weird results
-            return None
+            return
 
         # Ok, we got to the conclusion that this query is genuinely to prepare
         self._prepared[key] = name if prep is Prepare.SHOULD else 1
@@ -111,10 +128,21 @@ class PrepareManager:
         # Evict an old value from the cache; if it was prepared, deallocate it
         # Do it only once: if the cache was resized, deallocate gradually
         if len(self._prepared) <= self.prepared_max:
-            return None
+            return
 
         old_val = self._prepared.popitem(last=False)[1]
         if isinstance(old_val, bytes):
-            return b"DEALLOCATE " + old_val
-        else:
-            return None
+            self._maint_commands.append(b"DEALLOCATE " + old_val)
+
+    def has_maintenance_commands(self) -> bool:
+        """Return `!True` if there are maintenance commands to execute."""
+        return bool(self._maint_commands)
+
+    def get_maintenance_commands(self) -> Iterator[bytes]:
+        """
+        Iterate over the maintenance commands to execute on the server.
+
+        The commands returned are removed from the queue.
+        """
+        while self._maint_commands:
+            yield self._maint_commands.popleft()
@@ -133,6 +133,14 @@ class Transformer(AdaptContext):
 
         return ps, tuple(ts), fs
 
+    def reset_row_dumpers(self) -> None:
+        """
+        Forget the dumpers chosen by `dump_sequence()` for each parameter.
+
+        The next sequence dumped may have parameters of different types.
+        """
+        self._row_dumpers = []
+
     def get_dumper(self, obj: Any, format: Format) -> "Dumper":
         """
         Return a Dumper instance to dump *obj*.
@@ -183,6 +191,30 @@ class Transformer(AdaptContext):
 
         return records
 
+    def load_column(self, col: int, row0: int, row1: int) -> List[Any]:
+        res = self._pgresult
+        if not res:
+            raise e.InterfaceError("result not set")
+
+        if not 0 <= col < self._nfields:
+            raise e.InterfaceError(
+                f"column must be included between 0 and {self._nfields - 1}"
+            )
+
+        if not (0 <= row0 <= self._ntuples and 0 <= row1 <= self._ntuples):
+            raise e.InterfaceError(
+                f"rows must be included between 0 and {self._ntuples}"
+            )
+
+        load = self._row_loaders[col]
+        values: List[Any] = [None] * (row1 - row0)
+        for row in range(row0, row1):
+            val = res.get_value(row, col)
+            if val is not None:
+                values[row - row0] = load(val)
+
+        return values
+
     def load_row(self, row: int) -> Optional[Row]:
         res = self._pgresult
         if not res:
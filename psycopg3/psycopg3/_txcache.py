@@ -0,0 +1,90 @@
+"""
+Cache of the transformers used to execute queries on a connection.
+"""
+
+# Copyright (C) 2021 The Psycopg Team
+
+from typing import Optional, Tuple, Union
+from collections import OrderedDict
+
+from . import adapt
+from .proto import AdaptContext, Transformer
+from .pq.proto import PGconn
+
+# The query (str or bytes), the connection parameters read by the adapters
+# and the versions of the adapters maps when the transformer was created.
+Key = Tuple[Union[str, bytes], Tuple[Optional[bytes], ...], int, int]
+
+# The connection parameters the adapters configure themselves upon. A
+# transformer created with different values would load data in a wrong way.
+_KEY_PARAMS = (b"client_encoding", b"DateStyle", b"IntervalStyle")
+
+
+class TransformersCache:
+    """
+    Keep the transformers used by the queries executed on a connection.
+
+    The transformers keep the dumpers and loaders they used, so executing the
+    same query again, for instance on a new cursor, doesn't need to look for
+    them and create them again.
+
+    A transformer is used by a single cursor at time: the cursor takes it
+    out of the cache before executing a query and gives it back when done.
+    """
+
+    # Maximum number of transformers kept on the connection.
+    transformers_max: int = 100
+
+    def __init__(self) -> None:
+        self._transformers: OrderedDict[Key, Transformer] = OrderedDict()
+
+    def make_key(self, query: Union[str, bytes], pgconn: PGconn) -> Key:
+        """
+        Return the key to store a transformer for *query*.
+
+        The key changes if any adapter is registered, or if a parameter
+        affecting the adapters (e.g. the DateStyle) is changed, so that
+        transformers created before are not used.
+
+        The oids of the result are not part of the key: the transformers
+        already keep their loaders by oid.
+        """
+        return (
+            query,
+            tuple(pgconn.parameter_status(name) for name in _KEY_PARAMS),
+            adapt.AdaptersMap._dumpers_version,
+            adapt.AdaptersMap._loaders_version,
+        )
+
+    def is_stale(self, key: Key, pgconn: PGconn) -> bool:
+        """
+        Return `!True` if a transformer created with *key* can't be used
+        anymore to execute its query on *pgconn*.
+        """
+        return key != self.make_key(key[0], pgconn)
+
+    def get(self, key: Key, context: AdaptContext) -> Transformer:
+        """
+        Return a transformer to execute a query.
+
+        Take a transformer for the same query out of the cache, if available,
+        otherwise create a new one.
+        """
+        tx = self._transformers.pop(key, None)
+        if tx is None:
+            tx = adapt.Transformer(context)
+        return tx
+
+    def put(self, key: Key, tx: Transformer) -> None:
+        """
+        Give back a transformer to the cache after using it.
+        """
+        tx.set_pgresult(None)
+        tx.reset_row_dumpers()
+        tx.make_row = tuple
+
+        # If the key is already present, move the new transformer at the end.
+        self._transformers.pop(key, None)
+        self._transformers[key] = tx
+        if len(self._transformers) > self.transformers_max:
+            self._transformers.popitem(last=False)
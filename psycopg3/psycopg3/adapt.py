@@ -146,6 +146,14 @@ class AdaptersMap(AdaptContext):
     # Record if a dumper or loader has an optimised version.
     _optimised: Dict[type, type] = {}
 
+    # Incremented whenever a dumper is registered on any map. The maps may
+    # share their dumpers with the ones they were copied from or to, so this
+    # invalidates the dumpers resolved by all of them.
+    _dumpers_version = 0
+
+    # Incremented whenever a loader is registered on any map.
+    _loaders_version = 0
+
     def __init__(
         self,
         template: Optional["AdaptersMap"] = None,
@@ -164,6 +172,10 @@ class AdaptersMap(AdaptContext):
             self._own_loaders = [True, True]
             self.types = types or TypesRegistry()
 
+        # The dumper classes already resolved by get_dumper()
+        self._dumpers_cache: Dict[Tuple[type, Format], Type[Dumper]] = {}
+        self._dumpers_cache_version = AdaptersMap._dumpers_version
+
     # implement the AdaptContext protocol too
     @property
     def adapters(self) -> "AdaptersMap":
@@ -191,6 +203,7 @@ class AdaptersMap(AdaptContext):
             self._own_dumpers[fmt] = True
 
         self._dumpers[fmt][cls] = dumper
+        AdaptersMap._dumpers_version += 1
 
     def register_loader(
         self, oid: Union[int, str], loader: Type[Loader]
@@ -212,6 +225,7 @@ class AdaptersMap(AdaptContext):
             self._own_loaders[fmt] = True
 
         self._loaders[fmt][oid] = loader
+        AdaptersMap._loaders_version += 1
 
     def get_dumper(self, cls: type, format: Format) -> Type[Dumper]:
         """
@@ -219,6 +233,27 @@ class AdaptersMap(AdaptContext):
 
         Raise ProgrammingError if a class is not available.
         """
+        if self._dumpers_cache_version != AdaptersMap._dumpers_version:
+            self._dumpers_cache.clear()
+            self._dumpers_cache_version = AdaptersMap._dumpers_version
+
+        try:
+            return self._dumpers_cache[cls, format]
+        except KeyError:
+            pass
+
+        dumper = self._dumpers_cache[cls, format] = self._find_dumper(
+            cls, format
+        )
+        return dumper
+
+    def _find_dumper(self, cls: type, format: Format) -> Type[Dumper]:
+        """
+        Look for the dumper class for a type in the maps of a format.
+
+        Look for the class and its superclasses, registered either by
+        themselves or by fully qualified name.
+        """
         if format == Format.AUTO:
             # When dumping a string with %s we may refer to any type actually,
             # but the user surely passed a text format
@@ -255,6 +290,19 @@ class AdaptersMap(AdaptContext):
             f" to format {Format(format).name}"
         )
 
+    def _is_customised(self) -> bool:
+        """
+        Return `!True` if the map has some state not shared with its template.
+
+        This is the case if adapters or types were registered on the map after
+        it was copied, or if the map wasn't copied at all.
+        """
+        return (
+            any(self._own_dumpers)
+            or any(self._own_loaders)
+            or self.types._own_state
+        )
+
     def get_loader(
         self, oid: int, format: pq.Format
     ) -> Optional[Type[Loader]]:
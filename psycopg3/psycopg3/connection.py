@@ -34,8 +34,10 @@ from .proto import AdaptContext, ConnectionType
 from .cursor import Cursor, AsyncCursor
 from .conninfo import make_conninfo
 from .generators import notifies
+from .pipeline import BasePipeline, Pipeline, AsyncPipeline
 from .transaction import Transaction, AsyncTransaction
 from .server_cursor import ServerCursor, AsyncServerCursor
+from ._txcache import TransformersCache
 from ._preparing import PrepareManager
 
 logger = logging.getLogger(__name__)
@@ -43,21 +45,27 @@ package_logger = logging.getLogger("psycopg3")
 
 connect: Callable[[str], PQGenConn["PGconn"]]
 execute: Callable[["PGconn"], PQGen[List["PGresult"]]]
+new_poller: Callable[[int], Any]
 
 if TYPE_CHECKING:
     from .pq.proto import PGconn, PGresult
+    from .pool.base import BasePool
 
 if pq.__impl__ == "c":
     from psycopg3_c import _psycopg3
 
     connect = _psycopg3.connect
     execute = _psycopg3.execute
+    wait = _psycopg3.wait_c
+    new_poller = _psycopg3.new_poller_c
 
 else:
     from . import generators
 
     connect = generators.connect
     execute = generators.execute
+    wait = waiting.wait
+    new_poller = waiting.new_poller
 
 
 class Notify(NamedTuple):
@@ -118,6 +126,14 @@ class BaseConnection(AdaptContext):
         self._savepoints: List[str] = []
 
         self._prepared: PrepareManager = PrepareManager()
+        self._transformers = TransformersCache()
+
+        # The pipeline handler, if the connection is in pipeline mode.
+        self._pipeline: Optional[BasePipeline] = None
+
+        # Attributes managed by the pool the connection belongs to, if any.
+        self._pool: Optional["BasePool[Any]"] = None
+        self._expire_at = 0.0
 
         wself = ref(self)
 
@@ -335,12 +351,15 @@ class BaseConnection(AdaptContext):
         conn.row_factory = row_factory
         return conn
 
-    def _exec_command(self, command: Query) -> PQGen["PGresult"]:
+    def _exec_command(self, command: Query) -> PQGen[Optional["PGresult"]]:
         """
         Generator to send a command and receive the result to the backend.
 
         Only used to implement internal commands such as "commit", with eventual
         arguments bound client-side. The cursor can do more complex stuff.
+
+        In pipeline mode the command is only queued, and its result will be
+        checked when received: return `!None` in this case.
         """
         if self.pgconn.status != ConnStatus.OK:
             if self.pgconn.status == ConnStatus.BAD:
@@ -355,6 +374,12 @@ class BaseConnection(AdaptContext):
         elif isinstance(command, Composable):
             command = command.as_bytes(self)
 
+        if self._pipeline:
+            # PQsendQuery is not allowed in pipeline mode
+            self.pgconn.send_query_params(command, None)
+            self._pipeline._enqueue(None)
+            return None
+
         self.pgconn.send_query(command)
         result = (yield from execute(self.pgconn))[-1]
         if result.status not in (ExecStatus.COMMAND_OK, ExecStatus.TUPLES_OK):
@@ -371,13 +396,15 @@ class BaseConnection(AdaptContext):
 
     def _start_query(self) -> PQGen[None]:
         """Generator to start a transaction if necessary."""
-        if self._autocommit:
-            return
+        if self._begin_needed():
+            yield from self._exec_command(b"begin")
 
-        if self.pgconn.transaction_status != TransactionStatus.IDLE:
-            return
+    def _begin_needed(self) -> bool:
+        """Return `!True` if a query should start a transaction."""
+        if self._autocommit:
+            return False
 
-        yield from self._exec_command(b"begin")
+        return self.pgconn.transaction_status == TransactionStatus.IDLE
 
     def _commit_gen(self) -> PQGen[None]:
         """Generator implementing `Connection.commit()`."""
@@ -417,6 +444,10 @@ class Connection(BaseConnection):
         super().__init__(pgconn)
         self.lock = threading.Lock()
 
+        # The object used by wait() to poll the connection socket, created on
+        # the first wait and reused until the connection is closed.
+        self._poller: Any = None
+
     @classmethod
     def connect(
         cls,
@@ -462,11 +493,16 @@ class Connection(BaseConnection):
         else:
             self.commit()
 
-        self.close()
+        # If the connection belongs to a pool, the pool will take care of it.
+        if not self._pool:
+            self.close()
 
     def close(self) -> None:
         """Close the database connection."""
         self.pgconn.finish()
+        if self._poller is not None:
+            self._poller.close()
+            self._poller = None
 
     @overload
     def cursor(
@@ -542,6 +578,12 @@ class Connection(BaseConnection):
         with Transaction(self, savepoint_name, force_rollback) as tx:
             yield tx
 
+    @contextmanager
+    def pipeline(self) -> Iterator[Pipeline]:
+        """Context manager to switch the connection into pipeline mode."""
+        with Pipeline(self) as pipeline:
+            yield pipeline
+
     def notifies(self) -> Iterator[Notify]:
         """
         Yield `Notify` objects as soon as they are received from the database.
@@ -563,7 +605,10 @@ class Connection(BaseConnection):
         The function must be used on generators that don't change connection
         fd (i.e. not on connect and reset).
         """
-        return waiting.wait(gen, self.pgconn.socket, timeout=timeout)
+        fileno = self.pgconn.socket
+        if self._poller is None:
+            self._poller = new_poller(fileno)
+        return wait(gen, fileno, timeout=timeout, poller=self._poller)
 
     @classmethod
     def _wait_conn(
@@ -632,7 +677,9 @@ class AsyncConnection(BaseConnection):
         else:
             await self.commit()
 
-        await self.close()
+        # If the connection belongs to a pool, the pool will take care of it.
+        if not self._pool:
+            await self.close()
 
     async def close(self) -> None:
         self.pgconn.finish()
@@ -704,6 +751,12 @@ class AsyncConnection(BaseConnection):
         async with tx:
             yield tx
 
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncIterator[AsyncPipeline]:
+        """Context manager to switch the connection into pipeline mode."""
+        async with AsyncPipeline(self) as pipeline:
+            yield pipeline
+
     async def notifies(self) -> AsyncIterator[Notify]:
         while 1:
             async with self.lock:
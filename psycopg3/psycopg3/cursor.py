@@ -5,9 +5,10 @@ psycopg3 cursor objects
 # Copyright (C) 2020-2021 The Psycopg Team
 
 import sys
+from copy import copy
 from types import TracebackType
-from typing import Any, AsyncIterator, Callable, Generic, Iterator, List
-from typing import Optional, NoReturn, Sequence, Type, TYPE_CHECKING
+from typing import Any, AsyncIterator, Callable, Dict, Generic, Iterator, List
+from typing import Optional, NoReturn, Sequence, Tuple, Type, TYPE_CHECKING
 from contextlib import contextmanager
 
 from . import pq
@@ -16,12 +17,16 @@ from . import errors as e
 from . import generators
 
 from .pq import ExecStatus, Format
+from .sql import Composable
 from .copy import Copy, AsyncCopy
 from .rows import tuple_row
 from .proto import ConnectionType, Query, Params, PQGen
 from .proto import Row, RowFactory
 from ._column import Column
+from ._columnar import ARRAY_TYPECODES, has_default_loader, load_array
 from ._queries import PostgresQuery
+from .pipeline import BasePipeline, PrepareInfo
+from ._txcache import Key
 from ._preparing import Prepare
 
 if sys.version_info >= (3, 7):
@@ -30,6 +35,7 @@ else:
     from .utils.context import asynccontextmanager
 
 if TYPE_CHECKING:
+    import pyarrow as pa
     from .proto import Transformer
     from .pq.proto import PGconn, PGresult
     from .connection import BaseConnection  # noqa: F401
@@ -46,13 +52,18 @@ else:
     execute = generators.execute
 
 
+def _chunked_rows_supported() -> bool:
+    """Return `!True` if the libpq wrapper supports chunked rows mode."""
+    return pq.version() >= 170000 and pq.__build_version__ >= 170000
+
+
 class BaseCursor(Generic[ConnectionType]):
     # Slots with __weakref__ and generic bases don't work on Py 3.6
     # https://bugs.python.org/issue41451
     if sys.version_info >= (3, 7):
         __slots__ = """
             _conn format _adapters arraysize _closed _results pgresult _pos
-            _iresult _rowcount _pgq _tx _last_query _row_factory
+            _iresult _rowcount _pgq _tx _tx_key _last_query _row_factory
             __weakref__
             """.split()
 
@@ -74,6 +85,7 @@ class BaseCursor(Generic[ConnectionType]):
         self.arraysize = 1
         self._closed = False
         self._last_query: Optional[Query] = None
+        self._tx_key: Optional[Key] = None
         self._reset()
 
     def _reset(self) -> None:
@@ -203,16 +215,34 @@ class BaseCursor(Generic[ConnectionType]):
         prepare: Optional[bool] = None,
     ) -> PQGen[None]:
         """Generator implementing `Cursor.execute()`."""
-        yield from self._start_query(query)
+        yield from self._start_query(query, begin=False)
         pgq = self._convert_query(query, params)
         results = yield from self._maybe_prepare_gen(pgq, prepare)
-        self._execute_results(results)
+        if results is not None:
+            self._execute_results(results)
+        # else the results are passed to the cursor by the pipeline
         self._last_query = query
 
     def _executemany_gen(
         self, query: Query, params_seq: Sequence[Params]
     ) -> PQGen[None]:
         """Generator implementing `Cursor.executemany()`."""
+        if self._conn._pipeline:
+            # The results will be received from the pipeline
+            yield from self._executemany_gen_pipeline(query, params_seq)
+            return
+
+        if BasePipeline.is_supported():
+            # Send all the statements and receive all the results in one
+            # round trip. In autocommit every statement is synced on its own,
+            # so that an error doesn't discard the statements before it.
+            yield from self._oneshot_pipeline_gen(
+                self._executemany_gen_pipeline(
+                    query, params_seq, sync=self._conn.autocommit
+                )
+            )
+            return
+
         yield from self._start_query(query)
         first = True
         for params in params_seq:
@@ -224,15 +254,135 @@ class BaseCursor(Generic[ConnectionType]):
                 pgq.dump(params)
 
             results = yield from self._maybe_prepare_gen(pgq, True)
+            assert results is not None
             self._execute_results(results)
 
         self._last_query = query
 
+    def _oneshot_pipeline_gen(self, gen: PQGen[None]) -> PQGen[None]:
+        """
+        Generator running *gen* in a pipeline entered for its duration only.
+
+        The operations queued by *gen* are sent together and all their
+        results are received with a single sync.
+        """
+        pipeline = BasePipeline(self._conn)
+        pipeline._enter()
+        try:
+            yield from gen
+            yield from pipeline._sync_gen()
+        except Exception:
+            # Receive the results of the operations already sent. If one of
+            # them failed, report its error, as it happened first.
+            if pipeline.result_queue:
+                yield from pipeline._sync_gen()
+            raise
+        finally:
+            pipeline._exit()
+
+    def _executemany_gen_pipeline(
+        self, query: Query, params_seq: Sequence[Params], sync: bool = False
+    ) -> PQGen[None]:
+        """
+        Generator queuing the statements of `Cursor.executemany()` in a
+        pipeline.
+
+        The statements are sent back-to-back, without waiting for their
+        results: the statement is prepared once, the first time it is met
+        with a certain set of parameters types. If *sync* is true, send a
+        synchronization point after every statement.
+        """
+        pipeline = self._conn._pipeline
+        assert pipeline
+
+        yield from self._start_query(query)
+        for cmd in self._conn._prepared.get_maintenance_commands():
+            yield from self._conn._exec_command(cmd)
+
+        # The first result resets the cursor state, the others only add up
+        # to its rowcount.
+        handler = self._set_results_from_pipeline
+        # Map parameters types -> name of the statement prepared
+        names: Dict[Tuple[int, ...], bytes] = {}
+        first = True
+        for params in params_seq:
+            if first:
+                pgq = self._convert_query(query, params)
+                self._pgq = pgq
+                first = False
+            else:
+                pgq.dump(params)
+
+            name = names.get(pgq.types)
+            if name is not None:
+                self._send_query_prepared(name, pgq)
+                pipeline._enqueue(handler)
+            else:
+                prep, name = self._conn._prepared.get(pgq, True)
+                if prep is Prepare.NO:
+                    self._execute_send(pgq)
+                    pipeline._enqueue(handler)
+                else:
+                    if prep is Prepare.SHOULD:
+                        self._send_prepare(name, pgq)
+                        pipeline._enqueue(None)
+                    names[pgq.types] = name
+                    self._send_query_prepared(name, pgq)
+                    # Take a copy of the query: dump() will change its types.
+                    pipeline._enqueue(handler, (copy(pgq), prep, name))
+
+            handler = self._add_results_from_pipeline
+            if sync:
+                pipeline._queue_sync()
+
+        self._last_query = query
+
     def _maybe_prepare_gen(
         self, pgq: PostgresQuery, prepare: Optional[bool]
-    ) -> PQGen[Sequence["PGresult"]]:
+    ) -> PQGen[Optional[Sequence["PGresult"]]]:
+        """
+        Send the query, preparing it if needed, and return its results.
+
+        Before the query, start a transaction if needed and send the
+        maintenance commands pending for the prepared statements.
+
+        In pipeline mode only queue the query and return `!None`: the
+        results will be passed to the cursor when received. If the query uses
+        the extended query protocol and the other commands would cost extra
+        round trips, send everything in a pipeline and return `!None` too.
+        """
+        conn = self._conn
+
         # Check if the query is prepared or needs preparing
-        prep, name = self._conn._prepared.get(pgq, prepare)
+        prep, name = conn._prepared.get(pgq, prepare)
+        prepinfo = (pgq, prep, name) if prepare is not False else None
+
+        if conn._pipeline:
+            yield from self._queue_query_gen(pgq, prep, name, prepinfo)
+            return None
+
+        if (
+            (
+                prep is not Prepare.NO
+                or pgq.params
+                or self.format == Format.BINARY
+            )
+            and (
+                prep is Prepare.SHOULD
+                or conn._begin_needed()
+                or conn._prepared.has_maintenance_commands()
+            )
+            and BasePipeline.is_supported()
+        ):
+            yield from self._oneshot_pipeline_gen(
+                self._queue_query_gen(pgq, prep, name, prepinfo)
+            )
+            return None
+
+        yield from conn._start_query()
+        for cmd in conn._prepared.get_maintenance_commands():
+            yield from conn._exec_command(cmd)
+
         if prep is Prepare.YES:
             # The query is already prepared
             self._send_query_prepared(name, pgq)
@@ -244,32 +394,77 @@ class BaseCursor(Generic[ConnectionType]):
         else:
             # The query must be prepared and executed
             self._send_prepare(name, pgq)
-            (result,) = yield from execute(self._conn.pgconn)
+            (result,) = yield from execute(conn.pgconn)
             if result.status == ExecStatus.FATAL_ERROR:
                 raise e.error_from_result(
-                    result, encoding=self._conn.client_encoding
+                    result, encoding=conn.client_encoding
                 )
             self._send_query_prepared(name, pgq)
 
         # run the query
-        results = yield from execute(self._conn.pgconn)
+        results = yield from execute(conn.pgconn)
 
-        # Update the prepare state of the query
-        if prepare is not False:
-            cmd = self._conn._prepared.maintain(pgq, results, prep, name)
-            if cmd:
-                yield from self._conn._exec_command(cmd)
+        # Update the prepare state of the query. If possible, the eventual
+        # maintenance commands are sent together with the next query.
+        if prepinfo:
+            conn._prepared.maintain(pgq, results, prep, name)
+            if not BasePipeline.is_supported():
+                for cmd in conn._prepared.get_maintenance_commands():
+                    yield from conn._exec_command(cmd)
 
         return results
 
+    def _queue_query_gen(
+        self,
+        pgq: PostgresQuery,
+        prep: Prepare,
+        name: bytes,
+        prepinfo: Optional[PrepareInfo],
+    ) -> PQGen[None]:
+        """
+        Generator queuing a query in the current pipeline, preparing it if
+        needed.
+
+        Queue the BEGIN and the prepared statements maintenance commands too,
+        if needed.
+        """
+        conn = self._conn
+        pipeline = conn._pipeline
+        assert pipeline
+
+        yield from conn._start_query()
+        for cmd in conn._prepared.get_maintenance_commands():
+            yield from conn._exec_command(cmd)
+
+        if prep is Prepare.SHOULD:
+            self._send_prepare(name, pgq)
+            pipeline._enqueue(None)
+
+        if prep is Prepare.NO:
+            self._execute_send(pgq)
+        else:
+            self._send_query_prepared(name, pgq)
+
+        pipeline._enqueue(self._set_results_from_pipeline, prepinfo)
+
     def _stream_send_gen(
-        self, query: Query, params: Optional[Params] = None
+        self, query: Query, params: Optional[Params] = None, *, size: int = 1
     ) -> PQGen[None]:
         """Generator to send the query for `Cursor.stream()`."""
+        if self._conn._pipeline:
+            raise e.NotSupportedError(
+                "stream() cannot be used in pipeline mode"
+            )
+        if size < 1:
+            raise ValueError("size must be greater than 0")
+
         yield from self._start_query(query)
         pgq = self._convert_query(query, params)
         self._execute_send(pgq, no_pqexec=True)
-        self._conn.pgconn.set_single_row_mode()
+        if size > 1 and _chunked_rows_supported():
+            self._conn.pgconn.set_chunked_rows_mode(size)
+        else:
+            self._conn.pgconn.set_single_row_mode()
         self._last_query = query
 
     def _stream_fetchone_gen(self, first: bool) -> PQGen[Optional["PGresult"]]:
@@ -278,7 +473,7 @@ class BaseCursor(Generic[ConnectionType]):
         if res is None:
             return None
 
-        elif res.status == ExecStatus.SINGLE_TUPLE:
+        elif res.status in (ExecStatus.SINGLE_TUPLE, ExecStatus.TUPLES_CHUNK):
             self.pgresult = res
             self._tx.set_pgresult(res, set_loaders=first)
             if first:
@@ -301,23 +496,124 @@ class BaseCursor(Generic[ConnectionType]):
             self._raise_from_results([res])
             return None  # TODO: shouldn't be needed
 
-    def _start_query(self, query: Optional[Query] = None) -> PQGen[None]:
+    def _stream_results_gen(
+        self, first: bool, size: int
+    ) -> PQGen[List["PGresult"]]:
+        """
+        Generator returning the next results of a streamed query.
+
+        In chunked mode return a whole chunk. In single row mode return up to
+        *size* results, but only wait for the server for the first one: the
+        following ones are returned only if already received.
+
+        Return an empty list when the results are finished.
+        """
+        res = yield from self._stream_fetchone_gen(first)
+        if not res:
+            return []
+
+        results = [res]
+        pgconn = self._conn.pgconn
+        while (
+            len(results) < size
+            and res.status == ExecStatus.SINGLE_TUPLE
+            and not pgconn.is_busy()
+        ):
+            res = yield from self._stream_fetchone_gen(False)
+            if not res:
+                break
+            results.append(res)
+
+        return results
+
+    def _stream_fetchmany_gen(
+        self, first: bool, size: int
+    ) -> PQGen[List[Row]]:
+        """
+        Generator returning the next rows of `Cursor.stream()`.
+
+        Return an empty list when the results are finished.
+        """
+        results = yield from self._stream_results_gen(first, size)
+        if len(results) == 1:
+            return self._tx.load_rows(0, results[0].ntuples)
+
+        rows: List[Row] = []
+        for res in results:
+            self._tx.set_pgresult(res, set_loaders=False)
+            rows.extend(self._tx.load_rows(0, res.ntuples))
+        return rows
+
+    def _start_query(
+        self, query: Optional[Query] = None, *, begin: bool = True
+    ) -> PQGen[None]:
         """Generator to start the processing of a query.
 
         It is implemented as generator because it may send additional queries,
-        such as `begin`.
+        such as `begin`. If *begin* is false the caller must take care of it.
         """
         if self.closed:
             raise e.InterfaceError("the cursor is closed")
 
         self._reset()
-        if not self._last_query or (self._last_query is not query):
+        if (
+            not self._last_query
+            or self._last_query is not query
+            # Adapters registered on the cursor after the transformer was
+            # taken from the connection, or anywhere after it was created
+            or (
+                self._tx_key is not None
+                and (
+                    self._adapters._is_customised()
+                    or self._conn._transformers.is_stale(
+                        self._tx_key, self._conn.pgconn
+                    )
+                )
+            )
+        ):
             self._last_query = None
+            self._set_transformer(query)
+        if begin:
+            yield from self._conn._start_query()
+
+    def _set_transformer(self, query: Optional[Query]) -> None:
+        """
+        Set up the transformer to execute a new query.
+
+        Reuse the transformer used by the connection for the same query, if
+        any, so that the dumpers and loaders it created are available.
+        """
+        self._put_transformer()
+
+        if isinstance(query, Composable):
+            query = query.as_bytes(self)
+
+        # The transformers of the connection use its adapters: they can't be
+        # used if the cursor has adapters of its own.
+        if (
+            not isinstance(query, (str, bytes))
+            or self._adapters._is_customised()
+        ):
             self._tx = adapt.Transformer(self)
-        yield from self._conn._start_query()
+            return
+
+        txs = self._conn._transformers
+        self._tx_key = txs.make_key(query, self._conn.pgconn)
+        self._tx = txs.get(self._tx_key, self._conn)
+
+    def _put_transformer(self) -> None:
+        """
+        Give back the transformer used by the last query to the connection.
+        """
+        if self._tx_key is not None:
+            self._conn._transformers.put(self._tx_key, self._tx)
+            self._tx_key = None
 
     def _start_copy_gen(self, statement: Query) -> PQGen[None]:
         """Generator implementing sending a command for `Cursor.copy()."""
+        if self._conn._pipeline:
+            raise e.NotSupportedError("COPY cannot be used in pipeline mode")
+
         yield from self._start_query()
         query = self._convert_query(statement)
 
@@ -338,7 +634,13 @@ class BaseCursor(Generic[ConnectionType]):
         This is not a generator, but a normal non-blocking function.
         """
         self._pgq = query
-        if query.params or no_pqexec or self.format == Format.BINARY:
+        if (
+            query.params
+            or no_pqexec
+            or self.format == Format.BINARY
+            # PQsendQuery is not allowed in pipeline mode
+            or self._conn._pipeline
+        ):
             self._conn.pgconn.send_query_params(
                 query.query,
                 query.params,
@@ -354,6 +656,10 @@ class BaseCursor(Generic[ConnectionType]):
     def _convert_query(
         self, query: Query, params: Optional[Params] = None
     ) -> PostgresQuery:
+        if isinstance(query, Composable) and self._tx_key is not None:
+            # The query was already converted to find its transformer
+            query = self._tx_key[0]
+
         pgq = PostgresQuery(self._tx)
         pgq.convert(query, params)
         return pgq
@@ -395,6 +701,32 @@ class BaseCursor(Generic[ConnectionType]):
 
         return
 
+    def _set_results_from_pipeline(
+        self, results: Sequence["PGresult"]
+    ) -> None:
+        """
+        Receive the results of a query queued in pipeline mode.
+        """
+        if results[0].status == ExecStatus.PIPELINE_ABORTED:
+            raise e.PipelineAborted("pipeline aborted")
+
+        self._rowcount = -1
+        self._execute_results(results)
+
+    def _add_results_from_pipeline(
+        self, results: Sequence["PGresult"]
+    ) -> None:
+        """
+        Receive the results of a further query queued by `executemany()`.
+
+        The cursor state is replaced as in `execute()`, the rowcount is added
+        to the one of the previous results.
+        """
+        if results[0].status == ExecStatus.PIPELINE_ABORTED:
+            raise e.PipelineAborted("pipeline aborted")
+
+        self._execute_results(results)
+
     def _raise_from_results(self, results: Sequence["PGresult"]) -> NoReturn:
         statuses = {res.status for res in results}
         badstats = statuses.difference(self._status_ok)
@@ -434,6 +766,54 @@ class BaseCursor(Generic[ConnectionType]):
                 "the last operation didn't produce a result"
             )
 
+    def _load_columns(self) -> Dict[str, Sequence[Any]]:
+        """
+        Implement part of fetch_columns() common to sync and async.
+
+        Load the remaining rows of the current result, column by column.
+        """
+        res = self.pgresult
+        assert res
+        columns = self.description or ()
+        names = set()
+        for column in columns:
+            if column.name in names:
+                raise e.ProgrammingError(
+                    f"cannot fetch columns by name: the name {column.name!r}"
+                    " is used by more than one column"
+                )
+            names.add(column.name)
+
+        row0, row1 = self._pos, res.ntuples
+        rv: Dict[str, Sequence[Any]] = {}
+        for col, column in enumerate(columns):
+            values: Optional[Sequence[Any]] = None
+            oid = res.ftype(col)
+            if res.fformat(col) == Format.BINARY and has_default_loader(
+                self._tx, oid
+            ):
+                typecode = ARRAY_TYPECODES.get(oid)
+                if typecode:
+                    values = load_array(res, col, row0, row1, typecode)
+            if values is None:
+                values = self._tx.load_column(col, row0, row1)
+            rv[column.name] = values
+
+        self._pos = row1
+        return rv
+
+    def _load_arrow(self) -> "pa.RecordBatch":
+        """
+        Implement part of fetch_arrow() common to sync and async.
+        """
+        from ._arrow import record_batch
+
+        res = self.pgresult
+        assert res
+        rv = record_batch(self, [res], self._pos)
+        self._pos = res.ntuples
+        return rv
+
     def _check_copy_result(self, result: "PGresult") -> None:
         """
         Check that the value returned in a copy() operation is a legit COPY.
@@ -468,6 +848,7 @@ class BaseCursor(Generic[ConnectionType]):
 
     def _close(self) -> None:
         self._closed = True
+        self._put_transformer()
         # however keep the query available, which can be useful for debugging
         # in case of errors
         pgq = self._pgq
@@ -518,18 +899,55 @@ class Cursor(BaseCursor["Connection"]):
             self._conn.wait(self._executemany_gen(query, params_seq))
 
     def stream(
-        self, query: Query, params: Optional[Params] = None
+        self,
+        query: Query,
+        params: Optional[Params] = None,
+        *,
+        size: int = 1,
     ) -> Iterator[Row]:
         """
         Iterate row-by-row on a result from the database.
+
+        *size* is the number of rows to receive from the server in a single
+        result. If greater than 1, and if the libpq supports it, use chunked
+        mode instead of single row mode.
+        """
+        with self._conn.lock:
+            self._conn.wait(self._stream_send_gen(query, params, size=size))
+            first = True
+            while 1:
+                recs = self._conn.wait(self._stream_fetchmany_gen(first, size))
+                if not recs:
+                    break
+                yield from recs
+                first = False
+
+    def stream_arrow(
+        self,
+        query: Query,
+        params: Optional[Params] = None,
+        *,
+        batch_rows: int = 10000,
+    ) -> Iterator["pa.RecordBatch"]:
         """
+        Iterate on a result from the database by Apache Arrow record batches.
+
+        Every batch contains up to *batch_rows* rows.
+        """
+        from ._arrow import record_batch
+
         with self._conn.lock:
-            self._conn.wait(self._stream_send_gen(query, params))
+            self._conn.wait(
+                self._stream_send_gen(query, params, size=batch_rows)
+            )
             first = True
-            while self._conn.wait(self._stream_fetchone_gen(first)):
-                rec = self._tx.load_row(0)
-                assert rec is not None
-                yield rec
+            while 1:
+                results = self._conn.wait(
+                    self._stream_results_gen(first, batch_rows)
+                )
+                if not results:
+                    break
+                yield record_batch(self, results)
                 first = False
 
     def fetchone(self) -> Optional[Row]:
@@ -538,6 +956,7 @@ class Cursor(BaseCursor["Connection"]):
 
         Return `!None` the recordset is finished.
         """
+        self._fetch_pipeline()
         self._check_result()
         record = self._tx.load_row(self._pos)
         if record is not None:
@@ -550,6 +969,7 @@ class Cursor(BaseCursor["Connection"]):
 
         *size* default to `!self.arraysize` if not specified.
         """
+        self._fetch_pipeline()
         self._check_result()
         assert self.pgresult
 
@@ -565,13 +985,36 @@ class Cursor(BaseCursor["Connection"]):
         """
         Return all the remaining records from the current recordset.
         """
+        self._fetch_pipeline()
         self._check_result()
         assert self.pgresult
         records = self._tx.load_rows(self._pos, self.pgresult.ntuples)
         self._pos = self.pgresult.ntuples
         return records
 
+    def fetch_columns(self) -> Dict[str, Sequence[Any]]:
+        """
+        Return all the remaining records from the current recordset by column.
+
+        Return a mapping from the column names to the sequences of their
+        values. Raise `ProgrammingError` if more than one column have the same
+        name.
+        """
+        self._fetch_pipeline()
+        self._check_result()
+        return self._load_columns()
+
+    def fetch_arrow(self) -> "pa.RecordBatch":
+        """
+        Return all the remaining records from the current recordset as an
+        Apache Arrow record batch.
+        """
+        self._fetch_pipeline()
+        self._check_result()
+        return self._load_arrow()
+
     def __iter__(self) -> Iterator[Row]:
+        self._fetch_pipeline()
         self._check_result()
 
         load = self._tx.load_row
@@ -594,8 +1037,15 @@ class Cursor(BaseCursor["Connection"]):
         Raise `!IndexError` in case a scroll operation would leave the result
         set. In this case the position will not change.
         """
+        self._fetch_pipeline()
         self._scroll(value, mode)
 
+    def _fetch_pipeline(self) -> None:
+        # In pipeline mode, receive the results of the queued queries
+        if not self.pgresult and self._conn._pipeline:
+            with self._conn.lock:
+                self._conn.wait(self._conn._pipeline._fetch_gen(flush=True))
+
     @contextmanager
     def copy(self, statement: Query) -> Iterator[Copy]:
         """
@@ -646,18 +1096,52 @@ class AsyncCursor(BaseCursor["AsyncConnection"]):
             await self._conn.wait(self._executemany_gen(query, params_seq))
 
     async def stream(
-        self, query: Query, params: Optional[Params] = None
+        self,
+        query: Query,
+        params: Optional[Params] = None,
+        *,
+        size: int = 1,
     ) -> AsyncIterator[Row]:
         async with self._conn.lock:
-            await self._conn.wait(self._stream_send_gen(query, params))
+            await self._conn.wait(
+                self._stream_send_gen(query, params, size=size)
+            )
+            first = True
+            while 1:
+                recs = await self._conn.wait(
+                    self._stream_fetchmany_gen(first, size)
+                )
+                if not recs:
+                    break
+                for rec in recs:
+                    yield rec
+                first = False
+
+    async def stream_arrow(
+        self,
+        query: Query,
+        params: Optional[Params] = None,
+        *,
+        batch_rows: int = 10000,
+    ) -> AsyncIterator["pa.RecordBatch"]:
+        from ._arrow import record_batch
+
+        async with self._conn.lock:
+            await self._conn.wait(
+                self._stream_send_gen(query, params, size=batch_rows)
+            )
             first = True
-            while await self._conn.wait(self._stream_fetchone_gen(first)):
-                rec = self._tx.load_row(0)
-                assert rec is not None
-                yield rec
+            while 1:
+                results = await self._conn.wait(
+                    self._stream_results_gen(first, batch_rows)
+                )
+                if not results:
+                    break
+                yield record_batch(self, results)
                 first = False
 
     async def fetchone(self) -> Optional[Row]:
+        await self._fetch_pipeline()
         self._check_result()
         rv = self._tx.load_row(self._pos)
         if rv is not None:
@@ -665,6 +1149,7 @@ class AsyncCursor(BaseCursor["AsyncConnection"]):
         return rv  # type: ignore[no-any-return]
 
     async def fetchmany(self, size: int = 0) -> List[Row]:
+        await self._fetch_pipeline()
         self._check_result()
         assert self.pgresult
 
@@ -677,13 +1162,25 @@ class AsyncCursor(BaseCursor["AsyncConnection"]):
         return records
 
     async def fetchall(self) -> List[Row]:
+        await self._fetch_pipeline()
         self._check_result()
         assert self.pgresult
         records = self._tx.load_rows(self._pos, self.pgresult.ntuples)
         self._pos = self.pgresult.ntuples
         return records
 
+    async def fetch_columns(self) -> Dict[str, Sequence[Any]]:
+        await self._fetch_pipeline()
+        self._check_result()
+        return self._load_columns()
+
+    async def fetch_arrow(self) -> "pa.RecordBatch":
+        await self._fetch_pipeline()
+        self._check_result()
+        return self._load_arrow()
+
     async def __aiter__(self) -> AsyncIterator[Row]:
+        await self._fetch_pipeline()
         self._check_result()
 
         load = self._tx.load_row
@@ -696,8 +1193,16 @@ class AsyncCursor(BaseCursor["AsyncConnection"]):
             yield row
 
     async def scroll(self, value: int, mode: str = "relative") -> None:
+        await self._fetch_pipeline()
         self._scroll(value, mode)
 
+    async def _fetch_pipeline(self) -> None:
+        if not self.pgresult and self._conn._pipeline:
+            async with self._conn.lock:
+                await self._conn.wait(
+                    self._conn._pipeline._fetch_gen(flush=True)
+                )
+
     @asynccontextmanager
     async def copy(self, statement: Query) -> AsyncIterator[AsyncCopy]:
         async with self._conn.lock:
@@ -165,6 +165,17 @@ class NotSupportedError(DatabaseError):
     __module__ = "psycopg3"
 
 
+class PipelineAborted(OperationalError):
+    """
+    Raised when an operation fails because the current pipeline is aborted.
+
+    In pipeline mode, after a statement fails, the following ones are not
+    executed by the server until the next synchronization point.
+    """
+
+    __module__ = "psycopg3.errors"
+
+
 class Diagnostic:
     """Details from a database error report."""
 
@@ -16,7 +16,7 @@ when the file descriptor is ready.
 # Copyright (C) 2020-2021 The Psycopg Team
 
 import logging
-from typing import List, Optional, Union
+from typing import Callable, List, Optional, Union
 
 from . import pq
 from . import errors as e
@@ -75,7 +75,7 @@ def execute(pgconn: PGconn) -> PQGen[List[PGresult]]:
     return rv
 
 
-def send(pgconn: PGconn) -> PQGen[None]:
+def _send(pgconn: PGconn) -> PQGen[None]:
     """
     Generator to send a query to the server without blocking.
 
@@ -99,7 +99,7 @@ def send(pgconn: PGconn) -> PQGen[None]:
         continue
 
 
-def fetch_many(pgconn: PGconn) -> PQGen[List[PGresult]]:
+def _fetch_many(pgconn: PGconn) -> PQGen[List[PGresult]]:
     """
     Generator retrieving results from the database without blocking.
 
@@ -124,7 +124,7 @@ def fetch_many(pgconn: PGconn) -> PQGen[List[PGresult]]:
     return results
 
 
-def fetch(pgconn: PGconn) -> PQGen[Optional[PGresult]]:
+def _fetch(pgconn: PGconn) -> PQGen[Optional[PGresult]]:
     """
     Generator retrieving a single result from the database without blocking.
 
@@ -157,7 +157,7 @@ _copy_statuses = (
 )
 
 
-def notifies(pgconn: PGconn) -> PQGen[List[pq.PGnotify]]:
+def _notifies(pgconn: PGconn) -> PQGen[List[pq.PGnotify]]:
     yield Wait.R
     pgconn.consume_input()
 
@@ -172,7 +172,7 @@ def notifies(pgconn: PGconn) -> PQGen[List[pq.PGnotify]]:
     return ns
 
 
-def copy_from(pgconn: PGconn) -> PQGen[Union[memoryview, PGresult]]:
+def _copy_from(pgconn: PGconn) -> PQGen[Union[memoryview, PGresult]]:
     while 1:
         nbytes, data = pgconn.get_copy_data(1)
         if nbytes != 0:
@@ -197,13 +197,13 @@ def copy_from(pgconn: PGconn) -> PQGen[Union[memoryview, PGresult]]:
     return result
 
 
-def copy_to(pgconn: PGconn, buffer: bytes) -> PQGen[None]:
+def _copy_to(pgconn: PGconn, buffer: bytes) -> PQGen[None]:
     # Retry enqueuing data until successful
     while pgconn.put_copy_data(buffer) == 0:
         yield Wait.W
 
 
-def copy_end(pgconn: PGconn, error: Optional[bytes]) -> PQGen[PGresult]:
+def _copy_end(pgconn: PGconn, error: Optional[bytes]) -> PQGen[PGresult]:
     # Retry enqueuing end copy message until successful
     while pgconn.put_copy_end(error) == 0:
         yield Wait.W
@@ -224,3 +224,33 @@ def copy_end(pgconn: PGconn, error: Optional[bytes]) -> PQGen[PGresult]:
         raise e.error_from_result(result, encoding=encoding)
 
     return result
+
+
+send: Callable[[PGconn], PQGen[None]]
+fetch_many: Callable[[PGconn], PQGen[List[PGresult]]]
+fetch: Callable[[PGconn], PQGen[Optional[PGresult]]]
+notifies: Callable[[PGconn], PQGen[List[pq.PGnotify]]]
+copy_from: Callable[[PGconn], PQGen[Union[memoryview, PGresult]]]
+copy_to: Callable[[PGconn, bytes], PQGen[None]]
+copy_end: Callable[[PGconn, Optional[bytes]], PQGen[PGresult]]
+
+# Override functions with fast versions if available
+if pq.__impl__ == "c":
+    from psycopg3_c import _psycopg3
+
+    send = _psycopg3.send
+    fetch_many = _psycopg3.fetch_many
+    fetch = _psycopg3.fetch
+    notifies = _psycopg3.notifies
+    copy_from = _psycopg3.copy_from
+    copy_to = _psycopg3.copy_to
+    copy_end = _psycopg3.copy_end
+
+else:
+    send = _send
+    fetch_many = _fetch_many
+    fetch = _fetch
+    notifies = _notifies
+    copy_from = _copy_from
+    copy_to = _copy_to
+    copy_end = _copy_end
@@ -0,0 +1,112 @@
+"""
+Support for loading query results into NumPy arrays.
+
+The module requires the `numpy` package to be installed.
+"""
+
+# Copyright (C) 2021 The Psycopg Team
+
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from . import errors as e
+from .pq import Format
+from .oids import postgres_types as builtins
+from ._columnar import fill_buffer, has_default_loader
+
+if TYPE_CHECKING:
+    from .cursor import BaseCursor
+    from .pq.proto import PGresult
+
+# The dtypes to load the fixed-width binary values into.
+DTYPES: Dict[int, "np.dtype[Any]"] = {
+    builtins["bool"].oid: np.dtype("?"),
+    builtins["int2"].oid: np.dtype("i2"),
+    builtins["int4"].oid: np.dtype("i4"),
+    builtins["int8"].oid: np.dtype("i8"),
+    builtins["float4"].oid: np.dtype("f4"),
+    builtins["float8"].oid: np.dtype("f8"),
+}
+
+
+def load_column(
+    pgresult: "PGresult",
+    col: int,
+    row0: int = 0,
+    row1: Optional[int] = None,
+) -> "np.ndarray[Any, Any]":
+    """
+    Load a column of a binary result into a NumPy array.
+
+    Return the values of column *col* in the rows from *row0* to *row1*
+    (by default, to the end of the result). The values are copied from the
+    result into the array without creating a Python object for each of them.
+    If the column contains NULLs, return a `!numpy.ma.MaskedArray` with the
+    NULL values masked.
+
+    The column must be in binary format and of one of the types in `DTYPES`.
+    """
+    if row1 is None:
+        row1 = pgresult.ntuples
+
+    if pgresult.fformat(col) != Format.BINARY:
+        raise e.NotSupportedError(
+            f"column {col} is not in binary format:"
+            " please use a cursor with binary=True"
+        )
+
+    oid = pgresult.ftype(col)
+    try:
+        dtype = DTYPES[oid]
+    except KeyError:
+        raise e.NotSupportedError(
+            f"cannot load column {col} of type oid {oid} into a numpy array"
+        ) from None
+
+    data = np.empty(row1 - row0, dtype=dtype)
+    mask = np.zeros(row1 - row0, dtype=bool)
+    if fill_buffer(pgresult, col, row0, row1, dtype.itemsize, data, mask):
+        return np.ma.MaskedArray(data, mask)
+    else:
+        return data
+
+
+def fetch_arrays(
+    cursor: "BaseCursor[Any]",
+) -> Dict[str, "np.ndarray[Any, Any]"]:
+    """
+    Return all the remaining records from a cursor's current result by column.
+
+    Return a mapping from the column names to NumPy arrays of their values.
+    The columns of the types in `DTYPES` are loaded by `load_column()`, if the
+    result is in binary format and no custom loader is registered for their
+    type; the values of the other columns are loaded as Python objects, in
+    arrays with dtype `!object`.
+
+    In pipeline mode the results of the cursor must have already been
+    received, for instance by calling `~psycopg3.Pipeline.sync()`.
+    """
+    cursor._check_result()
+    res = cursor.pgresult
+    assert res
+    row0, row1 = cursor._pos, res.ntuples
+    rv: Dict[str, "np.ndarray[Any, Any]"] = {}
+    for col, column in enumerate(cursor.description or ()):
+        oid = res.ftype(col)
+        if (
+            res.fformat(col) == Format.BINARY
+            and oid in DTYPES
+            and has_default_loader(cursor._tx, oid)
+        ):
+            rv[column.name] = load_column(res, col, row0, row1)
+        else:
+            # Assign item by item: values which are sequences themselves
+            # (e.g. from array columns) must not be broadcast.
+            values = np.empty(row1 - row0, dtype=object)
+            for i, val in enumerate(cursor._tx.load_column(col, row0, row1)):
+                values[i] = val
+            rv[column.name] = values
+
+    cursor._pos = row1
+    return rv
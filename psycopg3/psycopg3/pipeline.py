@@ -0,0 +1,262 @@
+"""
+Pipeline mode context managers returned by Connection.pipeline()
+"""
+
+# Copyright (C) 2021 The Psycopg Team
+
+import logging
+from types import TracebackType
+from typing import Callable, Deque, Optional, Sequence, Tuple, Type
+from typing import TYPE_CHECKING
+from collections import deque
+
+from . import pq
+from . import errors as e
+from .pq import ConnStatus, ExecStatus
+from .proto import PQGen
+from .generators import send, fetch, fetch_many
+from ._queries import PostgresQuery
+from ._preparing import Prepare
+
+if TYPE_CHECKING:
+    from .pq.proto import PGconn, PGresult
+    from .connection import BaseConnection, Connection, AsyncConnection
+
+logger = logging.getLogger(__name__)
+
+# Information about a prepared statement queued in a pipeline, to maintain
+# the connection's prepared statements cache once the result is received.
+PrepareInfo = Tuple[PostgresQuery, Prepare, bytes]
+
+# A function receiving the results of a query, usually a cursor method.
+ResultsHandler = Callable[[Sequence["PGresult"]], None]
+
+# An operation whose result is expected from the server: the function to pass
+# the results to (None for internal commands) and the prepare information.
+# A None in the queue represents a synchronization point.
+PendingResult = Tuple[Optional[ResultsHandler], Optional[PrepareInfo]]
+
+
+class BasePipeline:
+    def __init__(self, conn: "BaseConnection"):
+        self._conn = conn
+        self.pgconn: "PGconn" = conn.pgconn
+        self.result_queue: Deque[Optional[PendingResult]] = deque()
+
+    def __repr__(self) -> str:
+        cls = f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+        info = pq.misc.connection_summary(self.pgconn)
+        return f"<{cls} {info} at 0x{id(self):x}>"
+
+    @property
+    def status(self) -> pq.PipelineStatus:
+        """The pipeline mode status of the connection."""
+        return pq.PipelineStatus(self.pgconn.pipeline_status)
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        """Return `!True` if the libpq wrapper supports pipeline mode."""
+        return pq.version() >= 140000 and pq.__build_version__ >= 140000
+
+    def _enter(self) -> None:
+        if self._conn._pipeline:
+            raise e.ProgrammingError(
+                "the connection is already in pipeline mode"
+            )
+        self.pgconn.enter_pipeline_mode()
+        self._conn._pipeline = self
+
+    def _exit(self) -> None:
+        self._conn._pipeline = None
+        if self.pgconn.status != ConnStatus.BAD:
+            self.pgconn.exit_pipeline_mode()
+
+    def _enqueue(
+        self,
+        handler: Optional[ResultsHandler],
+        prepinfo: Optional[PrepareInfo] = None,
+    ) -> None:
+        """
+        Register that the operation just sent will return a result.
+
+        When received, the result will be passed to *handler*; if there is no
+        handler (internal commands), the result is only checked for errors.
+        """
+        self.result_queue.append((handler, prepinfo))
+
+    def _sync_gen(self) -> PQGen[None]:
+        """
+        Generator sending a synchronization point and receiving all the
+        results pending.
+        """
+        self._queue_sync()
+        yield from self._fetch_gen(flush=False)
+
+    def _queue_sync(self) -> None:
+        """
+        Send a synchronization point, without receiving the results.
+
+        The operations sent before it will be committed, or rolled back, by
+        the server independently of the following ones.
+        """
+        self.pgconn.pipeline_sync()
+        self.result_queue.append(None)
+
+    def _discard_gen(self) -> PQGen[None]:
+        """
+        Generator receiving the results pending after an error.
+
+        Further errors are only logged, to not clobber the one being handled.
+        """
+        try:
+            yield from self._sync_gen()
+        except Exception as ex:
+            logger.warning("error ignored syncing %r: %s", self, ex)
+
+    def _fetch_gen(self, *, flush: bool) -> PQGen[None]:
+        """
+        Generator receiving the results of all the operations queued.
+
+        If *flush* is true, ask the server to send the results of the
+        operations received so far, otherwise they would only be sent upon
+        the next synchronization point.
+
+        Pass the results to the cursors which requested them. If any of the
+        operation failed raise the first error, after all the results have
+        been received.
+        """
+        if not self.result_queue:
+            return
+
+        if flush:
+            self.pgconn.send_flush_request()
+        yield from send(self.pgconn)
+
+        first_error: Optional[e.Error] = None
+        while self.result_queue:
+            queued = self.result_queue.popleft()
+            if queued is None:
+                res = yield from fetch(self.pgconn)
+                if not res or res.status != ExecStatus.PIPELINE_SYNC:
+                    raise e.InternalError(
+                        f"expected pipeline sync, got"
+                        f" {ExecStatus(res.status).name if res else None}"
+                    )
+                continue
+
+            results = yield from fetch_many(self.pgconn)
+            try:
+                self._process_results(queued, results)
+            except e.Error as ex:
+                if not first_error:
+                    first_error = ex
+
+        if first_error:
+            raise first_error
+
+    def _process_results(
+        self, queued: PendingResult, results: Sequence["PGresult"]
+    ) -> None:
+        """
+        Dispatch the results of an operation to the requesting handler.
+
+        Maintain the prepared statements cache, if needed.
+        """
+        if not results:
+            raise e.InternalError("got no result from the query")
+
+        handler, prepinfo = queued
+        if handler:
+            handler(results)
+        else:
+            res = results[-1]
+            if res.status == ExecStatus.FATAL_ERROR:
+                raise e.error_from_result(
+                    res, encoding=self._conn.client_encoding
+                )
+            elif res.status == ExecStatus.PIPELINE_ABORTED:
+                raise e.PipelineAborted("pipeline aborted")
+
+        if prepinfo:
+            pgq, prep, name = prepinfo
+            self._conn._prepared.maintain(pgq, results, prep, name)
+
+
+class Pipeline(BasePipeline):
+    """Handler for connection in pipeline mode."""
+
+    __module__ = "psycopg3"
+    _conn: "Connection"
+
+    def __init__(self, conn: "Connection"):
+        super().__init__(conn)
+
+    def sync(self) -> None:
+        """Sync the pipeline, send any pending command and receive all the
+        results.
+
+        Raise the first error received from the server, if any.
+        """
+        with self._conn.lock:
+            self._conn.wait(self._sync_gen())
+
+    def __enter__(self) -> "Pipeline":
+        with self._conn.lock:
+            self._enter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        with self._conn.lock:
+            try:
+                if not exc_val:
+                    self._conn.wait(self._sync_gen())
+                else:
+                    # Don't clobber an exception raised in the block
+                    self._conn.wait(self._discard_gen())
+            finally:
+                self._exit()
+
+
+class AsyncPipeline(BasePipeline):
+    """Handler for async connection in pipeline mode."""
+
+    __module__ = "psycopg3"
+    _conn: "AsyncConnection"
+
+    def __init__(self, conn: "AsyncConnection"):
+        super().__init__(conn)
+
+    async def sync(self) -> None:
+        """Sync the pipeline, send any pending command and receive all the
+        results.
+
+        Raise the first error received from the server, if any.
+        """
+        async with self._conn.lock:
+            await self._conn.wait(self._sync_gen())
+
+    async def __aenter__(self) -> "AsyncPipeline":
+        async with self._conn.lock:
+            self._enter()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        async with self._conn.lock:
+            try:
+                if not exc_val:
+                    await self._conn.wait(self._sync_gen())
+                else:
+                    # Don't clobber an exception raised in the block
+                    await self._conn.wait(self._discard_gen())
+            finally:
+                self._exit()
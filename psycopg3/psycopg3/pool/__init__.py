@@ -0,0 +1,17 @@
+"""
+psycopg3 connection pool package
+"""
+
+# Copyright (C) 2021 The Psycopg Team
+
+from .pool import ConnectionPool
+from .async_pool import AsyncConnectionPool
+from .errors import PoolClosed, PoolTimeout, TooManyRequests
+
+__all__ = [
+    "AsyncConnectionPool",
+    "ConnectionPool",
+    "PoolClosed",
+    "PoolTimeout",
+    "TooManyRequests",
+]
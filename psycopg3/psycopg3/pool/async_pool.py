@@ -0,0 +1,694 @@
+"""
+psycopg3 asynchronous connection pool
+"""
+
+# Copyright (C) 2021 The Psycopg Team
+
+import sys
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from time import monotonic
+from types import TracebackType
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque
+from typing import List, Optional, Set, Type
+from weakref import ref
+from collections import deque
+
+from .. import errors as e
+from ..pq import TransactionStatus
+from ..connection import AsyncConnection
+
+if sys.version_info >= (3, 7):
+    from contextlib import asynccontextmanager
+else:
+    from ..utils.context import asynccontextmanager
+
+from .base import BasePool, ConnectionAttempt
+from .errors import PoolClosed, PoolTimeout, TooManyRequests
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncConnectionPool(BasePool[AsyncConnection]):
+    """
+    A pool of `AsyncConnection` objects, maintained by asyncio tasks.
+    """
+
+    __module__ = "psycopg3.pool"
+
+    def __init__(
+        self,
+        conninfo: str = "",
+        *,
+        connection_class: Type[AsyncConnection] = AsyncConnection,
+        configure: Optional[
+            Callable[[AsyncConnection], Awaitable[None]]
+        ] = None,
+        **kwargs: Any,
+    ):
+        self.connection_class = connection_class
+        self._configure = configure
+
+        self._lock = asyncio.Lock()
+        self._waiting: Deque["AsyncClient"] = deque()
+
+        # to notify that the pool is full
+        self._pool_full_event: Optional[asyncio.Event] = None
+
+        # The maintenance tasks running and the ones scheduled in the future
+        self._tasks: Set["asyncio.Future[None]"] = set()
+        self._sched: Set[asyncio.TimerHandle] = set()
+
+        super().__init__(conninfo, **kwargs)
+
+        # Populate the pool with initial minconn connections in background
+        for i in range(self._nconns):
+            self.run_task(AddConnection(self))
+
+        # Schedule a task to shrink the pool if connections over minconn have
+        # remained unused.
+        self.schedule_task(ShrinkPool(self), self.max_idle)
+
+    def __del__(self) -> None:
+        # If the '_closed' property is not set we probably failed in __init__.
+        # Don't try anything complicated as probably it won't work.
+        if getattr(self, "_closed", True):
+            return
+
+        self._stop_tasks()
+        for conn in self._pool:
+            conn.pgconn.finish()
+
+    async def wait(self, timeout: float = 30.0) -> None:
+        """
+        Wait for the pool to be full after init.
+
+        Raise `PoolTimeout` if not ready within *timeout* sec.
+        """
+        async with self._lock:
+            assert not self._pool_full_event
+            if len(self._pool) >= self._nconns:
+                return
+            self._pool_full_event = asyncio.Event()
+
+        logger.info("waiting for pool %r initialization", self.name)
+        try:
+            await asyncio.wait_for(self._pool_full_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            await self.close()  # stop all the tasks
+            raise PoolTimeout(
+                f"pool initialization incomplete after {timeout} sec"
+            ) from None
+
+        async with self._lock:
+            self._pool_full_event = None
+
+        logger.info("pool %r is ready to use", self.name)
+
+    @asynccontextmanager
+    async def connection(
+        self, timeout: Optional[float] = None
+    ) -> AsyncIterator[AsyncConnection]:
+        """Context manager to obtain a connection from the pool.
+
+        Return the connection immediately if available, otherwise wait up to
+        *timeout* or `self.timeout` and throw `PoolTimeout` if a connection is
+        not available in time.
+
+        Upon context exit, return the connection to the pool. Apply the normal
+        connection context behaviour (commit/rollback the transaction in case
+        of success/error). If the connection is no more in working state
+        replace it with a new one.
+        """
+        conn = await self.getconn(timeout=timeout)
+        try:
+            async with conn:
+                yield conn
+        finally:
+            await self.putconn(conn)
+
+    async def getconn(
+        self, timeout: Optional[float] = None
+    ) -> AsyncConnection:
+        """Obtain a contection from the pool.
+
+        You should preferably use `connection()`. Use this function only if
+        it is not possible to use the connection as context manager.
+
+        After using this function you *must* call a corresponding `putconn()`:
+        failing to do so will deplete the pool. A depleted pool is a sad pool:
+        you don't want a depleted pool.
+        """
+        logger.debug("connection requested to %r", self.name)
+        # Critical section: decide here if there's a connection ready
+        # or if the client needs to wait.
+        async with self._lock:
+            if self._closed:
+                raise PoolClosed(f"the pool {self.name!r} is closed")
+
+            pos: Optional[AsyncClient] = None
+            conn = self._get_ready_conn()
+            if not conn:
+                if self.max_waiting and len(self._waiting) >= self.max_waiting:
+                    raise TooManyRequests(
+                        f"the pool {self.name!r} has aleady"
+                        f" {len(self._waiting)} requests waiting"
+                    )
+
+                # No connection available: put the client in the waiting queue
+                pos = AsyncClient()
+                self._waiting.append(pos)
+
+                # If there is space for the pool to grow, let's do it
+                if self._nconns < self._maxconn:
+                    self._nconns += 1
+                    logger.info(
+                        "growing pool %r to %s", self.name, self._nconns
+                    )
+                    self.run_task(AddConnection(self))
+
+        # If we are in the waiting queue, wait to be assigned a connection
+        # (outside the critical section, so only the waiting client is locked)
+        if pos:
+            if timeout is None:
+                timeout = self.timeout
+            try:
+                conn = await pos.wait(timeout=timeout)
+            except Exception:
+                async with self._lock:
+                    try:
+                        self._waiting.remove(pos)
+                    except ValueError:
+                        # The client was served in the meantime
+                        pass
+                raise
+
+        # Tell the connection it belongs to a pool to avoid closing on __exit__
+        # Note that this property shouldn't be set while the connection is in
+        # the pool, to avoid to create a reference loop.
+        assert conn
+        conn._pool = self
+        logger.debug("connection given by %r", self.name)
+        return conn
+
+    def _get_ready_conn(self) -> Optional[AsyncConnection]:
+        """
+        Return a connection from the pool, if there is one ready to be served.
+
+        Don't talk to the server: only discard the connections known to be
+        broken or expired, and replace them in background. Must be called
+        holding the lock.
+        """
+        while self._pool:
+            conn = self._pool.popleft()
+            if len(self._pool) < self._nconns_min:
+                self._nconns_min = len(self._pool)
+
+            if self._check_conn(conn):
+                return conn
+
+            self.run_task(ReplaceConnection(self, conn))
+
+        return None
+
+    async def putconn(self, conn: AsyncConnection) -> None:
+        """Return a connection to the loving hands of its pool.
+
+        Use this function only paired with a `getconn()`. You don't need to use
+        it if you use the much more comfortable `connection()` context manager.
+        """
+        # Quick check to discard the wrong connection
+        pool = getattr(conn, "_pool", None)
+        if pool is not self:
+            if pool:
+                msg = f"it comes from pool {pool.name!r}"
+            else:
+                msg = "it doesn't come from any pool"
+            raise ValueError(
+                f"can't return connection to pool {self.name!r}, {msg}: {conn}"
+            )
+
+        logger.debug("returning connection to %r", self.name)
+
+        # If the pool is closed just close the connection instead of returning
+        # it to the pool. For extra refcare remove the pool reference from it.
+        if self._closed:
+            conn._pool = None
+            await conn.close()
+            return
+
+        # If the connection is clean, put it back immediately; otherwise use a
+        # background task to perform the maintenance work.
+        if (
+            conn.pgconn.transaction_status == TransactionStatus.IDLE
+            and self._check_conn(conn)
+        ):
+            await self._return_connection(conn)
+        else:
+            self.run_task(ReturnConnection(self, conn))
+
+    async def close(self, timeout: float = 1.0) -> None:
+        """Close the pool and make it unavailable to new clients.
+
+        All the waiting and future client will fail to acquire a connection
+        with a `PoolClosed` exception. Currently used connections will not be
+        closed until returned to the pool.
+
+        Wait *timeout* for background tasks to terminate their job, if
+        positive.
+        """
+        if self._closed:
+            return
+
+        async with self._lock:
+            self._closed = True
+            logger.debug("pool %r closed", self.name)
+
+            # Take waiting client and pool connections out of the state
+            waiting = list(self._waiting)
+            self._waiting.clear()
+            pool = list(self._pool)
+            self._pool.clear()
+
+        # Now that the flag _closed is set, getconn will fail immediately,
+        # putconn will just close the returned connection.
+        tasks = self._stop_tasks()
+
+        # Signal to eventual clients in the queue that business is closed.
+        for pos in waiting:
+            pos.fail(PoolClosed(f"the pool {self.name!r} is closed"))
+
+        # Close the connections still in the pool
+        for conn in pool:
+            await conn.close()
+
+        # Wait for the tasks to terminate
+        if timeout > 0 and tasks:
+            done, pending = await asyncio.wait(tasks, timeout=timeout)
+            if pending:
+                logger.warning(
+                    "couldn't stop %s tasks in pool %r within %s seconds",
+                    len(pending),
+                    self.name,
+                    timeout,
+                )
+
+    def _stop_tasks(self) -> List["asyncio.Future[None]"]:
+        """
+        Cancel the scheduled tasks and return the ones currently running.
+        """
+        for handle in self._sched:
+            handle.cancel()
+        self._sched.clear()
+        return list(self._tasks)
+
+    async def __aenter__(self) -> "AsyncConnectionPool":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def reconnect_failed(self) -> None:
+        """
+        Called when reconnection failed for longer than `reconnect_timeout`.
+
+        By default it does nothing: subclasses may override it, for instance
+        to alert or to terminate the program.
+        """
+        pass
+
+    def run_task(self, task: "MaintenanceTask") -> None:
+        """Run a maintenance task in a background asyncio task.
+
+        Every task runs concurrently to the others, so that, for instance,
+        several connections can be created at the same time.
+        """
+        fut = asyncio.ensure_future(task.run())
+        self._tasks.add(fut)
+        fut.add_done_callback(self._task_done)
+
+    def schedule_task(self, task: "MaintenanceTask", delay: float) -> None:
+        """Run a maintenance task in a background task in the future."""
+        loop = asyncio.get_event_loop()
+        handle: asyncio.TimerHandle
+        # Don't let the event loop keep the pool alive
+        wself = ref(self)
+
+        def tick() -> None:
+            pool = wself()
+            if pool:
+                pool._sched.discard(handle)
+            task.tick()
+
+        handle = loop.call_later(delay, tick)
+        self._sched.add(handle)
+
+    def _task_done(self, fut: "asyncio.Future[None]") -> None:
+        self._tasks.discard(fut)
+        if fut.cancelled():
+            return
+
+        # Make sure the exception doesn't go unretrieved.
+        ex = fut.exception()
+        if ex:
+            logger.warning(
+                "task run in pool %r failed: %s: %s",
+                self.name,
+                ex.__class__.__name__,
+                ex,
+            )
+
+    async def _connect(self) -> AsyncConnection:
+        """Return a new connection configured for the pool."""
+        conn = await self.connection_class.connect(
+            self.conninfo, **self.kwargs
+        )
+        if self._configure:
+            await self._configure(conn)
+            status = conn.pgconn.transaction_status
+            if status != TransactionStatus.IDLE:
+                sname = TransactionStatus(status).name
+                await conn.close()
+                raise e.ProgrammingError(
+                    f"connection left in status {sname} by configure function"
+                    f" {self._configure}: discarded"
+                )
+
+        self._set_expire(conn)
+        return conn
+
+    async def _add_connection(
+        self, attempt: Optional[ConnectionAttempt]
+    ) -> None:
+        """Try to connect and add the connection to the pool.
+
+        If failed, reschedule a new attempt in the future for a few times, then
+        give up, decrease the pool connections number and call
+        `self.reconnect_failed()`.
+
+        """
+        now = monotonic()
+        if not attempt:
+            attempt = ConnectionAttempt(
+                reconnect_timeout=self.reconnect_timeout
+            )
+
+        try:
+            conn = await self._connect()
+        except Exception as ex:
+            logger.warning("error connecting in %r: %s", self.name, ex)
+            if attempt.time_to_give_up(now):
+                logger.warning(
+                    "reconnection attempt in pool %r failed after %s sec",
+                    self.name,
+                    self.reconnect_timeout,
+                )
+                async with self._lock:
+                    self._nconns -= 1
+                await self.reconnect_failed()
+            else:
+                attempt.update_delay(now)
+                self.schedule_task(AddConnection(self, attempt), attempt.delay)
+        else:
+            await self._add_to_pool(conn)
+
+    async def _return_connection(self, conn: AsyncConnection) -> None:
+        """
+        Return a connection to the pool after usage.
+        """
+        conn._pool = None
+        await self._reset_connection(conn)
+        if conn.pgconn.transaction_status == TransactionStatus.UNKNOWN:
+            # Connection no more in working state: create a new one.
+            logger.warning("discarding closed connection: %s", conn)
+            self.run_task(AddConnection(self))
+            return
+
+        # Check if the connection is past its best before date
+        if conn._expire_at <= monotonic():
+            logger.info("discarding expired connection")
+            await conn.close()
+            self.run_task(AddConnection(self))
+            return
+
+        await self._add_to_pool(conn)
+
+    async def _replace_connection(self, conn: AsyncConnection) -> None:
+        """
+        Close a connection found broken or expired and create a new one.
+        """
+        logger.info("replacing connection %s in pool %r", conn, self.name)
+        await conn.close()
+        await self._add_connection(None)
+
+    async def _add_to_pool(self, conn: AsyncConnection) -> None:
+        """
+        Add a connection to the pool.
+
+        The connection can be a fresh one or one already used in the pool.
+
+        If a client is already waiting for a connection pass it on, otherwise
+        put it back into the pool
+        """
+        # Critical section: if there is a client waiting give it the connection
+        # otherwise put it back into the pool.
+        async with self._lock:
+            # The pool was closed while the connection was being created
+            # or returned: don't leak it into a pool nobody will empty.
+            if self._closed:
+                await conn.close()
+                return
+
+            while self._waiting:
+                # If there is a client waiting (which is still waiting and
+                # hasn't timed out), give it the connection and notify it.
+                pos = self._waiting.popleft()
+                if pos.set(conn):
+                    break
+            else:
+                # No client waiting for a connection: put it back into the pool
+                self._pool.append(conn)
+
+                # If we have been asked to wait for pool init, notify the
+                # waiter if the pool is full.
+                if self._pool_full_event and len(self._pool) >= self._nconns:
+                    self._pool_full_event.set()
+
+    async def _reset_connection(self, conn: AsyncConnection) -> None:
+        """
+        Bring a connection to IDLE state or close it.
+        """
+        status = conn.pgconn.transaction_status
+        if status == TransactionStatus.IDLE:
+            return
+
+        if status in (TransactionStatus.INTRANS, TransactionStatus.INERROR):
+            # Connection returned with an active transaction
+            logger.warning("rolling back returned connection: %s", conn)
+            try:
+                await conn.rollback()
+            except Exception as ex:
+                logger.warning(
+                    "rollback failed: %s: %s. Discarding connection %s",
+                    ex.__class__.__name__,
+                    ex,
+                    conn,
+                )
+                await conn.close()
+
+        elif status == TransactionStatus.ACTIVE:
+            # Connection returned during an operation. Bad... just close it.
+            logger.warning("closing returned connection: %s", conn)
+            await conn.close()
+
+    async def _shrink_pool(self) -> None:
+        to_close: Optional[AsyncConnection] = None
+
+        async with self._lock:
+            # Reset the min number of connections used
+            nconns_min = self._nconns_min
+            self._nconns_min = len(self._pool)
+
+            # If the pool can shrink and connections were unused, drop one
+            if self._nconns > self._minconn and nconns_min > 0:
+                to_close = self._pool.popleft()
+                self._nconns -= 1
+                self._nconns_min -= 1
+
+        # Close the connection outside the critical section: the clients
+        # don't have to wait for it.
+        if to_close:
+            logger.info(
+                "shrinking pool %r to %s because %s unused connections"
+                " in the last %s sec",
+                self.name,
+                self._nconns,
+                nconns_min,
+                self.max_idle,
+            )
+            await to_close.close()
+
+
+class AsyncClient:
+    """A position in a queue for a client waiting for a connection."""
+
+    __slots__ = ("_fut",)
+
+    def __init__(self) -> None:
+        # The future is cancelled by wait_for() on timeout: after that the
+        # client won't accept a connection anymore, which would get lost.
+        loop = asyncio.get_event_loop()
+        self._fut: "asyncio.Future[AsyncConnection]" = loop.create_future()
+
+    async def wait(self, timeout: float) -> AsyncConnection:
+        """Wait for a connection to be set and return it.
+
+        Raise an exception if the wait times out or if fail() is called.
+        """
+        try:
+            return await asyncio.wait_for(self._fut, timeout)
+        except asyncio.TimeoutError:
+            raise PoolTimeout(
+                f"couldn't get a connection after {timeout} sec"
+            ) from None
+
+    def set(self, conn: AsyncConnection) -> bool:
+        """Signal the client waiting that a connection is ready.
+
+        Return True if the client has "accepted" the connection, False
+        otherwise (typically because wait() has timed out).
+        """
+        if self._fut.done():
+            return False
+
+        self._fut.set_result(conn)
+        return True
+
+    def fail(self, error: Exception) -> bool:
+        """Signal the client that, alas, they won't have a connection today.
+
+        Return True if the client has "accepted" the error, False otherwise
+        (typically because wait() has timed out).
+        """
+        if self._fut.done():
+            return False
+
+        self._fut.set_exception(error)
+        return True
+
+
+class MaintenanceTask(ABC):
+    """A task to run asynchronously to maintain the pool state."""
+
+    def __init__(self, pool: "AsyncConnectionPool"):
+        self.pool = ref(pool)
+        logger.debug("task created: %s", self)
+
+    def __repr__(self) -> str:
+        pool = self.pool()
+        name = repr(pool.name) if pool else "<pool is gone>"
+        return f"<{self.__class__.__name__} {name} at 0x{id(self):x}>"
+
+    async def run(self) -> None:
+        """Run the task.
+
+        This usually happens in a background asyncio task. Call the concrete
+        _run() implementation, if the pool is still alive.
+        """
+        pool = self.pool()
+        if not pool or pool.closed:
+            # Pool is no more working. Quietly discard the operation.
+            return
+
+        logger.debug("task running: %s", self)
+        await self._run(pool)
+
+    def tick(self) -> None:
+        """Run the scheduled task
+
+        This function is called by the event loop when the task is due: start
+        a new asyncio task to run it.
+        """
+        pool = self.pool()
+        if not pool or pool.closed:
+            # Pool is no more working. Quietly discard the operation.
+            return
+
+        pool.run_task(self)
+
+    @abstractmethod
+    async def _run(self, pool: "AsyncConnectionPool") -> None:
+        ...
+
+
+class AddConnection(MaintenanceTask):
+    def __init__(
+        self,
+        pool: "AsyncConnectionPool",
+        attempt: Optional[ConnectionAttempt] = None,
+    ):
+        super().__init__(pool)
+        self.attempt = attempt
+
+    async def _run(self, pool: "AsyncConnectionPool") -> None:
+        await pool._add_connection(self.attempt)
+
+
+class ReturnConnection(MaintenanceTask):
+    """Clean up and return a connection to the pool."""
+
+    def __init__(self, pool: "AsyncConnectionPool", conn: AsyncConnection):
+        super().__init__(pool)
+        self.conn = conn
+
+    async def run(self) -> None:
+        pool = self.pool()
+        if not pool or pool.closed:
+            # Nobody will use this connection anymore
+            self.conn._pool = None
+            await self.conn.close()
+            return
+
+        await super().run()
+
+    async def _run(self, pool: "AsyncConnectionPool") -> None:
+        await pool._return_connection(self.conn)
+
+
+class ReplaceConnection(MaintenanceTask):
+    """Close a connection found unusable and create a new one."""
+
+    def __init__(self, pool: "AsyncConnectionPool", conn: AsyncConnection):
+        super().__init__(pool)
+        self.conn = conn
+
+    async def run(self) -> None:
+        pool = self.pool()
+        if not pool or pool.closed:
+            await self.conn.close()
+            return
+
+        await super().run()
+
+    async def _run(self, pool: "AsyncConnectionPool") -> None:
+        await pool._replace_connection(self.conn)
+
+
+class ShrinkPool(MaintenanceTask):
+    """If the pool can shrink, remove one connection.
+
+    Re-schedule periodically and also reset the minimum number of connections
+    in the pool.
+    """
+
+    async def _run(self, pool: "AsyncConnectionPool") -> None:
+        # Reschedule the task now so that in case of any error we don't lose
+        # the periodic run.
+        pool.schedule_task(self, pool.max_idle)
+        await pool._shrink_pool()
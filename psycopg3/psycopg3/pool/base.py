@@ -0,0 +1,161 @@
+"""
+psycopg3 connection pool base class and functionalities.
+"""
+
+# Copyright (C) 2021 The Psycopg Team
+
+import random
+import logging
+from time import monotonic
+from typing import Any, Deque, Dict, Generic, Optional
+from collections import deque
+
+from ..pq import TransactionStatus
+from ..proto import ConnectionType
+
+logger = logging.getLogger(__name__)
+
+
+class BasePool(Generic[ConnectionType]):
+    """
+    Base class for the connection pools.
+
+    Implement the parameters handling and the bookkeeping shared by the
+    sync/async implementations; the subclasses implement the interfaces using
+    threads or asyncio tasks.
+    """
+
+    # Used to generate pool names
+    _num_pool = 0
+
+    def __init__(
+        self,
+        conninfo: str = "",
+        *,
+        kwargs: Optional[Dict[str, Any]] = None,
+        minconn: int = 4,
+        maxconn: Optional[int] = None,
+        name: Optional[str] = None,
+        timeout: float = 30.0,
+        max_waiting: int = 0,
+        max_lifetime: float = 60 * 60.0,
+        max_idle: float = 10 * 60.0,
+        reconnect_timeout: float = 5 * 60.0,
+        num_workers: int = 3,
+    ):
+        if maxconn is None:
+            maxconn = minconn
+        if maxconn < minconn:
+            raise ValueError("maxconn must be greater or equal than minconn")
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+
+        if not name:
+            num = BasePool._num_pool = BasePool._num_pool + 1
+            name = f"pool-{num}"
+
+        self.conninfo = conninfo
+        self.kwargs: Dict[str, Any] = kwargs or {}
+        self.name = name
+        self._minconn = minconn
+        self._maxconn = maxconn
+        self.timeout = timeout
+        self.max_waiting = max_waiting
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.reconnect_timeout = reconnect_timeout
+        self.num_workers = num_workers
+
+        # Number of connections the pool is responsible for: the ones in the
+        # pool, the ones given to the clients and the ones being prepared.
+        self._nconns = minconn
+
+        # The connections ready to be served to the clients.
+        self._pool: Deque[ConnectionType] = deque()
+
+        # Min number of connections in the pool in a max_idle unit of time.
+        # It is reset periodically by the ShrinkPool scheduled task.
+        # It is used to shrink back the pool if maxconn > minconn and extra
+        # connections have been acquired, if we notice that in the last
+        # max_idle time we didn't need all of them.
+        self._nconns_min = minconn
+
+        self._closed = False
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__module__}.{self.__class__.__name__}"
+            f" {self.name!r} at 0x{id(self):x}>"
+        )
+
+    @property
+    def minconn(self) -> int:
+        """The minimum number of connections kept in the pool."""
+        return self._minconn
+
+    @property
+    def maxconn(self) -> int:
+        """The maximum number of connections the pool can grow to."""
+        return self._maxconn
+
+    @property
+    def closed(self) -> bool:
+        """`!True` if the pool is closed."""
+        return self._closed
+
+    def _check_conn(self, conn: ConnectionType) -> bool:
+        """
+        Check, without talking to the server, if *conn* can be served.
+
+        Return `!False` if the connection is broken or has lived longer than
+        `max_lifetime`: in this case it should be replaced.
+        """
+        if conn.pgconn.transaction_status == TransactionStatus.UNKNOWN:
+            return False
+        if conn._expire_at <= monotonic():
+            return False
+        return True
+
+    def _set_expire(self, conn: ConnectionType) -> None:
+        """Set the time after which *conn* should be replaced."""
+        # Don't make all the connections expire at the same moment
+        conn._expire_at = monotonic() + self._jitter(
+            self.max_lifetime, -0.05, 0.0
+        )
+
+    @staticmethod
+    def _jitter(value: float, min_pc: float, max_pc: float) -> float:
+        """
+        Add a random value to *value* between *min_pc* and *max_pc* percent.
+        """
+        return value * (1.0 + ((max_pc - min_pc) * random.random()) + min_pc)
+
+
+class ConnectionAttempt:
+    """Keep the state of a connection attempt."""
+
+    INITIAL_DELAY = 1.0
+    DELAY_JITTER = 0.1
+    DELAY_BACKOFF = 2.0
+
+    def __init__(self, *, reconnect_timeout: float):
+        self.reconnect_timeout = reconnect_timeout
+        self.delay = 0.0
+        self.give_up_at = 0.0
+
+    def update_delay(self, now: float) -> None:
+        """Calculate how long to wait for a new connection attempt"""
+        if self.delay == 0.0:
+            self.give_up_at = now + self.reconnect_timeout
+            self.delay = BasePool._jitter(
+                self.INITIAL_DELAY, -self.DELAY_JITTER, self.DELAY_JITTER
+            )
+        else:
+            self.delay *= self.DELAY_BACKOFF
+
+        if self.delay + now > self.give_up_at:
+            self.delay = max(0.0, self.give_up_at - now)
+
+    def time_to_give_up(self, now: float) -> bool:
+        """Return True if we are tired of trying to connect. Meh."""
+        return self.give_up_at > 0.0 and now >= self.give_up_at
@@ -0,0 +1,734 @@
+"""
+psycopg3 synchronous connection pool
+"""
+
+# Copyright (C) 2021 The Psycopg Team
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+from time import monotonic
+from queue import Queue, Empty
+from types import TracebackType
+from typing import Any, Callable, Deque, Iterator, List, Optional, Type
+from weakref import ref
+from contextlib import contextmanager
+from collections import deque
+
+from .. import errors as e
+from ..pq import TransactionStatus
+from ..connection import Connection
+
+from .base import BasePool, ConnectionAttempt
+from .sched import Scheduler
+from .errors import PoolClosed, PoolTimeout, TooManyRequests
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool(BasePool[Connection]):
+    """
+    A pool of `Connection` objects, maintained by background threads.
+    """
+
+    __module__ = "psycopg3.pool"
+
+    def __init__(
+        self,
+        conninfo: str = "",
+        *,
+        connection_class: Type[Connection] = Connection,
+        configure: Optional[Callable[[Connection], None]] = None,
+        **kwargs: Any,
+    ):
+        self.connection_class = connection_class
+        self._configure = configure
+
+        self._lock = threading.RLock()
+        self._waiting: Deque["WaitingClient"] = deque()
+
+        # to notify that the pool is full
+        self._pool_full_event: Optional[threading.Event] = None
+
+        self._sched = Scheduler()
+        self._tasks: "Queue[MaintenanceTask]" = Queue()
+        self._workers: List[threading.Thread] = []
+
+        super().__init__(conninfo, **kwargs)
+
+        self._sched_runner = threading.Thread(
+            target=self._sched.run, name=f"{self.name}-scheduler", daemon=True
+        )
+        for i in range(self.num_workers):
+            t = threading.Thread(
+                target=self.worker,
+                args=(self._tasks,),
+                name=f"{self.name}-worker-{i}",
+                daemon=True,
+            )
+            self._workers.append(t)
+
+        # The object state is complete. Start the worker threads
+        self._sched_runner.start()
+        for t in self._workers:
+            t.start()
+
+        # Populate the pool with initial minconn connections in background
+        for i in range(self._nconns):
+            self.run_task(AddConnection(self))
+
+        # Schedule a task to shrink the pool if connections over minconn have
+        # remained unused.
+        self.schedule_task(ShrinkPool(self), self.max_idle)
+
+    def __del__(self) -> None:
+        # If the '_closed' property is not set we probably failed in __init__.
+        # Don't try anything complicated as probably it won't work.
+        if getattr(self, "_closed", True):
+            return
+
+        # Close the idle connections, to avoid to leave them to the gc.
+        self._stop_workers(connections=list(self._pool))
+
+    def wait(self, timeout: float = 30.0) -> None:
+        """
+        Wait for the pool to be full after init.
+
+        Raise `PoolTimeout` if not ready within *timeout* sec.
+        """
+        with self._lock:
+            assert not self._pool_full_event
+            if len(self._pool) >= self._nconns:
+                return
+            self._pool_full_event = threading.Event()
+
+        logger.info("waiting for pool %r initialization", self.name)
+        if not self._pool_full_event.wait(timeout):
+            self.close()  # stop all the threads
+            raise PoolTimeout(
+                f"pool initialization incomplete after {timeout} sec"
+            )
+
+        with self._lock:
+            self._pool_full_event = None
+
+        logger.info("pool %r is ready to use", self.name)
+
+    @contextmanager
+    def connection(
+        self, timeout: Optional[float] = None
+    ) -> Iterator[Connection]:
+        """Context manager to obtain a connection from the pool.
+
+        Return the connection immediately if available, otherwise wait up to
+        *timeout* or `self.timeout` and throw `PoolTimeout` if a connection is
+        not available in time.
+
+        Upon context exit, return the connection to the pool. Apply the normal
+        connection context behaviour (commit/rollback the transaction in case
+        of success/error). If the connection is no more in working state
+        replace it with a new one.
+        """
+        conn = self.getconn(timeout=timeout)
+        try:
+            with conn:
+                yield conn
+        finally:
+            self.putconn(conn)
+
+    def getconn(self, timeout: Optional[float] = None) -> Connection:
+        """Obtain a contection from the pool.
+
+        You should preferably use `connection()`. Use this function only if
+        it is not possible to use the connection as context manager.
+
+        After using this function you *must* call a corresponding `putconn()`:
+        failing to do so will deplete the pool. A depleted pool is a sad pool:
+        you don't want a depleted pool.
+        """
+        logger.debug("connection requested to %r", self.name)
+        # Critical section: decide here if there's a connection ready
+        # or if the client needs to wait.
+        with self._lock:
+            if self._closed:
+                raise PoolClosed(f"the pool {self.name!r} is closed")
+
+            pos: Optional[WaitingClient] = None
+            conn = self._get_ready_conn()
+            if not conn:
+                if self.max_waiting and len(self._waiting) >= self.max_waiting:
+                    raise TooManyRequests(
+                        f"the pool {self.name!r} has aleady"
+                        f" {len(self._waiting)} requests waiting"
+                    )
+
+                # No connection available: put the client in the waiting queue
+                pos = WaitingClient()
+                self._waiting.append(pos)
+
+                # If there is space for the pool to grow, let's do it
+                if self._nconns < self._maxconn:
+                    self._nconns += 1
+                    logger.info(
+                        "growing pool %r to %s", self.name, self._nconns
+                    )
+                    self.run_task(AddConnection(self))
+
+        # If we are in the waiting queue, wait to be assigned a connection
+        # (outside the critical section, so only the waiting client is locked)
+        if pos:
+            if timeout is None:
+                timeout = self.timeout
+            try:
+                conn = pos.wait(timeout=timeout)
+            except Exception:
+                with self._lock:
+                    try:
+                        self._waiting.remove(pos)
+                    except ValueError:
+                        # The client was served in the meantime
+                        pass
+                raise
+
+        # Tell the connection it belongs to a pool to avoid closing on __exit__
+        # Note that this property shouldn't be set while the connection is in
+        # the pool, to avoid to create a reference loop.
+        assert conn
+        conn._pool = self
+        logger.debug("connection given by %r", self.name)
+        return conn
+
+    def _get_ready_conn(self) -> Optional[Connection]:
+        """
+        Return a connection from the pool, if there is one ready to be served.
+
+        Don't talk to the server: only discard the connections known to be
+        broken or expired, and replace them in background. Must be called
+        holding the lock.
+        """
+        while self._pool:
+            conn = self._pool.popleft()
+            if len(self._pool) < self._nconns_min:
+                self._nconns_min = len(self._pool)
+
+            if self._check_conn(conn):
+                return conn
+
+            self.run_task(ReplaceConnection(self, conn))
+
+        return None
+
+    def putconn(self, conn: Connection) -> None:
+        """Return a connection to the loving hands of its pool.
+
+        Use this function only paired with a `getconn()`. You don't need to use
+        it if you use the much more comfortable `connection()` context manager.
+        """
+        # Quick check to discard the wrong connection
+        pool = getattr(conn, "_pool", None)
+        if pool is not self:
+            if pool:
+                msg = f"it comes from pool {pool.name!r}"
+            else:
+                msg = "it doesn't come from any pool"
+            raise ValueError(
+                f"can't return connection to pool {self.name!r}, {msg}: {conn}"
+            )
+
+        logger.debug("returning connection to %r", self.name)
+
+        # If the pool is closed just close the connection instead of returning
+        # it to the pool. For extra refcare remove the pool reference from it.
+        if self._closed:
+            conn._pool = None
+            conn.close()
+            return
+
+        # If the connection is clean, put it back immediately; otherwise use a
+        # worker to perform the maintenance work in a separate thread.
+        if (
+            conn.pgconn.transaction_status == TransactionStatus.IDLE
+            and self._check_conn(conn)
+        ):
+            self._return_connection(conn)
+        else:
+            self.run_task(ReturnConnection(self, conn))
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Close the pool and make it unavailable to new clients.
+
+        All the waiting and future client will fail to acquire a connection
+        with a `PoolClosed` exception. Currently used connections will not be
+        closed until returned to the pool.
+
+        Wait *timeout* for threads to terminate their job, if positive.
+        """
+        if self._closed:
+            return
+
+        with self._lock:
+            self._closed = True
+            logger.debug("pool %r closed", self.name)
+
+            # Take waiting client and pool connections out of the state
+            waiting = list(self._waiting)
+            self._waiting.clear()
+            pool = list(self._pool)
+            self._pool.clear()
+
+        # Now that the flag _closed is set, getconn will fail immediately,
+        # putconn will just close the returned connection.
+        self._stop_workers(waiting, pool, timeout)
+
+    def _stop_workers(
+        self,
+        waiting_clients: List["WaitingClient"] = [],
+        connections: List[Connection] = [],
+        timeout: float = 0.0,
+    ) -> None:
+
+        # Stop the scheduler
+        self._sched.enter(0, None)
+
+        # Stop the worker threads
+        for i in range(len(self._workers)):
+            self.run_task(StopWorker(self))
+
+        # Signal to eventual clients in the queue that business is closed.
+        for pos in waiting_clients:
+            pos.fail(PoolClosed(f"the pool {self.name!r} is closed"))
+
+        # Close the connections still in the pool
+        for conn in connections:
+            conn.close()
+
+        # Wait for the worker threads to terminate
+        if timeout > 0:
+            current = threading.current_thread()
+            for t in [self._sched_runner] + self._workers:
+                if not t.is_alive() or t is current:
+                    continue
+                t.join(timeout)
+                if t.is_alive():
+                    logger.warning(
+                        "couldn't stop thread %s in pool %r within %s seconds",
+                        t,
+                        self.name,
+                        timeout,
+                    )
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def reconnect_failed(self) -> None:
+        """
+        Called when reconnection failed for longer than `reconnect_timeout`.
+
+        The function is called in a worker thread. By default it does nothing:
+        subclasses may override it, for instance to alert or to terminate the
+        program.
+        """
+        pass
+
+    def run_task(self, task: "MaintenanceTask") -> None:
+        """Run a maintenance task in a worker thread."""
+        self._tasks.put_nowait(task)
+
+    def schedule_task(self, task: "MaintenanceTask", delay: float) -> None:
+        """Run a maintenance task in a worker thread in the future."""
+        self._sched.enter(delay, task.tick)
+
+    _WORKER_TIMEOUT = 60.0
+
+    @classmethod
+    def worker(cls, q: "Queue[MaintenanceTask]") -> None:
+        """Runner to execute pending maintenance task.
+
+        The function is designed to run as a separate thread.
+
+        Block on the queue *q*, run a task received. Finish running if a
+        StopWorker is received.
+        """
+        # Don't make all the workers time out at the same moment
+        timeout = cls._jitter(cls._WORKER_TIMEOUT, -0.1, 0.1)
+        while True:
+            # Use a timeout to make the wait interruptable
+            try:
+                task = q.get(timeout=timeout)
+            except Empty:
+                continue
+
+            if isinstance(task, StopWorker):
+                logger.debug(
+                    "terminating working thread %s",
+                    threading.current_thread().name,
+                )
+                return
+
+            # Run the task. Make sure don't die in the attempt.
+            try:
+                task.run()
+            except Exception as ex:
+                logger.warning(
+                    "task run %s failed: %s: %s",
+                    task,
+                    ex.__class__.__name__,
+                    ex,
+                )
+
+    def _connect(self) -> Connection:
+        """Return a new connection configured for the pool."""
+        conn = self.connection_class.connect(self.conninfo, **self.kwargs)
+        if self._configure:
+            self._configure(conn)
+            status = conn.pgconn.transaction_status
+            if status != TransactionStatus.IDLE:
+                sname = TransactionStatus(status).name
+                conn.close()
+                raise e.ProgrammingError(
+                    f"connection left in status {sname} by configure function"
+                    f" {self._configure}: discarded"
+                )
+
+        self._set_expire(conn)
+        return conn
+
+    def _add_connection(self, attempt: Optional[ConnectionAttempt]) -> None:
+        """Try to connect and add the connection to the pool.
+
+        If failed, reschedule a new attempt in the future for a few times, then
+        give up, decrease the pool connections number and call
+        `self.reconnect_failed()`.
+
+        """
+        now = monotonic()
+        if not attempt:
+            attempt = ConnectionAttempt(
+                reconnect_timeout=self.reconnect_timeout
+            )
+
+        try:
+            conn = self._connect()
+        except Exception as ex:
+            logger.warning("error connecting in %r: %s", self.name, ex)
+            if attempt.time_to_give_up(now):
+                logger.warning(
+                    "reconnection attempt in pool %r failed after %s sec",
+                    self.name,
+                    self.reconnect_timeout,
+                )
+                with self._lock:
+                    self._nconns -= 1
+                self.reconnect_failed()
+            else:
+                attempt.update_delay(now)
+                self.schedule_task(AddConnection(self, attempt), attempt.delay)
+        else:
+            self._add_to_pool(conn)
+
+    def _return_connection(self, conn: Connection) -> None:
+        """
+        Return a connection to the pool after usage.
+        """
+        conn._pool = None
+        self._reset_connection(conn)
+        if conn.pgconn.transaction_status == TransactionStatus.UNKNOWN:
+            # Connection no more in working state: create a new one.
+            logger.warning("discarding closed connection: %s", conn)
+            self.run_task(AddConnection(self))
+            return
+
+        # Check if the connection is past its best before date
+        if conn._expire_at <= monotonic():
+            logger.info("discarding expired connection")
+            conn.close()
+            self.run_task(AddConnection(self))
+            return
+
+        self._add_to_pool(conn)
+
+    def _replace_connection(self, conn: Connection) -> None:
+        """
+        Close a connection found broken or expired and create a new one.
+        """
+        logger.info("replacing connection %s in pool %r", conn, self.name)
+        conn.close()
+        self._add_connection(None)
+
+    def _add_to_pool(self, conn: Connection) -> None:
+        """
+        Add a connection to the pool.
+
+        The connection can be a fresh one or one already used in the pool.
+
+        If a client is already waiting for a connection pass it on, otherwise
+        put it back into the pool
+        """
+        # Critical section: if there is a client waiting give it the connection
+        # otherwise put it back into the pool.
+        with self._lock:
+            # The pool was closed while the connection was being created
+            # or returned: don't leak it into a pool nobody will empty.
+            if self._closed:
+                conn.close()
+                return
+
+            while self._waiting:
+                # If there is a client waiting (which is still waiting and
+                # hasn't timed out), give it the connection and notify it.
+                pos = self._waiting.popleft()
+                if pos.set(conn):
+                    break
+            else:
+                # No client waiting for a connection: put it back into the pool
+                self._pool.append(conn)
+
+                # If we have been asked to wait for pool init, notify the
+                # waiter if the pool is full.
+                if self._pool_full_event and len(self._pool) >= self._nconns:
+                    self._pool_full_event.set()
+
+    def _reset_connection(self, conn: Connection) -> None:
+        """
+        Bring a connection to IDLE state or close it.
+        """
+        status = conn.pgconn.transaction_status
+        if status == TransactionStatus.IDLE:
+            return
+
+        if status in (TransactionStatus.INTRANS, TransactionStatus.INERROR):
+            # Connection returned with an active transaction
+            logger.warning("rolling back returned connection: %s", conn)
+            try:
+                conn.rollback()
+            except Exception as ex:
+                logger.warning(
+                    "rollback failed: %s: %s. Discarding connection %s",
+                    ex.__class__.__name__,
+                    ex,
+                    conn,
+                )
+                conn.close()
+
+        elif status == TransactionStatus.ACTIVE:
+            # Connection returned during an operation. Bad... just close it.
+            logger.warning("closing returned connection: %s", conn)
+            conn.close()
+
+    def _shrink_pool(self) -> None:
+        to_close: Optional[Connection] = None
+
+        with self._lock:
+            # Reset the min number of connections used
+            nconns_min = self._nconns_min
+            self._nconns_min = len(self._pool)
+
+            # If the pool can shrink and connections were unused, drop one
+            if self._nconns > self._minconn and nconns_min > 0:
+                to_close = self._pool.popleft()
+                self._nconns -= 1
+                self._nconns_min -= 1
+
+        if to_close:
+            logger.info(
+                "shrinking pool %r to %s because %s unused connections"
+                " in the last %s sec",
+                self.name,
+                self._nconns,
+                nconns_min,
+                self.max_idle,
+            )
+            to_close.close()
+
+
+class WaitingClient:
+    """A position in a queue for a client waiting for a connection."""
+
+    __slots__ = ("conn", "error", "_cond")
+
+    def __init__(self) -> None:
+        self.conn: Optional[Connection] = None
+        self.error: Optional[Exception] = None
+
+        # The WaitingClient behaves in a way similar to an Event, but we need
+        # to notify reliably the flagger that the waiter has "accepted" the
+        # message and it hasn't timed out yet, otherwise the pool may give a
+        # connection to a client that has already timed out getconn(), which
+        # will be lost.
+        self._cond = threading.Condition()
+
+    def wait(self, timeout: float) -> Connection:
+        """Wait for a connection to be set and return it.
+
+        Raise an exception if the wait times out or if fail() is called.
+        """
+        with self._cond:
+            if not (self.conn or self.error):
+                if not self._cond.wait(timeout):
+                    self.error = PoolTimeout(
+                        f"couldn't get a connection after {timeout} sec"
+                    )
+
+        if self.conn:
+            return self.conn
+        else:
+            assert self.error
+            raise self.error
+
+    def set(self, conn: Connection) -> bool:
+        """Signal the client waiting that a connection is ready.
+
+        Return True if the client has "accepted" the connection, False
+        otherwise (typically because wait() has timed out).
+        """
+        with self._cond:
+            if self.conn or self.error:
+                return False
+
+            self.conn = conn
+            self._cond.notify_all()
+            return True
+
+    def fail(self, error: Exception) -> bool:
+        """Signal the client that, alas, they won't have a connection today.
+
+        Return True if the client has "accepted" the error, False otherwise
+        (typically because wait() has timed out).
+        """
+        with self._cond:
+            if self.conn or self.error:
+                return False
+
+            self.error = error
+            self._cond.notify_all()
+            return True
+
+
+class MaintenanceTask(ABC):
+    """A task to run asynchronously to maintain the pool state."""
+
+    def __init__(self, pool: "ConnectionPool"):
+        self.pool = ref(pool)
+        logger.debug(
+            "task created in %s: %s", threading.current_thread().name, self
+        )
+
+    def __repr__(self) -> str:
+        pool = self.pool()
+        name = repr(pool.name) if pool else "<pool is gone>"
+        return f"<{self.__class__.__name__} {name} at 0x{id(self):x}>"
+
+    def run(self) -> None:
+        """Run the task.
+
+        This usually happens in a worker thread. Call the concrete _run()
+        implementation, if the pool is still alive.
+        """
+        pool = self.pool()
+        if not pool or pool.closed:
+            # Pool is no more working. Quietly discard the operation.
+            return
+
+        logger.debug(
+            "task running in %s: %s", threading.current_thread().name, self
+        )
+        self._run(pool)
+
+    def tick(self) -> None:
+        """Run the scheduled task
+
+        This function is called by the scheduler thread. Use a worker to
+        run the task for real in order to free the scheduler immediately.
+        """
+        pool = self.pool()
+        if not pool or pool.closed:
+            # Pool is no more working. Quietly discard the operation.
+            return
+
+        pool.run_task(self)
+
+    @abstractmethod
+    def _run(self, pool: "ConnectionPool") -> None:
+        ...
+
+
+class StopWorker(MaintenanceTask):
+    """Signal the maintenance thread to terminate."""
+
+    def _run(self, pool: "ConnectionPool") -> None:
+        pass
+
+
+class AddConnection(MaintenanceTask):
+    def __init__(
+        self,
+        pool: "ConnectionPool",
+        attempt: Optional[ConnectionAttempt] = None,
+    ):
+        super().__init__(pool)
+        self.attempt = attempt
+
+    def _run(self, pool: "ConnectionPool") -> None:
+        pool._add_connection(self.attempt)
+
+
+class ReturnConnection(MaintenanceTask):
+    """Clean up and return a connection to the pool."""
+
+    def __init__(self, pool: "ConnectionPool", conn: Connection):
+        super().__init__(pool)
+        self.conn = conn
+
+    def run(self) -> None:
+        pool = self.pool()
+        if not pool or pool.closed:
+            # Nobody will use this connection anymore
+            self.conn._pool = None
+            self.conn.close()
+            return
+
+        super().run()
+
+    def _run(self, pool: "ConnectionPool") -> None:
+        pool._return_connection(self.conn)
+
+
+class ReplaceConnection(MaintenanceTask):
+    """Close a connection found unusable and create a new one."""
+
+    def __init__(self, pool: "ConnectionPool", conn: Connection):
+        super().__init__(pool)
+        self.conn = conn
+
+    def run(self) -> None:
+        pool = self.pool()
+        if not pool or pool.closed:
+            self.conn.close()
+            return
+
+        super().run()
+
+    def _run(self, pool: "ConnectionPool") -> None:
+        pool._replace_connection(self.conn)
+
+
+class ShrinkPool(MaintenanceTask):
+    """If the pool can shrink, remove one connection.
+
+    Re-schedule periodically and also reset the minimum number of connections
+    in the pool.
+    """
+
+    def _run(self, pool: "ConnectionPool") -> None:
+        # Reschedule the task now so that in case of any error we don't lose
+        # the periodic run.
+        pool.schedule_task(self, pool.max_idle)
+        pool._shrink_pool()
@@ -16,7 +16,7 @@ from typing import Callable, List, Type
 from .misc import ConninfoOption, PGnotify, PGresAttDesc
 from .misc import error_message
 from ._enums import ConnStatus, DiagnosticField, ExecStatus, Format
-from ._enums import Ping, PollingStatus, TransactionStatus
+from ._enums import Ping, PipelineStatus, PollingStatus, TransactionStatus
 from . import proto
 
 logger = logging.getLogger(__name__)
@@ -27,6 +27,13 @@ __impl__: str
 Possible values include ``python``, ``c``, ``binary``.
 """
 
+__build_version__: int
+"""The libpq version the currently loaded implementation was built with.
+
+For the ``python`` implementation, which is not built, it is the version of
+the libpq currently loaded.
+"""
+
 version: Callable[[], int]
 PGconn: Type[proto.PGconn]
 PGresult: Type[proto.PGresult]
@@ -43,7 +50,8 @@ def import_from_libpq() -> None:
     try to import the best implementation available.
     """
     # import these names into the module on success as side effect
-    global __impl__, version, PGconn, PGresult, Conninfo, Escaping, PGcancel
+    global __impl__, __build_version__, version
+    global PGconn, PGresult, Conninfo, Escaping, PGcancel
 
     impl = os.environ.get("PSYCOPG3_IMPL", "").lower()
     module = None
@@ -82,6 +90,7 @@ def import_from_libpq() -> None:
 
     if module:
         __impl__ = module.__impl__
+        __build_version__ = module.__build_version__
         version = module.version
         PGconn = module.PGconn
         PGresult = module.PGresult
@@ -106,6 +115,7 @@ __all__ = (
     "ConnStatus",
     "PollingStatus",
     "TransactionStatus",
+    "PipelineStatus",
     "ExecStatus",
     "Ping",
     "DiagnosticField",
@@ -102,6 +102,30 @@ class ExecStatus(IntEnum):
     query.
     """
 
+    PIPELINE_SYNC = auto()
+    """
+    The PGresult represents a synchronization point in pipeline mode,
+    requested by `~PGconn.pipeline_sync()`.
+
+    This status occurs only when pipeline mode has been selected.
+    """
+
+    PIPELINE_ABORTED = auto()
+    """
+    The PGresult represents a pipeline that has received an error from the
+    server.
+
+    This status occurs only when pipeline mode has been selected.
+    """
+
+    TUPLES_CHUNK = auto()
+    """
+    The PGresult contains several result tuples from the current command.
+
+    This status occurs only when chunked mode has been selected for the query
+    (available from libpq 17).
+    """
+
 
 class TransactionStatus(IntEnum):
     """
@@ -126,6 +150,25 @@ class TransactionStatus(IntEnum):
     """Unknown connection state, broken connection."""
 
 
+class PipelineStatus(IntEnum):
+    """
+    The pipeline mode status of a connection.
+    """
+
+    __module__ = "psycopg3.pq"
+
+    OFF = 0
+    """The connection is not in pipeline mode."""
+    ON = auto()
+    """The connection is in pipeline mode."""
+    ABORTED = auto()
+    """
+    The connection is in pipeline mode and an error occurred while processing
+    the current pipeline. The aborted flag is cleared when PQgetResult
+    returns a result of type `ExecStatus.PIPELINE_SYNC`.
+    """
+
+
 class Ping(IntEnum):
     """Response from a ping attempt."""
 
@@ -38,6 +38,12 @@ class PGresAttDesc_struct:
     atttypmod: int
 
 def PQhostaddr(arg1: Optional[PGconn_struct]) -> bytes: ...
+def PQpipelineStatus(arg1: Optional[PGconn_struct]) -> int: ...
+def PQenterPipelineMode(arg1: Optional[PGconn_struct]) -> int: ...
+def PQexitPipelineMode(arg1: Optional[PGconn_struct]) -> int: ...
+def PQpipelineSync(arg1: Optional[PGconn_struct]) -> int: ...
+def PQsendFlushRequest(arg1: Optional[PGconn_struct]) -> int: ...
+def PQsetChunkedRowsMode(arg1: Optional[PGconn_struct], arg2: int) -> int: ...
 def PQerrorMessage(arg1: Optional[PGconn_struct]) -> bytes: ...
 def PQresultErrorMessage(arg1: Optional[PGresult_struct]) -> bytes: ...
 def PQexecPrepared(
@@ -182,7 +188,13 @@ def PQisBusy(arg1: Optional[PGconn_struct]) -> int: ...
 def PQsetnonblocking(arg1: Optional[PGconn_struct], arg2: int) -> int: ...
 def PQisnonblocking(arg1: Optional[PGconn_struct]) -> int: ...
 def PQflush(arg1: Optional[PGconn_struct]) -> int: ...
+def _PQpipelineStatus(arg1: Optional[PGconn_struct]) -> int: ...
+def _PQenterPipelineMode(arg1: Optional[PGconn_struct]) -> int: ...
+def _PQexitPipelineMode(arg1: Optional[PGconn_struct]) -> int: ...
+def _PQpipelineSync(arg1: Optional[PGconn_struct]) -> int: ...
+def _PQsendFlushRequest(arg1: Optional[PGconn_struct]) -> int: ...
 def PQsetSingleRowMode(arg1: Optional[PGconn_struct]) -> int: ...
+def _PQsetChunkedRowsMode(arg1: Optional[PGconn_struct], arg2: int) -> int: ...
 def PQgetCancel(arg1: Optional[PGconn_struct]) -> PGcancel_struct: ...
 def PQfreeCancel(arg1: Optional[PGcancel_struct]) -> None: ...
 def PQputCopyData(arg1: Optional[PGconn_struct], arg2: bytes, arg3: int) -> int: ...
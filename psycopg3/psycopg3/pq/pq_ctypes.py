@@ -37,6 +37,9 @@ def version() -> int:
     return impl.PQlibVersion()
 
 
+__build_version__ = version()
+
+
 def notice_receiver(
     arg: Any, result_ptr: impl.PGresult_struct, wconn: "ref[PGconn]"
 ) -> None:
@@ -534,6 +537,65 @@ class PGconn:
         if not impl.PQsetSingleRowMode(self.pgconn_ptr):
             raise e.OperationalError("setting single row mode failed")
 
+    def set_chunked_rows_mode(self, size: int) -> None:
+        """Select chunked mode for the query just sent.
+
+        :raises ~e.OperationalError: if the mode cannot be set.
+        :raises ~e.NotSupportedError: if the libpq is older than version 17.
+        """
+        if not impl.PQsetChunkedRowsMode(self.pgconn_ptr, size):
+            raise e.OperationalError("setting chunked rows mode failed")
+
+    @property
+    def pipeline_status(self) -> int:
+        return impl.PQpipelineStatus(self.pgconn_ptr)
+
+    def enter_pipeline_mode(self) -> None:
+        """Enter pipeline mode.
+
+        :raises ~e.OperationalError: in case of failure to enter the pipeline
+            mode.
+        """
+        if impl.PQenterPipelineMode(self.pgconn_ptr) != 1:
+            raise e.OperationalError(
+                f"entering pipeline mode failed: {error_message(self)}"
+            )
+
+    def exit_pipeline_mode(self) -> None:
+        """Exit pipeline mode.
+
+        :raises ~e.OperationalError: in case of failure to exit the pipeline
+            mode, for instance if there are results not consumed yet.
+        """
+        if impl.PQexitPipelineMode(self.pgconn_ptr) != 1:
+            raise e.OperationalError(
+                f"exiting pipeline mode failed: {error_message(self)}"
+            )
+
+    def pipeline_sync(self) -> None:
+        """Mark a synchronization point in a pipeline.
+
+        :raises ~e.OperationalError: if the connection is not in pipeline mode
+            or if sync failed.
+        """
+        rv = impl.PQpipelineSync(self.pgconn_ptr)
+        if rv == 0:
+            raise e.OperationalError("connection not in pipeline mode")
+        if rv != 1:
+            raise e.OperationalError(
+                f"pipeline sync failed: {error_message(self)}"
+            )
+
+    def send_flush_request(self) -> None:
+        """Send a request for the server to flush its output buffer.
+
+        :raises ~e.OperationalError: if the flush request failed.
+        """
+        if impl.PQsendFlushRequest(self.pgconn_ptr) == 0:
+            raise e.OperationalError(
+                f"flush request failed: {error_message(self)}"
+            )
+
     def get_cancel(self) -> "PGcancel":
         """
         Create an object with the information needed to cancel a command.
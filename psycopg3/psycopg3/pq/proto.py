@@ -223,6 +223,25 @@ class PGconn(Protocol):
     def set_single_row_mode(self) -> None:
         ...
 
+    def set_chunked_rows_mode(self, size: int) -> None:
+        ...
+
+    @property
+    def pipeline_status(self) -> int:
+        ...
+
+    def enter_pipeline_mode(self) -> None:
+        ...
+
+    def exit_pipeline_mode(self) -> None:
+        ...
+
+    def pipeline_sync(self) -> None:
+        ...
+
+    def send_flush_request(self) -> None:
+        ...
+
     def get_cancel(self) -> "PGcancel":
         ...
 
@@ -118,12 +118,18 @@ class Transformer(Protocol):
     ) -> Tuple[List[Any], Tuple[int, ...], Sequence[pq.Format]]:
         ...
 
+    def reset_row_dumpers(self) -> None:
+        ...
+
     def get_dumper(self, obj: Any, format: Format) -> "Dumper":
         ...
 
     def load_rows(self, row0: int, row1: int) -> List[Row]:
         ...
 
+    def load_column(self, col: int, row0: int, row1: int) -> List[Any]:
+        ...
+
     def load_row(self, row: int) -> Optional[Row]:
         ...
 
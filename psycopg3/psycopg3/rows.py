@@ -7,7 +7,8 @@ psycopg3 row factories
 import functools
 import re
 from collections import namedtuple
-from typing import Any, Callable, Dict, NamedTuple, Sequence, Tuple, Type
+from typing import Any, Callable, Dict, NamedTuple, NoReturn, Sequence, Tuple
+from typing import Type
 from typing import TYPE_CHECKING
 
 from . import errors as e
@@ -36,12 +37,13 @@ def dict_row(
     Note that this is not compatible with the DBAPI, which expects the records
     to be sequences.
     """
+    desc = cursor.description
+    if desc is None:
+        return _no_result
+
+    titles = [c.name for c in desc]
 
     def make_row(values: Sequence[Any]) -> Dict[str, Any]:
-        desc = cursor.description
-        if desc is None:
-            raise e.InterfaceError("The cursor doesn't have a result")
-        titles = (c.name for c in desc)
         return dict(zip(titles, values))
 
     return make_row
@@ -51,17 +53,21 @@ def namedtuple_row(
     cursor: "BaseCursor[Any]",
 ) -> Callable[[Sequence[Any]], NamedTuple]:
     """Row factory to represent rows as `~collections.namedtuple`."""
+    desc = cursor.description
+    if desc is None:
+        return _no_result
 
-    def make_row(values: Sequence[Any]) -> NamedTuple:
-        desc = cursor.description
-        if desc is None:
-            raise e.InterfaceError("The cursor doesn't have a result")
-        key = tuple(c.name for c in desc)
-        nt = _make_nt(key)
-        rv = nt._make(values)
-        return rv
+    key = tuple(c.name for c in desc)
+    return _make_nt(key)._make
 
-    return make_row
+
+def _no_result(values: Sequence[Any]) -> NoReturn:
+    """Row maker for the results not returning tuples.
+
+    The factories are called for every result, but rows can only be fetched
+    from the results returning tuples.
+    """
+    raise e.InterfaceError("The cursor doesn't have a result")
 
 
 # ascii except alnum and underscore
@@ -54,6 +54,10 @@ class ServerCursorHelper(Generic[ConnectionType]):
     ) -> PQGen[None]:
         """Generator implementing `ServerCursor.execute()`."""
         conn = cur._conn
+        if conn._pipeline:
+            raise e.NotSupportedError(
+                "server-side cursors cannot be used in pipeline mode"
+            )
 
         # If the cursor is being reused, the previous one must be closed.
         if self.described:
@@ -94,6 +98,7 @@ class ServerCursorHelper(Generic[ConnectionType]):
                 "select 1 from pg_catalog.pg_cursors where name = {}"
             ).format(sql.Literal(self.name))
             res = yield from cur._conn._exec_command(query)
+            assert res
             if res.ntuples == 0:
                 return
 
@@ -117,6 +122,7 @@ class ServerCursorHelper(Generic[ConnectionType]):
             howmuch, sql.Identifier(self.name)
         )
         res = yield from cur._conn._exec_command(query)
+        assert res
 
         cur.pgresult = res
         cur._tx.set_pgresult(res, set_loaders=False)
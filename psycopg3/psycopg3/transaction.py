@@ -7,13 +7,12 @@ Transaction context managers returned by Connection.transaction()
 import logging
 
 from types import TracebackType
-from typing import Generic, Optional, Type, Union, TYPE_CHECKING
+from typing import Generic, List, Optional, Type, Union, TYPE_CHECKING
 
 from . import pq
 from . import sql
 from .pq import TransactionStatus
 from .proto import ConnectionType, PQGen
-from .pq.proto import PGresult
 
 if TYPE_CHECKING:
     from .connection import Connection, AsyncConnection  # noqa: F401
@@ -81,11 +80,21 @@ class BaseTransaction(Generic[ConnectionType]):
         sp = f"{self.savepoint_name!r} " if self.savepoint_name else ""
         return f"<{cls} {sp}({status}) {info} at 0x{id(self):x}>"
 
-    def _enter_gen(self) -> PQGen[PGresult]:
+    def _enter_gen(self) -> PQGen[None]:
         if self._entered:
             raise TypeError("transaction blocks can be used only once")
         self._entered = True
 
+        # In pipeline mode the transaction status is not known until the
+        # operations queued are processed.
+        pipeline = self._conn._pipeline
+        if (
+            pipeline
+            and self._conn.pgconn.transaction_status
+            == TransactionStatus.ACTIVE
+        ):
+            yield from pipeline._sync_gen()
+
         self._outer_transaction = (
             self._conn.pgconn.transaction_status == TransactionStatus.IDLE
         )
@@ -113,7 +122,7 @@ class BaseTransaction(Generic[ConnectionType]):
             )
 
         self._conn._savepoints.append(self._savepoint_name)
-        return self._conn._exec_command(b"; ".join(commands))
+        yield from self._exec_commands(commands)
 
     def _exit_gen(
         self,
@@ -127,7 +136,7 @@ class BaseTransaction(Generic[ConnectionType]):
         else:
             return (yield from self._rollback_gen(exc_val))
 
-    def _commit_gen(self) -> PQGen[PGresult]:
+    def _commit_gen(self) -> PQGen[None]:
         assert self._conn._savepoints[-1] == self._savepoint_name
         self._conn._savepoints.pop()
         self._exited = True
@@ -144,7 +153,7 @@ class BaseTransaction(Generic[ConnectionType]):
             assert not self._conn._savepoints
             commands.append(b"commit")
 
-        return self._conn._exec_command(b"; ".join(commands))
+        yield from self._exec_commands(commands)
 
     def _rollback_gen(self, exc_val: Optional[BaseException]) -> PQGen[bool]:
         if isinstance(exc_val, Rollback):
@@ -158,8 +167,13 @@ class BaseTransaction(Generic[ConnectionType]):
         commands = []
         if self._savepoint_name and not self._outer_transaction:
             commands.append(
-                sql.SQL("rollback to {n}; release {n}")
-                .format(n=sql.Identifier(self._savepoint_name))
+                sql.SQL("rollback to {}")
+                .format(sql.Identifier(self._savepoint_name))
+                .as_bytes(self._conn)
+            )
+            commands.append(
+                sql.SQL("release {}")
+                .format(sql.Identifier(self._savepoint_name))
                 .as_bytes(self._conn)
             )
 
@@ -167,7 +181,7 @@ class BaseTransaction(Generic[ConnectionType]):
             assert not self._conn._savepoints
             commands.append(b"rollback")
 
-        yield from self._conn._exec_command(b"; ".join(commands))
+        yield from self._exec_commands(commands)
 
         if isinstance(exc_val, Rollback):
             if not exc_val.transaction or exc_val.transaction is self:
@@ -175,6 +189,15 @@ class BaseTransaction(Generic[ConnectionType]):
 
         return False
 
+    def _exec_commands(self, commands: List[bytes]) -> PQGen[None]:
+        if self._conn._pipeline:
+            # Multiple statements in the same query are not allowed in
+            # pipeline mode.
+            for command in commands:
+                yield from self._conn._exec_command(command)
+        else:
+            yield from self._conn._exec_command(b"; ".join(commands))
+
 
 class Transaction(BaseTransaction["Connection"]):
     """
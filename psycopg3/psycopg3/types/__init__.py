@@ -38,6 +38,7 @@ from .numeric import (
     FloatDumper,
     FloatBinaryDumper,
     DecimalDumper,
+    DecimalBinaryDumper,
     Int2Dumper,
     Int4Dumper,
     Int8Dumper,
@@ -46,6 +47,7 @@ from .numeric import (
     Int2BinaryDumper,
     Int4BinaryDumper,
     Int8BinaryDumper,
+    IntNumericBinaryDumper,
     OidBinaryDumper,
     IntLoader,
     Int2BinaryLoader,
@@ -56,6 +58,7 @@ from .numeric import (
     Float4BinaryLoader,
     Float8BinaryLoader,
     NumericLoader,
+    NumericBinaryLoader,
 )
 from .singletons import (
     BoolDumper,
@@ -66,17 +69,29 @@ from .singletons import (
 )
 from .date import (
     DateDumper,
+    DateBinaryDumper,
     TimeDumper,
+    TimeBinaryDumper,
     TimeTzDumper,
+    TimeTzBinaryDumper,
     DateTimeTzDumper,
+    DateTimeTzBinaryDumper,
     DateTimeDumper,
+    DateTimeBinaryDumper,
     TimeDeltaDumper,
+    TimeDeltaBinaryDumper,
     DateLoader,
+    DateBinaryLoader,
     TimeLoader,
+    TimeBinaryLoader,
     TimeTzLoader,
+    TimeTzBinaryLoader,
     TimestampLoader,
+    TimestampBinaryLoader,
     TimestamptzLoader,
+    TimestamptzBinaryLoader,
     IntervalLoader,
+    IntervalBinaryLoader,
 )
 from .json import (
     JsonDumper,
@@ -97,11 +112,18 @@ from .uuid import (
 from .network import (
     InterfaceDumper,
     NetworkDumper,
+    AddressBinaryDumper,
+    InterfaceBinaryDumper,
+    NetworkBinaryDumper,
     InetLoader,
     CidrLoader,
+    InetBinaryLoader,
+    CidrBinaryLoader,
+    InetPackedBinaryLoader,
 )
 from .range import (
     RangeDumper,
+    RangeBinaryDumper,
     RangeLoader,
     Int4RangeLoader,
     Int8RangeLoader,
@@ -109,10 +131,20 @@ from .range import (
     DateRangeLoader,
     TimestampRangeLoader,
     TimestampTZRangeLoader,
+    RangeBinaryLoader,
+    Int4RangeBinaryLoader,
+    Int8RangeBinaryLoader,
+    NumericRangeBinaryLoader,
+    DateRangeBinaryLoader,
+    TimestampRangeBinaryLoader,
+    TimestampTZRangeBinaryLoader,
 )
 from .array import (
     ListDumper,
     ListBinaryDumper,
+    ArrayBinaryDumper,
+    ArrayLoader,
+    ArrayBinaryLoader,
 )
 from .composite import (
     TupleDumper,
@@ -151,6 +183,7 @@ def register_default_globals(ctx: AdaptContext) -> None:
     FloatDumper.register(float, ctx)
     FloatBinaryDumper.register(float, ctx)
     DecimalDumper.register("decimal.Decimal", ctx)
+    DecimalBinaryDumper.register("decimal.Decimal", ctx)
     Int2Dumper.register(Int2, ctx)
     Int4Dumper.register(Int4, ctx)
     Int8Dumper.register(Int8, ctx)
@@ -159,6 +192,7 @@ def register_default_globals(ctx: AdaptContext) -> None:
     Int2BinaryDumper.register(Int2, ctx)
     Int4BinaryDumper.register(Int4, ctx)
     Int8BinaryDumper.register(Int8, ctx)
+    IntNumericBinaryDumper.register(IntNumeric, ctx)
     OidBinaryDumper.register(Oid, ctx)
     IntLoader.register("int2", ctx)
     IntLoader.register("int4", ctx)
@@ -173,6 +207,7 @@ def register_default_globals(ctx: AdaptContext) -> None:
     Float4BinaryLoader.register("float4", ctx)
     Float8BinaryLoader.register("float8", ctx)
     NumericLoader.register("numeric", ctx)
+    NumericBinaryLoader.register("numeric", ctx)
 
     BoolDumper.register(bool, ctx)
     BoolBinaryDumper.register(bool, ctx)
@@ -181,15 +216,25 @@ def register_default_globals(ctx: AdaptContext) -> None:
     BoolBinaryLoader.register("bool", ctx)
 
     DateDumper.register("datetime.date", ctx)
+    DateBinaryDumper.register("datetime.date", ctx)
     TimeDumper.register("datetime.time", ctx)
+    TimeBinaryDumper.register("datetime.time", ctx)
     DateTimeTzDumper.register("datetime.datetime", ctx)
+    DateTimeTzBinaryDumper.register("datetime.datetime", ctx)
     TimeDeltaDumper.register("datetime.timedelta", ctx)
+    TimeDeltaBinaryDumper.register("datetime.timedelta", ctx)
     DateLoader.register("date", ctx)
+    DateBinaryLoader.register("date", ctx)
     TimeLoader.register("time", ctx)
+    TimeBinaryLoader.register("time", ctx)
     TimeTzLoader.register("timetz", ctx)
+    TimeTzBinaryLoader.register("timetz", ctx)
     TimestampLoader.register("timestamp", ctx)
+    TimestampBinaryLoader.register("timestamp", ctx)
     TimestamptzLoader.register("timestamptz", ctx)
+    TimestamptzBinaryLoader.register("timestamptz", ctx)
     IntervalLoader.register("interval", ctx)
+    IntervalBinaryLoader.register("interval", ctx)
 
     JsonDumper.register(Json, ctx)
     JsonBinaryDumper.register(Json, ctx)
@@ -211,19 +256,35 @@ def register_default_globals(ctx: AdaptContext) -> None:
     InterfaceDumper.register("ipaddress.IPv6Interface", ctx)
     NetworkDumper.register("ipaddress.IPv4Network", ctx)
     NetworkDumper.register("ipaddress.IPv6Network", ctx)
+    AddressBinaryDumper.register("ipaddress.IPv4Address", ctx)
+    AddressBinaryDumper.register("ipaddress.IPv6Address", ctx)
+    InterfaceBinaryDumper.register("ipaddress.IPv4Interface", ctx)
+    InterfaceBinaryDumper.register("ipaddress.IPv6Interface", ctx)
+    NetworkBinaryDumper.register("ipaddress.IPv4Network", ctx)
+    NetworkBinaryDumper.register("ipaddress.IPv6Network", ctx)
     InetLoader.register("inet", ctx)
     CidrLoader.register("cidr", ctx)
+    InetBinaryLoader.register("inet", ctx)
+    CidrBinaryLoader.register("cidr", ctx)
 
     RangeDumper.register(Range, ctx)
+    RangeBinaryDumper.register(Range, ctx)
     Int4RangeLoader.register("int4range", ctx)
     Int8RangeLoader.register("int8range", ctx)
     NumericRangeLoader.register("numrange", ctx)
     DateRangeLoader.register("daterange", ctx)
     TimestampRangeLoader.register("tsrange", ctx)
     TimestampTZRangeLoader.register("tstzrange", ctx)
+    Int4RangeBinaryLoader.register("int4range", ctx)
+    Int8RangeBinaryLoader.register("int8range", ctx)
+    NumericRangeBinaryLoader.register("numrange", ctx)
+    DateRangeBinaryLoader.register("daterange", ctx)
+    TimestampRangeBinaryLoader.register("tsrange", ctx)
+    TimestampTZRangeBinaryLoader.register("tstzrange", ctx)
 
     ListDumper.register(list, ctx)
     ListBinaryDumper.register(list, ctx)
+    ArrayBinaryDumper.register("array.array", ctx)
 
     TupleDumper.register(tuple, ctx)
     RecordLoader.register("record", ctx)
@@ -5,16 +5,20 @@ Adapters for arrays
 # Copyright (C) 2020-2021 The Psycopg Team
 
 import re
+import sys
 import struct
-from typing import Any, Iterator, List, Optional, Set, Tuple, Type
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Type
+from typing import cast
 
 from .. import pq
 from .. import errors as e
 from ..oids import postgres_types, TEXT_OID, TEXT_ARRAY_OID, INVALID_OID
-from ..adapt import Buffer, Dumper, Loader, Transformer
+from ..adapt import Buffer, Dumper, Loader, Transformer, global_adapters
 from ..adapt import Format as Pg3Format
 from ..proto import AdaptContext
 from .._typeinfo import TypeInfo
+from ..wrappers.numeric import Int2, Int4, Int8
 
 
 class BaseListDumper(Dumper):
@@ -56,6 +60,15 @@ class BaseListDumper(Dumper):
         """
         Find the first non-null element of an eventually nested list
         """
+        if type(L) is list and L and type(L[0]) is int:
+            # Fast path for a flat list of ints: let array find their range.
+            try:
+                a = array("q", L)
+            except (TypeError, OverflowError):
+                pass
+            else:
+                return max(max(a), -min(a) - 1, -a[0])
+
         it = self._flatiter(L, set())
         try:
             item = next(it)
@@ -164,6 +177,16 @@ class ListBinaryDumper(BaseListDumper):
         if not obj:
             return _struct_head.pack(0, 0, sub_oid)
 
+        # Fast path for flat lists of numbers of fixed size
+        typecode = _FIXED_TYPECODES.get(sub_oid)
+        if typecode and type(obj) is list:
+            try:
+                items = array(typecode, obj)
+            except (TypeError, OverflowError):
+                pass
+            else:
+                return _dump_fixed_array(items, sub_oid)
+
         data: List[bytes] = [b"", b""]  # placeholders to avoid a resize
         dims: List[int] = []
         hasnull = 0
@@ -207,6 +230,118 @@ class ListBinaryDumper(BaseListDumper):
         return b"".join(data)
 
 
+class ArrayBinaryDumper(Dumper):
+    """
+    Dump an `!array.array` of numbers to a binary array.
+
+    Arrays of ints are dumped as :sql:`int2[]`, :sql:`int4[]` or
+    :sql:`int8[]`, according to the range of their typecode, arrays of floats
+    as :sql:`float8[]`.
+    """
+
+    format = pq.Format.BINARY
+
+    _typecode = ""
+    _sub_oid = INVALID_OID
+
+    def dump(self, obj: "array[Any]") -> Buffer:
+        if not self._typecode:
+            raise TypeError(
+                f"{type(self).__name__} is a dispatcher to other dumpers:"
+                " dump() is not supposed to be called"
+            )
+        if obj.typecode != self._typecode:
+            try:
+                obj = array(self._typecode, obj)
+            except OverflowError:
+                raise e.DataError(
+                    f"array values out of {self._typecode!r} range"
+                ) from None
+        if not obj:
+            return _struct_head.pack(0, 0, self._sub_oid)
+        return _dump_fixed_array(obj, self._sub_oid)
+
+    def get_key(
+        self, obj: "array[Any]", format: Pg3Format
+    ) -> Tuple[type, ...]:
+        return (self.cls, self._get_typecode_info(obj)[0])
+
+    def upgrade(self, obj: "array[Any]", format: Pg3Format) -> Dumper:
+        _, typecode, sub_oid = self._get_typecode_info(obj)
+        dumper = type(self)(self.cls)
+        dumper.oid = postgres_types[sub_oid].array_oid
+        dumper._typecode = typecode
+        dumper._sub_oid = sub_oid
+        return dumper
+
+    def _get_typecode_info(self, obj: "array[Any]") -> Tuple[type, str, int]:
+        try:
+            return _ARRAY_TYPECODES[obj.typecode]
+        except KeyError:
+            raise e.ProgrammingError(
+                f"cannot dump arrays of typecode {obj.typecode!r}"
+            ) from None
+
+
+def _dump_fixed_array(data: "array[Any]", sub_oid: int) -> bytearray:
+    """
+    Dump a non-empty array of numbers to the binary format of an array.
+
+    The items of *data* must have the size of the type *sub_oid*.
+    """
+    size = data.itemsize
+    stride = 4 + size
+    head = _struct_head.pack(1, 0, sub_oid) + _struct_dim.pack(len(data), 1)
+    nhead = len(head)
+    rv = bytearray(nhead + len(data) * stride)
+    rv[:nhead] = head
+
+    # Each item is preceded by its length. Copy each byte of the length and
+    # of the items, in network order, for all the items at once.
+    rv[nhead + 3 :: stride] = bytes([size]) * len(data)
+    raw = data.tobytes()
+    for i in range(size):
+        j = size - 1 - i if sys.byteorder == "little" else i
+        rv[nhead + 4 + i :: stride] = raw[j::size]
+
+    return rv
+
+
+# The array typecodes to convert a list of elements with these oids into.
+_FIXED_TYPECODES = {
+    postgres_types["int2"].oid: "h",
+    postgres_types["int4"].oid: "i",
+    postgres_types["int8"].oid: "q",
+    postgres_types["float4"].oid: "f",
+    postgres_types["float8"].oid: "d",
+}
+
+# The array.array typecodes which can be dumped, mapped to the key of their
+# dumper, the typecode to convert the array into and the oid of its items.
+_ARRAY_TYPECODES: Dict[str, Tuple[type, str, int]] = {}
+
+
+def _init_array_typecodes() -> None:
+    int_types = {
+        2: (Int2, "h", postgres_types["int2"].oid),
+        4: (Int4, "i", postgres_types["int4"].oid),
+        8: (Int8, "q", postgres_types["int8"].oid),
+    }
+    for typecode in "bhilqBHILQ":
+        size = array(typecode).itemsize
+        if typecode.isupper():
+            # Unsigned: the values need a wider signed type. For the widest
+            # ones use int8 anyway: large values will fail to convert.
+            size = min(size * 2, 8)
+        _ARRAY_TYPECODES[typecode] = int_types[max(size, 2)]
+
+    float8 = (float, "d", postgres_types["float8"].oid)
+    _ARRAY_TYPECODES["f"] = _ARRAY_TYPECODES["d"] = float8
+
+
+_init_array_typecodes()
+
+
 class BaseArrayLoader(Loader):
     base_oid: int
 
@@ -319,7 +454,11 @@ class ArrayBinaryLoader(BaseArrayLoader):
 def register_adapters(
     info: TypeInfo, context: Optional["AdaptContext"]
 ) -> None:
+    adapters = context.adapters if context else global_adapters
     for base in (ArrayLoader, ArrayBinaryLoader):
+        # Subclass the optimised loader, if available: the subclass, created
+        # here, wouldn't have an optimised version of its own.
+        base = adapters._get_optimised(cast(Type[BaseArrayLoader], base))
         lname = f"{info.name.title()}{base.__name__}"
         loader: Type[BaseArrayLoader] = type(
             lname, (base,), {"base_oid": info.oid}
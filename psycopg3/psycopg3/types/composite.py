@@ -13,6 +13,7 @@ from typing import Sequence, Tuple, Type
 from .. import pq
 from ..oids import TEXT_OID
 from ..adapt import Buffer, Format, Dumper, Loader, Transformer
+from ..adapt import global_adapters
 from ..proto import AdaptContext
 from .._typeinfo import CompositeInfo
 
@@ -200,10 +201,14 @@ def register_adapters(
     if not factory:
         factory = namedtuple(info.name, info.field_names)  # type: ignore
 
+    # Subclass the optimised loaders, if available: the subclasses, created
+    # here, wouldn't have an optimised version of their own.
+    adapters = context.adapters if context else global_adapters
+
     # generate and register a customized text loader
     loader: Type[BaseCompositeLoader] = type(
         f"{info.name.title()}Loader",
-        (CompositeLoader,),
+        (adapters._get_optimised(CompositeLoader),),
         {
             "factory": factory,
             "fields_types": info.field_types,
@@ -214,7 +219,7 @@ def register_adapters(
     # generate and register a customized binary loader
     loader = type(
         f"{info.name.title()}BinaryLoader",
-        (CompositeBinaryLoader,),
+        (adapters._get_optimised(CompositeBinaryLoader),),
         {"factory": factory},
     )
     loader.register(info.oid, context=context)
@@ -6,8 +6,9 @@ Adapters for date/time types.
 
 import re
 import sys
-from datetime import date, datetime, time, timedelta
-from typing import cast, Optional, Tuple, Union
+import struct
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Callable, cast, Optional, Tuple, Union
 
 from ..pq import Format
 from ..oids import postgres_types as builtins
@@ -15,6 +16,31 @@ from ..adapt import Buffer, Dumper, Loader, Format as Pg3Format
 from ..proto import AdaptContext
 from ..errors import InterfaceError, DataError
 
+_PackInt = Callable[[int], bytes]
+_UnpackInt = Callable[[bytes], Tuple[int]]
+
+_pack_int4 = cast(_PackInt, struct.Struct("!i").pack)
+_pack_int8 = cast(_PackInt, struct.Struct("!q").pack)
+_unpack_int4 = cast(_UnpackInt, struct.Struct("!i").unpack)
+_unpack_int8 = cast(_UnpackInt, struct.Struct("!q").unpack)
+
+_pack_timetz = cast(Callable[[int, int], bytes], struct.Struct("!qi").pack)
+_unpack_timetz = cast(
+    Callable[[bytes], Tuple[int, int]], struct.Struct("!qi").unpack
+)
+_pack_interval = cast(
+    Callable[[int, int, int], bytes], struct.Struct("!qii").pack
+)
+_unpack_interval = cast(
+    Callable[[bytes], Tuple[int, int, int]], struct.Struct("!qii").unpack
+)
+
+# The binary format represents dates and times relative to 2000-01-01
+_pg_date_epoch_days = date(2000, 1, 1).toordinal()
+_pg_datetime_epoch = datetime(2000, 1, 1)
+_pg_datetimetz_epoch = datetime(2000, 1, 1, tzinfo=timezone.utc)
+_py_date_min_days = date.min.toordinal()
+
 
 class DateDumper(Dumper):
 
@@ -27,6 +53,16 @@ class DateDumper(Dumper):
         return str(obj).encode("utf8")
 
 
+class DateBinaryDumper(Dumper):
+
+    format = Format.BINARY
+    _oid = builtins["date"].oid
+
+    def dump(self, obj: date) -> bytes:
+        days = obj.toordinal() - _pg_date_epoch_days
+        return _pack_int4(days)
+
+
 class TimeDumper(Dumper):
 
     format = Format.TEXT
@@ -59,6 +95,33 @@ class TimeTzDumper(TimeDumper):
     _oid = builtins["timetz"].oid
 
 
+class TimeBinaryDumper(TimeDumper):
+
+    format = Format.BINARY
+
+    def dump(self, obj: time) -> bytes:
+        return _pack_int8(_time_to_micros(obj))
+
+    def upgrade(self, obj: time, format: Pg3Format) -> "Dumper":
+        if not obj.tzinfo:
+            return self
+        else:
+            return TimeTzBinaryDumper(self.cls)
+
+
+class TimeTzBinaryDumper(TimeBinaryDumper):
+
+    _oid = builtins["timetz"].oid
+
+    def dump(self, obj: time) -> bytes:
+        off = obj.utcoffset()
+        assert off is not None
+        # The offset is stored in seconds west of UTC
+        return _pack_timetz(
+            _time_to_micros(obj), -(off.days * 86400 + off.seconds)
+        )
+
+
 class DateTimeTzDumper(Dumper):
 
     format = Format.TEXT
@@ -92,6 +155,28 @@ class DateTimeDumper(DateTimeTzDumper):
     _oid = builtins["timestamp"].oid
 
 
+class DateTimeTzBinaryDumper(DateTimeTzDumper):
+
+    format = Format.BINARY
+
+    def dump(self, obj: datetime) -> bytes:
+        return _pack_int8(_timedelta_to_micros(obj - _pg_datetimetz_epoch))
+
+    def upgrade(self, obj: datetime, format: Pg3Format) -> "Dumper":
+        if obj.tzinfo:
+            return self
+        else:
+            return DateTimeBinaryDumper(self.cls)
+
+
+class DateTimeBinaryDumper(DateTimeTzBinaryDumper):
+
+    _oid = builtins["timestamp"].oid
+
+    def dump(self, obj: datetime) -> bytes:
+        return _pack_int8(_timedelta_to_micros(obj - _pg_datetime_epoch))
+
+
 class TimeDeltaDumper(Dumper):
 
     format = Format.TEXT
@@ -119,6 +204,16 @@ class TimeDeltaDumper(Dumper):
         )
 
 
+class TimeDeltaBinaryDumper(Dumper):
+
+    format = Format.BINARY
+    _oid = builtins["interval"].oid
+
+    def dump(self, obj: timedelta) -> bytes:
+        micros = 1_000_000 * obj.seconds + obj.microseconds
+        return _pack_interval(micros, obj.days, 0)
+
+
 class DateLoader(Loader):
 
     format = Format.TEXT
@@ -181,6 +276,21 @@ class DateLoader(Loader):
         return max(map(len, parts))
 
 
+class DateBinaryLoader(Loader):
+
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> date:
+        days = _unpack_int4(data)[0] + _pg_date_epoch_days
+        try:
+            return date.fromordinal(days)
+        except (ValueError, OverflowError):
+            if days < _py_date_min_days:
+                raise DataError("date too small (before year 1)")
+            else:
+                raise DataError("date too large (after year 10K)")
+
+
 class TimeLoader(Loader):
 
     format = Format.TEXT
@@ -208,6 +318,21 @@ class TimeLoader(Loader):
         raise exc
 
 
+class TimeBinaryLoader(Loader):
+
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> time:
+        val = _unpack_int8(data)[0]
+        val, us = divmod(val, 1_000_000)
+        val, s = divmod(val, 60)
+        h, m = divmod(val, 60)
+        try:
+            return time(h, m, s, us)
+        except ValueError:
+            raise DataError(f"time not supported by Python: hour={h}")
+
+
 class TimeTzLoader(TimeLoader):
 
     format = Format.TEXT
@@ -249,6 +374,23 @@ class TimeTzLoader(TimeLoader):
         return TimeTzLoader.load(self, data)
 
 
+class TimeTzBinaryLoader(Loader):
+
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> time:
+        val, off = _unpack_timetz(data)
+
+        val, us = divmod(val, 1_000_000)
+        val, s = divmod(val, 60)
+        h, m = divmod(val, 60)
+
+        try:
+            return time(h, m, s, us, _timezone_from_seconds(-off))
+        except ValueError:
+            raise DataError(f"time not supported by Python: hour={h}")
+
+
 class TimestampLoader(DateLoader):
 
     format = Format.TEXT
@@ -306,6 +448,21 @@ class TimestampLoader(DateLoader):
                 return 0
 
 
+class TimestampBinaryLoader(Loader):
+
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> datetime:
+        micros = _unpack_int8(data)[0]
+        try:
+            return _pg_datetime_epoch + timedelta(microseconds=micros)
+        except OverflowError:
+            if micros <= 0:
+                raise DataError("timestamp too small (before year 1)")
+            else:
+                raise DataError("timestamp too large (after year 10K)")
+
+
 class TimestamptzLoader(TimestampLoader):
 
     format = Format.TEXT
@@ -376,6 +533,27 @@ class TimestamptzLoader(TimestampLoader):
         )
 
 
+class TimestamptzBinaryLoader(Loader):
+    """
+    Load a binary timestamptz as a `!datetime` in the UTC timezone.
+
+    Unlike the text format, the binary format doesn't carry the session
+    timezone offset: the value loaded represents the same instant.
+    """
+
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> datetime:
+        micros = _unpack_int8(data)[0]
+        try:
+            return _pg_datetimetz_epoch + timedelta(microseconds=micros)
+        except OverflowError:
+            if micros <= 0:
+                raise DataError("timestamp too small (before year 1)")
+            else:
+                raise DataError("timestamp too large (after year 10K)")
+
+
 class IntervalLoader(Loader):
 
     format = Format.TEXT
@@ -447,3 +625,44 @@ class IntervalLoader(Loader):
             "can't parse interval with IntervalStyle"
             f" {ints.decode('ascii')}: {data.decode('ascii')}"
         )
+
+
+class IntervalBinaryLoader(Loader):
+
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> timedelta:
+        micros, days, months = _unpack_interval(data)
+
+        # Convert the months to days consistently with the text loader
+        if months > 0:
+            years, months = divmod(months, 12)
+            days = days + 30 * months + 365 * years
+        elif months < 0:
+            years, months = divmod(-months, 12)
+            days = days - 30 * months - 365 * years
+
+        try:
+            return timedelta(days=days, microseconds=micros)
+        except OverflowError as e:
+            raise DataError(str(e))
+
+
+def _time_to_micros(obj: time) -> int:
+    return (
+        obj.microsecond
+        + 1_000_000 * obj.second
+        + 60_000_000 * (obj.minute + 60 * obj.hour)
+    )
+
+
+def _timedelta_to_micros(obj: timedelta) -> int:
+    return obj.microseconds + 1_000_000 * (obj.seconds + 86400 * obj.days)
+
+
+def _timezone_from_seconds(sec: int) -> timezone:
+    if sys.version_info < (3, 7):
+        # Python 3.6 doesn't support seconds in the timezones
+        sign = -1 if sec < 0 else 1
+        sec = sign * (abs(sec) // 60 * 60)
+    return timezone(timedelta(seconds=sec))
@@ -4,7 +4,7 @@ Adapters for network types.
 
 # Copyright (C) 2020-2021 The Psycopg Team
 
-from typing import Callable, Optional, Union, TYPE_CHECKING
+from typing import Callable, Optional, Tuple, Type, Union, TYPE_CHECKING
 
 from ..pq import Format
 from ..oids import postgres_types as builtins
@@ -23,6 +23,18 @@ imported = False
 ip_address: Callable[[str], Address]
 ip_interface: Callable[[str], Interface]
 ip_network: Callable[[str], Network]
+IPv4Address: "Type[ipaddress.IPv4Address]"
+IPv6Address: "Type[ipaddress.IPv6Address]"
+IPv4Interface: "Type[ipaddress.IPv4Interface]"
+IPv6Interface: "Type[ipaddress.IPv6Interface]"
+IPv4Network: "Type[ipaddress.IPv4Network]"
+IPv6Network: "Type[ipaddress.IPv6Network]"
+
+# The address families of the binary format, as defined in inet.h
+PGSQL_AF_INET = 2
+PGSQL_AF_INET6 = 3
+IPV4_PREFIXLEN = 32
+IPV6_PREFIXLEN = 128
 
 
 class InterfaceDumper(Dumper):
@@ -43,12 +55,53 @@ class NetworkDumper(Dumper):
         return str(obj).encode("utf8")
 
 
+class AddressBinaryDumper(Dumper):
+
+    format = Format.BINARY
+    _oid = builtins["inet"].oid
+
+    def dump(self, obj: Address) -> bytes:
+        packed = obj.packed
+        family = PGSQL_AF_INET if obj.version == 4 else PGSQL_AF_INET6
+        head = bytes((family, obj.max_prefixlen, 0, len(packed)))
+        return head + packed
+
+
+class InterfaceBinaryDumper(Dumper):
+
+    format = Format.BINARY
+    _oid = builtins["inet"].oid
+
+    def dump(self, obj: Interface) -> bytes:
+        packed = obj.packed
+        family = PGSQL_AF_INET if obj.version == 4 else PGSQL_AF_INET6
+        head = bytes((family, obj.network.prefixlen, 0, len(packed)))
+        return head + packed
+
+
+class NetworkBinaryDumper(Dumper):
+
+    format = Format.BINARY
+    _oid = builtins["cidr"].oid
+
+    def dump(self, obj: Network) -> bytes:
+        packed = obj.network_address.packed
+        family = PGSQL_AF_INET if obj.version == 4 else PGSQL_AF_INET6
+        head = bytes((family, obj.prefixlen, 1, len(packed)))
+        return head + packed
+
+
 class _LazyIpaddress(Loader):
     def __init__(self, oid: int, context: Optional[AdaptContext] = None):
         super().__init__(oid, context)
         global imported, ip_address, ip_interface, ip_network
+        global IPv4Address, IPv6Address, IPv4Interface, IPv6Interface
+        global IPv4Network, IPv6Network
         if not imported:
             from ipaddress import ip_address, ip_interface, ip_network
+            from ipaddress import IPv4Address, IPv6Address
+            from ipaddress import IPv4Interface, IPv6Interface
+            from ipaddress import IPv4Network, IPv6Network
 
             imported = True
 
@@ -76,3 +129,58 @@ class CidrLoader(_LazyIpaddress):
             data = bytes(data)
 
         return ip_network(data.decode("utf8"))
+
+
+class InetBinaryLoader(_LazyIpaddress):
+
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> Union[Address, Interface]:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+
+        prefix = data[1]
+        packed = data[4:]
+        if data[0] == PGSQL_AF_INET:
+            if prefix == IPV4_PREFIXLEN:
+                return IPv4Address(packed)
+            else:
+                return IPv4Interface((packed, prefix))
+        else:
+            if prefix == IPV6_PREFIXLEN:
+                return IPv6Address(packed)
+            else:
+                return IPv6Interface((packed, prefix))
+
+
+class CidrBinaryLoader(_LazyIpaddress):
+
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> Network:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+
+        prefix = data[1]
+        packed = data[4:]
+        if data[0] == PGSQL_AF_INET:
+            return IPv4Network((packed, prefix))
+        else:
+            return IPv6Network((packed, prefix))
+
+
+class InetPackedBinaryLoader(Loader):
+    """
+    Load :sql:`inet` and :sql:`cidr` values without creating `ipaddress`
+    objects.
+
+    Return a tuple with the address, as packed bytes of length 4 or 16, and
+    the prefix length. Use `!int.from_bytes(addr, "big")` to obtain the
+    address as a number. The loader is not registered by default: register
+    it on a connection or cursor to use it.
+    """
+
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> Tuple[bytes, int]:
+        return bytes(data[4:]), data[1]
@@ -12,6 +12,7 @@ from ..pq import Format
 from ..oids import postgres_types as builtins
 from ..adapt import Buffer, Dumper, Loader
 from ..adapt import Format as Pg3Format
+from ..errors import DataError
 from ..wrappers.numeric import Int2, Int4, Int8, IntNumeric
 
 _PackInt = Callable[[int], bytes]
@@ -31,6 +32,14 @@ _unpack_int8 = cast(_UnpackInt, struct.Struct("!q").unpack)
 _unpack_float4 = cast(_UnpackFloat, struct.Struct("!f").unpack)
 _unpack_float8 = cast(_UnpackFloat, struct.Struct("!d").unpack)
 
+_pack_numeric_head = cast(
+    Callable[[int, int, int, int], bytes], struct.Struct("!HhHH").pack
+)
+_unpack_numeric_head = cast(
+    Callable[[Buffer], Tuple[int, int, int, int]],
+    struct.Struct("!HhHH").unpack_from,
+)
+
 
 # Wrappers to force numbers to be cast as specific PostgreSQL types
 
@@ -92,6 +101,15 @@ class DecimalDumper(SpecialValuesDumper):
     }
 
 
+class DecimalBinaryDumper(Dumper):
+
+    format = Format.BINARY
+    _oid = builtins["numeric"].oid
+
+    def dump(self, obj: Decimal) -> bytes:
+        return dump_decimal_to_numeric_binary(obj)
+
+
 class Int2Dumper(NumberDumper):
     _oid = builtins["int2"].oid
 
@@ -172,7 +190,7 @@ class IntNumericBinaryDumper(IntNumericDumper):
     format = Format.BINARY
 
     def dump(self, obj: int) -> bytes:
-        raise NotImplementedError("binary decimal dump not implemented yet")
+        return dump_decimal_to_numeric_binary(Decimal(obj))
 
 
 class OidBinaryDumper(OidDumper):
@@ -267,3 +285,90 @@ class NumericLoader(Loader):
         if isinstance(data, memoryview):
             data = bytes(data)
         return Decimal(data.decode("utf8"))
+
+
+class NumericBinaryLoader(Loader):
+
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> Decimal:
+        ndigits, weight, sign, dscale = _unpack_numeric_head(data)
+        if sign == NUMERIC_POS or sign == NUMERIC_NEG:
+            val = 0
+            for digit in struct.unpack_from(f"!{ndigits}H", data, 8):
+                val = val * 10_000 + digit
+
+            # Adjust the number of digits to the display scale: the last
+            # base 10000 digit may carry zeros past it or too few digits.
+            shift = DEC_DIGITS * (weight - ndigits + 1) + dscale
+            if shift >= 0:
+                val *= 10 ** shift
+            else:
+                val //= 10 ** -shift
+
+            if sign == NUMERIC_NEG:
+                val = -val
+            return Decimal(f"{val}E-{dscale}")
+
+        else:
+            try:
+                return _decimal_special[sign]
+            except KeyError:
+                raise DataError(f"bad value for numeric sign: 0x{sign:X}")
+
+
+DEC_DIGITS = 4  # decimal digits per Postgres "digit"
+NUMERIC_POS = 0x0000
+NUMERIC_NEG = 0x4000
+NUMERIC_NAN = 0xC000
+NUMERIC_PINF = 0xD000
+NUMERIC_NINF = 0xF000
+
+_decimal_special = {
+    NUMERIC_NAN: Decimal("NaN"),
+    NUMERIC_PINF: Decimal("Infinity"),
+    NUMERIC_NINF: Decimal("-Infinity"),
+}
+
+
+def dump_decimal_to_numeric_binary(obj: Decimal) -> bytes:
+    """
+    Convert a `!Decimal` into the binary representation of a numeric.
+    """
+    if obj.is_nan():
+        return _pack_numeric_head(0, 0, NUMERIC_NAN, 0)
+    elif obj.is_infinite():
+        return _pack_numeric_head(
+            0, 0, NUMERIC_NINF if obj.is_signed() else NUMERIC_PINF, 0
+        )
+
+    sign, digits, exp = obj.as_tuple()
+    assert isinstance(exp, int)
+    dscale = -exp if exp < 0 else 0
+
+    # Pad the digits with zeros, on the right to make the exponent a multiple
+    # of DEC_DIGITS, on the left to make their number a multiple of it too.
+    rpad = exp % DEC_DIGITS
+    exp -= rpad
+    lpad = -(len(digits) + rpad) % DEC_DIGITS
+    s = "0" * lpad + "".join(map(str, digits)) + "0" * rpad
+    pgdigits = [
+        int(s[i : i + DEC_DIGITS]) for i in range(0, len(s), DEC_DIGITS)
+    ]
+    weight = len(pgdigits) - 1 + exp // DEC_DIGITS
+
+    # Drop the zero digits at the ends
+    i0 = 0
+    while i0 < len(pgdigits) and not pgdigits[i0]:
+        i0 += 1
+    if i0 == len(pgdigits):
+        return _pack_numeric_head(0, 0, NUMERIC_POS, dscale)
+    i1 = len(pgdigits)
+    while not pgdigits[i1 - 1]:
+        i1 -= 1
+    pgdigits = pgdigits[i0:i1]
+    weight -= i0
+
+    return _pack_numeric_head(
+        len(pgdigits), weight, NUMERIC_NEG if sign else NUMERIC_POS, dscale
+    ) + struct.pack(f"!{len(pgdigits)}H", *pgdigits)
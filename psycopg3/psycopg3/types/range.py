@@ -5,13 +5,16 @@ Support for range types adaptation.
 # Copyright (C) 2020-2021 The Psycopg Team
 
 import re
-from typing import cast, Any, Dict, Generic, Optional, Tuple, TypeVar, Type
+import struct
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple
+from typing import TypeVar, Type, cast
 from decimal import Decimal
 from datetime import date, datetime
 
 from ..pq import Format
-from ..oids import postgres_types as builtins, INVALID_OID
-from ..adapt import Buffer, Dumper, Format as Pg3Format
+from ..oids import postgres_types as builtins, INVALID_OID, TEXT_OID
+from ..adapt import Buffer, Dumper, Loader, Transformer, global_adapters
+from ..adapt import Format as Pg3Format
 from ..proto import AdaptContext
 from .._typeinfo import RangeInfo
 
@@ -19,6 +22,18 @@ from .composite import SequenceDumper, BaseCompositeLoader
 
 T = TypeVar("T")
 
+# Flags of the binary format of ranges, as defined in rangetypes.h
+RANGE_EMPTY = 0x01  # range is empty
+RANGE_LB_INC = 0x02  # lower bound is inclusive
+RANGE_UB_INC = 0x04  # upper bound is inclusive
+RANGE_LB_INF = 0x08  # lower bound is -infinity
+RANGE_UB_INF = 0x10  # upper bound is +infinity
+
+_pack_len = cast(Callable[[int], bytes], struct.Struct("!i").pack)
+_unpack_len = cast(
+    Callable[[Buffer, int], Tuple[int]], struct.Struct("!i").unpack_from
+)
+
 
 class Range(Generic[T]):
     """Python representation for a PostgreSQL |range|_ type.
@@ -209,58 +224,51 @@ class Range(Generic[T]):
             setattr(self, slot, value)
 
 
-class RangeDumper(SequenceDumper):
+class BaseRangeDumper(Dumper):
     """
-    Dumper for range types.
+    Base class for the dumpers of range types.
 
     The dumper can upgrade to one specific for a different range type.
     """
 
-    format = Format.TEXT
-
     def __init__(self, cls: type, context: Optional[AdaptContext] = None):
         super().__init__(cls, context)
+        self._tx = Transformer(context)
         self.sub_dumper: Optional[Dumper] = None
         self._types = context.adapters.types if context else builtins
 
-    def dump(self, obj: Range[Any]) -> bytes:
-        if not obj:
-            return b"empty"
-        else:
-            return self._dump_sequence(
-                (obj.lower, obj.upper),
-                b"[" if obj.lower_inc else b"(",
-                b"]" if obj.upper_inc else b")",
-                b",",
-            )
-
-    _re_needs_quotes = re.compile(br'[",\\\s()\[\]]')
-
     def get_key(self, obj: Range[Any], format: Pg3Format) -> Tuple[type, ...]:
         item = self._get_item(obj)
         if item is not None:
-            # TODO: binary range support
-            sd = self._tx.get_dumper(item, Pg3Format.TEXT)
+            sd = self._tx.get_dumper(item, format)
             return (self.cls, sd.cls)
         else:
             return (self.cls,)
 
-    def upgrade(self, obj: Range[Any], format: Pg3Format) -> "RangeDumper":
+    def upgrade(self, obj: Range[Any], format: Pg3Format) -> "BaseRangeDumper":
         item = self._get_item(obj)
         if item is None:
+            # Empty or unbounded ranges can only be dumped as text if the
+            # type is unknown.
             return RangeDumper(self.cls)
 
-        # TODO: binary range support
-        sd = self._tx.get_dumper(item, Pg3Format.TEXT)
-        dumper = type(self)(self.cls, self._tx)
-        dumper.sub_dumper = sd
-        if isinstance(item, int):
+        dumper: BaseRangeDumper
+        if type(item) is int:
             # postgres won't cast int4range -> int8range so we must use
             # text format and unknown oid here
+            sd = self._tx.get_dumper(item, Pg3Format.TEXT)
+            dumper = RangeDumper(self.cls, self._tx)
+            dumper.sub_dumper = sd
             dumper.oid = INVALID_OID
-        elif isinstance(item, str) and sd.oid == INVALID_OID:
+            return dumper
+
+        sd = self._tx.get_dumper(item, format)
+        dcls = RangeDumper if sd.format == Format.TEXT else RangeBinaryDumper
+        dumper = dcls(self.cls, self._tx)
+        dumper.sub_dumper = sd
+        if isinstance(item, str) and sd.oid == INVALID_OID:
             # Work around the normal mapping where text is dumped as unknown
-            dumper.oid = self._get_range_oid(self._types["text"].oid)
+            dumper.oid = self._get_range_oid(TEXT_OID)
         else:
             dumper.oid = self._get_range_oid(sd.oid)
         return dumper
@@ -282,6 +290,64 @@ class RangeDumper(SequenceDumper):
         return info.oid if info else INVALID_OID
 
 
+class RangeDumper(BaseRangeDumper, SequenceDumper):
+    """
+    Dumper for range types in text format.
+    """
+
+    format = Format.TEXT
+
+    def dump(self, obj: Range[Any]) -> bytes:
+        if not obj:
+            return b"empty"
+        else:
+            return self._dump_sequence(
+                (obj.lower, obj.upper),
+                b"[" if obj.lower_inc else b"(",
+                b"]" if obj.upper_inc else b")",
+                b",",
+            )
+
+    _re_needs_quotes = re.compile(br'[",\\\s()\[\]]')
+
+
+class RangeBinaryDumper(BaseRangeDumper):
+    """
+    Dumper for range types in binary format.
+    """
+
+    format = Format.BINARY
+
+    def dump(self, obj: Range[Any]) -> bytes:
+        if not obj:
+            return bytes([RANGE_EMPTY])
+
+        head = 0
+        data: List[Buffer] = [b""]  # placeholder for the flags
+
+        if obj.lower is not None:
+            if obj.lower_inc:
+                head |= RANGE_LB_INC
+            # If we get here, the sub_dumper must have been set
+            ad = self.sub_dumper.dump(obj.lower)  # type: ignore[union-attr]
+            data.append(_pack_len(len(ad)))
+            data.append(ad)
+        else:
+            head |= RANGE_LB_INF
+
+        if obj.upper is not None:
+            if obj.upper_inc:
+                head |= RANGE_UB_INC
+            ad = self.sub_dumper.dump(obj.upper)  # type: ignore[union-attr]
+            data.append(_pack_len(len(ad)))
+            data.append(ad)
+        else:
+            head |= RANGE_UB_INF
+
+        data[0] = bytes([head])
+        return b"".join(data)
+
+
 class RangeLoader(BaseCompositeLoader, Generic[T]):
     """Generic loader for a range.
 
@@ -306,16 +372,61 @@ class RangeLoader(BaseCompositeLoader, Generic[T]):
 _int2parens = {ord(c): c for c in "[]()"}
 
 
+class RangeBinaryLoader(Loader, Generic[T]):
+    """Generic loader for a range in binary format.
+
+    Subclasses shoud specify the oid of the subtype and the class to load.
+    """
+
+    format = Format.BINARY
+    subtype_oid: int
+
+    def __init__(self, oid: int, context: Optional[AdaptContext] = None):
+        super().__init__(oid, context)
+        self._tx = Transformer(context)
+
+    def load(self, data: Buffer) -> Range[T]:
+        head = data[0]
+        if head & RANGE_EMPTY:
+            return Range(empty=True)
+
+        load = self._tx.get_loader(self.subtype_oid, format=Format.BINARY).load
+        lb = "[" if head & RANGE_LB_INC else "("
+        ub = "]" if head & RANGE_UB_INC else ")"
+
+        pos = 1  # after the head
+        if head & RANGE_LB_INF:
+            min = None
+        else:
+            length = _unpack_len(data, pos)[0]
+            pos += 4
+            min = load(data[pos : pos + length])
+            pos += length
+
+        if head & RANGE_UB_INF:
+            max = None
+        else:
+            length = _unpack_len(data, pos)[0]
+            pos += 4
+            max = load(data[pos : pos + length])
+            pos += length
+
+        return Range(min, max, lb + ub)
+
+
 def register_adapters(
     info: RangeInfo, context: Optional["AdaptContext"]
 ) -> None:
-    # generate and register a customized text loader
-    loader: Type[RangeLoader[Any]] = type(
-        f"{info.name.title()}Loader",
-        (RangeLoader,),
-        {"subtype_oid": info.subtype_oid},
-    )
-    loader.register(info.oid, context=context)
+    adapters = context.adapters if context else global_adapters
+    for base in (RangeLoader, RangeBinaryLoader):
+        # Subclass the optimised loader, if available: the subclass, created
+        # here, wouldn't have an optimised version of its own.
+        base = adapters._get_optimised(cast(Type[Loader], base))
+        lname = f"{info.name.title()}{base.__name__}"
+        loader: Type[Loader] = type(
+            lname, (base,), {"subtype_oid": info.subtype_oid}
+        )
+        loader.register(info.oid, context=context)
 
 
 # Loaders for builtin range types
@@ -343,3 +454,27 @@ class TimestampRangeLoader(RangeLoader[datetime]):
 
 class TimestampTZRangeLoader(RangeLoader[datetime]):
     subtype_oid = builtins["timestamptz"].oid
+
+
+class Int4RangeBinaryLoader(RangeBinaryLoader[int]):
+    subtype_oid = builtins["int4"].oid
+
+
+class Int8RangeBinaryLoader(RangeBinaryLoader[int]):
+    subtype_oid = builtins["int8"].oid
+
+
+class NumericRangeBinaryLoader(RangeBinaryLoader[Decimal]):
+    subtype_oid = builtins["numeric"].oid
+
+
+class DateRangeBinaryLoader(RangeBinaryLoader[date]):
+    subtype_oid = builtins["date"].oid
+
+
+class TimestampRangeBinaryLoader(RangeBinaryLoader[datetime]):
+    subtype_oid = builtins["timestamp"].oid
+
+
+class TimestampTZRangeBinaryLoader(RangeBinaryLoader[datetime]):
+    subtype_oid = builtins["timestamptz"].oid
@@ -12,8 +12,8 @@ These functions are designed to consume the generators returned by the
 import select
 import selectors
 from enum import IntEnum
-from typing import Optional
-from asyncio import get_event_loop, Event
+from typing import Any, Callable, Optional
+from asyncio import get_event_loop, Future
 from selectors import DefaultSelector, EVENT_READ, EVENT_WRITE
 
 from . import errors as e
@@ -32,7 +32,10 @@ class Ready(IntEnum):
 
 
 def wait_selector(
-    gen: PQGen[RV], fileno: int, timeout: Optional[float] = None
+    gen: PQGen[RV],
+    fileno: int,
+    timeout: Optional[float] = None,
+    poller: Any = None,
 ) -> RV:
     """
     Wait for a generator using the best strategy available.
@@ -43,6 +46,8 @@ def wait_selector(
     :param timeout: timeout (in seconds) to check for other interrupt, e.g.
         to allow Ctrl-C.
     :type timeout: float
+    :param poller: an object returned by `new_poller()` for *fileno*, to
+        reuse instead of creating a new one.
     :return: whatever *gen* returns on completion.
 
     Consume *gen*, scheduling `fileno` for completion when it is reported to
@@ -50,13 +55,16 @@ def wait_selector(
     """
     try:
         s = next(gen)
-        sel = DefaultSelector()
+        sel = poller if poller is not None else DefaultSelector()
         while 1:
+            # Unregister on error too (e.g. Ctrl-C): the poller can be reused
             sel.register(fileno, s)
-            ready = None
-            while not ready:
-                ready = sel.select(timeout=timeout)
-            sel.unregister(fileno)
+            try:
+                ready = None
+                while not ready:
+                    ready = sel.select(timeout=timeout)
+            finally:
+                sel.unregister(fileno)
             s = gen.send(ready[0][1])
 
     except StopIteration as ex:
@@ -105,38 +113,43 @@ async def wait_async(gen: PQGen[RV], fileno: int) -> RV:
 
     Behave like in `wait()`, but exposing an `asyncio` interface.
     """
-    # Use an event to block and restart after the fd state changes.
-    # Not sure this is the best implementation but it's a start.
-    ev = Event()
+    # Use a future to block and restart after the fd state changes. The fd
+    # callbacks are removed as soon as the future is done, also if the wait is
+    # cancelled, so that they don't outlive the wait.
     loop = get_event_loop()
-    ready: Ready
+    fut: "Future[Ready]"
     s: Wait
 
     def wakeup(state: Ready) -> None:
-        nonlocal ready
-        ready = state
-        ev.set()
+        if not fut.done():
+            fut.set_result(state)
 
     try:
         s = next(gen)
         while 1:
-            ev.clear()
+            fut = loop.create_future()
             if s == Wait.R:
                 loop.add_reader(fileno, wakeup, Ready.R)
-                await ev.wait()
-                loop.remove_reader(fileno)
+                try:
+                    ready = await fut
+                finally:
+                    loop.remove_reader(fileno)
             elif s == Wait.W:
                 loop.add_writer(fileno, wakeup, Ready.W)
-                await ev.wait()
-                loop.remove_writer(fileno)
+                try:
+                    ready = await fut
+                finally:
+                    loop.remove_writer(fileno)
             elif s == Wait.RW:
                 loop.add_reader(fileno, wakeup, Ready.R)
                 loop.add_writer(fileno, wakeup, Ready.W)
-                await ev.wait()
-                loop.remove_reader(fileno)
-                loop.remove_writer(fileno)
+                try:
+                    ready = await fut
+                finally:
+                    loop.remove_reader(fileno)
+                    loop.remove_writer(fileno)
             else:
-                raise e.InternalError("bad poll status: %s")
+                raise e.InternalError(f"bad poll status: {s}")
             s = gen.send(ready)
 
     except StopIteration as ex:
@@ -157,38 +170,43 @@ async def wait_conn_async(gen: PQGenConn[RV]) -> RV:
     Behave like in `wait()`, but take the fileno to wait from the generator
     itself, which might change during processing.
     """
-    # Use an event to block and restart after the fd state changes.
-    # Not sure this is the best implementation but it's a start.
-    ev = Event()
+    # Use a future to block and restart after the fd state changes. The fd
+    # callbacks are removed as soon as the future is done, also if the wait is
+    # cancelled, so that they don't outlive the wait.
     loop = get_event_loop()
-    ready: Ready
+    fut: "Future[Ready]"
     s: Wait
 
     def wakeup(state: Ready) -> None:
-        nonlocal ready
-        ready = state
-        ev.set()
+        if not fut.done():
+            fut.set_result(state)
 
     try:
         fileno, s = next(gen)
         while 1:
-            ev.clear()
+            fut = loop.create_future()
             if s == Wait.R:
                 loop.add_reader(fileno, wakeup, Ready.R)
-                await ev.wait()
-                loop.remove_reader(fileno)
+                try:
+                    ready = await fut
+                finally:
+                    loop.remove_reader(fileno)
             elif s == Wait.W:
                 loop.add_writer(fileno, wakeup, Ready.W)
-                await ev.wait()
-                loop.remove_writer(fileno)
+                try:
+                    ready = await fut
+                finally:
+                    loop.remove_writer(fileno)
             elif s == Wait.RW:
                 loop.add_reader(fileno, wakeup, Ready.R)
                 loop.add_writer(fileno, wakeup, Ready.W)
-                await ev.wait()
-                loop.remove_reader(fileno)
-                loop.remove_writer(fileno)
+                try:
+                    ready = await fut
+                finally:
+                    loop.remove_reader(fileno)
+                    loop.remove_writer(fileno)
             else:
-                raise e.InternalError("bad poll status: %s")
+                raise e.InternalError(f"bad poll status: {s}")
             fileno, s = gen.send(ready)
 
     except StopIteration as ex:
@@ -196,8 +214,18 @@ async def wait_conn_async(gen: PQGenConn[RV]) -> RV:
         return rv
 
 
+def new_poller_selector(fileno: int) -> selectors.BaseSelector:
+    """
+    Return an object to wait on *fileno* with `wait_selector()`.
+    """
+    return DefaultSelector()
+
+
 def wait_epoll(
-    gen: PQGen[RV], fileno: int, timeout: Optional[float] = None
+    gen: PQGen[RV],
+    fileno: int,
+    timeout: Optional[float] = None,
+    poller: Any = None,
 ) -> RV:
     """
     Wait for a generator using epoll where supported.
@@ -205,6 +233,10 @@ def wait_epoll(
     Parameters are like for `wait()`. If it is detected that the best selector
     strategy is `epoll` then this function will be used instead of `wait`.
 
+    The events are registered with `!EPOLLONESHOT`, so a *poller* created by
+    `new_poller()` can be re-armed by every call, without registering and
+    unregistering *fileno*.
+
     See also: https://linux.die.net/man/2/epoll_ctl
     """
     if timeout is None or timeout < 0:
@@ -214,9 +246,13 @@ def wait_epoll(
 
     try:
         s = next(gen)
-        epoll = select.epoll()
         evmask = poll_evmasks[s]
-        epoll.register(fileno, evmask)
+        if poller is not None:
+            epoll = poller
+            epoll.modify(fileno, evmask)
+        else:
+            epoll = select.epoll()
+            epoll.register(fileno, evmask)
         while 1:
             fileevs = None
             while not fileevs:
@@ -235,8 +271,22 @@ def wait_epoll(
         return rv
 
 
+def new_poller_epoll(fileno: int) -> "select.epoll":
+    """
+    Return an epoll object to wait on *fileno* with `wait_epoll()`.
+
+    No event is armed on *fileno* until `!wait_epoll()` is called.
+    """
+    epoll = select.epoll()
+    epoll.register(fileno, select.EPOLLONESHOT)
+    return epoll
+
+
+new_poller: Callable[[int], Any]
+
 if selectors.DefaultSelector is getattr(selectors, "EpollSelector", None):
     wait = wait_epoll
+    new_poller = new_poller_epoll
 
     poll_evmasks = {
         Wait.R: select.EPOLLONESHOT | select.EPOLLIN,
@@ -246,3 +296,4 @@ if selectors.DefaultSelector is getattr(selectors, "EpollSelector", None):
 
 else:
     wait = wait_selector
+    new_poller = new_poller_selector
@@ -31,6 +31,14 @@ extras_require = {
     "binary": [
         f"psycopg3-binary == {version}",
     ],
+    # Load query results into NumPy arrays
+    "numpy": [
+        "numpy >= 1.17",
+    ],
+    # Convert query results into Apache Arrow record batches
+    "arrow": [
+        "pyarrow >= 3",
+    ],
     "test": [
         "pytest >= 6, < 6.1",
         "pytest-asyncio >= 0.14.0, < 0.15",
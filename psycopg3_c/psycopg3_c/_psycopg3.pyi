@@ -7,7 +7,7 @@ information. Will submit a bug.
 
 # Copyright (C) 2020-2021 The Psycopg Team
 
-from typing import Any, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
 
 from psycopg3 import proto
 from psycopg3.adapt import Dumper, Loader, AdaptersMap, Format
@@ -33,8 +33,10 @@ class Transformer(proto.AdaptContext):
     def dump_sequence(
         self, params: Sequence[Any], formats: Sequence[Format]
     ) -> Tuple[List[Any], Tuple[int, ...], Sequence[pq.Format]]: ...
+    def reset_row_dumpers(self) -> None: ...
     def get_dumper(self, obj: Any, format: Format) -> Dumper: ...
     def load_rows(self, row0: int, row1: int) -> List[proto.Row]: ...
+    def load_column(self, col: int, row0: int, row1: int) -> List[Any]: ...
     def load_row(self, row: int) -> Optional[proto.Row]: ...
     def load_sequence(
         self, record: Sequence[Optional[bytes]]
@@ -44,6 +46,27 @@ class Transformer(proto.AdaptContext):
 # Generators
 def connect(conninfo: str) -> proto.PQGenConn[PGconn]: ...
 def execute(pgconn: PGconn) -> proto.PQGen[List[PGresult]]: ...
+def send(pgconn: PGconn) -> proto.PQGen[None]: ...
+def fetch_many(pgconn: PGconn) -> proto.PQGen[List[PGresult]]: ...
+def fetch(pgconn: PGconn) -> proto.PQGen[Optional[PGresult]]: ...
+def notifies(pgconn: PGconn) -> proto.PQGen[List[pq.PGnotify]]: ...
+def copy_from(pgconn: PGconn) -> proto.PQGen[Union[memoryview, PGresult]]: ...
+def copy_to(pgconn: PGconn, buffer: bytes) -> proto.PQGen[None]: ...
+def copy_end(
+    pgconn: PGconn, error: Optional[bytes]
+) -> proto.PQGen[PGresult]: ...
+
+# Waiting
+class Poller:
+    def close(self) -> None: ...
+
+def new_poller_c(fileno: int) -> Poller: ...
+def wait_c(
+    gen: proto.PQGen[proto.RV],
+    fileno: int,
+    timeout: Optional[float] = None,
+    poller: Optional[Poller] = None,
+) -> proto.RV: ...
 
 # Copy support
 def format_row_text(
@@ -57,4 +80,15 @@ def parse_row_binary(
     data: bytes, tx: proto.Transformer
 ) -> Tuple[Any, ...]: ...
 
+# Columnar fetch support
+def fill_buffer(
+    pgresult: PGresult,
+    col: int,
+    row0: int,
+    row1: int,
+    itemsize: int,
+    data: Any,
+    mask: Any = None,
+) -> int: ...
+
 # vim: set syntax=python:
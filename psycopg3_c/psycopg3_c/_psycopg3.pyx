@@ -26,7 +26,12 @@ include "_psycopg3/adapt.pyx"
 include "_psycopg3/copy.pyx"
 include "_psycopg3/generators.pyx"
 include "_psycopg3/transform.pyx"
+include "_psycopg3/waiting.pyx"
+include "_psycopg3/columnar.pyx"
 
+include "types/array.pyx"
+include "types/composite.pyx"
+include "types/date.pyx"
 include "types/numeric.pyx"
 include "types/singletons.pyx"
 include "types/text.pyx"
@@ -0,0 +1,115 @@
+"""
+C optimised functions to load results by column.
+
+"""
+
+# Copyright (C) 2021 The Psycopg Team
+
+from libc.string cimport memcpy, memset
+from libc.stdint cimport uint16_t, uint32_t, uint64_t
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release
+from cpython.buffer cimport PyBUF_WRITABLE
+
+from psycopg3_c._psycopg3 cimport endian
+
+
+def fill_buffer(
+    pq.PGresult pgresult,
+    int col,
+    int row0,
+    int row1,
+    int itemsize,
+    object data,
+    object mask = None,
+) -> int:
+    """
+    Copy the values of a fixed-width binary column into a buffer.
+
+    *data* is a writable buffer receiving the values of the rows from *row0*
+    to *row1*, converted to the native byte order; every value in the result
+    must be *itemsize* bytes long.
+
+    If *mask* is a writable buffer, its items are set to 1 for the NULL
+    values, and the corresponding *data* items are set to zero. Return the
+    number of NULL values found. If *mask* is `!None`, return -1 as soon as a
+    NULL value is found.
+    """
+    cdef libpq.PGresult *res = pgresult.pgresult_ptr
+    # cheeky access to the internal PGresult structure
+    cdef pg_result_int *ires = <pg_result_int*>res
+
+    if not 0 <= col < ires.numAttributes:
+        raise e.InterfaceError(
+            f"column must be included between 0 and {ires.numAttributes - 1}"
+        )
+    if not (0 <= row0 <= ires.ntups and row0 <= row1 <= ires.ntups):
+        raise e.InterfaceError(
+            f"rows must be included between 0 and {ires.ntups}"
+        )
+    if itemsize not in (1, 2, 4, 8):
+        raise ValueError(f"bad itemsize: {itemsize}")
+
+    cdef Py_buffer dbuf
+    cdef Py_buffer mbuf
+    cdef int has_mask = mask is not None
+    PyObject_GetBuffer(data, &dbuf, PyBUF_WRITABLE)
+    if has_mask:
+        try:
+            PyObject_GetBuffer(mask, &mbuf, PyBUF_WRITABLE)
+        except Exception:
+            PyBuffer_Release(&dbuf)
+            raise
+
+    cdef int row
+    cdef int nnulls = 0
+    cdef char *target = <char *>dbuf.buf
+    cdef char *mtarget = <char *>mbuf.buf if has_mask else NULL
+    cdef PGresAttValue *attval
+    cdef uint16_t val16
+    cdef uint32_t val32
+    cdef uint64_t val64
+
+    try:
+        if dbuf.len < (row1 - row0) * itemsize:
+            raise ValueError("data buffer too small")
+        if has_mask and mbuf.len < row1 - row0:
+            raise ValueError("mask buffer too small")
+
+        for row in range(row0, row1):
+            attval = &(ires.tuples[row][col])
+            if attval.len == -1:  # NULL_LEN
+                if not has_mask:
+                    return -1
+                memset(target, 0, itemsize)
+                mtarget[row - row0] = 1
+                nnulls += 1
+
+            elif attval.len != itemsize:
+                raise e.InterfaceError(
+                    f"expected values of {itemsize} bytes, got {attval.len}"
+                )
+
+            # The values in the result may be not aligned: copy them first
+            elif itemsize == 8:
+                memcpy(&val64, attval.value, 8)
+                val64 = endian.be64toh(val64)
+                memcpy(target, &val64, 8)
+            elif itemsize == 4:
+                memcpy(&val32, attval.value, 4)
+                val32 = endian.be32toh(val32)
+                memcpy(target, &val32, 4)
+            elif itemsize == 2:
+                memcpy(&val16, attval.value, 2)
+                val16 = endian.be16toh(val16)
+                memcpy(target, &val16, 2)
+            else:
+                target[0] = attval.value[0]
+
+            target += itemsize
+
+    finally:
+        PyBuffer_Release(&dbuf)
+        if has_mask:
+            PyBuffer_Release(&mbuf)
+
+    return nnulls
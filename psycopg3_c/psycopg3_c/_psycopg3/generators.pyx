@@ -4,15 +4,20 @@ C implementation of generators for the communication protocols with the libpq
 
 # Copyright (C) 2020-2021 The Psycopg Team
 
+from cpython.bytes cimport PyBytes_AsString
 from cpython.object cimport PyObject_CallFunctionObjArgs
+from cpython.memoryview cimport PyMemoryView_FromObject
+
+from psycopg3_c.pq cimport _buffer_as_string_and_size
 
 import logging
-from typing import List
+from typing import List, Optional, Union
 
 from psycopg3 import errors as e
 from psycopg3.pq import proto, error_message
 from psycopg3.proto import PQGen
 from psycopg3.waiting import Wait, Ready
+from psycopg3.encodings import py_codecs
 
 cdef object WAIT_W = Wait.W
 cdef object WAIT_R = Wait.R
@@ -69,28 +74,26 @@ def execute(pq.PGconn pgconn) -> PQGen[List[proto.PGresult]]:
     cdef list results = []
     cdef libpq.PGconn *pgconn_ptr = pgconn.pgconn_ptr
     cdef int status
-    cdef libpq.PGnotify *notify
     cdef libpq.PGresult *pgres
-    cdef int cires, ibres
+    cdef int cires, ibres, f
 
     # Sending the query
     while 1:
-        if libpq.PQflush(pgconn_ptr) == 0:
+        with nogil:
+            f = libpq.PQflush(pgconn_ptr)
+        if f == 0:
             break
+        if f < 0:
+            raise e.OperationalError(
+                f"flushing failed: {error_message(pgconn)}")
 
         status = yield WAIT_RW
         if status & READY_R:
-            with nogil:
-                # This call may read notifies which will be saved in the
-                # PGconn buffer and passed to Python later.
-                cires = libpq.PQconsumeInput(pgconn_ptr)
-            if 1 != cires:
-                raise e.OperationalError(
-                    f"consuming input failed: {error_message(pgconn)}")
+            # This call may read notifies which will be saved in the
+            # PGconn buffer and passed to Python later.
+            _consume_input(pgconn)
         continue
 
-    cdef object notify_handler = pgconn.notify_handler
-
     # Fetching the result
     while 1:
         with nogil:
@@ -105,21 +108,7 @@ def execute(pq.PGconn pgconn) -> PQGen[List[proto.PGresult]]:
             yield WAIT_R
             continue
 
-        # Consume notifies
-        if notify_handler is not None:
-            while 1:
-                pynotify = pgconn.notifies()
-                if pynotify is None:
-                    break
-                PyObject_CallFunctionObjArgs(
-                    notify_handler, <PyObject *>pynotify, NULL
-                )
-        else:
-            while 1:
-                notify = libpq.PQnotifies(pgconn_ptr)
-                if notify is NULL:
-                    break
-                libpq.PQfreemem(notify)
+        _consume_notifies(pgconn)
 
         pgres = libpq.PQgetResult(pgconn_ptr)
         if pgres is NULL:
@@ -133,3 +122,248 @@ def execute(pq.PGconn pgconn) -> PQGen[List[proto.PGresult]]:
             break
 
     return results
+
+
+def send(pq.PGconn pgconn) -> PQGen[None]:
+    """
+    Generator to send a query to the server without blocking.
+
+    The query must have already been sent using `pgconn.send_query()` or
+    similar. Flush the query and then return the result using nonblocking
+    functions.
+
+    After this generator has finished you may want to cycle using `fetch()`
+    to retrieve the results available.
+    """
+    cdef int status
+    cdef int f
+
+    while 1:
+        if pgconn.pgconn_ptr is NULL:
+            raise e.OperationalError(
+                "flushing failed: the connection is closed")
+        with nogil:
+            f = libpq.PQflush(pgconn.pgconn_ptr)
+        if f == 0:
+            break
+        if f < 0:
+            raise e.OperationalError(
+                f"flushing failed: {error_message(pgconn)}")
+
+        status = yield WAIT_RW
+        if status & READY_R:
+            # This call may read notifies: they will be saved in the
+            # PGconn buffer and passed to Python later, in `fetch()`.
+            _consume_input(pgconn)
+
+
+def fetch_many(pq.PGconn pgconn) -> PQGen[List[proto.PGresult]]:
+    """
+    Generator retrieving results from the database without blocking.
+
+    The query must have already been sent to the server, so pgconn.flush() has
+    already returned 0.
+
+    Return the list of results returned by the database (whether success
+    or error).
+    """
+    cdef list results = []
+    cdef libpq.PGresult *pgres
+    cdef int status
+
+    while 1:
+        while _is_busy(pgconn):
+            yield WAIT_R
+
+        _consume_notifies(pgconn)
+
+        pgres = libpq.PQgetResult(pgconn.pgconn_ptr)
+        if pgres is NULL:
+            break
+        results.append(pq.PGresult._from_ptr(pgres))
+
+        status = libpq.PQresultStatus(pgres)
+        if status in (libpq.PGRES_COPY_IN, libpq.PGRES_COPY_OUT, libpq.PGRES_COPY_BOTH):
+            # After entering copy mode the libpq will create a phony result
+            # for every request so let's break the endless loop.
+            break
+
+    return results
+
+
+def fetch(pq.PGconn pgconn) -> PQGen[Optional[proto.PGresult]]:
+    """
+    Generator retrieving a single result from the database without blocking.
+
+    The query must have already been sent to the server, so pgconn.flush() has
+    already returned 0.
+
+    Return a result from the database (whether success or error).
+    """
+    while _is_busy(pgconn):
+        yield WAIT_R
+
+    _consume_notifies(pgconn)
+
+    cdef libpq.PGresult *pgres = libpq.PQgetResult(pgconn.pgconn_ptr)
+    if pgres is NULL:
+        return None
+    return pq.PGresult._from_ptr(pgres)
+
+
+def notifies(pq.PGconn pgconn) -> PQGen[List[proto.PGnotify]]:
+    yield WAIT_R
+    _consume_input(pgconn)
+
+    cdef list ns = []
+    while 1:
+        n = pgconn.notifies()
+        if n is None:
+            break
+        ns.append(n)
+
+    return ns
+
+
+def copy_from(pq.PGconn pgconn) -> PQGen[Union[memoryview, proto.PGresult]]:
+    cdef char *buffer_ptr = NULL
+    cdef int nbytes
+
+    while 1:
+        nbytes = libpq.PQgetCopyData(pgconn.pgconn_ptr, &buffer_ptr, 1)
+        if nbytes == -2:
+            raise e.OperationalError(
+                f"receiving copy data failed: {error_message(pgconn)}")
+        if nbytes != 0:
+            break
+
+        # would block
+        yield WAIT_R
+        _consume_input(pgconn)
+
+    if nbytes > 0:
+        # some data
+        return PyMemoryView_FromObject(
+            pq.PQBuffer._from_buffer(<unsigned char *>buffer_ptr, nbytes))
+
+    # Retrieve the final result of copy
+    results = yield from fetch_many(pgconn)
+    return _copy_result(pgconn, results)
+
+
+def copy_to(pq.PGconn pgconn, buffer) -> PQGen[None]:
+    cdef char *cbuffer
+    cdef Py_ssize_t length
+    cdef int rv
+
+    # Retry enqueuing data until successful
+    while 1:
+        _buffer_as_string_and_size(buffer, &cbuffer, &length)
+        rv = libpq.PQputCopyData(pgconn.pgconn_ptr, cbuffer, length)
+        if rv > 0:
+            break
+        if rv < 0:
+            raise e.OperationalError(
+                f"sending copy data failed: {error_message(pgconn)}")
+        yield WAIT_W
+
+
+def copy_end(pq.PGconn pgconn, error: Optional[bytes]) -> PQGen[proto.PGresult]:
+    cdef const char *cerr = NULL
+    cdef int rv
+
+    # Retry enqueuing end copy message until successful
+    while 1:
+        if error is not None:
+            cerr = PyBytes_AsString(error)
+        rv = libpq.PQputCopyEnd(pgconn.pgconn_ptr, cerr)
+        if rv > 0:
+            break
+        if rv < 0:
+            raise e.OperationalError(
+                f"sending copy end failed: {error_message(pgconn)}")
+        yield WAIT_W
+
+    # Repeat until it the message is flushed to the server
+    while 1:
+        yield WAIT_W
+        if pgconn.pgconn_ptr is NULL:
+            raise e.OperationalError(
+                "flushing failed: the connection is closed")
+        with nogil:
+            rv = libpq.PQflush(pgconn.pgconn_ptr)
+        if rv == 0:
+            break
+        if rv < 0:
+            raise e.OperationalError(
+                f"flushing failed: {error_message(pgconn)}")
+
+    # Retrieve the final result of copy
+    results = yield from fetch_many(pgconn)
+    return _copy_result(pgconn, results)
+
+
+cdef int _consume_input(pq.PGconn pgconn) except -1:
+    cdef int cires
+    with nogil:
+        cires = libpq.PQconsumeInput(pgconn.pgconn_ptr)
+    if 1 != cires:
+        raise e.OperationalError(
+            f"consuming input failed: {error_message(pgconn)}")
+    return 0
+
+
+cdef int _is_busy(pq.PGconn pgconn) except -1:
+    """
+    Read the input available and return 1 if a result is not ready yet.
+    """
+    cdef libpq.PGconn *pgconn_ptr = pgconn.pgconn_ptr
+    cdef int cires, ibres = 0
+    with nogil:
+        cires = libpq.PQconsumeInput(pgconn_ptr)
+        if cires == 1:
+            ibres = libpq.PQisBusy(pgconn_ptr)
+    if 1 != cires:
+        raise e.OperationalError(
+            f"consuming input failed: {error_message(pgconn)}")
+    return ibres
+
+
+cdef int _consume_notifies(pq.PGconn pgconn) except -1:
+    """
+    Pass the notifies received to the connection handler, if any.
+    """
+    cdef object notify_handler = pgconn.notify_handler
+    cdef libpq.PGnotify *notify
+
+    if notify_handler is not None:
+        while 1:
+            pynotify = pgconn.notifies()
+            if pynotify is None:
+                break
+            PyObject_CallFunctionObjArgs(
+                notify_handler, <PyObject *>pynotify, NULL
+            )
+    else:
+        while 1:
+            notify = libpq.PQnotifies(pgconn.pgconn_ptr)
+            if notify is NULL:
+                break
+            libpq.PQfreemem(notify)
+
+    return 0
+
+
+cdef object _copy_result(pq.PGconn pgconn, list results):
+    """
+    Return the final result of a copy operation, raising if it failed.
+    """
+    cdef pq.PGresult result
+    (result,) = results
+    if libpq.PQresultStatus(result.pgresult_ptr) != libpq.PGRES_COMMAND_OK:
+        encoding = py_codecs.get(
+            pgconn.parameter_status(b"client_encoding") or "", "utf-8"
+        )
+        raise e.error_from_result(result, encoding=encoding)
+
+    return result
@@ -274,6 +274,9 @@ cdef class Transformer:
 
         return ps, ts, fs
 
+    def reset_row_dumpers(self) -> None:
+        self._row_dumpers = None
+
     def load_rows(self, int row0, int row1) -> List[Row]:
         if self._pgresult is None:
             raise e.InterfaceError("result not set")
@@ -345,6 +348,49 @@ cdef class Transformer:
                 Py_DECREF(<object>brecord)
         return records
 
+    def load_column(self, int col, int row0, int row1) -> List[Any]:
+        if self._pgresult is None:
+            raise e.InterfaceError("result not set")
+
+        if not 0 <= col < self._nfields:
+            raise e.InterfaceError(
+                f"column must be included between 0 and {self._nfields - 1}"
+            )
+
+        if not (0 <= row0 <= self._ntuples and 0 <= row1 <= self._ntuples):
+            raise e.InterfaceError(
+                f"rows must be included between 0 and {self._ntuples}"
+            )
+
+        cdef libpq.PGresult *res = self._pgresult.pgresult_ptr
+        # cheeky access to the internal PGresult structure
+        cdef pg_result_int *ires = <pg_result_int*>res
+
+        cdef int row
+        cdef PGresAttValue *attval
+        cdef PyObject *loader = PyList_GET_ITEM(self._row_loaders, col)
+
+        cdef object values = PyList_New(row1 - row0)
+        for row in range(row0, row1):
+            attval = &(ires.tuples[row][col])
+            if attval.len == -1:  # NULL_LEN
+                pyval = None
+            elif (<RowLoader>loader).cloader is not None:
+                pyval = (<RowLoader>loader).cloader.cload(
+                    attval.value, attval.len)
+            else:
+                b = PyMemoryView_FromObject(
+                    ViewBuffer._from_buffer(
+                        self._pgresult,
+                        <unsigned char *>attval.value, attval.len))
+                pyval = PyObject_CallFunctionObjArgs(
+                    (<RowLoader>loader).loadfunc, <PyObject *>b, NULL)
+
+            Py_INCREF(pyval)
+            PyList_SET_ITEM(values, row - row0, pyval)
+
+        return values
+
     def load_row(self, int row) -> Optional[Row]:
         if self._pgresult is None:
             return None
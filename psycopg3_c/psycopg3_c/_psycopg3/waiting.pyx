@@ -0,0 +1,109 @@
+"""
+C implementation of waiting functions
+"""
+
+# Copyright (C) 2021 The Psycopg Team
+
+from libc.errno cimport errno, EINTR
+from cpython.exc cimport PyErr_CheckSignals, PyErr_SetFromErrno
+
+from psycopg3.proto import PQGen, RV
+from psycopg3.waiting import Wait, Ready
+
+cdef extern from "<poll.h>" nogil:
+    cdef struct pollfd:
+        int fd
+        short events
+        short revents
+
+    ctypedef unsigned long nfds_t
+
+    int poll(pollfd *fds, nfds_t nfds, int timeout)
+
+    enum:
+        POLLIN
+        POLLOUT
+
+cdef int C_WAIT_R = Wait.R
+cdef int C_WAIT_W = Wait.W
+cdef object PY_READY_R = Ready.R
+cdef object PY_READY_W = Ready.W
+
+
+cdef class Poller:
+    """
+    The state used by `wait_c()` to wait on a file descriptor.
+
+    poll() doesn't need a kernel object, so there is nothing to release on
+    close.
+    """
+    cdef pollfd pfd
+
+    def __cinit__(self, int fileno):
+        self.pfd.fd = fileno
+
+    def close(self) -> None:
+        pass
+
+
+def new_poller_c(int fileno) -> Poller:
+    """
+    Return an object to wait on *fileno* with `wait_c()`.
+    """
+    return Poller(fileno)
+
+
+def wait_c(
+    gen: PQGen[RV], int fileno, timeout = None, Poller poller = None
+) -> RV:
+    """
+    Wait for a generator using poll(), releasing the GIL while waiting.
+
+    Parameters are like for `psycopg3.waiting.wait()`.
+    """
+    if poller is None:
+        poller = Poller(fileno)
+    else:
+        poller.pfd.fd = fileno
+
+    cdef int ctimeout = -1
+    if timeout is not None and timeout >= 0:
+        ctimeout = <int>(timeout * 1000.0)
+
+    cdef pollfd *pfd = &poller.pfd
+    cdef int wait
+    cdef int rv
+
+    try:
+        wait = next(gen)
+        while 1:
+            pfd.events = 0
+            if wait & C_WAIT_R:
+                pfd.events |= POLLIN
+            if wait & C_WAIT_W:
+                pfd.events |= POLLOUT
+            pfd.revents = 0
+
+            with nogil:
+                rv = poll(pfd, 1, ctimeout)
+
+            if rv == 0:
+                # Timeout: give a chance to handle signals, e.g. Ctrl-C
+                PyErr_CheckSignals()
+                continue
+            elif rv < 0:
+                if errno == EINTR:
+                    PyErr_CheckSignals()
+                    continue
+                PyErr_SetFromErrno(OSError)
+
+            # Errors and hangups are reported as ready to read, so that the
+            # generator finds out about them, as in wait_epoll().
+            if pfd.revents & ~POLLOUT:
+                ready = PY_READY_R
+            else:
+                ready = PY_READY_W
+            wait = gen.send(ready)
+
+    except StopIteration as ex:
+        return ex.args[0] if ex.args else None
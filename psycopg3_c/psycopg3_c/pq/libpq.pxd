@@ -4,6 +4,11 @@ Libpq header definition for the cython psycopg3.pq implementation.
 
 # Copyright (C) 2020-2021 The Psycopg Team
 
+cdef extern from "pg_config.h":
+    # The version of the libpq headers psycopg3 is built against.
+    int PG_VERSION_NUM
+
+
 cdef extern from "libpq-fe.h":
     int PQlibVersion()
 
@@ -93,14 +98,14 @@ cdef extern from "libpq-fe.h":
         PGRES_SINGLE_TUPLE
 
     # 33.1. Database Connection Control Functions
-    PGconn *PQconnectdb(const char *conninfo)
+    PGconn *PQconnectdb(const char *conninfo) nogil
     PGconn *PQconnectStart(const char *conninfo)
     PostgresPollingStatusType PQconnectPoll(PGconn *conn)
     PQconninfoOption *PQconndefaults()
     PQconninfoOption *PQconninfo(PGconn *conn)
     PQconninfoOption *PQconninfoParse(const char *conninfo, char **errmsg)
     void PQfinish(PGconn *conn)
-    void PQreset(PGconn *conn)
+    void PQreset(PGconn *conn) nogil
     int PQresetStart(PGconn *conn)
     PostgresPollingStatusType PQresetPoll(PGconn *conn)
     PGPing PQping(const char *conninfo)
@@ -223,12 +228,14 @@ cdef extern from "libpq-fe.h":
                             int resultFormat) nogil
     int PQsendDescribePrepared(PGconn *conn, const char *stmtName)
     int PQsendDescribePortal(PGconn *conn, const char *portalName)
-    PGresult *PQgetResult(PGconn *conn)
+    PGresult *PQgetResult(PGconn *conn) nogil
     int PQconsumeInput(PGconn *conn) nogil
     int PQisBusy(PGconn *conn) nogil
     int PQsetnonblocking(PGconn *conn, int arg)
     int PQisnonblocking(const PGconn *conn)
-    int PQflush(PGconn *conn)
+    int PQflush(PGconn *conn) nogil
+
+    # Pipeline Mode: see below
 
     # 33.5. Retrieving Query Results Row-by-Row
     int PQsetSingleRowMode(PGconn *conn)
@@ -236,15 +243,15 @@ cdef extern from "libpq-fe.h":
     # 33.6. Canceling Queries in Progress
     PGcancel *PQgetCancel(PGconn *conn)
     void PQfreeCancel(PGcancel *cancel)
-    int PQcancel(PGcancel *cancel, char *errbuf, int errbufsize)
+    int PQcancel(PGcancel *cancel, char *errbuf, int errbufsize) nogil
 
     # 33.8. Asynchronous Notification
     PGnotify *PQnotifies(PGconn *conn) nogil
 
     # 33.9. Functions Associated with the COPY Command
-    int PQputCopyData(PGconn *conn, const char *buffer, int nbytes)
-    int PQputCopyEnd(PGconn *conn, const char *errormsg)
-    int PQgetCopyData(PGconn *conn, char **buffer, int async)
+    int PQputCopyData(PGconn *conn, const char *buffer, int nbytes) nogil
+    int PQputCopyEnd(PGconn *conn, const char *errormsg) nogil
+    int PQgetCopyData(PGconn *conn, char **buffer, int async) nogil
 
     # 33.11. Miscellaneous Functions
     void PQfreemem(void *ptr) nogil
@@ -257,3 +264,45 @@ cdef extern from "libpq-fe.h":
     ctypedef void (*PQnoticeReceiver)(void *arg, const PGresult *res)
     PQnoticeReceiver PQsetNoticeReceiver(
         PGconn *conn, PQnoticeReceiver prog, void *arg)
+
+
+# Pipeline Mode (available from libpq 14)
+cdef extern from *:
+    """
+/* Allow building against a libpq without pipeline mode. The functions are
+ * replaced by stubs which are never called: see _check_supported() in pgconn.pyx
+ */
+#if PG_VERSION_NUM < 140000
+typedef enum {
+    PQ_PIPELINE_OFF,
+    PQ_PIPELINE_ON,
+    PQ_PIPELINE_ABORTED
+} PGpipelineStatus;
+
+#define PQpipelineStatus(conn) PQ_PIPELINE_OFF
+#define PQenterPipelineMode(conn) 0
+#define PQexitPipelineMode(conn) 0
+#define PQpipelineSync(conn) 0
+#define PQsendFlushRequest(conn) 0
+#endif
+"""
+    ctypedef enum PGpipelineStatus:
+        PQ_PIPELINE_OFF
+        PQ_PIPELINE_ON
+        PQ_PIPELINE_ABORTED
+
+    PGpipelineStatus PQpipelineStatus(const PGconn *conn)
+    int PQenterPipelineMode(PGconn *conn)
+    int PQexitPipelineMode(PGconn *conn)
+    int PQpipelineSync(PGconn *conn)
+    int PQsendFlushRequest(PGconn *conn)
+
+
+# Retrieving Query Results in Chunks (available from libpq 17)
+cdef extern from *:
+    """
+#if PG_VERSION_NUM < 170000
+#define PQsetChunkedRowsMode(conn, chunkSize) 0
+#endif
+"""
+    int PQsetChunkedRowsMode(PGconn *conn, int chunkSize)
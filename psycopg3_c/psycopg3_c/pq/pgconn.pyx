@@ -44,7 +44,9 @@ cdef class PGconn:
 
     @classmethod
     def connect(cls, const char *conninfo) -> PGconn:
-        cdef libpq.PGconn* pgconn = libpq.PQconnectdb(conninfo)
+        cdef libpq.PGconn* pgconn
+        with nogil:
+            pgconn = libpq.PQconnectdb(conninfo)
         if not pgconn:
             raise MemoryError("couldn't allocate PGconn")
 
@@ -85,7 +87,8 @@ cdef class PGconn:
 
     def reset(self) -> None:
         _ensure_pgconn(self)
-        libpq.PQreset(self.pgconn_ptr)
+        with nogil:
+            libpq.PQreset(self.pgconn_ptr)
 
     def reset_start(self) -> None:
         if not libpq.PQresetStart(self.pgconn_ptr):
@@ -396,13 +399,18 @@ cdef class PGconn:
             )
 
     def get_result(self) -> Optional["PGresult"]:
-        cdef libpq.PGresult *pgresult = libpq.PQgetResult(self.pgconn_ptr)
+        cdef libpq.PGresult *pgresult
+        with nogil:
+            pgresult = libpq.PQgetResult(self.pgconn_ptr)
         if pgresult is NULL:
             return None
         return PGresult._from_ptr(pgresult)
 
     def consume_input(self) -> None:
-        if 1 != libpq.PQconsumeInput(self.pgconn_ptr):
+        cdef int rv
+        with nogil:
+            rv = libpq.PQconsumeInput(self.pgconn_ptr)
+        if 1 != rv:
             raise e.OperationalError(f"consuming input failed: {error_message(self)}")
 
     def is_busy(self) -> int:
@@ -423,7 +431,9 @@ cdef class PGconn:
     def flush(self) -> int:
         if self.pgconn_ptr == NULL:
             raise e.OperationalError(f"flushing failed: the connection is closed")
-        cdef int rv = libpq.PQflush(self.pgconn_ptr)
+        cdef int rv
+        with nogil:
+            rv = libpq.PQflush(self.pgconn_ptr)
         if rv < 0:
             raise e.OperationalError(f"flushing failed: {error_message(self)}")
         return rv
@@ -432,6 +442,48 @@ cdef class PGconn:
         if not libpq.PQsetSingleRowMode(self.pgconn_ptr):
             raise e.OperationalError("setting single row mode failed")
 
+    def set_chunked_rows_mode(self, size: int) -> None:
+        _check_supported("PQsetChunkedRowsMode", 170000)
+        if not libpq.PQsetChunkedRowsMode(self.pgconn_ptr, size):
+            raise e.OperationalError("setting chunked rows mode failed")
+
+    @property
+    def pipeline_status(self) -> int:
+        if libpq.PG_VERSION_NUM < 140000:
+            return libpq.PQ_PIPELINE_OFF
+        return libpq.PQpipelineStatus(self.pgconn_ptr)
+
+    def enter_pipeline_mode(self) -> None:
+        _check_supported("PQenterPipelineMode", 140000)
+        if libpq.PQenterPipelineMode(self.pgconn_ptr) != 1:
+            raise e.OperationalError(
+                f"entering pipeline mode failed: {error_message(self)}"
+            )
+
+    def exit_pipeline_mode(self) -> None:
+        _check_supported("PQexitPipelineMode", 140000)
+        if libpq.PQexitPipelineMode(self.pgconn_ptr) != 1:
+            raise e.OperationalError(
+                f"exiting pipeline mode failed: {error_message(self)}"
+            )
+
+    def pipeline_sync(self) -> None:
+        _check_supported("PQpipelineSync", 140000)
+        cdef int rv = libpq.PQpipelineSync(self.pgconn_ptr)
+        if rv == 0:
+            raise e.OperationalError("connection not in pipeline mode")
+        if rv != 1:
+            raise e.OperationalError(
+                f"pipeline sync failed: {error_message(self)}"
+            )
+
+    def send_flush_request(self) -> None:
+        _check_supported("PQsendFlushRequest", 140000)
+        if libpq.PQsendFlushRequest(self.pgconn_ptr) == 0:
+            raise e.OperationalError(
+                f"flush request failed: {error_message(self)}"
+            )
+
     def get_cancel(self) -> PGcancel:
         cdef libpq.PGcancel *ptr = libpq.PQgetCancel(self.pgconn_ptr)
         if not ptr:
@@ -455,7 +507,8 @@ cdef class PGconn:
         cdef Py_ssize_t length
 
         _buffer_as_string_and_size(buffer, &cbuffer, &length)
-        rv = libpq.PQputCopyData(self.pgconn_ptr, cbuffer, length)
+        with nogil:
+            rv = libpq.PQputCopyData(self.pgconn_ptr, cbuffer, length)
         if rv < 0:
             raise e.OperationalError(f"sending copy data failed: {error_message(self)}")
         return rv
@@ -465,7 +518,8 @@ cdef class PGconn:
         cdef const char *cerr = NULL
         if error is not None:
             cerr = PyBytes_AsString(error)
-        rv = libpq.PQputCopyEnd(self.pgconn_ptr, cerr)
+        with nogil:
+            rv = libpq.PQputCopyEnd(self.pgconn_ptr, cerr)
         if rv < 0:
             raise e.OperationalError(f"sending copy end failed: {error_message(self)}")
         return rv
@@ -473,7 +527,8 @@ cdef class PGconn:
     def get_copy_data(self, int async_) -> Tuple[int, memoryview]:
         cdef char *buffer_ptr = NULL
         cdef int nbytes
-        nbytes = libpq.PQgetCopyData(self.pgconn_ptr, &buffer_ptr, async_)
+        with nogil:
+            nbytes = libpq.PQgetCopyData(self.pgconn_ptr, &buffer_ptr, async_)
         if nbytes == -2:
             raise e.OperationalError(f"receiving copy data failed: {error_message(self)}")
         if buffer_ptr is not NULL:
@@ -498,6 +553,18 @@ cdef int _ensure_pgconn(PGconn pgconn) except 0:
     raise e.OperationalError("the connection is closed")
 
 
+cdef int _check_supported(fname, int pgversion) except -1:
+    """
+    Raise NotSupportedError if the libpq psycopg3 is built against is too old.
+    """
+    if libpq.PG_VERSION_NUM < pgversion:
+        raise e.NotSupportedError(
+            f"{fname} requires libpq from PostgreSQL {pgversion // 10000},"
+            f" psycopg3 was built against {libpq.PG_VERSION_NUM}"
+        )
+    return 0
+
+
 cdef char *_call_bytes(PGconn pgconn, conn_bytes_f func) except NULL:
     """
     Call one of the pgconn libpq functions returning a bytes pointer.
@@ -0,0 +1,663 @@
+"""
+Cython adapters for arrays.
+"""
+
+# Copyright (C) 2021 The Psycopg Team
+
+cimport cython
+
+from libc.stdint cimport *
+from libc.string cimport memcmp, memcpy
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from cpython.ref cimport Py_INCREF
+from cpython.list cimport (
+    PyList_New, PyList_Append, PyList_CheckExact,
+    PyList_GET_ITEM, PyList_SET_ITEM, PyList_GET_SIZE)
+from cpython.long cimport PyLong_CheckExact, PyLong_FromUnsignedLongLong
+from cpython.float cimport PyFloat_CheckExact, PyFloat_AS_DOUBLE
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from cpython.object cimport PyObject, PyObject_CallFunctionObjArgs
+from cpython.bytearray cimport PyByteArray_AS_STRING
+
+from psycopg3_c._psycopg3 cimport endian
+
+from psycopg3 import errors as e
+from psycopg3.oids import postgres_types, TEXT_ARRAY_OID
+
+cdef extern from "Python.h":
+    int PyOS_strnicmp(const char *s1, const char *s2, Py_ssize_t size)
+    long long PyLong_AsLongLongAndOverflow(object pylong, int *overflow) except? -1
+
+DEF MAXDIM = 6  # maximum number of dimensions of a Postgres array
+
+
+cdef class _BaseListDumper(CDumper):
+
+    cdef Transformer _tx
+    cdef readonly object sub_dumper
+    cdef CDumper _sub_cdumper
+    cdef object _types
+
+    def __init__(self, cls: type, context: Optional[AdaptContext] = None):
+        super().__init__(cls, context)
+        self._tx = Transformer(context)
+        self._types = (
+            context.adapters.types if context is not None else postgres_types
+        )
+
+    cdef object get_key(self, object obj, object format):
+        item = self._find_list_element(obj)
+        if item is not None:
+            sd = self._tx.get_dumper(item, format)
+            return (self.cls, sd.cls)
+        else:
+            return (self.cls,)
+
+    cdef object upgrade(self, object obj, object format):
+        cdef _BaseListDumper dumper
+
+        item = self._find_list_element(obj)
+        if item is None:
+            # Empty lists can only be dumped as text if the type is unknown.
+            return ListDumper(self.cls, self._tx)
+
+        sd = self._tx.get_dumper(item, format)
+        if sd.format == PQ_TEXT:
+            dumper = ListDumper(self.cls, self._tx)
+        else:
+            dumper = ListBinaryDumper(self.cls, self._tx)
+
+        dumper.sub_dumper = sd
+        if isinstance(sd, CDumper):
+            dumper._sub_cdumper = <CDumper>sd
+
+        # We consider an array of unknowns as unknown, so we can dump empty
+        # lists or lists containing only None elements.
+        if sd.oid != oids.INVALID_OID:
+            dumper.oid = self._get_array_oid(sd.oid)
+        else:
+            dumper.oid = oids.INVALID_OID
+
+        return dumper
+
+    cdef object _find_list_element(self, object L):
+        """
+        Find the first non-null element of an eventually nested list
+        """
+        if PyList_CheckExact(L):
+            imax = _flat_int_list_magnitude(L)
+            if imax is not None:
+                return imax
+
+        # The first item found and, if it is an int, the largest magnitude.
+        cdef list found = [None, 0]
+        _scan_list(L, set(), found)
+        if found[0] is None or not isinstance(found[0], int):
+            return found[0]
+        else:
+            return found[1]
+
+    cdef libpq.Oid _get_array_oid(self, libpq.Oid base_oid) except? 0:
+        """
+        Return the oid of the array from the oid of the base item.
+
+        Fall back on text[].
+        """
+        cdef libpq.Oid oid = 0
+        if base_oid:
+            info = self._types.get(base_oid)
+            if info:
+                oid = info.array_oid
+
+        return oid or TEXT_ARRAY_OID
+
+    cdef Py_ssize_t _dump_item(
+        self, obj, bytearray rv, Py_ssize_t offset
+    ) except -1:
+        """Dump a non-null item of the list using the sub-dumper."""
+        cdef char *src
+        cdef char *buf
+        cdef Py_ssize_t size
+
+        if self._sub_cdumper is not None:
+            return self._sub_cdumper.cdump(obj, rv, offset)
+
+        # If we get here, the sub_dumper must have been set
+        b = self.sub_dumper.dump(obj)
+        _buffer_as_string_and_size(b, &src, &size)
+        buf = CDumper.ensure_size(rv, offset, size)
+        memcpy(buf, src, size)
+        return size
+
+
+cdef int _scan_list(object L, set seen, list found) except -1:
+    """
+    Look for the first non-null item in a nested list and store it in found[0].
+
+    If the item is an int, keep on scanning and store in found[1] the largest
+    magnitude of the ints found. Return 1 if the scan can stop early.
+    """
+    if id(L) in seen:
+        raise e.DataError("cannot dump a recursive list")
+
+    seen.add(id(L))
+
+    for item in L:
+        if type(item) is list:
+            if _scan_list(item, seen, found):
+                return 1
+        elif item is not None:
+            if found[0] is None:
+                found[0] = item
+                if not isinstance(item, int):
+                    return 1
+                found[1] = item if item >= 0 else -item
+            else:
+                item = item if item >= 0 else -item - 1
+                if item > found[1]:
+                    found[1] = item
+
+    return 0
+
+
+cdef object _flat_int_list_magnitude(list L):
+    """
+    Return the largest magnitude of the items of a flat list of ints.
+
+    Return None if the list contains other objects or ints not fitting in 64
+    bits: the caller should use `_scan_list()` instead.
+    """
+    cdef Py_ssize_t n = PyList_GET_SIZE(L)
+    cdef Py_ssize_t i
+    cdef PyObject *item
+    cdef long long val
+    cdef unsigned long long mag
+    cdef unsigned long long imax = 0
+    cdef int overflow
+
+    if not n:
+        return None
+
+    for i in range(n):
+        item = PyList_GET_ITEM(L, i)
+        if not PyLong_CheckExact(<object>item):
+            return None
+        val = PyLong_AsLongLongAndOverflow(<object>item, &overflow)
+        if overflow:
+            return None
+
+        if val >= 0:
+            mag = val
+        else:
+            # as in _scan_list(), -n counts as n only for the first item
+            mag = <unsigned long long>(~val) + (i == 0)
+        if mag > imax:
+            imax = mag
+
+    return PyLong_FromUnsignedLongLong(imax)
+
+
+@cython.final
+cdef class ListDumper(_BaseListDumper):
+
+    format = PQ_TEXT
+
+    cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
+        return self._dump_list(obj, rv, offset)
+
+    cdef Py_ssize_t _dump_list(
+        self, object L, bytearray rv, Py_ssize_t offset
+    ) except -1:
+        cdef char *buf
+        cdef Py_ssize_t pos = offset
+
+        if not L:
+            buf = CDumper.ensure_size(rv, pos, 2)
+            buf[0] = b'{'
+            buf[1] = b'}'
+            return 2
+
+        buf = CDumper.ensure_size(rv, pos, 1)
+        buf[0] = b'{'
+        pos += 1
+
+        for item in L:
+            if isinstance(item, list):
+                pos += self._dump_list(item, rv, pos)
+            elif item is not None:
+                pos += self._dump_quoted_item(item, rv, pos)
+            else:
+                buf = CDumper.ensure_size(rv, pos, 4)
+                memcpy(buf, b"NULL", 4)
+                pos += 4
+
+            buf = CDumper.ensure_size(rv, pos, 1)
+            buf[0] = b','
+            pos += 1
+
+        # overwrite the last comma
+        PyByteArray_AS_STRING(rv)[pos - 1] = b'}'
+        return pos - offset
+
+    cdef Py_ssize_t _dump_quoted_item(
+        self, obj, bytearray rv, Py_ssize_t offset
+    ) except -1:
+        cdef Py_ssize_t size = self._dump_item(obj, rv, offset)
+        cdef char *buf = PyByteArray_AS_STRING(rv) + offset
+
+        # from https://www.postgresql.org/docs/current/arrays.html#ARRAYS-IO
+        #
+        # The array output routine will put double quotes around element
+        # values if they are empty strings, contain curly braces, delimiter
+        # characters, double quotes, backslashes, or white space, or match
+        # the word NULL.
+        # TODO: recognise only , as delimiter. Should be configured
+        cdef int quote = size == 0 or (
+            size == 4 and PyOS_strnicmp(buf, "null", 4) == 0)
+        cdef Py_ssize_t nesc = 0
+        cdef Py_ssize_t i
+        cdef char c
+        for i in range(size):
+            c = buf[i]
+            if c == b'"' or c == b'\\':
+                nesc += 1
+                quote = 1
+            elif (
+                c == b'{' or c == b'}' or c == b','
+                or c == b' ' or b'\t' <= c <= b'\r'
+            ):
+                quote = 1
+
+        if not quote:
+            return size
+
+        # Double quotes and backslashes embedded in element values will be
+        # backslash-escaped. Shift the data right, escaping it, backwards.
+        buf = CDumper.ensure_size(rv, offset, size + nesc + 2)
+        cdef Py_ssize_t j = size + nesc + 1
+        buf[j] = b'"'
+        j -= 1
+        for i in range(size - 1, -1, -1):
+            c = buf[i]
+            buf[j] = c
+            j -= 1
+            if c == b'"' or c == b'\\':
+                buf[j] = b'\\'
+                j -= 1
+        buf[0] = b'"'
+
+        return size + nesc + 2
+
+
+@cython.final
+cdef class ListBinaryDumper(_BaseListDumper):
+
+    format = PQ_BINARY
+
+    cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
+        # Postgres won't take unknown for element oid: fall back on text
+        cdef libpq.Oid sub_oid = oids.TEXT_OID
+        if self.sub_dumper is not None and self.sub_dumper.oid:
+            sub_oid = self.sub_dumper.oid
+
+        cdef uint32_t head[3]
+        cdef char *buf
+        if not obj:
+            head[0] = head[1] = 0
+            head[2] = endian.htobe32(sub_oid)
+            buf = CDumper.ensure_size(rv, offset, sizeof(head))
+            memcpy(buf, head, sizeof(head))
+            return sizeof(head)
+
+        # Fast path for flat lists of numbers of fixed size
+        cdef Py_ssize_t size
+        if self._sub_cdumper is not None and PyList_CheckExact(obj):
+            size = _dump_fixed_list(obj, rv, offset, sub_oid)
+            if size:
+                return size
+
+        cdef Py_ssize_t dims[MAXDIM]
+        cdef int ndims = 0
+        L = obj
+        while isinstance(L, self.cls):
+            if not L:
+                raise e.DataError("lists cannot contain empty lists")
+            if ndims >= MAXDIM:
+                raise e.DataError(
+                    f"arrays cannot have more than {MAXDIM} dimensions")
+            dims[ndims] = len(L)
+            ndims += 1
+            L = L[0]
+
+        cdef Py_ssize_t headsize = sizeof(head) + 2 * ndims * sizeof(uint32_t)
+        buf = CDumper.ensure_size(rv, offset, headsize)
+
+        cdef uint32_t dim[2]
+        cdef int i
+        for i in range(ndims):
+            dim[0] = endian.htobe32(<uint32_t>dims[i])
+            dim[1] = endian.htobe32(1)  # lower bound
+            memcpy(buf + sizeof(head) + i * sizeof(dim), dim, sizeof(dim))
+
+        cdef int hasnull = 0
+        size = self._dump_list(
+            obj, rv, offset + headsize, dims, ndims, 0, &hasnull)
+
+        head[0] = endian.htobe32(ndims)
+        head[1] = endian.htobe32(hasnull)
+        head[2] = endian.htobe32(sub_oid)
+        buf = PyByteArray_AS_STRING(rv) + offset
+        memcpy(buf, head, sizeof(head))
+        return headsize + size
+
+    cdef Py_ssize_t _dump_list(
+        self, object L, bytearray rv, Py_ssize_t offset,
+        Py_ssize_t *dims, int ndims, int dim, int *hasnull
+    ) except -1:
+        if len(L) != dims[dim]:
+            raise e.DataError("nested lists have inconsistent lengths")
+
+        cdef Py_ssize_t pos = offset
+        cdef Py_ssize_t size
+        cdef uint32_t besize
+        cdef char *buf
+
+        if dim == ndims - 1:
+            for item in L:
+                if item is not None:
+                    size = self._dump_item(item, rv, pos + sizeof(besize))
+                    besize = endian.htobe32(<uint32_t>size)
+                else:
+                    size = 0
+                    besize = 0xffffffff
+                    hasnull[0] = 1
+
+                buf = CDumper.ensure_size(rv, pos, sizeof(besize))
+                memcpy(buf, &besize, sizeof(besize))
+                pos += sizeof(besize) + size
+        else:
+            for item in L:
+                if not isinstance(item, self.cls):
+                    raise e.DataError("nested lists have inconsistent depths")
+                pos += self._dump_list(
+                    item, rv, pos, dims, ndims, dim + 1, hasnull)
+
+        return pos - offset
+
+
+cdef Py_ssize_t _dump_fixed_list(
+    list L, bytearray rv, Py_ssize_t offset, libpq.Oid sub_oid
+) except -1:
+    """
+    Dump a flat list of ints or floats to the binary format of an array.
+
+    Return 0 if the list cannot be dumped this way, because it contains other
+    objects or values out of the range of the *sub_oid* type.
+    """
+    cdef Py_ssize_t size
+    cdef int is_float = 0
+    if sub_oid == oids.INT2_OID:
+        size = 2
+    elif sub_oid == oids.INT4_OID:
+        size = 4
+    elif sub_oid == oids.INT8_OID:
+        size = 8
+    elif sub_oid == oids.FLOAT8_OID:
+        size = 8
+        is_float = 1
+    else:
+        return 0
+
+    # head: ndims, hasnull, elem oid, dimension, lower bound
+    cdef Py_ssize_t n = PyList_GET_SIZE(L)
+    cdef uint32_t head[5]
+    head[0] = endian.htobe32(1)
+    head[1] = 0
+    head[2] = endian.htobe32(sub_oid)
+    head[3] = endian.htobe32(<uint32_t>n)
+    head[4] = endian.htobe32(1)
+
+    cdef Py_ssize_t length = sizeof(head) + n * (sizeof(uint32_t) + size)
+    cdef char *buf = CDumper.ensure_size(rv, offset, length)
+    memcpy(buf, head, sizeof(head))
+    buf += sizeof(head)
+
+    cdef uint32_t besize = endian.htobe32(<uint32_t>size)
+    cdef PyObject *item
+    cdef long long val
+    cdef int overflow
+    cdef double dval
+    cdef uint16_t be16
+    cdef uint32_t be32
+    cdef uint64_t be64
+    cdef Py_ssize_t i
+
+    for i in range(n):
+        item = PyList_GET_ITEM(L, i)
+        memcpy(buf, &besize, sizeof(besize))
+        buf += sizeof(besize)
+
+        if is_float:
+            if not PyFloat_CheckExact(<object>item):
+                return 0
+            dval = PyFloat_AS_DOUBLE(<object>item)
+            memcpy(&be64, &dval, sizeof(be64))
+            be64 = endian.htobe64(be64)
+            memcpy(buf, &be64, sizeof(be64))
+
+        else:
+            if not PyLong_CheckExact(<object>item):
+                return 0
+            val = PyLong_AsLongLongAndOverflow(<object>item, &overflow)
+            if overflow:
+                return 0
+            if size == 8:
+                be64 = endian.htobe64(<uint64_t>val)
+                memcpy(buf, &be64, sizeof(be64))
+            elif size == 4:
+                if not INT32_MIN <= val <= INT32_MAX:
+                    return 0
+                be32 = endian.htobe32(<uint32_t><int32_t>val)
+                memcpy(buf, &be32, sizeof(be32))
+            else:
+                if not INT16_MIN <= val <= INT16_MAX:
+                    return 0
+                be16 = endian.htobe16(<uint16_t><int16_t>val)
+                memcpy(buf, &be16, sizeof(be16))
+
+        buf += size
+
+    return length
+
+
+cdef class _BaseArrayLoader(CLoader):
+
+    cdef Transformer _tx
+    cdef RowLoader _row_loader
+    cdef libpq.Oid _row_oid
+
+    def __init__(self, oid: int, context: Optional[AdaptContext] = None):
+        super().__init__(oid, context)
+        self._tx = Transformer(context)
+
+    cdef RowLoader _get_row_loader(self, libpq.Oid oid, object format):
+        """Return the loader for the array elements, with the given oid."""
+        cdef object pyoid
+        if self._row_loader is None or oid != self._row_oid:
+            pyoid = oid
+            self._row_loader = <RowLoader>self._tx._c_get_loader(
+                <PyObject *>pyoid, <PyObject *>format)
+            self._row_oid = oid
+
+        return self._row_loader
+
+
+cdef object _load_element(
+    RowLoader row_loader, const char *data, size_t length
+):
+    if row_loader.cloader is not None:
+        return row_loader.cloader.cload(data, length)
+
+    b = PyBytes_FromStringAndSize(data, length)
+    return PyObject_CallFunctionObjArgs(
+        row_loader.loadfunc, <PyObject *>b, NULL)
+
+
+cdef class ArrayLoader(_BaseArrayLoader):
+
+    format = PQ_TEXT
+
+    cdef object cload(self, const char *data, size_t length):
+        cdef RowLoader row_loader = self._get_row_loader(
+            self.base_oid, PQ_TEXT)
+
+        # Every token is copied to a null-terminated scratch buffer, unescaped.
+        # It can't be longer than the entire literal.
+        cdef char *scratch = <char *>PyMem_Malloc(length + 1)
+        if scratch == NULL:
+            raise MemoryError()
+
+        try:
+            return _parse_array_text(data, data + length, row_loader, scratch)
+        finally:
+            PyMem_Free(scratch)
+
+
+cdef object _parse_array_text(
+    const char *ptr, const char *end, RowLoader row_loader, char *scratch
+):
+    # TODO: currently recognise only , as delimiter. Should be configured
+    cdef list stack = []
+    cdef list a
+    cdef const char *start
+    cdef char *tgt
+    rv = None
+
+    while ptr < end:
+        if ptr[0] == b'{':
+            a = []
+            if rv is None:
+                rv = a
+            if stack:
+                PyList_Append(stack[-1], a)
+            stack.append(a)
+            ptr += 1
+
+        elif ptr[0] == b'}':
+            if not stack:
+                raise e.DataError("malformed array, unexpected '}'")
+            rv = stack.pop()
+            ptr += 1
+
+        elif ptr[0] == b',' or ptr[0] == b'\\':
+            ptr += 1
+
+        else:
+            if not stack:
+                wat = PyBytes_FromStringAndSize(
+                    ptr, min(end - ptr, 10)).decode("utf8", "replace")
+                raise e.DataError(f"malformed array, unexpected '{wat}...'")
+
+            tgt = scratch
+            if ptr[0] == b'"':
+                ptr += 1
+                while ptr < end and ptr[0] != b'"':
+                    if ptr[0] == b'\\':
+                        ptr += 1
+                        if ptr == end:
+                            break
+                    tgt[0] = ptr[0]
+                    tgt += 1
+                    ptr += 1
+
+                if ptr == end:
+                    raise e.DataError("malformed array, unterminated quote")
+                ptr += 1  # closing quote
+
+            else:
+                start = ptr
+                while ptr < end and not (
+                    ptr[0] == b'{' or ptr[0] == b'}' or ptr[0] == b','
+                    or ptr[0] == b'"' or ptr[0] == b'\\'
+                ):
+                    ptr += 1
+
+                if ptr - start == 4 and memcmp(start, b"NULL", 4) == 0:
+                    PyList_Append(stack[-1], None)
+                    continue
+
+                memcpy(tgt, start, ptr - start)
+                tgt += ptr - start
+
+            tgt[0] = b'\0'
+            PyList_Append(
+                stack[-1], _load_element(row_loader, scratch, tgt - scratch))
+
+    if rv is None:
+        raise e.DataError("malformed array, no '{' found")
+    return rv
+
+
+cdef class ArrayBinaryLoader(_BaseArrayLoader):
+
+    format = PQ_BINARY
+
+    cdef object cload(self, const char *data, size_t length):
+        cdef uint32_t head[3]
+        memcpy(head, data, sizeof(head))
+        cdef uint32_t ndims = endian.be32toh(head[0])
+        if not ndims:
+            return []
+        if ndims > MAXDIM:
+            raise e.DataError(
+                f"unexpected number of dimensions {ndims} exceeding the"
+                f" maximum allowed {MAXDIM}")
+
+        cdef RowLoader row_loader = self._get_row_loader(
+            endian.be32toh(head[2]), PQ_BINARY)
+
+        cdef Py_ssize_t dims[MAXDIM]
+        # Every dimension is followed by its lower bound, which we ignore
+        cdef const char *ptr = data + sizeof(head)
+        cdef uint32_t dim
+        cdef int i
+        for i in range(ndims):
+            memcpy(&dim, ptr, sizeof(dim))
+            dims[i] = endian.be32toh(dim)
+            ptr += 2 * sizeof(dim)
+
+        return _array_load_binary_rec(ndims, dims, &ptr, row_loader)
+
+
+cdef object _array_load_binary_rec(
+    Py_ssize_t ndims, Py_ssize_t *dims, const char **bufptr,
+    RowLoader row_loader
+):
+    cdef const char *buf
+    cdef int32_t size
+    cdef object val
+
+    cdef Py_ssize_t nelems = dims[0]
+    cdef Py_ssize_t i
+    cdef list out = PyList_New(nelems)
+
+    for i in range(nelems):
+        if ndims == 1:
+            buf = bufptr[0]
+            memcpy(&size, buf, sizeof(size))
+            size = <int32_t>endian.be32toh(<uint32_t>size)
+            buf += sizeof(size)
+            if size == -1:
+                val = None
+            else:
+                val = _load_element(row_loader, buf, size)
+                buf += size
+            bufptr[0] = buf
+        else:
+            val = _array_load_binary_rec(
+                ndims - 1, dims + 1, bufptr, row_loader)
+
+        Py_INCREF(val)
+        PyList_SET_ITEM(out, i, val)
+
+    return out
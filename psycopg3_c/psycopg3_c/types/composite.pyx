@@ -0,0 +1,279 @@
+"""
+Cython adapters for composite types.
+"""
+
+# Copyright (C) 2021 The Psycopg Team
+
+cimport cython
+
+from libc.stdint cimport int32_t, uint32_t
+from libc.string cimport memcpy
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
+from cpython.ref cimport Py_INCREF
+from cpython.list cimport PyList_GET_ITEM, PyList_GET_SIZE
+from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
+from cpython.object cimport PyObject
+
+from psycopg3_c._psycopg3 cimport endian
+
+from psycopg3 import errors as e
+
+
+cdef class _BaseRecordLoader(CLoader):
+
+    cdef Transformer _tx
+
+    def __init__(self, oid: int, context: Optional[AdaptContext] = None):
+        super().__init__(oid, context)
+        self._tx = Transformer(context)
+
+
+cdef class RecordLoader(_BaseRecordLoader):
+
+    format = PQ_TEXT
+
+    cdef RowLoader _text_loader
+
+    cdef object cload(self, const char *data, size_t length):
+        if length == 2 and data[0] == b'(' and data[1] == b')':
+            return ()
+
+        return self._parse_record(data + 1, data + length - 1)
+
+    cdef RowLoader _get_field_loader(self, Py_ssize_t i):
+        """Return the loader for the field number *i* of the record."""
+        cdef object oid
+        if self._text_loader is None:
+            oid = oids.TEXT_OID
+            self._text_loader = <RowLoader>self._tx._c_get_loader(
+                <PyObject *>oid, <PyObject *>PQ_TEXT)
+        return self._text_loader
+
+    cdef int _check_nfields(self, Py_ssize_t nfields) except -1:
+        return 0
+
+    cdef tuple _parse_record(self, const char *ptr, const char *end):
+        """
+        Parse the content of a record between the parens into its fields.
+        """
+        cdef Py_ssize_t nfields = _count_record_fields(ptr, end)
+        self._check_nfields(nfields)
+
+        # Every field is copied to a null-terminated scratch buffer, unescaped.
+        # It can't be longer than the entire record.
+        cdef char *scratch = <char *>PyMem_Malloc(end - ptr + 1)
+        if scratch == NULL:
+            raise MemoryError()
+
+        cdef tuple rv = PyTuple_New(nfields)
+        cdef Py_ssize_t i
+        cdef const char *start
+        cdef char *tgt
+        cdef int isnull
+
+        try:
+            for i in range(nfields):
+                tgt = scratch
+                if ptr < end and ptr[0] == b'"':
+                    isnull = 0
+                    ptr += 1
+                    while 1:
+                        if ptr >= end:
+                            raise e.DataError(
+                                "malformed record, unterminated quote")
+                        if ptr[0] == b'"':
+                            if ptr + 1 < end and ptr[1] == b'"':
+                                ptr += 1
+                            else:
+                                ptr += 1
+                                break
+                        elif ptr[0] == b'\\':
+                            if ptr + 1 < end and ptr[1] == b'\\':
+                                ptr += 1
+                        tgt[0] = ptr[0]
+                        tgt += 1
+                        ptr += 1
+
+                else:
+                    # An empty unquoted field represents NULL
+                    start = ptr
+                    while ptr < end and ptr[0] != b',':
+                        ptr += 1
+                    isnull = ptr == start
+                    memcpy(tgt, start, ptr - start)
+                    tgt += ptr - start
+
+                if ptr < end:
+                    if ptr[0] != b',':
+                        raise e.DataError(
+                            "malformed record, unexpected character after"
+                            " a quoted field")
+                    ptr += 1
+
+                if isnull:
+                    val = None
+                else:
+                    tgt[0] = b'\0'
+                    val = _load_element(
+                        self._get_field_loader(i), scratch, tgt - scratch)
+
+                Py_INCREF(val)
+                PyTuple_SET_ITEM(rv, i, val)
+
+        finally:
+            PyMem_Free(scratch)
+
+        return rv
+
+
+cdef Py_ssize_t _count_record_fields(const char *ptr, const char *end):
+    """
+    Return the number of fields of a record, counting the unquoted commas.
+
+    Quotes inside quoted fields are doubled, so they don't change the count.
+    """
+    cdef Py_ssize_t rv = 1
+    cdef int quoted = 0
+    while ptr < end:
+        if ptr[0] == b'"':
+            quoted = not quoted
+        elif ptr[0] == b',' and not quoted:
+            rv += 1
+        ptr += 1
+
+    return rv
+
+
+cdef class CompositeLoader(RecordLoader):
+
+    format = PQ_TEXT
+
+    cdef object _factory
+    cdef list _field_loaders
+
+    cdef object cload(self, const char *data, size_t length):
+        if self._field_loaders is None:
+            self._config_types()
+
+        cdef tuple args
+        if length == 2 and data[0] == b'(' and data[1] == b')':
+            args = ()
+        else:
+            args = self._parse_record(data + 1, data + length - 1)
+
+        return self._factory(*args)
+
+    cdef RowLoader _get_field_loader(self, Py_ssize_t i):
+        return <RowLoader>PyList_GET_ITEM(self._field_loaders, i)
+
+    cdef int _check_nfields(self, Py_ssize_t nfields) except -1:
+        if nfields != PyList_GET_SIZE(self._field_loaders):
+            raise e.ProgrammingError(
+                f"cannot load sequence of {nfields} items:"
+                f" {len(self._field_loaders)} loaders registered")
+        return 0
+
+    cdef void _config_types(self) except *:
+        cls = type(self)
+        self._factory = cls.factory
+        self._field_loaders = [
+            <RowLoader>self._tx._c_get_loader(
+                <PyObject *>oid, <PyObject *>PQ_TEXT)
+            for oid in cls.fields_types
+        ]
+
+
+cdef class RecordBinaryLoader(_BaseRecordLoader):
+
+    format = PQ_BINARY
+
+    # The loaders for the fields of the first record loaded, and their oids.
+    # The following records are expected to have the same fields.
+    cdef list _field_loaders
+    cdef libpq.Oid *_field_oids
+    cdef Py_ssize_t _nfields
+
+    def __dealloc__(self):
+        PyMem_Free(self._field_oids)
+
+    cdef object cload(self, const char *data, size_t length):
+        cdef uint32_t besize
+        memcpy(&besize, data, sizeof(besize))
+        cdef Py_ssize_t nfields = endian.be32toh(besize)
+        if self._field_loaders is None or nfields != self._nfields:
+            self._config_types(data, nfields)
+
+        cdef tuple rv = PyTuple_New(nfields)
+        cdef const char *ptr = data + sizeof(besize)
+        cdef uint32_t beoid
+        cdef libpq.Oid oid
+        cdef int32_t size
+        cdef RowLoader row_loader
+        cdef Py_ssize_t i
+
+        for i in range(nfields):
+            memcpy(&beoid, ptr, sizeof(beoid))
+            oid = endian.be32toh(beoid)
+            memcpy(&besize, ptr + sizeof(beoid), sizeof(besize))
+            size = <int32_t>endian.be32toh(besize)
+            ptr += sizeof(beoid) + sizeof(besize)
+
+            if size == -1:
+                val = None
+            else:
+                if oid == self._field_oids[i]:
+                    row_loader = <RowLoader>PyList_GET_ITEM(
+                        self._field_loaders, i)
+                else:
+                    row_loader = self._get_loader(oid)
+                val = _load_element(row_loader, ptr, size)
+                ptr += size
+
+            Py_INCREF(val)
+            PyTuple_SET_ITEM(rv, i, val)
+
+        return rv
+
+    cdef RowLoader _get_loader(self, libpq.Oid oid):
+        cdef object pyoid = oid
+        return <RowLoader>self._tx._c_get_loader(
+            <PyObject *>pyoid, <PyObject *>PQ_BINARY)
+
+    cdef void _config_types(
+        self, const char *data, Py_ssize_t nfields
+    ) except *:
+        cdef libpq.Oid *field_oids = <libpq.Oid *>PyMem_Realloc(
+            self._field_oids, max(nfields, 1) * sizeof(libpq.Oid))
+        if field_oids == NULL:
+            raise MemoryError()
+        self._field_oids = field_oids
+
+        cdef list loaders = []
+        cdef const char *ptr = data + sizeof(uint32_t)
+        cdef uint32_t be
+        cdef int32_t size
+        cdef Py_ssize_t i
+        for i in range(nfields):
+            memcpy(&be, ptr, sizeof(be))
+            field_oids[i] = endian.be32toh(be)
+            loaders.append(self._get_loader(field_oids[i]))
+            memcpy(&be, ptr + sizeof(be), sizeof(be))
+            size = <int32_t>endian.be32toh(be)
+            ptr += 2 * sizeof(be) + (size if size > 0 else 0)
+
+        self._field_loaders = loaders
+        self._nfields = nfields
+
+
+cdef class CompositeBinaryLoader(RecordBinaryLoader):
+
+    format = PQ_BINARY
+
+    cdef object _factory
+
+    cdef object cload(self, const char *data, size_t length):
+        if self._factory is None:
+            self._factory = type(self).factory
+
+        args = RecordBinaryLoader.cload(self, data, length)
+        return self._factory(*args)
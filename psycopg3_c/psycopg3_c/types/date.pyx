@@ -0,0 +1,1073 @@
+"""
+Cython adapters for date/time types.
+"""
+
+# Copyright (C) 2021 The Psycopg Team
+
+cimport cython
+
+from libc.stdint cimport int32_t, int64_t, uint32_t, uint64_t
+from libc.string cimport memset, memcpy
+from cpython cimport datetime as cdt
+from cpython.dict cimport PyDict_GetItem, PyDict_SetItem
+from cpython.object cimport PyObject
+from cpython.version cimport PY_VERSION_HEX
+
+from datetime import date, datetime, timedelta, timezone
+
+from psycopg3_c._psycopg3 cimport endian
+
+from psycopg3 import errors as e
+
+cdt.import_datetime()
+
+# The binary format represents dates and times relative to 2000-01-01
+DEF PG_DATE_EPOCH_DAYS = 730120  # date(2000, 1, 1).toordinal()
+
+cdef object pg_date_epoch = date(2000, 1, 1)
+cdef object pg_datetime_epoch = datetime(2000, 1, 1)
+cdef object pg_datetimetz_epoch = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+# The order of the date fields in the values returned by the server
+DEF ORDER_YMD = 0
+DEF ORDER_DMY = 1
+DEF ORDER_MDY = 2
+DEF ORDER_PGDM = 3  # Postgres DateStyle, e.g. "Wed 15 Jan 12:00:00 2020"
+DEF ORDER_PGMD = 4  # Postgres DateStyle, e.g. "Wed Jan 15 12:00:00 2020"
+
+# Enough room for every text representation we dump
+DEF MAXDTLEN = 64
+
+
+@cython.final
+cdef class DateDumper(CDumper):
+
+    format = PQ_TEXT
+
+    def __cinit__(self):
+        self.oid = oids.DATE_OID
+
+    cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
+        # NOTE: whatever the PostgreSQL DateStyle input format (DMY, MDY, YMD)
+        # the YYYY-MM-DD is always understood correctly.
+        cdef char *buf = CDumper.ensure_size(rv, offset, 10)
+        _write_date(
+            buf, cdt.date_year(obj), cdt.date_month(obj), cdt.date_day(obj))
+        return 10
+
+
+@cython.final
+cdef class DateBinaryDumper(CDumper):
+
+    format = PQ_BINARY
+
+    def __cinit__(self):
+        self.oid = oids.DATE_OID
+
+    cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
+        cdef int32_t days = _ymd_to_ordinal(
+            cdt.date_year(obj), cdt.date_month(obj), cdt.date_day(obj)
+        ) - PG_DATE_EPOCH_DAYS
+        cdef uint32_t bedays = endian.htobe32(<uint32_t>days)
+        cdef char *buf = CDumper.ensure_size(rv, offset, sizeof(bedays))
+        memcpy(buf, &bedays, sizeof(bedays))
+        return sizeof(bedays)
+
+
+cdef class _BaseTimeDumper(CDumper):
+
+    cdef object get_key(self, object obj, object format):
+        # Use (cls,) to report the need to upgrade to a dumper for timetz (the
+        # Frankenstein of the data types).
+        if cdt.time_tzinfo(obj) is None:
+            return self.cls
+        else:
+            return (self.cls,)
+
+
+cdef class _BaseTimeTextDumper(_BaseTimeDumper):
+
+    format = PQ_TEXT
+
+    cdef object upgrade(self, object obj, object format):
+        if cdt.time_tzinfo(obj) is None:
+            return self
+        else:
+            return TimeTzDumper(self.cls)
+
+
+@cython.final
+cdef class TimeDumper(_BaseTimeTextDumper):
+
+    def __cinit__(self):
+        self.oid = oids.TIME_OID
+
+    cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
+        cdef char tmp[MAXDTLEN]
+        cdef char *end = _write_time(
+            tmp, cdt.time_hour(obj), cdt.time_minute(obj),
+            cdt.time_second(obj), cdt.time_microsecond(obj))
+        return _copy_to(rv, offset, tmp, end)
+
+
+@cython.final
+cdef class TimeTzDumper(_BaseTimeTextDumper):
+
+    def __cinit__(self):
+        self.oid = oids.TIMETZ_OID
+
+    cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
+        cdef char tmp[MAXDTLEN]
+        cdef char *end = _write_time(
+            tmp, cdt.time_hour(obj), cdt.time_minute(obj),
+            cdt.time_second(obj), cdt.time_microsecond(obj))
+        end = _write_utcoffset(end, obj.utcoffset())
+        return _copy_to(rv, offset, tmp, end)
+
+
+cdef class _BaseTimeBinaryDumper(_BaseTimeDumper):
+
+    format = PQ_BINARY
+
+    cdef object upgrade(self, object obj, object format):
+        if cdt.time_tzinfo(obj) is None:
+            return self
+        else:
+            return TimeTzBinaryDumper(self.cls)
+
+
+@cython.final
+cdef class TimeBinaryDumper(_BaseTimeBinaryDumper):
+
+    def __cinit__(self):
+        self.oid = oids.TIME_OID
+
+    cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
+        cdef int64_t micros = _time_to_micros(obj)
+        cdef uint64_t bemicros = endian.htobe64(<uint64_t>micros)
+        cdef char *buf = CDumper.ensure_size(rv, offset, sizeof(bemicros))
+        memcpy(buf, &bemicros, sizeof(bemicros))
+        return sizeof(bemicros)
+
+
+@cython.final
+cdef class TimeTzBinaryDumper(_BaseTimeBinaryDumper):
+
+    def __cinit__(self):
+        self.oid = oids.TIMETZ_OID
+
+    cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
+        cdef int64_t micros = _time_to_micros(obj)
+        cdef uint64_t bemicros = endian.htobe64(<uint64_t>micros)
+
+        off = obj.utcoffset()
+        # The offset is stored in seconds west of UTC
+        cdef int32_t offsec = -(
+            cdt.timedelta_days(off) * 86400 + cdt.timedelta_seconds(off))
+        cdef uint32_t beoff = endian.htobe32(<uint32_t>offsec)
+
+        cdef char *buf = CDumper.ensure_size(
+            rv, offset, sizeof(bemicros) + sizeof(beoff))
+        memcpy(buf, &bemicros, sizeof(bemicros))
+        memcpy(buf + sizeof(bemicros), &beoff, sizeof(beoff))
+        return sizeof(bemicros) + sizeof(beoff)
+
+
+cdef class _BaseDateTimeDumper(CDumper):
+
+    cdef object get_key(self, object obj, object format):
+        # Use (cls,) to report the need to upgrade (downgrade, actually) to a
+        # dumper for naive timestamp.
+        if cdt.datetime_tzinfo(obj) is not None:
+            return self.cls
+        else:
+            return (self.cls,)
+
+
+cdef class _BaseDateTimeTextDumper(_BaseDateTimeDumper):
+
+    format = PQ_TEXT
+
+    cdef object upgrade(self, object obj, object format):
+        if cdt.datetime_tzinfo(obj) is not None:
+            return self
+        else:
+            return DateTimeDumper(self.cls)
+
+    cdef char *_write_datetime(self, char *buf, obj):
+        # NOTE: whatever the PostgreSQL DateStyle input format (DMY, MDY, YMD)
+        # the YYYY-MM-DD is always understood correctly.
+        buf = _write_date(
+            buf, cdt.datetime_year(obj), cdt.datetime_month(obj),
+            cdt.datetime_day(obj))
+        buf[0] = b' '
+        return _write_time(
+            buf + 1, cdt.datetime_hour(obj), cdt.datetime_minute(obj),
+            cdt.datetime_second(obj), cdt.datetime_microsecond(obj))
+
+
+@cython.final
+cdef class DateTimeTzDumper(_BaseDateTimeTextDumper):
+
+    def __cinit__(self):
+        self.oid = oids.TIMESTAMPTZ_OID
+
+    cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
+        cdef char tmp[MAXDTLEN]
+        cdef char *end = self._write_datetime(tmp, obj)
+        end = _write_utcoffset(end, obj.utcoffset())
+        return _copy_to(rv, offset, tmp, end)
+
+
+@cython.final
+cdef class DateTimeDumper(_BaseDateTimeTextDumper):
+
+    def __cinit__(self):
+        self.oid = oids.TIMESTAMP_OID
+
+    cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
+        cdef char tmp[MAXDTLEN]
+        cdef char *end = self._write_datetime(tmp, obj)
+        return _copy_to(rv, offset, tmp, end)
+
+
+cdef class _BaseDateTimeBinaryDumper(_BaseDateTimeDumper):
+
+    format = PQ_BINARY
+
+    cdef object upgrade(self, object obj, object format):
+        if cdt.datetime_tzinfo(obj) is not None:
+            return self
+        else:
+            return DateTimeBinaryDumper(self.cls)
+
+
+@cython.final
+cdef class DateTimeTzBinaryDumper(_BaseDateTimeBinaryDumper):
+
+    def __cinit__(self):
+        self.oid = oids.TIMESTAMPTZ_OID
+
+    cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
+        cdef int64_t micros = _datetime_to_micros(obj)
+
+        # Convert to UTC
+        off = obj.utcoffset()
+        micros -= (
+            (<int64_t>cdt.timedelta_days(off) * 86400
+                + cdt.timedelta_seconds(off))
+            * 1000000 + cdt.timedelta_microseconds(off))
+
+        cdef uint64_t bemicros = endian.htobe64(<uint64_t>micros)
+        cdef char *buf = CDumper.ensure_size(rv, offset, sizeof(bemicros))
+        memcpy(buf, &bemicros, sizeof(bemicros))
+        return sizeof(bemicros)
+
+
+@cython.final
+cdef class DateTimeBinaryDumper(_BaseDateTimeBinaryDumper):
+
+    def __cinit__(self):
+        self.oid = oids.TIMESTAMP_OID
+
+    cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
+        cdef int64_t micros = _datetime_to_micros(obj)
+        cdef uint64_t bemicros = endian.htobe64(<uint64_t>micros)
+        cdef char *buf = CDumper.ensure_size(rv, offset, sizeof(bemicros))
+        memcpy(buf, &bemicros, sizeof(bemicros))
+        return sizeof(bemicros)
+
+
+@cython.final
+cdef class TimeDeltaDumper(CDumper):
+
+    format = PQ_TEXT
+    cdef int _sql_standard
+
+    def __cinit__(self):
+        self.oid = oids.INTERVAL_OID
+
+    def __init__(self, cls: type, context: Optional[AdaptContext] = None):
+        super().__init__(cls, context)
+
+        self._sql_standard = 0
+        cdef const char *ints
+        if self._pgconn is not None:
+            ints = libpq.PQparameterStatus(
+                self._pgconn.pgconn_ptr, b"IntervalStyle")
+            if ints is not NULL and ints == b"sql_standard":
+                self._sql_standard = 1
+
+    cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
+        cdef char tmp[MAXDTLEN]
+        cdef char *end = tmp
+        cdef int days = cdt.timedelta_days(obj)
+        cdef int seconds = cdt.timedelta_seconds(obj)
+        cdef int micros = cdt.timedelta_microseconds(obj)
+
+        if self._sql_standard:
+            # sql_standard format needs explicit signs
+            # otherwise -1 day 1 sec will mean -1 sec
+            end = _write_signed(end, days)
+            end = _write_str(end, b" day ", 5)
+            end = _write_signed(end, seconds)
+            end = _write_str(end, b" second ", 8)
+            end = _write_signed(end, micros)
+            end = _write_str(end, b" microsecond", 12)
+        else:
+            # Same as str(obj)
+            if days:
+                end += pg_lltoa(days, end)
+                if days == 1 or days == -1:
+                    end = _write_str(end, b" day, ", 6)
+                else:
+                    end = _write_str(end, b" days, ", 7)
+            end += pg_lltoa(seconds // 3600, end)
+            end[0] = b':'
+            end = _write_padded(end + 1, seconds // 60 % 60, 2)
+            end[0] = b':'
+            end = _write_padded(end + 1, seconds % 60, 2)
+            if micros:
+                end[0] = b'.'
+                end = _write_padded(end + 1, micros, 6)
+
+        return _copy_to(rv, offset, tmp, end)
+
+
+@cython.final
+cdef class TimeDeltaBinaryDumper(CDumper):
+
+    format = PQ_BINARY
+
+    def __cinit__(self):
+        self.oid = oids.INTERVAL_OID
+
+    cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
+        cdef int64_t micros = (
+            1000000 * <int64_t>cdt.timedelta_seconds(obj)
+            + cdt.timedelta_microseconds(obj))
+        cdef int32_t days = cdt.timedelta_days(obj)
+
+        cdef uint64_t bemicros = endian.htobe64(<uint64_t>micros)
+        cdef uint32_t bedays = endian.htobe32(<uint32_t>days)
+        cdef uint32_t bemonths = 0
+
+        cdef char *buf = CDumper.ensure_size(rv, offset, 16)
+        memcpy(buf, &bemicros, sizeof(bemicros))
+        memcpy(buf + 8, &bedays, sizeof(bedays))
+        memcpy(buf + 12, &bemonths, sizeof(bemonths))
+        return 16
+
+
+@cython.final
+cdef class DateLoader(CLoader):
+
+    format = PQ_TEXT
+    cdef int _order
+
+    def __init__(self, oid: int, context: Optional[AdaptContext] = None):
+        super().__init__(oid, context)
+
+        ds = _get_datestyle(self._pgconn)
+        if ds.startswith(b"I"):  # ISO
+            self._order = ORDER_YMD
+        elif ds.startswith(b"G"):  # German
+            self._order = ORDER_DMY
+        elif ds.startswith(b"S") or ds.startswith(b"P"):  # SQL, Postgres
+            self._order = ORDER_DMY if ds.endswith(b"DMY") else ORDER_MDY
+        else:
+            raise e.InterfaceError(f"unexpected DateStyle: {ds.decode('ascii')}")
+
+    cdef object cload(self, const char *data, size_t length):
+        cdef const char *end = data + length
+        if length >= 2 and end[-1] == b'C':  # ends with BC
+            raise _get_bc_error(data, length)
+
+        cdef int64_t vals[3]
+        memset(vals, 0, sizeof(vals))
+        cdef const char *ptr = _parse_date_values(data, end, vals, 3)
+        if ptr != end:
+            raise _get_parse_error(data, length, "date")
+
+        cdef int64_t y, m, d
+        if self._order == ORDER_YMD:
+            y, m, d = vals[0], vals[1], vals[2]
+        elif self._order == ORDER_DMY:
+            d, m, y = vals[0], vals[1], vals[2]
+        else:
+            m, d, y = vals[0], vals[1], vals[2]
+
+        if y > 9999:
+            raise _get_year_error(data, length)
+
+        try:
+            return cdt.date_new(y, m, d)
+        except ValueError:
+            raise _get_parse_error(data, length, "date") from None
+
+
+@cython.final
+cdef class DateBinaryLoader(CLoader):
+
+    format = PQ_BINARY
+
+    cdef object cload(self, const char *data, size_t length):
+        cdef int days = <int32_t>endian.be32toh((<uint32_t *>data)[0])
+        try:
+            return pg_date_epoch + cdt.timedelta_new(days, 0, 0)
+        except OverflowError:
+            if days < 0:
+                raise e.DataError("date too small (before year 1)") from None
+            else:
+                raise e.DataError("date too large (after year 10K)") from None
+
+
+cdef class _BaseTimeLoader(CLoader):
+
+    format = PQ_TEXT
+
+    cdef const char *_parse_time(
+        self, const char *data, size_t length, int64_t *vals
+    ) except NULL:
+        """
+        Parse a string like 'HH:MM:SS[.ffffff]' into hour, minute, second, us.
+
+        Return the pointer after the parsed time.
+        """
+        cdef const char *end = data + length
+        cdef const char *ptr = _parse_date_values(data, end, vals, 3)
+        if ptr < end and ptr[0] == b'.':
+            ptr = _parse_micros(ptr, end, &vals[3])
+
+        # Most likely, time 24:00
+        if vals[0] >= 24:
+            raise e.DataError(
+                "time not supported by Python:"
+                f" {data[:length].decode('utf8', 'replace')}"
+            )
+
+        return ptr
+
+
+@cython.final
+cdef class TimeLoader(_BaseTimeLoader):
+
+    cdef object cload(self, const char *data, size_t length):
+        cdef int64_t vals[4]
+        memset(vals, 0, sizeof(vals))
+        cdef const char *ptr = self._parse_time(data, length, vals)
+        if ptr != data + length:
+            raise _get_parse_error(data, length, "time")
+
+        try:
+            return cdt.time_new(vals[0], vals[1], vals[2], vals[3], None)
+        except ValueError:
+            raise _get_parse_error(data, length, "time") from None
+
+
+@cython.final
+cdef class TimeTzLoader(_BaseTimeLoader):
+
+    cdef object cload(self, const char *data, size_t length):
+        cdef const char *end = data + length
+        cdef int64_t vals[4]
+        memset(vals, 0, sizeof(vals))
+        cdef const char *ptr = self._parse_time(data, length, vals)
+        if ptr >= end or (ptr[0] != b'+' and ptr[0] != b'-'):
+            raise _get_parse_error(data, length, "timetz")
+
+        cdef int offset
+        if _parse_timezone_to_seconds(ptr, end, &offset) != end:
+            raise _get_parse_error(data, length, "timetz")
+        tz = _timezone_from_seconds(offset)
+        try:
+            return cdt.time_new(vals[0], vals[1], vals[2], vals[3], tz)
+        except ValueError:
+            raise _get_parse_error(data, length, "timetz") from None
+
+
+@cython.final
+cdef class TimeBinaryLoader(CLoader):
+
+    format = PQ_BINARY
+
+    cdef object cload(self, const char *data, size_t length):
+        cdef int64_t val = <int64_t>endian.be64toh((<uint64_t *>data)[0])
+        return _time_from_micros(val, None)
+
+
+@cython.final
+cdef class TimeTzBinaryLoader(CLoader):
+
+    format = PQ_BINARY
+
+    cdef object cload(self, const char *data, size_t length):
+        cdef int64_t val = <int64_t>endian.be64toh((<uint64_t *>data)[0])
+        cdef int32_t off = <int32_t>endian.be32toh((<uint32_t *>(data + 8))[0])
+        return _time_from_micros(val, _timezone_from_seconds(-off))
+
+
+cdef class _BaseTimestampLoader(CLoader):
+
+    format = PQ_TEXT
+    cdef int _order
+
+    def __init__(self, oid: int, context: Optional[AdaptContext] = None):
+        super().__init__(oid, context)
+
+        ds = _get_datestyle(self._pgconn)
+        if ds.startswith(b"I"):  # ISO
+            self._order = ORDER_YMD
+        elif ds.startswith(b"G"):  # German
+            self._order = ORDER_DMY
+        elif ds.startswith(b"S"):  # SQL
+            self._order = ORDER_DMY if ds.endswith(b"DMY") else ORDER_MDY
+        elif ds.startswith(b"P"):  # Postgres
+            self._order = ORDER_PGDM if ds.endswith(b"DMY") else ORDER_PGMD
+        else:
+            raise e.InterfaceError(f"unexpected DateStyle: {ds.decode('ascii')}")
+
+    cdef const char *_parse_timestamp(
+        self, const char *data, size_t length, int64_t *vals
+    ) except NULL:
+        """
+        Parse the date and time part of a timestamp.
+
+        Write year, month, day, hour, minute, second, us into *vals*; return
+        the pointer after the parsed values.
+        """
+        cdef const char *end = data + length
+        if length >= 2 and end[-1] == b'C':  # ends with BC
+            raise _get_bc_error(data, length)
+
+        cdef const char *ptr
+        cdef int64_t tmp[6]
+        memset(tmp, 0, sizeof(tmp))
+
+        if self._order == ORDER_PGDM or self._order == ORDER_PGMD:
+            ptr = self._parse_pg_timestamp(data, end, vals)
+        else:
+            ptr = _parse_date_values(data, end, tmp, 6)
+            if self._order == ORDER_YMD:
+                vals[0], vals[1], vals[2] = tmp[0], tmp[1], tmp[2]
+            elif self._order == ORDER_DMY:
+                vals[2], vals[1], vals[0] = tmp[0], tmp[1], tmp[2]
+            else:
+                vals[1], vals[2], vals[0] = tmp[0], tmp[1], tmp[2]
+            vals[3], vals[4], vals[5] = tmp[3], tmp[4], tmp[5]
+            if ptr < end and ptr[0] == b'.':
+                ptr = _parse_micros(ptr, end, &vals[6])
+
+        if vals[0] > 9999:
+            raise _get_year_error(data, length)
+
+        return ptr
+
+    cdef const char *_parse_pg_timestamp(
+        self, const char *data, const char *end, int64_t *vals
+    ) except NULL:
+        # Parse a timestamp in Postgres DateStyle, e.g.
+        # "Wed 15 Jan 12:00:00.5 2020" (DMY), "Wed Jan 15 12:00:00.5 2020" (MDY)
+        cdef int64_t tmp[4]  # day, hour, minute, second
+        memset(tmp, 0, sizeof(tmp))
+
+        # Skip the day of the week
+        cdef const char *ptr = _skip_word(data, end)
+        if self._order == ORDER_PGDM:
+            ptr = _parse_date_values(ptr, end, tmp, 1)
+            ptr = _skip_word(ptr, end)  # just the space after the day
+            vals[1] = _parse_month(ptr, end)
+            ptr = _skip_word(ptr, end)
+            ptr = _parse_date_values(ptr, end, tmp + 1, 3)
+        else:
+            vals[1] = _parse_month(ptr, end)
+            ptr = _skip_word(ptr, end)
+            ptr = _parse_date_values(ptr, end, tmp, 4)
+
+        vals[2], vals[3], vals[4], vals[5] = tmp[0], tmp[1], tmp[2], tmp[3]
+        if ptr < end and ptr[0] == b'.':
+            ptr = _parse_micros(ptr, end, &vals[6])
+
+        # The year is last
+        if ptr >= end or ptr[0] != b' ':
+            raise _get_parse_error(data, end - data, "timestamp")
+        return _parse_date_values(ptr + 1, end, vals, 1)
+
+
+@cython.final
+cdef class TimestampLoader(_BaseTimestampLoader):
+
+    cdef object cload(self, const char *data, size_t length):
+        cdef int64_t vals[7]
+        memset(vals, 0, sizeof(vals))
+        cdef const char *ptr = self._parse_timestamp(data, length, vals)
+        if ptr != data + length:
+            raise _get_parse_error(data, length, "timestamp")
+
+        try:
+            return cdt.datetime_new(
+                vals[0], vals[1], vals[2],
+                vals[3], vals[4], vals[5], vals[6], None)
+        except ValueError:
+            raise _get_parse_error(data, length, "timestamp") from None
+
+
+@cython.final
+cdef class TimestampBinaryLoader(CLoader):
+
+    format = PQ_BINARY
+
+    cdef object cload(self, const char *data, size_t length):
+        cdef int64_t micros = <int64_t>endian.be64toh((<uint64_t *>data)[0])
+        return _datetime_from_micros(pg_datetime_epoch, micros)
+
+
+@cython.final
+cdef class TimestamptzLoader(_BaseTimestampLoader):
+
+    cdef object cload(self, const char *data, size_t length):
+        if self._order != ORDER_YMD:
+            # The timezone name is not always displayed with the other styles
+            return self._load_notimpl(data, length)
+
+        cdef const char *end = data + length
+        cdef int64_t vals[7]
+        memset(vals, 0, sizeof(vals))
+        cdef const char *ptr = self._parse_timestamp(data, length, vals)
+        if ptr >= end or (ptr[0] != b'+' and ptr[0] != b'-'):
+            raise _get_parse_error(data, length, "timestamptz")
+
+        cdef int offset
+        if _parse_timezone_to_seconds(ptr, end, &offset) != end:
+            raise _get_parse_error(data, length, "timestamptz")
+        tz = _timezone_from_seconds(offset)
+        try:
+            return cdt.datetime_new(
+                vals[0], vals[1], vals[2],
+                vals[3], vals[4], vals[5], vals[6], tz)
+        except ValueError:
+            raise _get_parse_error(data, length, "timestamptz") from None
+
+    cdef object _load_notimpl(self, const char *data, size_t length):
+        s = data[:length].decode("utf8", "replace")
+        ds = _get_datestyle(self._pgconn).decode("ascii")
+        raise NotImplementedError(
+            f"can't parse datetimetz with DateStyle {ds}: {s}"
+        )
+
+
+@cython.final
+cdef class TimestamptzBinaryLoader(CLoader):
+    """
+    Load a binary timestamptz as a `!datetime` in the UTC timezone.
+    """
+
+    format = PQ_BINARY
+
+    cdef object cload(self, const char *data, size_t length):
+        cdef int64_t micros = <int64_t>endian.be64toh((<uint64_t *>data)[0])
+        return _datetime_from_micros(pg_datetimetz_epoch, micros)
+
+
+@cython.final
+cdef class IntervalLoader(CLoader):
+
+    format = PQ_TEXT
+    cdef int _postgres_style
+
+    def __init__(self, oid: int, context: Optional[AdaptContext] = None):
+        super().__init__(oid, context)
+
+        self._postgres_style = 1
+        cdef const char *ints
+        if self._pgconn is not None:
+            ints = libpq.PQparameterStatus(
+                self._pgconn.pgconn_ptr, b"IntervalStyle")
+            if ints is NULL or ints != b"postgres":
+                self._postgres_style = 0
+
+    cdef object cload(self, const char *data, size_t length):
+        if not self._postgres_style:
+            return self._load_notimpl(data, length)
+
+        # Parse a string like "1 year 2 mons -3 days +04:05:06.789"
+        cdef const char *ptr = data
+        cdef const char *end = data + length
+        cdef int64_t days = 0
+        cdef int64_t secs = 0
+        cdef int64_t vals[3]
+        cdef int64_t micros = 0
+        cdef int sign
+
+        while ptr < end:
+            sign = 1
+            if ptr[0] == b'-':
+                sign = -1
+                ptr += 1
+            elif ptr[0] == b'+':
+                ptr += 1
+
+            memset(vals, 0, sizeof(vals))
+            ptr = _parse_date_values(ptr, end, vals, 1)
+            if ptr < end and ptr[0] == b':':
+                # The time part, always last
+                ptr = _parse_date_values(ptr + 1, end, vals + 1, 2)
+                if ptr < end and ptr[0] == b'.':
+                    ptr = _parse_micros(ptr, end, &micros)
+                if ptr != end:
+                    raise _get_parse_error(data, length, "interval")
+
+                secs = vals[0] * 3600 + vals[1] * 60 + vals[2]
+                days += sign * (secs // 86400)
+                secs = sign * (secs % 86400)
+                micros = sign * micros
+                break
+
+            # A value with its unit, e.g. "3 days"
+            ptr += 1
+            if ptr >= end:
+                raise _get_parse_error(data, length, "interval")
+            if ptr[0] == b'y':
+                days += sign * vals[0] * 365
+            elif ptr[0] == b'm':
+                days += sign * vals[0] * 30
+            elif ptr[0] == b'd':
+                days += sign * vals[0]
+            else:
+                raise _get_parse_error(data, length, "interval")
+
+            ptr = _skip_word(ptr, end)
+
+        if not -999999999 <= days <= 999999999:
+            raise e.DataError(
+                f"days={days}; must have magnitude <= 999999999"
+            )
+        try:
+            return cdt.timedelta_new(days, secs, micros)
+        except OverflowError as ex:
+            raise e.DataError(str(ex)) from None
+
+    cdef object _load_notimpl(self, const char *data, size_t length):
+        s = data[:length].decode("utf8", "replace")
+        cdef const char *ints = NULL
+        if self._pgconn is not None:
+            ints = libpq.PQparameterStatus(
+                self._pgconn.pgconn_ptr, b"IntervalStyle")
+        ints_s = ints.decode("ascii") if ints is not NULL else "unknown"
+        raise NotImplementedError(
+            f"can't parse interval with IntervalStyle {ints_s}: {s}"
+        )
+
+
+@cython.final
+cdef class IntervalBinaryLoader(CLoader):
+
+    format = PQ_BINARY
+
+    cdef object cload(self, const char *data, size_t length):
+        cdef int64_t micros = <int64_t>endian.be64toh((<uint64_t *>data)[0])
+        cdef int64_t days = <int32_t>endian.be32toh((<uint32_t *>(data + 8))[0])
+        cdef int32_t months = <int32_t>endian.be32toh(
+            (<uint32_t *>(data + 12))[0])
+
+        # Convert the months to days consistently with the text loader
+        if months > 0:
+            days += 365 * (months // 12) + 30 * (months % 12)
+        elif months < 0:
+            days -= 365 * (-months // 12) + 30 * (-months % 12)
+
+        days += micros // 86400000000
+        micros %= 86400000000
+        if not -999999999 <= days <= 999999999:
+            raise e.DataError(
+                f"days={days}; must have magnitude <= 999999999"
+            )
+        try:
+            return cdt.timedelta_new(
+                days, micros // 1000000, micros % 1000000)
+        except OverflowError as ex:
+            raise e.DataError(str(ex)) from None
+
+
+cdef object _get_datestyle(pq.PGconn pgconn):
+    cdef const char *ds
+    if pgconn is not None:
+        ds = libpq.PQparameterStatus(pgconn.pgconn_ptr, b"DateStyle")
+        if ds is not NULL and ds[0]:
+            return ds
+    return b"ISO, DMY"
+
+
+@cython.cdivision(True)
+cdef const char *_parse_date_values(
+    const char *ptr, const char *end, int64_t *vals, int nvals
+):
+    """
+    Parse *nvals* numeric values separated by non-numeric chars.
+
+    Write the result in the *vals* array (assumed zeroed).
+
+    Return the pointer at the separator after the final digit.
+    """
+    cdef int ival = 0
+    while ptr < end:
+        if b'0' <= ptr[0] <= b'9':
+            vals[ival] = vals[ival] * 10 + (ptr[0] - <char>b'0')
+        else:
+            ival += 1
+            if ival >= nvals:
+                break
+
+        ptr += 1
+
+    return ptr
+
+
+cdef const char *_parse_micros(
+    const char *ptr, const char *end, int64_t *us
+):
+    """
+    Parse the microseconds from a string like '.123456'.
+
+    Return the pointer after the last digit.
+    """
+    cdef int ndigits = 0
+    ptr += 1  # skip the dot
+    us[0] = 0
+    while ptr < end and b'0' <= ptr[0] <= b'9':
+        if ndigits < 6:
+            us[0] = us[0] * 10 + (ptr[0] - <char>b'0')
+            ndigits += 1
+        ptr += 1
+
+    while ndigits < 6:
+        us[0] *= 10
+        ndigits += 1
+
+    return ptr
+
+
+cdef const char *_parse_timezone_to_seconds(
+    const char *ptr, const char *end, int *offset
+):
+    """
+    Parse a timezone from a string like '+HH[:MM[:SS]]' into *offset* seconds.
+
+    Return the pointer after the last digit.
+    """
+    cdef int sign = -1 if ptr[0] == b'-' else 1
+    cdef int64_t vals[3]
+    memset(vals, 0, sizeof(vals))
+    ptr = _parse_date_values(ptr + 1, end, vals, 3)
+    offset[0] = sign * (vals[0] * 3600 + vals[1] * 60 + vals[2])
+    return ptr
+
+
+cdef dict _timezones = {}
+
+cdef object _timezone_from_seconds(int sec):
+    cdef PyObject *ptr = PyDict_GetItem(_timezones, sec)
+    if ptr != NULL:
+        return <object>ptr
+
+    if PY_VERSION_HEX < 0x03070000:
+        # Python 3.6 doesn't support seconds in the timezones
+        tz = timezone(timedelta(minutes=int(sec / 60)))
+    else:
+        tz = timezone(timedelta(seconds=sec))
+    PyDict_SetItem(_timezones, sec, tz)
+    return tz
+
+
+cdef const char *_skip_word(const char *ptr, const char *end):
+    """Return the pointer after the next space (or the end of the string)."""
+    while ptr < end and ptr[0] != b' ':
+        ptr += 1
+    if ptr < end:
+        ptr += 1
+    return ptr
+
+
+cdef const char *_month_abbrs = b"JanFebMarAprMayJunJulAugSepOctNovDec"
+
+cdef int _parse_month(const char *ptr, const char *end):
+    """Return the number of the month abbreviated at *ptr*, 0 if not found."""
+    cdef int i
+    if end - ptr < 3:
+        return 0
+    for i in range(12):
+        if (
+            ptr[0] == _month_abbrs[i * 3]
+            and ptr[1] == _month_abbrs[i * 3 + 1]
+            and ptr[2] == _month_abbrs[i * 3 + 2]
+        ):
+            return i + 1
+    return 0
+
+
+cdef object _get_parse_error(const char *data, size_t length, str what):
+    s = data[:length].decode("utf8", "replace")
+    return e.DataError(f"can't parse {what}: {s!r}")
+
+
+cdef object _get_bc_error(const char *data, size_t length):
+    # Most likely we received a BC date, which Python doesn't support
+    s = data[:length].decode("utf8", "replace")
+    return e.DataError(f"Python doesn't support BC date: got {s}")
+
+
+cdef object _get_year_error(const char *data, size_t length):
+    s = data[:length].decode("utf8", "replace")
+    return e.DataError(f"Python date doesn't support years after 9999: got {s}")
+
+
+@cython.cdivision(True)
+cdef char *_write_padded(char *buf, int64_t val, int width):
+    """
+    Write the non-negative *val* in *buf*, zero-padded to *width* digits.
+
+    Return the pointer after the digits.
+    """
+    cdef int i
+    for i in range(width - 1, -1, -1):
+        buf[i] = <char>b'0' + val % 10
+        val //= 10
+    return buf + width
+
+
+cdef char *_write_signed(char *buf, int64_t val):
+    """Write *val* in *buf* with an explicit sign; return the end pointer."""
+    if val >= 0:
+        buf[0] = b'+'
+        buf += 1
+    return buf + pg_lltoa(val, buf)
+
+
+cdef char *_write_str(char *buf, const char *s, int size):
+    memcpy(buf, s, size)
+    return buf + size
+
+
+cdef char *_write_date(char *buf, int year, int month, int day):
+    """Write a date as YYYY-MM-DD; return the end pointer."""
+    buf = _write_padded(buf, year, 4)
+    buf[0] = b'-'
+    buf = _write_padded(buf + 1, month, 2)
+    buf[0] = b'-'
+    return _write_padded(buf + 1, day, 2)
+
+
+cdef char *_write_time(char *buf, int hour, int minute, int second, int us):
+    """Write a time as HH:MM:SS[.ffffff], like str(); return the end pointer."""
+    buf = _write_padded(buf, hour, 2)
+    buf[0] = b':'
+    buf = _write_padded(buf + 1, minute, 2)
+    buf[0] = b':'
+    buf = _write_padded(buf + 1, second, 2)
+    if us:
+        buf[0] = b'.'
+        buf = _write_padded(buf + 1, us, 6)
+    return buf
+
+
+@cython.cdivision(True)
+cdef char *_write_utcoffset(char *buf, object offset) except NULL:
+    """
+    Write a timezone offset as +HH:MM[:SS[.ffffff]], like isoformat().
+
+    Write nothing if *offset* is None. Return the end pointer.
+    """
+    if offset is None:
+        return buf
+
+    cdef int64_t us = (
+        (<int64_t>cdt.timedelta_days(offset) * 86400
+            + cdt.timedelta_seconds(offset))
+        * 1000000 + cdt.timedelta_microseconds(offset))
+    if us < 0:
+        buf[0] = b'-'
+        us = -us
+    else:
+        buf[0] = b'+'
+
+    cdef int64_t secs = us // 1000000
+    us %= 1000000
+    buf = _write_padded(buf + 1, secs // 3600, 2)
+    buf[0] = b':'
+    buf = _write_padded(buf + 1, secs // 60 % 60, 2)
+    if secs % 60 or us:
+        buf[0] = b':'
+        buf = _write_padded(buf + 1, secs % 60, 2)
+        if us:
+            buf[0] = b'.'
+            buf = _write_padded(buf + 1, us, 6)
+
+    return buf
+
+
+cdef Py_ssize_t _copy_to(
+    bytearray rv, Py_ssize_t offset, const char *start, const char *end
+) except -1:
+    cdef Py_ssize_t size = end - start
+    cdef char *buf = CDumper.ensure_size(rv, offset, size)
+    memcpy(buf, start, size)
+    return size
+
+
+cdef int _days_before_month[13]
+_days_before_month[:] = [
+    0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
+
+cdef int64_t _ymd_to_ordinal(int year, int month, int day):
+    """Return the proleptic Gregorian ordinal of a date, like toordinal()."""
+    cdef int64_t y = year - 1
+    cdef int64_t rv = y * 365 + y // 4 - y // 100 + y // 400
+    rv += _days_before_month[month] + day
+    if month > 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        rv += 1
+    return rv
+
+
+cdef int64_t _time_to_micros(obj):
+    return (
+        cdt.time_microsecond(obj)
+        + 1000000 * <int64_t>(
+            cdt.time_second(obj)
+            + 60 * (cdt.time_minute(obj) + 60 * cdt.time_hour(obj))))
+
+
+cdef int64_t _datetime_to_micros(obj):
+    """Return the microseconds of a datetime since 2000-01-01, ignoring tz."""
+    cdef int64_t days = _ymd_to_ordinal(
+        cdt.datetime_year(obj), cdt.datetime_month(obj), cdt.datetime_day(obj)
+    ) - PG_DATE_EPOCH_DAYS
+    cdef int64_t secs = (
+        cdt.datetime_second(obj)
+        + 60 * (cdt.datetime_minute(obj) + 60 * cdt.datetime_hour(obj)))
+    return (days * 86400 + secs) * 1000000 + cdt.datetime_microsecond(obj)
+
+
+cdef object _time_from_micros(int64_t val, object tz):
+    cdef int64_t us = val % 1000000
+    val //= 1000000
+    cdef int64_t s = val % 60
+    val //= 60
+    cdef int64_t m = val % 60
+    cdef int64_t h = val // 60
+    try:
+        return cdt.time_new(h, m, s, us, tz)
+    except ValueError:
+        raise e.DataError(f"time not supported by Python: hour={h}") from None
+
+
+cdef object _datetime_from_micros(object epoch, int64_t micros):
+    cdef int64_t days = micros // 86400000000
+    micros %= 86400000000
+    try:
+        return epoch + cdt.timedelta_new(
+            days, micros // 1000000, micros % 1000000)
+    except OverflowError:
+        if days < 0:
+            raise e.DataError("timestamp too small (before year 1)") from None
+        else:
+            raise e.DataError("timestamp too large (after year 10K)") from None
@@ -7,16 +7,20 @@ Cython adapters for numeric types.
 cimport cython
 
 from libc.stdint cimport *
-from libc.string cimport memcpy, strlen
-from cpython.mem cimport PyMem_Free
+from libc.string cimport memcpy, memset, strlen
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
 from cpython.long cimport (
     PyLong_FromString, PyLong_FromLong, PyLong_FromLongLong,
     PyLong_FromUnsignedLong, PyLong_AsLongLong)
 from cpython.bytes cimport PyBytes_AsStringAndSize
 from cpython.float cimport PyFloat_FromDouble, PyFloat_AsDouble
+from cpython.unicode cimport PyUnicode_DecodeASCII, PyUnicode_DecodeUTF8
 
 from psycopg3_c._psycopg3 cimport endian
 
+from decimal import Decimal
+
+from psycopg3 import errors as e
 from psycopg3.wrappers.numeric import Int2, Int4, Int8, IntNumeric
 
 cdef extern from "Python.h":
@@ -26,7 +30,7 @@ cdef extern from "Python.h":
     char *PyOS_double_to_string(
         double val, char format_code, int precision, int flags, int *ptype
     ) except NULL
-    int PyOS_snprintf(char *str, size_t size, const char *format, ...)
+    int PyOS_snprintf(char *str, size_t size, const char *fmt, ...)
     int Py_DTSF_ADD_DOT_0
     long long PyLong_AsLongLongAndOverflow(object pylong, int *overflow) except? -1
 
@@ -40,6 +44,13 @@ int pg_lltoa(int64_t value, char *a);
 
 DEF MAXINT8LEN = 20
 
+DEF DEC_DIGITS = 4  # decimal digits per Postgres "digit"
+DEF NUMERIC_POS = 0x0000
+DEF NUMERIC_NEG = 0x4000
+DEF NUMERIC_NAN = 0xC000
+DEF NUMERIC_PINF = 0xD000
+DEF NUMERIC_NINF = 0xF000
+
 
 cdef class _NumberDumper(CDumper):
 
@@ -170,7 +181,7 @@ cdef class IntNumericBinaryDumper(CDumper):
         self.oid = oids.NUMERIC_OID
 
     cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
-        raise NotImplementedError("binary decimal dump not implemented yet")
+        return dump_decimal_to_numeric_binary(Decimal(obj), rv, offset)
 
 
 cdef class IntDumper(_NumberDumper):
@@ -375,3 +386,164 @@ cdef class Float8BinaryLoader(CLoader):
         cdef uint64_t asint = endian.be64toh((<uint64_t *>data)[0])
         cdef char *swp = <char *>&asint
         return PyFloat_FromDouble((<double *>swp)[0])
+
+
+@cython.final
+cdef class DecimalBinaryDumper(CDumper):
+
+    format = PQ_BINARY
+
+    def __cinit__(self):
+        self.oid = oids.NUMERIC_OID
+
+    cdef Py_ssize_t cdump(self, obj, bytearray rv, Py_ssize_t offset) except -1:
+        return dump_decimal_to_numeric_binary(obj, rv, offset)
+
+
+@cython.final
+cdef class NumericLoader(CLoader):
+
+    format = PQ_TEXT
+
+    cdef object cload(self, const char *data, size_t length):
+        return Decimal(PyUnicode_DecodeUTF8(data, length, NULL))
+
+
+cdef object _decimal_nan = Decimal("NaN")
+cdef object _decimal_pinf = Decimal("Infinity")
+cdef object _decimal_ninf = Decimal("-Infinity")
+
+
+@cython.final
+cdef class NumericBinaryLoader(CLoader):
+
+    format = PQ_BINARY
+
+    cdef object cload(self, const char *data, size_t length):
+        cdef uint16_t *data16 = <uint16_t *>data
+        cdef uint16_t ndigits = endian.be16toh(data16[0])
+        cdef int16_t weight = <int16_t>endian.be16toh(data16[1])
+        cdef uint16_t sign = endian.be16toh(data16[2])
+        cdef uint16_t dscale = endian.be16toh(data16[3])
+
+        if sign == NUMERIC_NAN:
+            return _decimal_nan
+        elif sign == NUMERIC_PINF:
+            return _decimal_pinf
+        elif sign == NUMERIC_NINF:
+            return _decimal_ninf
+        elif sign != NUMERIC_POS and sign != NUMERIC_NEG:
+            raise e.DataError(f"bad value for numeric sign: 0x{sign:X}")
+
+        # Number of decimal digits to add (or drop, if negative) to the base
+        # 10000 digits to represent the number up to the display scale.
+        cdef int shift = DEC_DIGITS * (weight - ndigits + 1) + dscale
+        cdef int nchars = DEC_DIGITS * ndigits + shift
+        cdef char *buf = <char *>PyMem_Malloc(
+            DEC_DIGITS * ndigits + (shift if shift > 0 else 0) + 16)
+        if buf == NULL:
+            raise MemoryError()
+
+        cdef char *end = buf
+        cdef uint16_t pgdigit
+        cdef int i
+        try:
+            if sign == NUMERIC_NEG:
+                end[0] = b'-'
+                end += 1
+
+            if nchars > 0:
+                for i in range(ndigits):
+                    pgdigit = endian.be16toh(data16[i + 4])
+                    end[0] = <char>b'0' + pgdigit // 1000
+                    end[1] = <char>b'0' + pgdigit // 100 % 10
+                    end[2] = <char>b'0' + pgdigit // 10 % 10
+                    end[3] = <char>b'0' + pgdigit % 10
+                    end += DEC_DIGITS
+
+                if shift > 0:
+                    memset(end, <char>b'0', shift)
+                # else the digits dropped are the padding of the last group
+                end += shift
+            else:
+                end[0] = b'0'
+                end += 1
+
+            end += PyOS_snprintf(end, 8, "E-%d", <int>dscale)
+            return Decimal(PyUnicode_DecodeASCII(buf, end - buf, NULL))
+
+        finally:
+            PyMem_Free(buf)
+
+
+cdef Py_ssize_t dump_decimal_to_numeric_binary(
+    obj, bytearray rv, Py_ssize_t offset
+) except -1:
+    sign, digits, pyexp = obj.as_tuple()
+
+    cdef uint16_t head[4]
+    cdef char *buf
+    if not isinstance(pyexp, int):
+        if pyexp == "n" or pyexp == "N":
+            head[2] = NUMERIC_NAN
+        elif pyexp == "F":
+            head[2] = NUMERIC_NINF if sign else NUMERIC_PINF
+        else:
+            raise e.DataError(f"unexpected decimal exponent: {pyexp}")
+
+        buf = CDumper.ensure_size(rv, offset, sizeof(head))
+        head[0] = head[1] = head[3] = 0
+        head[2] = endian.htobe16(head[2])
+        memcpy(buf, head, sizeof(head))
+        return sizeof(head)
+
+    cdef int exp = pyexp
+    cdef int dscale = -exp if exp < 0 else 0
+
+    # Pad the digits with zeros, on the right to make the exponent a multiple
+    # of DEC_DIGITS, on the left to make their number a multiple of it too.
+    cdef int ndigits = len(digits)
+    cdef int rpad = exp % DEC_DIGITS
+    if rpad < 0:
+        rpad += DEC_DIGITS
+    exp -= rpad
+    cdef int lpad = (DEC_DIGITS - (ndigits + rpad) % DEC_DIGITS) % DEC_DIGITS
+    cdef int ntot = lpad + ndigits + rpad
+    cdef int weight = ntot // DEC_DIGITS - 1 + exp // DEC_DIGITS
+
+    buf = CDumper.ensure_size(
+        rv, offset, sizeof(head) + ntot // DEC_DIGITS * sizeof(uint16_t))
+    cdef char *out = buf + sizeof(head)
+
+    # Write the base 10000 digits, skipping the zeros at the start and
+    # stopping after the last non-zero one.
+    cdef int i, nout = 0, nsig = 0
+    cdef uint16_t pgdigit = 0, bedigit
+    for i in range(ntot):
+        pgdigit *= 10
+        if lpad <= i < lpad + ndigits:
+            pgdigit += <int>digits[i - lpad]
+        if i % DEC_DIGITS != DEC_DIGITS - 1:
+            continue
+
+        if nout == 0 and pgdigit == 0:
+            weight -= 1
+        else:
+            bedigit = endian.htobe16(pgdigit)
+            memcpy(out + nout * sizeof(uint16_t), &bedigit, sizeof(uint16_t))
+            nout += 1
+            if pgdigit:
+                nsig = nout
+        pgdigit = 0
+
+    if nsig == 0:
+        weight = 0
+    if not INT16_MIN <= weight <= INT16_MAX:
+        raise e.DataError(f"value out of range for numeric: {obj}")
+
+    head[0] = endian.htobe16(nsig)
+    head[1] = endian.htobe16(<uint16_t><int16_t>weight)
+    head[2] = endian.htobe16(NUMERIC_NEG if sign else NUMERIC_POS)
+    head[3] = endian.htobe16(dscale)
+    memcpy(buf, head, sizeof(head))
+    return sizeof(head) + nsig * sizeof(uint16_t)
@@ -1,14 +1,18 @@
 import importlib
 from math import isnan
+from array import array
 from uuid import UUID
 from random import choice, random, randrange
 from collections import deque
+from decimal import Decimal
+from datetime import date, datetime, time, timedelta
 
 import pytest
 
 import psycopg3
 from psycopg3 import sql
 from psycopg3.adapt import Format
+from psycopg3.types import Int8
 
 
 @pytest.fixture
@@ -127,7 +131,7 @@ class Faker:
             if cls is list:
                 while 1:
                     scls = choice(types_list)
-                    if scls is not list:
+                    if scls is not list and scls is not array:
                         break
                 schema[i] = [scls]
             elif cls is tuple:
@@ -215,6 +219,14 @@ class Faker:
     def match_any(self, spec, got, want):
         assert got == want
 
+    def make_array(self, spec):
+        # Use a single typecode: the column type is chosen on the first value
+        length = randrange(1, self.list_max_length)
+        return spec("q", (self.make_Int8(Int8) for i in range(length)))
+
+    def match_array(self, spec, got, want):
+        assert got == list(want)
+
     def make_bool(self, spec):
         return choice((True, False))
 
@@ -225,6 +237,31 @@ class Faker:
         length = randrange(self.str_max_length)
         return spec(bytes([randrange(256) for i in range(length)]))
 
+    def make_date(self, spec):
+        day = randrange(date.max.toordinal())
+        return date.fromordinal(day + 1)
+
+    def make_datetime(self, spec):
+        # Naive, to be dumped as timestamp and loaded back unchanged
+        delta = datetime.max - datetime.min
+        micros = randrange((delta.days + 1) * 24 * 60 * 60 * 1_000_000)
+        return datetime.min + timedelta(microseconds=micros)
+
+    def make_Decimal(self, spec):
+        if random() >= 0.99:
+            return Decimal("NaN")
+
+        sign = choice("+-")
+        num = randrange(1 << randrange(1, 100))
+        exp = randrange(-20, 20)
+        return Decimal(f"{sign}{num}e{exp}")
+
+    def match_Decimal(self, spec, got, want):
+        if got is not None and got.is_nan():
+            assert want.is_nan()
+        else:
+            assert got == want
+
     def make_float(self, spec):
         if random() <= 0.99:
             # this exponent should generate no inf
@@ -245,6 +282,9 @@ class Faker:
     def make_int(self, spec):
         return randrange(-(1 << 63), 1 << 63)
 
+    def make_IntNumeric(self, spec):
+        return spec(randrange(-(1 << 100), 1 << 100))
+
     def make_Int2(self, spec):
         return spec(randrange(-(1 << 15), 1 << 15))
 
@@ -254,6 +294,25 @@ class Faker:
     def make_Int8(self, spec):
         return spec(randrange(-(1 << 63), 1 << 63))
 
+    def make_IPv4Address(self, spec):
+        return spec(randrange(1 << 32))
+
+    def make_IPv4Interface(self, spec):
+        # The interfaces with a full prefix are loaded as addresses
+        return spec((randrange(1 << 32), randrange(32)))
+
+    def make_IPv4Network(self, spec):
+        return spec((randrange(1 << 32), randrange(33)), strict=False)
+
+    def make_IPv6Address(self, spec):
+        return spec(randrange(1 << 128))
+
+    def make_IPv6Interface(self, spec):
+        return spec((randrange(1 << 128), randrange(128)))
+
+    def make_IPv6Network(self, spec):
+        return spec((randrange(1 << 128), randrange(129)), strict=False)
+
     def make_Json(self, spec):
         return spec(self._make_json())
 
@@ -296,6 +355,16 @@ class Faker:
     def make_Oid(self, spec):
         return spec(randrange(1 << 32))
 
+    def make_Range(self, spec):
+        # Ranges of int8: the server normalises the bounds to "[)", with
+        # "(" if the lower bound is unbound.
+        lower = randrange(-(1 << 62), 1 << 62)
+        upper = Int8(lower + randrange(1, 1 << 62))
+        if random() < 0.1:
+            return spec(None, upper, "()")
+        else:
+            return spec(Int8(lower), upper, "[)")
+
     def make_str(self, spec, length=0):
         if not length:
             length = randrange(self.str_max_length)
@@ -308,6 +377,19 @@ class Faker:
 
         return "".join(map(chr, rv))
 
+    def make_time(self, spec):
+        val = randrange(24 * 60 * 60 * 1_000_000)
+        val, micros = divmod(val, 1_000_000)
+        val, sec = divmod(val, 60)
+        hour, minute = divmod(val, 60)
+        return time(hour, minute, sec, micros)
+
+    def make_timedelta(self, spec):
+        return timedelta(
+            days=randrange(-100_000, 100_000),
+            microseconds=randrange(24 * 60 * 60 * 1_000_000),
+        )
+
     def make_UUID(self, spec):
         return UUID(bytes=bytes([randrange(256) for i in range(16)]))
 
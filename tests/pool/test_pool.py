@@ -0,0 +1,450 @@
+import logging
+import weakref
+from time import sleep, time
+from threading import Thread
+
+import pytest
+
+import psycopg3
+from psycopg3 import pool
+from psycopg3.pq import TransactionStatus
+
+
+def test_defaults(dsn):
+    with pool.ConnectionPool(dsn) as p:
+        assert p.minconn == p.maxconn == 4
+        assert p.timeout == 30
+        assert p.max_idle == 600
+        assert p.num_workers == 3
+
+
+def test_minconn_maxconn(dsn):
+    with pool.ConnectionPool(dsn, minconn=2) as p:
+        assert p.minconn == p.maxconn == 2
+
+    with pool.ConnectionPool(dsn, minconn=2, maxconn=4) as p:
+        assert p.minconn == 2
+        assert p.maxconn == 4
+
+    with pytest.raises(ValueError):
+        pool.ConnectionPool(dsn, minconn=4, maxconn=2)
+
+
+def test_kwargs(dsn):
+    with pool.ConnectionPool(dsn, kwargs={"autocommit": True}, minconn=1) as p:
+        with p.connection() as conn:
+            assert conn.autocommit
+
+
+def test_its_really_a_pool(dsn):
+    with pool.ConnectionPool(dsn, minconn=2) as p:
+        with p.connection() as conn:
+            with conn.execute("select pg_backend_pid()") as cur:
+                (pid1,) = cur.fetchone()
+
+            with p.connection() as conn2:
+                with conn2.execute("select pg_backend_pid()") as cur:
+                    (pid2,) = cur.fetchone()
+
+        with p.connection() as conn:
+            assert conn.pgconn.backend_pid in (pid1, pid2)
+
+
+def test_context(dsn):
+    with pool.ConnectionPool(dsn, minconn=1) as p:
+        assert not p.closed
+    assert p.closed
+
+
+def test_connection_not_lost(dsn):
+    with pool.ConnectionPool(dsn, minconn=1) as p:
+        with pytest.raises(ZeroDivisionError):
+            with p.connection() as conn:
+                pid = conn.pgconn.backend_pid
+                1 / 0
+
+        with p.connection() as conn2:
+            assert conn2.pgconn.backend_pid == pid
+
+
+def test_configure(dsn):
+    inits = 0
+
+    def configure(conn):
+        nonlocal inits
+        inits += 1
+        with conn.transaction():
+            conn.execute("set default_transaction_read_only to on")
+
+    with pool.ConnectionPool(dsn, minconn=1, configure=configure) as p:
+        p.wait(timeout=1.0)
+        with p.connection() as conn:
+            assert inits == 1
+            res = conn.execute("show default_transaction_read_only")
+            assert res.fetchone()[0] == "on"
+
+
+def test_configure_badstate(dsn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg3.pool")
+
+    def configure(conn):
+        conn.execute("select 1")
+
+    with pool.ConnectionPool(dsn, minconn=1, configure=configure) as p:
+        with pytest.raises(pool.PoolTimeout):
+            p.wait(timeout=0.5)
+
+    assert caplog.records
+    assert "INTRANS" in caplog.records[0].message
+
+
+def test_wait_closed(dsn):
+    with pool.ConnectionPool(dsn) as p:
+        pass
+
+    with pytest.raises(pool.PoolClosed):
+        with p.connection():
+            pass
+
+
+@pytest.mark.slow
+def test_queue(dsn):
+    p = pool.ConnectionPool(dsn, minconn=2)
+    results = []
+
+    def worker(n):
+        t0 = time()
+        with p.connection() as conn:
+            (pid,) = conn.execute(
+                "select pg_backend_pid() from pg_sleep(0.2)"
+            ).fetchone()
+        t1 = time()
+        results.append((n, t1 - t0, pid))
+
+    ts = [Thread(target=worker, args=(i,)) for i in range(6)]
+    [t.start() for t in ts]
+    [t.join() for t in ts]
+    p.close()
+
+    times = [item[1] for item in results]
+    want_times = [0.2, 0.2, 0.4, 0.4, 0.6, 0.6]
+    for got, want in zip(times, want_times):
+        assert got == pytest.approx(want, 0.2), times
+
+    assert len(set(r[2] for r in results)) == 2, results
+
+
+@pytest.mark.slow
+def test_queue_timeout(dsn):
+    p = pool.ConnectionPool(dsn, minconn=2, timeout=0.1)
+    results = []
+    errors = []
+
+    def worker(n):
+        t0 = time()
+        try:
+            with p.connection() as conn:
+                (pid,) = conn.execute(
+                    "select pg_backend_pid() from pg_sleep(0.2)"
+                ).fetchone()
+        except pool.PoolTimeout as e:
+            t1 = time()
+            errors.append((n, t1 - t0, e))
+        else:
+            t1 = time()
+            results.append((n, t1 - t0, pid))
+
+    ts = [Thread(target=worker, args=(i,)) for i in range(4)]
+    [t.start() for t in ts]
+    [t.join() for t in ts]
+    p.close()
+
+    assert len(results) == 2
+    assert len(errors) == 2
+    for e in errors:
+        assert 0.1 < e[1] < 0.15
+
+
+@pytest.mark.slow
+def test_queue_too_many_requests(dsn):
+    p = pool.ConnectionPool(dsn, minconn=1, max_waiting=1)
+    p.wait(timeout=1.0)
+    errors = []
+
+    def worker():
+        try:
+            with p.connection() as conn:
+                conn.execute("select pg_sleep(0.3)")
+        except pool.TooManyRequests as e:
+            errors.append(e)
+
+    ts = [Thread(target=worker) for i in range(3)]
+    for t in ts:
+        t.start()
+        sleep(0.05)
+    [t.join() for t in ts]
+    p.close()
+
+    assert len(errors) == 1
+
+
+def test_dead_client(dsn):
+    p = pool.ConnectionPool(dsn, minconn=2)
+
+    def worker(i):
+        try:
+            with p.connection(timeout=0.1) as conn:
+                conn.execute("select pg_sleep(0.3)")
+        except pool.PoolTimeout:
+            pass
+
+    ts = [Thread(target=worker, args=(i,)) for i in range(4)]
+    [t.start() for t in ts]
+    [t.join() for t in ts]
+    sleep(0.2)
+    assert len(p._pool) == 2
+    assert not p._waiting
+    p.close()
+
+
+@pytest.mark.slow
+def test_grow(dsn):
+    p = pool.ConnectionPool(dsn, minconn=2, maxconn=4, num_workers=3)
+    p.wait(timeout=1.0)
+    results = []
+
+    def worker(n):
+        t0 = time()
+        with p.connection() as conn:
+            conn.execute("select 1 from pg_sleep(0.2)")
+        t1 = time()
+        results.append((n, t1 - t0))
+
+    ts = [Thread(target=worker, args=(i,)) for i in range(6)]
+    [t.start() for t in ts]
+    [t.join() for t in ts]
+    p.close()
+
+    want_times = [0.2, 0.2, 0.2, 0.2, 0.4, 0.4]
+    times = [item[1] for item in results]
+    for got, want in zip(times, want_times):
+        assert got == pytest.approx(want, 0.2), times
+
+
+@pytest.mark.slow
+def test_shrink(dsn):
+    p = pool.ConnectionPool(dsn, minconn=2, maxconn=4, max_idle=0.2)
+    p.wait(timeout=1.0)
+    assert p.max_idle == 0.2
+
+    def worker(n):
+        with p.connection() as conn:
+            conn.execute("select pg_sleep(0.1)")
+
+    ts = [Thread(target=worker, args=(i,)) for i in range(4)]
+    [t.start() for t in ts]
+    [t.join() for t in ts]
+    assert p._nconns == 4
+
+    sleep(1)
+    p.close()
+    assert p._nconns == 2
+
+
+def test_putconn_no_pool(dsn):
+    with pool.ConnectionPool(dsn, minconn=1) as p:
+        conn = psycopg3.connect(dsn)
+        with pytest.raises(ValueError):
+            p.putconn(conn)
+        conn.close()
+
+
+def test_putconn_wrong_pool(dsn):
+    with pool.ConnectionPool(dsn, minconn=1) as p1:
+        with pool.ConnectionPool(dsn, minconn=1) as p2:
+            conn = p1.getconn()
+            with pytest.raises(ValueError):
+                p2.putconn(conn)
+            p1.putconn(conn)
+
+
+def test_del_no_warning(dsn, recwarn):
+    p = pool.ConnectionPool(dsn, minconn=2)
+    with p.connection() as conn:
+        conn.execute("select 1")
+
+    p.wait(timeout=1.0)
+    ref = weakref.ref(p)
+    del p
+    assert not ref()
+    assert not recwarn
+
+
+@pytest.mark.slow
+def test_del_stop_threads(dsn):
+    p = pool.ConnectionPool(dsn)
+    ts = [p._sched_runner] + p._workers
+    del p
+    sleep(0.2)
+    for t in ts:
+        assert not t.is_alive()
+
+
+def test_closed_getconn(dsn):
+    p = pool.ConnectionPool(dsn, minconn=1)
+    assert not p.closed
+    with p.connection():
+        pass
+
+    p.close()
+    assert p.closed
+
+    with pytest.raises(pool.PoolClosed):
+        with p.connection():
+            pass
+
+
+def test_closed_putconn(dsn):
+    p = pool.ConnectionPool(dsn, minconn=1)
+
+    with p.connection() as conn:
+        pass
+    assert not conn.closed
+
+    with p.connection() as conn:
+        p.close()
+    assert conn.closed
+
+
+@pytest.mark.slow
+def test_closed_connecting(dsn):
+    conns = []
+
+    def configure(conn):
+        conns.append(conn)
+        sleep(0.2)
+
+    p = pool.ConnectionPool(dsn, minconn=1, configure=configure)
+    sleep(0.1)
+    assert len(conns) == 1
+    p.close()
+    assert conns[0].closed
+    assert not p._pool
+
+
+@pytest.mark.slow
+def test_closed_queue(dsn):
+    p = pool.ConnectionPool(dsn, minconn=1)
+    success = []
+
+    def w1():
+        with p.connection() as conn:
+            conn.execute("select 1 from pg_sleep(0.2)")
+        success.append("w1")
+
+    def w2():
+        with pytest.raises(pool.PoolClosed):
+            with p.connection():
+                pass
+        success.append("w2")
+
+    t1 = Thread(target=w1)
+    t2 = Thread(target=w2)
+    t1.start()
+    sleep(0.1)
+    t2.start()
+    p.close()
+    t1.join()
+    t2.join()
+    assert len(success) == 2
+
+
+def test_intrans_rollback(dsn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg3.pool")
+    p = pool.ConnectionPool(dsn, minconn=1)
+    conn = p.getconn()
+    pid = conn.pgconn.backend_pid
+    conn.execute("create table test_intrans_rollback ()")
+    assert conn.pgconn.transaction_status == TransactionStatus.INTRANS
+    p.putconn(conn)
+
+    with p.connection() as conn2:
+        assert conn2.pgconn.backend_pid == pid
+        assert conn2.pgconn.transaction_status == TransactionStatus.IDLE
+        assert not conn2.execute(
+            "select 1 from pg_class where relname = 'test_intrans_rollback'"
+        ).fetchone()
+
+    p.close()
+    assert len(caplog.records) == 1
+    assert "rolling back" in caplog.records[0].message
+
+
+def test_inerror_rollback(dsn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg3.pool")
+    p = pool.ConnectionPool(dsn, minconn=1)
+    conn = p.getconn()
+    pid = conn.pgconn.backend_pid
+    with pytest.raises(psycopg3.ProgrammingError):
+        conn.execute("wat")
+    assert conn.pgconn.transaction_status == TransactionStatus.INERROR
+    p.putconn(conn)
+
+    with p.connection() as conn2:
+        assert conn2.pgconn.backend_pid == pid
+        assert conn2.pgconn.transaction_status == TransactionStatus.IDLE
+
+    p.close()
+    assert len(caplog.records) == 1
+    assert "rolling back" in caplog.records[0].message
+
+
+def test_closed_conn_replaced(dsn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg3.pool")
+    p = pool.ConnectionPool(dsn, minconn=1)
+    conn = p.getconn()
+    pid = conn.pgconn.backend_pid
+    conn.close()
+    p.putconn(conn)
+
+    with p.connection() as conn2:
+        assert conn2.pgconn.backend_pid != pid
+
+    p.close()
+    assert len(caplog.records) == 1
+    assert "closed" in caplog.records[0].message
+
+
+@pytest.mark.slow
+def test_max_lifetime(dsn):
+    p = pool.ConnectionPool(dsn, minconn=1, max_lifetime=0.5)
+    p.wait(timeout=1.0)
+    pids = []
+    for i in range(5):
+        with p.connection() as conn:
+            pids.append(conn.pgconn.backend_pid)
+        sleep(0.2)
+    p.close()
+
+    assert pids[0] == pids[1] != pids[4], pids
+
+
+@pytest.mark.slow
+def test_reconnect_failed():
+    class MyPool(pool.ConnectionPool):
+        failed = 0
+
+        def reconnect_failed(self):
+            self.failed += 1
+
+    p = MyPool(
+        "host=127.0.0.1 port=1 connect_timeout=1",
+        minconn=1,
+        reconnect_timeout=1.0,
+    )
+    sleep(2.5)
+    try:
+        assert p.failed == 1
+        assert p._nconns == 0
+    finally:
+        p.close()
@@ -0,0 +1,369 @@
+import asyncio
+import logging
+from time import time
+
+import pytest
+
+import psycopg3
+from psycopg3 import pool
+from psycopg3.pq import TransactionStatus
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_defaults(dsn):
+    async with pool.AsyncConnectionPool(dsn) as p:
+        assert p.minconn == p.maxconn == 4
+        assert p.timeout == 30
+        assert p.max_idle == 600
+
+
+async def test_its_really_a_pool(dsn):
+    async with pool.AsyncConnectionPool(dsn, minconn=2) as p:
+        async with p.connection() as conn:
+            cur = await conn.execute("select pg_backend_pid()")
+            (pid1,) = await cur.fetchone()
+
+            async with p.connection() as conn2:
+                cur = await conn2.execute("select pg_backend_pid()")
+                (pid2,) = await cur.fetchone()
+
+        async with p.connection() as conn:
+            assert conn.pgconn.backend_pid in (pid1, pid2)
+
+
+async def test_context(dsn):
+    async with pool.AsyncConnectionPool(dsn, minconn=1) as p:
+        assert not p.closed
+    assert p.closed
+
+
+async def test_connection_not_lost(dsn):
+    async with pool.AsyncConnectionPool(dsn, minconn=1) as p:
+        with pytest.raises(ZeroDivisionError):
+            async with p.connection() as conn:
+                pid = conn.pgconn.backend_pid
+                1 / 0
+
+        async with p.connection() as conn2:
+            assert conn2.pgconn.backend_pid == pid
+
+
+async def test_configure(dsn):
+    inits = 0
+
+    async def configure(conn):
+        nonlocal inits
+        inits += 1
+        async with conn.transaction():
+            await conn.execute("set default_transaction_read_only to on")
+
+    async with pool.AsyncConnectionPool(
+        dsn, minconn=1, configure=configure
+    ) as p:
+        await p.wait(timeout=1.0)
+        async with p.connection() as conn:
+            assert inits == 1
+            cur = await conn.execute("show default_transaction_read_only")
+            assert (await cur.fetchone())[0] == "on"
+
+
+@pytest.mark.slow
+async def test_queue(dsn):
+    p = pool.AsyncConnectionPool(dsn, minconn=2)
+    results = []
+
+    async def worker(n):
+        t0 = time()
+        async with p.connection() as conn:
+            cur = await conn.execute(
+                "select pg_backend_pid() from pg_sleep(0.2)"
+            )
+            (pid,) = await cur.fetchone()
+        t1 = time()
+        results.append((n, t1 - t0, pid))
+
+    await asyncio.gather(*(worker(i) for i in range(6)))
+    await p.close()
+
+    times = [item[1] for item in results]
+    want_times = [0.2, 0.2, 0.4, 0.4, 0.6, 0.6]
+    for got, want in zip(times, want_times):
+        assert got == pytest.approx(want, 0.2), times
+
+    assert len(set(r[2] for r in results)) == 2, results
+
+
+async def test_queue_fifo(dsn):
+    p = pool.AsyncConnectionPool(dsn, minconn=1)
+    await p.wait(timeout=1.0)
+    order = []
+
+    async def worker(n):
+        async with p.connection() as conn:
+            order.append(n)
+            await conn.execute("select pg_sleep(0.02)")
+
+    await asyncio.gather(*(worker(i) for i in range(5)))
+    await p.close()
+    assert order == list(range(5))
+
+
+@pytest.mark.slow
+async def test_queue_timeout(dsn):
+    p = pool.AsyncConnectionPool(dsn, minconn=2, timeout=0.1)
+    results = []
+    errors = []
+
+    async def worker(n):
+        t0 = time()
+        try:
+            async with p.connection() as conn:
+                cur = await conn.execute(
+                    "select pg_backend_pid() from pg_sleep(0.2)"
+                )
+                (pid,) = await cur.fetchone()
+        except pool.PoolTimeout as e:
+            t1 = time()
+            errors.append((n, t1 - t0, e))
+        else:
+            t1 = time()
+            results.append((n, t1 - t0, pid))
+
+    await asyncio.gather(*(worker(i) for i in range(4)))
+    await p.close()
+
+    assert len(results) == 2
+    assert len(errors) == 2
+    for e in errors:
+        assert 0.1 < e[1] < 0.15
+
+
+async def test_queue_too_many_requests(dsn):
+    p = pool.AsyncConnectionPool(dsn, minconn=1, max_waiting=1)
+    await p.wait(timeout=1.0)
+    errors = []
+
+    async def worker():
+        try:
+            async with p.connection() as conn:
+                await conn.execute("select pg_sleep(0.1)")
+        except pool.TooManyRequests as e:
+            errors.append(e)
+
+    await asyncio.gather(*(worker() for i in range(3)))
+    await p.close()
+
+    assert len(errors) == 1
+
+
+async def test_dead_client(dsn):
+    p = pool.AsyncConnectionPool(dsn, minconn=2)
+
+    async def worker(i):
+        try:
+            async with p.connection(timeout=0.1) as conn:
+                await conn.execute("select pg_sleep(0.3)")
+        except pool.PoolTimeout:
+            pass
+
+    await asyncio.gather(*(worker(i) for i in range(4)))
+    await asyncio.sleep(0.2)
+    assert len(p._pool) == 2
+    assert not p._waiting
+    await p.close()
+
+
+@pytest.mark.slow
+async def test_grow_concurrently(dsn):
+    p = pool.AsyncConnectionPool(dsn, minconn=1, maxconn=6)
+    await p.wait(timeout=1.0)
+    results = []
+
+    async def worker(n):
+        t0 = time()
+        async with p.connection() as conn:
+            await conn.execute("select 1 from pg_sleep(0.2)")
+        t1 = time()
+        results.append((n, t1 - t0))
+
+    await asyncio.gather(*(worker(i) for i in range(6)))
+    assert p._nconns == 6
+    await p.close()
+
+    # The new connections are created together: nobody waits for the others,
+    # which would take 0.2 * 6 seconds if done serially
+    times = [item[1] for item in results]
+    for got in times:
+        assert got < 0.2 * 6 / 2, times
+
+
+@pytest.mark.slow
+async def test_shrink(dsn):
+    p = pool.AsyncConnectionPool(dsn, minconn=2, maxconn=4, max_idle=0.2)
+    await p.wait(timeout=1.0)
+
+    async def worker(n):
+        async with p.connection() as conn:
+            await conn.execute("select pg_sleep(0.1)")
+
+    await asyncio.gather(*(worker(i) for i in range(4)))
+    assert p._nconns == 4
+
+    await asyncio.sleep(1)
+    await p.close()
+    assert p._nconns == 2
+
+
+async def test_putconn_no_pool(dsn):
+    async with pool.AsyncConnectionPool(dsn, minconn=1) as p:
+        conn = await psycopg3.AsyncConnection.connect(dsn)
+        with pytest.raises(ValueError):
+            await p.putconn(conn)
+        await conn.close()
+
+
+async def test_putconn_wrong_pool(dsn):
+    async with pool.AsyncConnectionPool(dsn, minconn=1) as p1:
+        async with pool.AsyncConnectionPool(dsn, minconn=1) as p2:
+            conn = await p1.getconn()
+            with pytest.raises(ValueError):
+                await p2.putconn(conn)
+            await p1.putconn(conn)
+
+
+async def test_closed_getconn(dsn):
+    p = pool.AsyncConnectionPool(dsn, minconn=1)
+    async with p.connection():
+        pass
+
+    await p.close()
+    assert p.closed
+
+    with pytest.raises(pool.PoolClosed):
+        async with p.connection():
+            pass
+
+
+async def test_closed_putconn(dsn):
+    p = pool.AsyncConnectionPool(dsn, minconn=1)
+
+    async with p.connection() as conn:
+        pass
+    assert not conn.closed
+
+    async with p.connection() as conn:
+        await p.close()
+    assert conn.closed
+
+
+async def test_closed_connecting(dsn):
+    conns = []
+
+    async def configure(conn):
+        conns.append(conn)
+        await asyncio.sleep(0.2)
+
+    p = pool.AsyncConnectionPool(dsn, minconn=1, configure=configure)
+    await asyncio.sleep(0.1)
+    assert len(conns) == 1
+    await p.close()
+    assert conns[0].closed
+    assert not p._pool
+
+
+async def test_closed_queue(dsn):
+    p = pool.AsyncConnectionPool(dsn, minconn=1)
+    success = []
+
+    async def w1():
+        async with p.connection() as conn:
+            await conn.execute("select 1 from pg_sleep(0.2)")
+        success.append("w1")
+
+    async def w2():
+        await asyncio.sleep(0.1)
+        with pytest.raises(pool.PoolClosed):
+            async with p.connection():
+                pass
+        success.append("w2")
+
+    async def closer():
+        await asyncio.sleep(0.15)
+        await p.close()
+
+    await asyncio.gather(w1(), w2(), closer())
+    assert len(success) == 2
+
+
+async def test_intrans_rollback(dsn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg3.pool")
+    p = pool.AsyncConnectionPool(dsn, minconn=1)
+    conn = await p.getconn()
+    pid = conn.pgconn.backend_pid
+    await conn.execute("create table test_intrans_rollback ()")
+    assert conn.pgconn.transaction_status == TransactionStatus.INTRANS
+    await p.putconn(conn)
+
+    async with p.connection() as conn2:
+        assert conn2.pgconn.backend_pid == pid
+        assert conn2.pgconn.transaction_status == TransactionStatus.IDLE
+        cur = await conn2.execute(
+            "select 1 from pg_class where relname = 'test_intrans_rollback'"
+        )
+        assert not await cur.fetchone()
+
+    await p.close()
+    assert len(caplog.records) == 1
+    assert "rolling back" in caplog.records[0].message
+
+
+async def test_closed_conn_replaced(dsn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg3.pool")
+    p = pool.AsyncConnectionPool(dsn, minconn=1)
+    conn = await p.getconn()
+    pid = conn.pgconn.backend_pid
+    await conn.close()
+    await p.putconn(conn)
+
+    async with p.connection() as conn2:
+        assert conn2.pgconn.backend_pid != pid
+
+    await p.close()
+    assert len(caplog.records) == 1
+    assert "closed" in caplog.records[0].message
+
+
+@pytest.mark.slow
+async def test_max_lifetime(dsn):
+    p = pool.AsyncConnectionPool(dsn, minconn=1, max_lifetime=0.5)
+    await p.wait(timeout=1.0)
+    pids = []
+    for i in range(5):
+        async with p.connection() as conn:
+            pids.append(conn.pgconn.backend_pid)
+        await asyncio.sleep(0.2)
+    await p.close()
+
+    assert pids[0] == pids[1] != pids[4], pids
+
+
+@pytest.mark.slow
+async def test_reconnect_failed():
+    class MyPool(pool.AsyncConnectionPool):
+        failed = 0
+
+        async def reconnect_failed(self):
+            self.failed += 1
+
+    p = MyPool(
+        "host=127.0.0.1 port=1 connect_timeout=1",
+        minconn=1,
+        reconnect_timeout=1.0,
+    )
+    await asyncio.sleep(2.5)
+    try:
+        assert p.failed == 1
+        assert p._nconns == 0
+    finally:
+        await p.close()
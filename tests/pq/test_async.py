@@ -104,6 +104,22 @@ def test_single_row_mode(pgconn):
     assert res.ntuples == 0
 
 
+@pytest.mark.libpq(">= 17")
+def test_chunked_rows_mode(pgconn):
+    pgconn.send_query(b"select generate_series(1,5)")
+    pgconn.set_chunked_rows_mode(2)
+
+    results = execute_wait(pgconn)
+    assert [res.status for res in results] == [
+        pq.ExecStatus.TUPLES_CHUNK,
+        pq.ExecStatus.TUPLES_CHUNK,
+        pq.ExecStatus.TUPLES_CHUNK,
+        pq.ExecStatus.TUPLES_OK,
+    ]
+    assert [res.ntuples for res in results] == [2, 2, 1, 0]
+    assert results[1].get_value(1, 0) == b"4"
+
+
 def test_send_query_params(pgconn):
     pgconn.send_query_params(b"select $1::int + $2", [b"5", b"3"])
     (res,) = execute_wait(pgconn)
@@ -378,6 +378,22 @@ def test_set_single_row_mode(pgconn):
     pgconn.set_single_row_mode()
 
 
+@pytest.mark.libpq(">= 17")
+def test_set_chunked_rows_mode(pgconn):
+    with pytest.raises(psycopg3.OperationalError):
+        pgconn.set_chunked_rows_mode(10)
+
+    pgconn.send_query(b"select 1")
+    pgconn.set_chunked_rows_mode(10)
+
+
+@pytest.mark.libpq("< 17")
+def test_set_chunked_rows_mode_missing(pgconn):
+    pgconn.send_query(b"select 1")
+    with pytest.raises(psycopg3.NotSupportedError):
+        pgconn.set_chunked_rows_mode(10)
+
+
 def test_cancel(pgconn):
     cancel = pgconn.get_cancel()
     cancel.cancel()
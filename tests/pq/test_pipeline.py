@@ -0,0 +1,123 @@
+import pytest
+
+import psycopg3
+from psycopg3 import pq
+
+
+@pytest.mark.libpq("< 14")
+def test_old_libpq(pgconn):
+    assert pgconn.pipeline_status == pq.PipelineStatus.OFF
+    with pytest.raises(psycopg3.NotSupportedError):
+        pgconn.enter_pipeline_mode()
+    with pytest.raises(psycopg3.NotSupportedError):
+        pgconn.exit_pipeline_mode()
+    with pytest.raises(psycopg3.NotSupportedError):
+        pgconn.pipeline_sync()
+    with pytest.raises(psycopg3.NotSupportedError):
+        pgconn.send_flush_request()
+
+
+@pytest.mark.libpq(">= 14")
+def test_work_in_progress(pgconn):
+    assert not pgconn.nonblocking
+    assert pgconn.pipeline_status == pq.PipelineStatus.OFF
+    pgconn.enter_pipeline_mode()
+    pgconn.send_query_params(b"select $1", [b"1"])
+    with pytest.raises(psycopg3.OperationalError, match="cannot exit"):
+        pgconn.exit_pipeline_mode()
+
+
+@pytest.mark.libpq(">= 14")
+def test_multi_pipelines(pgconn):
+    assert pgconn.pipeline_status == pq.PipelineStatus.OFF
+    pgconn.enter_pipeline_mode()
+    pgconn.send_query_params(b"select $1", [b"1"], param_types=[25])
+    pgconn.pipeline_sync()
+    pgconn.send_query_params(b"select $1", [b"2"], param_types=[25])
+    pgconn.pipeline_sync()
+
+    # result from first query
+    result1 = pgconn.get_result()
+    assert result1 is not None
+    assert result1.status == pq.ExecStatus.TUPLES_OK
+
+    # NULL signals end of result
+    assert pgconn.get_result() is None
+
+    # first sync result
+    sync_result = pgconn.get_result()
+    assert sync_result is not None
+    assert sync_result.status == pq.ExecStatus.PIPELINE_SYNC
+
+    # result from second query
+    result2 = pgconn.get_result()
+    assert result2 is not None
+    assert result2.status == pq.ExecStatus.TUPLES_OK
+
+    # NULL signals end of result
+    assert pgconn.get_result() is None
+
+    # second sync result
+    sync_result = pgconn.get_result()
+    assert sync_result is not None
+    assert sync_result.status == pq.ExecStatus.PIPELINE_SYNC
+
+    # pipeline still ON
+    assert pgconn.pipeline_status == pq.PipelineStatus.ON
+
+    pgconn.exit_pipeline_mode()
+
+    assert pgconn.pipeline_status == pq.PipelineStatus.OFF
+
+    assert result1.get_value(0, 0) == b"1"
+    assert result2.get_value(0, 0) == b"2"
+
+
+@pytest.mark.libpq(">= 14")
+def test_flush_request(pgconn):
+    assert pgconn.pipeline_status == pq.PipelineStatus.OFF
+    pgconn.enter_pipeline_mode()
+    pgconn.send_query_params(b"select $1", [b"1"], param_types=[25])
+    pgconn.send_flush_request()
+    r = pgconn.get_result()
+    assert r.status == pq.ExecStatus.TUPLES_OK
+    assert r.get_value(0, 0) == b"1"
+    assert pgconn.get_result() is None
+    pgconn.exit_pipeline_mode()
+
+
+@pytest.mark.libpq(">= 14")
+def test_pipeline_aborted(pgconn):
+    pgconn.enter_pipeline_mode()
+    pgconn.send_query_params(b"select 1 / 0", None)
+    pgconn.send_query_params(b"select 1", None)
+    pgconn.pipeline_sync()
+
+    r = pgconn.get_result()
+    assert r.status == pq.ExecStatus.FATAL_ERROR
+    assert pgconn.get_result() is None
+    assert pgconn.pipeline_status == pq.PipelineStatus.ABORTED
+
+    r = pgconn.get_result()
+    assert r.status == pq.ExecStatus.PIPELINE_ABORTED
+    assert pgconn.get_result() is None
+
+    r = pgconn.get_result()
+    assert r.status == pq.ExecStatus.PIPELINE_SYNC
+    assert pgconn.pipeline_status == pq.PipelineStatus.ON
+    pgconn.exit_pipeline_mode()
+
+
+@pytest.mark.libpq(">= 14")
+def test_pipeline_transaction_status(pgconn):
+    pgconn.enter_pipeline_mode()
+    assert pgconn.transaction_status == pq.TransactionStatus.IDLE
+    pgconn.send_query_params(b"begin", None)
+    assert pgconn.transaction_status == pq.TransactionStatus.ACTIVE
+    pgconn.pipeline_sync()
+
+    assert pgconn.get_result().status == pq.ExecStatus.COMMAND_OK
+    assert pgconn.get_result() is None
+    assert pgconn.get_result().status == pq.ExecStatus.PIPELINE_SYNC
+    assert pgconn.transaction_status == pq.TransactionStatus.INTRANS
+    pgconn.exit_pipeline_mode()
@@ -5,3 +5,11 @@ def test_version():
     rv = pq.version()
     assert rv > 90500
     assert rv < 200000  # you are good for a while
+
+
+def test_build_version():
+    rv = pq.__build_version__
+    assert rv > 90500
+    assert rv < 200000
+    if pq.__impl__ == "python":
+        assert rv == pq.version()
@@ -5,6 +5,7 @@ import pytest
 import psycopg3
 from psycopg3 import pq
 from psycopg3.adapt import Transformer, Format, Dumper, Loader
+from psycopg3.adapt import AdaptersMap, global_adapters
 from psycopg3.oids import postgres_types as builtins, TEXT_OID
 
 
@@ -103,6 +104,22 @@ def test_subclass_dumper(conn):
     assert conn.execute("select %t", ["hello"]).fetchone()[0] == "hellohello"
 
 
+def test_dumper_cache_invalidated():
+    sdumper = global_adapters.get_dumper(str, Format.TEXT)
+    adapters = AdaptersMap(global_adapters)
+    adapters.register_dumper(MyStr, sdumper)
+    child = AdaptersMap(adapters)
+    assert adapters.get_dumper(MyStr, Format.TEXT) is sdumper
+    assert child.get_dumper(MyStr, Format.TEXT) is sdumper
+
+    dumper = make_dumper("x")
+    adapters.register_dumper(MyStr, dumper)
+    assert adapters.get_dumper(MyStr, Format.TEXT) is dumper
+    # The child map shares the dumpers of the map it was copied from
+    assert child.get_dumper(MyStr, Format.TEXT) is dumper
+    assert global_adapters.get_dumper(MyStr, Format.TEXT) is sdumper
+
+
 def test_subclass_loader(conn):
     # This might be a C fast object: make sure that the Python code is called
     from psycopg3.types import TextLoader
@@ -303,9 +320,6 @@ def test_optimised_adapters():
             continue
         c_adapters.pop(obj.__name__, None)
 
-    # TODO: This dumper is not registered yet as not implemented
-    del c_adapters["IntNumericBinaryDumper"]
-
     assert not c_adapters
 
 
@@ -0,0 +1,104 @@
+import datetime as dt
+
+import pytest
+
+import psycopg3
+
+from .test_adapt import make_bin_loader
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_fetch_arrow(conn, binary):
+    cur = conn.cursor(binary=binary)
+    cur.execute(
+        """
+        select i::int2 as s, i::int4 as i, i::int8 as b, i::float4 as r,
+            i::float8 as d, i % 2 = 0 as t, i::text as x,
+            nullif(i, 2) as n
+        from generate_series(1, 3) as i
+        """
+    )
+    assert cur.fetchone()[0] == 1
+    batch = cur.fetch_arrow()
+    assert batch.schema.names == ["s", "i", "b", "r", "d", "t", "x", "n"]
+    assert [f.type for f in batch.schema] == [
+        pa.int16(),
+        pa.int32(),
+        pa.int64(),
+        pa.float32(),
+        pa.float64(),
+        pa.bool_(),
+        pa.string(),
+        pa.int32(),
+    ]
+    assert batch.to_pydict() == {
+        "s": [2, 3],
+        "i": [2, 3],
+        "b": [2, 3],
+        "r": [2.0, 3.0],
+        "d": [2.0, 3.0],
+        "t": [True, False],
+        "x": ["2", "3"],
+        "n": [None, 3],
+    }
+    assert cur.fetchone() is None
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_fetch_arrow_date(conn, binary):
+    cur = conn.cursor(binary=binary)
+    cur.execute(
+        "select '2021-01-01'::date + i as dd from generate_series(1, 2) as i"
+    )
+    batch = cur.fetch_arrow()
+    assert batch.schema.types == [pa.date32()]
+    assert batch.to_pydict() == {
+        "dd": [dt.date(2021, 1, 2), dt.date(2021, 1, 3)]
+    }
+
+
+@pytest.mark.parametrize("batch_rows", [None, 2])
+def test_fetch_arrow_custom_loader(conn, batch_rows):
+    cur = conn.cursor(binary=True)
+    make_bin_loader("x").register("int4", cur)
+    query = "select i from generate_series(1, 3) as i"
+    cur.execute(query)
+    recs = cur.fetchall()
+    assert recs[0][0].endswith("x")
+    if batch_rows:
+        batches = list(cur.stream_arrow(query, batch_rows=batch_rows))
+    else:
+        cur.execute(query)
+        batches = [cur.fetch_arrow()]
+    table = pa.Table.from_batches(batches)
+    assert table.column("i").to_pylist() == [rec[0] for rec in recs]
+
+
+def test_fetch_arrow_no_result(conn):
+    cur = conn.cursor()
+    cur.execute("set timezone to utc")
+    with pytest.raises(psycopg3.ProgrammingError):
+        cur.fetch_arrow()
+
+
+@pytest.mark.parametrize("binary", [False, True])
+@pytest.mark.parametrize("batch_rows", [1, 3, 100])
+def test_stream_arrow(conn, binary, batch_rows):
+    cur = conn.cursor(binary=binary)
+    batches = list(
+        cur.stream_arrow(
+            "select i, nullif(i, 5)::float8 as f"
+            " from generate_series(1, %s) as i",
+            [10],
+            batch_rows=batch_rows,
+        )
+    )
+    assert all(b.num_rows <= batch_rows for b in batches)
+    assert all(b.schema == batches[0].schema for b in batches)
+    table = pa.Table.from_batches(batches)
+    assert table.column("i").to_pylist() == list(range(1, 11))
+    assert table.column("f").to_pylist() == [
+        float(i) if i != 5 else None for i in range(1, 11)
+    ]
@@ -33,6 +33,49 @@ def test_concurrent_execution(dsn):
     assert time.time() - t0 < 0.8, "something broken in concurrency"
 
 
+@pytest.mark.slow
+@pytest.mark.skipif(
+    psycopg3.pq.__impl__ != "c",
+    reason="only the C implementation releases the GIL",
+)
+@pytest.mark.skipif(
+    (os.cpu_count() or 1) < 4, reason="not enough CPUs to run in parallel"
+)
+def test_concurrent_fetch_scaling(dsn):
+    # Receiving large results on several connections at the same time should
+    # take less time than receiving them one after the other: the libpq I/O
+    # and the parsing of the results don't hold the GIL.
+    nconns = 4
+    query = "select repeat('x', 100) from generate_series(1, 200000)"
+    conns = [psycopg3.connect(dsn) for i in range(nconns)]
+
+    def worker(conn):
+        conn.execute(query)
+
+    def run(nthreads):
+        ts = [
+            threading.Thread(target=worker, args=(conn,))
+            for conn in conns[:nthreads]
+        ]
+        t0 = time.time()
+        for t in ts:
+            t.start()
+        for t in ts:
+            t.join()
+        return time.time() - t0
+
+    try:
+        run(nconns)  # warm up
+        t1 = run(1)
+        tn = run(nconns)
+    finally:
+        for conn in conns:
+            conn.close()
+
+    speedup = t1 * nconns / tn
+    assert speedup > 1.5, f"speedup with {nconns} threads: {speedup}"
+
+
 @pytest.mark.slow
 def test_commit_concurrency(conn):
     # Check the condition reported in psycopg2#103
@@ -60,7 +60,10 @@ def test_connect_timeout():
 
 def test_close(conn):
     assert not conn.closed
+    conn.execute("select 1")
+    assert conn._poller is not None
     conn.close()
+    assert conn._poller is None
     assert conn.closed
     assert conn.pgconn.status == conn.ConnStatus.BAD
 
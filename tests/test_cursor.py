@@ -1,5 +1,6 @@
 import gc
 import pickle
+from array import array
 import weakref
 import datetime as dt
 
@@ -10,6 +11,8 @@ from psycopg3 import sql, rows
 from psycopg3.oids import postgres_types as builtins
 from psycopg3.adapt import Format
 
+from .test_adapt import make_bin_loader, make_loader
+
 
 def test_close(conn):
     cur = conn.cursor()
@@ -192,6 +195,20 @@ def test_executemany_returning_rowcount(conn, execmany):
     assert cur.rowcount == 2
 
 
+def test_executemany_autocommit_error(conn):
+    # Every statement is committed on its own: an error doesn't discard the
+    # statements executed before it.
+    conn.autocommit = True
+    cur = conn.cursor()
+    cur.execute("create temp table execmany_pk (num int primary key)")
+    with pytest.raises(psycopg3.errors.UniqueViolation):
+        cur.executemany(
+            "insert into execmany_pk values (%s)", [(1,), (2,), (1,), (3,)]
+        )
+    cur.execute("select num from execmany_pk where num < 3 order by num")
+    assert cur.fetchall() == [(1,), (2,)]
+
+
 @pytest.mark.parametrize(
     "query",
     [
@@ -286,6 +303,75 @@ def test_iter_stop(conn):
     assert list(cur) == []
 
 
+@pytest.mark.parametrize("fmt_out", [Format.TEXT, Format.BINARY])
+def test_fetch_columns(conn, fmt_out):
+    cur = conn.cursor(binary=fmt_out == Format.BINARY)
+    cur.execute(
+        """
+        select i::int2 as s, i::int4 as i, i::int8 as b, i::float4 as r,
+            i::float8 as d, i % 2 = 0 as t, i::text as x,
+            nullif(i, 2) as n
+        from generate_series(1, 3) as i
+        """
+    )
+    assert cur.fetchone() == (1, 1, 1, 1.0, 1.0, False, "1", 1)
+    cols = cur.fetch_columns()
+    assert list(cols) == ["s", "i", "b", "r", "d", "t", "x", "n"]
+    assert [list(c) for c in cols.values()] == [
+        [2, 3],
+        [2, 3],
+        [2, 3],
+        [2.0, 3.0],
+        [2.0, 3.0],
+        [True, False],
+        ["2", "3"],
+        [None, 3],
+    ]
+
+    arrays = [k for k, c in cols.items() if isinstance(c, array)]
+    if fmt_out == Format.BINARY:
+        assert arrays == ["s", "i", "b", "r", "d"]
+    else:
+        assert not arrays
+
+    assert cur.fetchone() is None
+    assert all(not c for c in cur.fetch_columns().values())
+
+
+@pytest.mark.parametrize("fmt_out", [Format.TEXT, Format.BINARY])
+def test_fetch_columns_bool(conn, fmt_out):
+    cur = conn.cursor(binary=fmt_out == Format.BINARY)
+    cur.execute("select i % 2 = 0 from generate_series(1, 3) as i")
+    col = cur.fetch_columns()["?column?"]
+    assert col == [False, True, False]
+    assert all(type(v) is bool for v in col)
+
+
+def test_fetch_columns_custom_loader(conn):
+    cur = conn.cursor(binary=True)
+    make_bin_loader("x").register("int4", cur)
+    query = "select i from generate_series(1, 3) as i"
+    cur.execute(query)
+    recs = cur.fetchall()
+    assert recs[0][0].endswith("x")
+    cur.execute(query)
+    assert list(cur.fetch_columns()["i"]) == [rec[0] for rec in recs]
+
+
+def test_fetch_columns_duplicate_name(conn):
+    cur = conn.cursor()
+    cur.execute("select 1 as a, 2 as b, 3 as a")
+    with pytest.raises(psycopg3.ProgrammingError):
+        cur.fetch_columns()
+
+
+def test_fetch_columns_no_result(conn):
+    cur = conn.cursor()
+    cur.execute("set timezone to utc")
+    with pytest.raises(psycopg3.ProgrammingError):
+        cur.fetch_columns()
+
+
 def test_row_factory(conn):
     cur = conn.cursor(row_factory=my_row_factory)
     cur.execute("select 'foo' as bar")
@@ -379,6 +465,77 @@ def test_query_params_executemany(conn):
     # assert cur.params == [b"x"]
 
 
+@pytest.mark.parametrize(
+    "query",
+    ["select %s::int", sql.SQL("select {}::int").format(sql.Literal(1))],
+)
+def test_transformer_reused(conn, query):
+    args = [1] if isinstance(query, str) else None
+    with conn.cursor() as cur:
+        cur.execute(query, args)
+        tx = cur._tx
+
+    with conn.cursor() as cur:
+        cur.execute(query, args)
+        assert cur._tx is tx
+        assert cur.fetchone() == (1,)
+        cur.execute("select 1")
+        assert cur._tx is not tx
+
+    with conn.cursor() as cur:
+        # The dumpers for the parameters are chosen again
+        cur.execute("select %s::int", [100000])
+        assert cur.fetchone() == (100000,)
+
+
+def test_transformer_not_reused_customised(conn):
+    with conn.cursor() as cur:
+        cur.execute("select 'hello'::text")
+        tx = cur._tx
+
+    cur = conn.cursor()
+    make_loader("1").register("text", cur)
+    cur.execute("select 'hello'::text")
+    assert cur._tx is not tx
+    assert cur.fetchone() == ("hello1",)
+
+
+def test_transformer_adapter_registered(conn):
+    cur = conn.cursor()
+    query = "select 'hello'::text"
+    cur.execute(query)
+    make_loader("1").register("text", conn)
+    cur.execute(query)
+    assert cur.fetchone() == ("hello1",)
+
+
+@pytest.mark.parametrize("fmt_out", [Format.TEXT, Format.BINARY])
+def test_transformer_datestyle_changed(conn, fmt_out):
+    cur = conn.cursor(binary=fmt_out == Format.BINARY)
+    query = "select '2021-03-04'::date, '1 day 1 sec'::interval"
+    cur.execute("set datestyle = 'SQL, DMY'")
+    cur.execute("set intervalstyle = 'postgres'")
+    cur.execute(query)
+    want = (dt.date(2021, 3, 4), dt.timedelta(days=1, seconds=1))
+    assert cur.fetchone() == want
+    cur.execute("set datestyle = 'SQL, MDY'")
+    cur.execute(query)
+    assert cur.fetchone() == want
+    cur.execute("set datestyle = 'German'")
+    cur.execute(query)
+    assert cur.fetchone() == want
+    cur.execute("set intervalstyle = 'sql_standard'")
+    cur.execute(query)
+    if fmt_out == Format.TEXT:
+        with pytest.raises(NotImplementedError):
+            cur.fetchone()
+    else:
+        assert cur.fetchone() == want
+    cur.execute("set intervalstyle = 'postgres'")
+    cur.execute(query)
+    assert cur.fetchone() == want
+
+
 def test_stream(conn):
     cur = conn.cursor()
     recs = []
@@ -404,6 +561,25 @@ def test_stream_sql(conn):
     assert recs == [(1, dt.date(2021, 1, 2)), (2, dt.date(2021, 1, 3))]
 
 
+@pytest.mark.parametrize("size", [2, 3, 10])
+def test_stream_size(conn, size):
+    cur = conn.cursor()
+    recs = list(
+        cur.stream(
+            "select i, '2021-01-01'::date + i from generate_series(1, %s) i",
+            [5],
+            size=size,
+        )
+    )
+    assert recs == [(i, dt.date(2021, 1, 1 + i)) for i in range(1, 6)]
+
+
+def test_stream_bad_size(conn):
+    cur = conn.cursor()
+    with pytest.raises(ValueError):
+        list(cur.stream("select 1", size=0))
+
+
 def test_stream_row_factory(conn):
     cur = conn.cursor(row_factory=rows.dict_row)
     it = iter(cur.stream("select generate_series(1,2) as a"))
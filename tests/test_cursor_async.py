@@ -1,4 +1,5 @@
 import gc
+from array import array
 import pytest
 import weakref
 import datetime as dt
@@ -192,6 +193,18 @@ async def test_executemany_returning_rowcount(aconn, execmany):
     assert cur.rowcount == 2
 
 
+async def test_executemany_autocommit_error(aconn):
+    await aconn.set_autocommit(True)
+    cur = aconn.cursor()
+    await cur.execute("create temp table execmany_pk (num int primary key)")
+    with pytest.raises(psycopg3.errors.UniqueViolation):
+        await cur.executemany(
+            "insert into execmany_pk values (%s)", [(1,), (2,), (1,), (3,)]
+        )
+    await cur.execute("select num from execmany_pk where num < 3 order by num")
+    assert await cur.fetchall() == [(1,), (2,)]
+
+
 @pytest.mark.parametrize(
     "query",
     [
@@ -292,6 +305,19 @@ async def test_iter_stop(aconn):
         assert False
 
 
+async def test_fetch_columns(aconn):
+    cur = aconn.cursor(binary=True)
+    await cur.execute(
+        "select i as a, nullif(i, 2) as b from generate_series(1, 3) as i"
+    )
+    cols = await cur.fetch_columns()
+    assert list(cols) == ["a", "b"]
+    assert isinstance(cols["a"], array)
+    assert list(cols["a"]) == [1, 2, 3]
+    assert cols["b"] == [1, None, 3]
+    assert await cur.fetchone() is None
+
+
 async def test_row_factory(aconn):
     cur = aconn.cursor(row_factory=my_row_factory)
     await cur.execute("select 'foo' as bar")
@@ -410,6 +436,26 @@ async def test_stream_sql(aconn):
     assert recs == [(1, dt.date(2021, 1, 2)), (2, dt.date(2021, 1, 3))]
 
 
+@pytest.mark.parametrize("size", [2, 3, 10])
+async def test_stream_size(aconn, size):
+    cur = aconn.cursor()
+    recs = []
+    async for rec in cur.stream(
+        "select i, '2021-01-01'::date + i from generate_series(1, %s) i",
+        [5],
+        size=size,
+    ):
+        recs.append(rec)
+    assert recs == [(i, dt.date(2021, 1, 1 + i)) for i in range(1, 6)]
+
+
+async def test_stream_bad_size(aconn):
+    cur = aconn.cursor()
+    with pytest.raises(ValueError):
+        async for rec in cur.stream("select 1", size=0):
+            pass
+
+
 async def test_stream_row_factory(aconn):
     cur = aconn.cursor(row_factory=rows.dict_row)
     ait = cur.stream("select generate_series(1,2) as a")
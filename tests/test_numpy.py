@@ -0,0 +1,109 @@
+import pytest
+
+import psycopg3
+
+from .test_adapt import make_bin_loader
+
+np = pytest.importorskip("numpy")
+
+from psycopg3.numpy import fetch_arrays, load_column  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "pgtype, dtype",
+    [
+        ("bool", "?"),
+        ("int2", "i2"),
+        ("int4", "i4"),
+        ("int8", "i8"),
+        ("float4", "f4"),
+        ("float8", "f8"),
+    ],
+)
+def test_load_column(conn, pgtype, dtype):
+    cur = conn.cursor(binary=True)
+    cur.execute(
+        f"select (i % 2)::{pgtype} from generate_series(0, 9) as i"
+        if pgtype != "bool"
+        else "select i % 2 = 1 from generate_series(0, 9) as i"
+    )
+    data = load_column(cur.pgresult, 0)
+    assert not isinstance(data, np.ma.MaskedArray)
+    assert data.dtype == np.dtype(dtype)
+    assert data.tolist() == [i % 2 for i in range(10)]
+
+
+def test_load_column_rows(conn):
+    cur = conn.cursor(binary=True)
+    cur.execute("select generate_series(1, 10)::int8")
+    data = load_column(cur.pgresult, 0, 3, 6)
+    assert data.tolist() == [4, 5, 6]
+
+
+def test_load_column_nulls(conn):
+    cur = conn.cursor(binary=True)
+    cur.execute("select nullif(i, 2)::float8 from generate_series(1, 4) as i")
+    data = load_column(cur.pgresult, 0)
+    assert isinstance(data, np.ma.MaskedArray)
+    assert data.mask.tolist() == [False, True, False, False]
+    assert data.tolist() == [1.0, None, 3.0, 4.0]
+
+
+def test_load_column_text(conn):
+    cur = conn.cursor()
+    cur.execute("select 1::int4")
+    with pytest.raises(psycopg3.NotSupportedError):
+        load_column(cur.pgresult, 0)
+
+
+def test_load_column_bad_type(conn):
+    cur = conn.cursor(binary=True)
+    cur.execute("select 'a'::text")
+    with pytest.raises(psycopg3.NotSupportedError):
+        load_column(cur.pgresult, 0)
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_fetch_arrays(conn, binary):
+    cur = conn.cursor(binary=binary)
+    cur.execute(
+        """
+        select i::int4 as i, i::float8 / 2 as f, i::text as t,
+            array[i, i] as a
+        from generate_series(1, 3) as i
+        """
+    )
+    assert cur.fetchone() == (1, 0.5, "1", [1, 1])
+    arrays = fetch_arrays(cur)
+    assert list(arrays) == ["i", "f", "t", "a"]
+    if binary:
+        assert arrays["i"].dtype == np.dtype("i4")
+        assert arrays["f"].dtype == np.dtype("f8")
+    else:
+        assert arrays["i"].dtype == np.dtype(object)
+    assert arrays["t"].dtype == np.dtype(object)
+    assert arrays["i"].tolist() == [2, 3]
+    assert arrays["f"].tolist() == [1.0, 1.5]
+    assert arrays["t"].tolist() == ["2", "3"]
+    assert arrays["a"].tolist() == [[2, 2], [3, 3]]
+    assert cur.fetchone() is None
+
+
+def test_fetch_arrays_custom_loader(conn):
+    cur = conn.cursor(binary=True)
+    make_bin_loader("x").register("int4", cur)
+    query = "select i from generate_series(1, 3) as i"
+    cur.execute(query)
+    recs = cur.fetchall()
+    assert recs[0][0].endswith("x")
+    cur.execute(query)
+    arrays = fetch_arrays(cur)
+    assert arrays["i"].dtype == np.dtype(object)
+    assert arrays["i"].tolist() == [rec[0] for rec in recs]
+
+
+def test_fetch_arrays_no_result(conn):
+    cur = conn.cursor()
+    cur.execute("set timezone to utc")
+    with pytest.raises(psycopg3.ProgrammingError):
+        fetch_arrays(cur)
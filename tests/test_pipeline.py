@@ -0,0 +1,398 @@
+import logging
+
+import pytest
+
+import psycopg3
+from psycopg3 import pq
+from psycopg3 import errors as e
+
+pytestmark = pytest.mark.libpq(">= 14")
+
+
+def test_repr(conn):
+    with conn.pipeline() as p:
+        assert "psycopg3.Pipeline" in repr(p)
+        assert "[IDLE]" in repr(p)
+
+    conn.close()
+    assert "[BAD]" in repr(p)
+
+
+def test_pipeline_status(conn):
+    assert conn._pipeline is None
+    with conn.pipeline() as p:
+        assert conn._pipeline is p
+        assert p.status == pq.PipelineStatus.ON
+    assert p.status == pq.PipelineStatus.OFF
+    assert not conn._pipeline
+
+
+def test_pipeline_reenter(conn):
+    with conn.pipeline():
+        with pytest.raises(e.ProgrammingError):
+            with conn.pipeline():
+                pass
+
+
+def test_pipeline_exit_results(conn):
+    with conn.pipeline():
+        c1 = conn.execute("select 1")
+        c2 = conn.execute("select 2")
+
+    assert c1.fetchone() == (1,)
+    assert c2.fetchone() == (2,)
+    assert conn.pgconn.pipeline_status == pq.PipelineStatus.OFF
+
+
+def test_pipeline_lazy_fetch(conn):
+    with conn.pipeline() as p:
+        c1 = conn.execute("select 1")
+        c2 = conn.execute("select %s::text", ["hello"])
+        assert len(p.result_queue) == 3  # begin and two queries
+        assert c2.fetchone() == ("hello",)
+        assert not p.result_queue
+        assert c1.fetchall() == [(1,)]
+
+
+def test_pipeline_many_statements(conn):
+    cur = conn.cursor()
+    with conn.pipeline():
+        cur.execute("create temp table pltest (n int)")
+        for i in range(10):
+            cur.execute("insert into pltest values (%s)", [i])
+        cur.execute("select sum(n) from pltest")
+        assert cur.fetchone() == (45,)
+
+
+def test_pipeline_single_round_trip(conn):
+    # All the statements should be sent in one go and received together
+    with conn.pipeline() as p:
+        curs = [conn.execute("select %s", [i]) for i in range(5)]
+        assert len(p.result_queue) == 6
+    assert [c.fetchone()[0] for c in curs] == list(range(5))
+
+
+def test_sync(conn):
+    with conn.pipeline() as p:
+        cur = conn.execute("select 1")
+        p.sync()
+        assert not p.result_queue
+        assert cur.pgresult
+        assert conn.pgconn.transaction_status == pq.TransactionStatus.INTRANS
+        assert cur.fetchone() == (1,)
+
+
+def test_autocommit(conn):
+    conn.autocommit = True
+    with conn.pipeline() as p:
+        conn.execute("select 1")
+        assert len(p.result_queue) == 1
+    assert conn.pgconn.transaction_status == pq.TransactionStatus.IDLE
+
+
+def test_commit(conn):
+    conn.execute("create table if not exists pltest (n int)")
+    conn.execute("truncate pltest")
+    conn.commit()
+    with conn.pipeline():
+        conn.execute("insert into pltest values (1)")
+        conn.commit()
+        conn.execute("insert into pltest values (2)")
+        conn.rollback()
+
+    assert conn.execute("select n from pltest").fetchall() == [(1,)]
+    conn.execute("drop table pltest")
+    conn.commit()
+
+
+def test_error(conn):
+    with pytest.raises(e.UndefinedTable):
+        with conn.pipeline():
+            conn.execute("select 1")
+            c2 = conn.execute("select * from wat")
+            c3 = conn.execute("select 3")
+
+    assert conn.pgconn.pipeline_status == pq.PipelineStatus.OFF
+    assert conn.pgconn.transaction_status == pq.TransactionStatus.INERROR
+    with pytest.raises(e.ProgrammingError):
+        c2.fetchone()
+    with pytest.raises(e.ProgrammingError):
+        c3.fetchone()
+    conn.rollback()
+
+
+def test_error_on_fetch(conn):
+    with conn.pipeline() as p:
+        conn.execute("select 1 / 0")
+        c2 = conn.execute("select 2")
+        with pytest.raises(e.DivisionByZero):
+            c2.fetchone()
+
+        assert p.status == pq.PipelineStatus.ABORTED
+        with pytest.raises(e.ProgrammingError):
+            c2.fetchone()
+
+        p.sync()
+        assert p.status == pq.PipelineStatus.ON
+        conn.rollback()
+        c3 = conn.execute("select 3")
+        assert c3.fetchone() == (3,)
+
+
+def test_error_in_block(conn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg3")
+    with pytest.raises(ZeroDivisionError):
+        with conn.pipeline():
+            cur = conn.execute("select 1")
+            1 / 0
+
+    # Results are received anyway
+    assert cur.fetchone() == (1,)
+    assert not caplog.records
+
+
+def test_transaction(conn):
+    with conn.pipeline():
+        with conn.transaction():
+            cur = conn.execute("select 'tx'")
+
+        with pytest.raises(ZeroDivisionError):
+            with conn.transaction():
+                conn.execute("select 'rb'")
+                1 / 0
+
+        assert cur.fetchone() == ("tx",)
+
+
+def test_transaction_nested(conn):
+    conn.autocommit = True
+    with conn.pipeline():
+        with conn.transaction():
+            outer = conn.execute("select 'outer'")
+            with conn.transaction() as inner:
+                conn.execute("select 'inner'")
+                raise psycopg3.Rollback(inner)
+
+        assert outer.fetchone() == ("outer",)
+    assert conn.pgconn.transaction_status == pq.TransactionStatus.IDLE
+
+
+def test_prepared(conn):
+    conn.prepare_threshold = 2
+    for j in range(2):
+        with conn.pipeline():
+            curs = [conn.execute("select %s::int", [i]) for i in range(5)]
+        assert [c.fetchone()[0] for c in curs] == list(range(5))
+
+    # Prepared only once, even if the threshold was passed several times
+    # before the results were received.
+    res = conn.execute(
+        "select count(*) from pg_prepared_statements"
+        " where statement = 'select $1::int'"
+    )
+    assert res.fetchone()[0] == 1
+
+
+def test_prepare_explicit(conn):
+    with conn.pipeline():
+        cur = conn.execute("select %s::text", ["x"], prepare=True)
+    assert cur.fetchone() == ("x",)
+    assert len(conn._prepared._prepared) == 1
+
+
+def test_cursor_stream(conn):
+    with conn.pipeline():
+        with pytest.raises(psycopg3.NotSupportedError):
+            list(conn.cursor().stream("select 1"))
+
+
+def test_copy(conn):
+    with conn.pipeline():
+        cur = conn.cursor()
+        with pytest.raises(psycopg3.NotSupportedError):
+            with cur.copy("copy (select 1) to stdout"):
+                pass
+
+
+def test_server_cursor(conn):
+    with conn.pipeline():
+        cur = conn.cursor("foo")
+        with pytest.raises(psycopg3.NotSupportedError):
+            cur.execute("select 1")
+
+
+def test_executemany(conn):
+    conn.execute("create temp table pltest (n int)")
+    with conn.pipeline():
+        cur = conn.cursor()
+        cur.executemany("insert into pltest values (%s)", [(i,) for i in "12"])
+        cur2 = conn.execute("select n from pltest order by n")
+        assert cur2.fetchall() == [(1,), (2,)]
+
+
+def test_executemany_rowcount(conn):
+    conn.execute("create temp table pltest (n int)")
+    with conn.pipeline() as p:
+        cur = conn.cursor()
+        cur.execute("insert into pltest values (10)")
+        cur.executemany("insert into pltest values (%s)", [(1,), (2,), (3,)])
+        p.sync()
+        assert cur.rowcount == 3
+
+
+def test_executemany_no_pipeline(conn):
+    # The statements are pipelined even if not requested explicitly
+    conn.execute("create temp table pltest (n int)")
+    cur = conn.cursor()
+    cur.executemany(
+        "insert into pltest values (%s)", [(i,) for i in range(10)]
+    )
+    assert cur.rowcount == 10
+    assert not conn._pipeline
+    assert conn.pgconn.pipeline_status == pq.PipelineStatus.OFF
+
+    cur.execute(
+        "select count(*) from pg_prepared_statements"
+        " where statement = 'insert into pltest values ($1)'"
+    )
+    assert cur.fetchone()[0] == 1
+
+
+def test_executemany_types_change(conn):
+    conn.execute("create temp table pltest (n bigint)")
+    cur = conn.cursor()
+    cur.executemany(
+        "insert into pltest values (%s)", [(None,), (1,), (None,), (2,)]
+    )
+    assert cur.rowcount == 4
+    cur.execute("select n from pltest order by n")
+    assert cur.fetchall() == [(1,), (2,), (None,), (None,)]
+
+
+def test_executemany_returning(conn):
+    cur = conn.cursor()
+    cur.executemany("select %s::int", [(1,), (2,)])
+    assert cur.fetchall() == [(2,)]
+
+
+def test_executemany_error(conn):
+    conn.autocommit = True
+    conn.execute("create temp table pltest (n int primary key)")
+    cur = conn.cursor()
+    with pytest.raises(e.UniqueViolation):
+        cur.executemany(
+            "insert into pltest values (%s)", [(1,), (2,), (1,), (3,)]
+        )
+
+    # In autocommit every statement is synced, hence committed, on its own:
+    # only the failed one is discarded.
+    assert conn.pgconn.pipeline_status == pq.PipelineStatus.OFF
+    cur.execute("select n from pltest order by n")
+    assert cur.fetchall() == [(1,), (2,), (3,)]
+
+
+def test_executemany_dump_error(conn):
+    # The error of the statement sent before is reported first
+    conn.execute("create temp table pltest (n int)")
+    cur = conn.cursor()
+    with pytest.raises(e.DataError):
+        cur.executemany("insert into pltest values (%s)", [("x",), (1,)])
+    assert conn.pgconn.pipeline_status == pq.PipelineStatus.OFF
+
+
+@pytest.fixture
+def pipelines(monkeypatch):
+    """Return a list of the pipelines entered during the test."""
+    rv = []
+    enter = psycopg3.pipeline.BasePipeline._enter
+
+    def _enter(self):
+        rv.append(self)
+        enter(self)
+
+    monkeypatch.setattr(psycopg3.pipeline.BasePipeline, "_enter", _enter)
+    return rv
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_implicit_begin(conn, pipelines, binary):
+    cur = conn.cursor(binary=binary)
+    cur.execute("select %s::text", ["hello"])
+    assert len(pipelines) == 1
+    assert conn.pgconn.transaction_status == pq.TransactionStatus.INTRANS
+    assert conn.pgconn.pipeline_status == pq.PipelineStatus.OFF
+    assert cur.fetchone() == ("hello",)
+
+    # No begin needed in the transaction
+    cur.execute("select %s::text", ["world"])
+    assert len(pipelines) == 1
+    assert cur.fetchone() == ("world",)
+
+
+def test_implicit_begin_no_params(conn, pipelines):
+    # Queries without parameters may contain several statements
+    cur = conn.execute("select 1; select 2")
+    assert not pipelines
+    assert conn.pgconn.transaction_status == pq.TransactionStatus.INTRANS
+    assert cur.fetchone() == (1,)
+
+
+def test_implicit_begin_autocommit(conn, pipelines):
+    conn.autocommit = True
+    conn.execute("select %s", [1])
+    assert not pipelines
+
+
+def test_implicit_begin_error(conn, pipelines):
+    with pytest.raises(e.DivisionByZero):
+        conn.execute("select 1 / %s", [0])
+    assert len(pipelines) == 1
+    assert conn.pgconn.transaction_status == pq.TransactionStatus.INERROR
+    assert conn.pgconn.pipeline_status == pq.PipelineStatus.OFF
+    conn.rollback()
+    assert conn.execute("select %s", [1]).fetchone() == (1,)
+
+
+def test_implicit_begin_prepare(conn, pipelines):
+    cur = conn.execute("select %s::int", [1], prepare=True)
+    assert len(pipelines) == 1
+    assert cur.fetchone() == (1,)
+    assert len(conn._prepared._prepared) == 1
+
+    conn.rollback()
+    cur = conn.execute("select %s::int", [2])
+    assert cur.fetchone() == (2,)
+
+
+def test_prepare_single_round_trip(conn, pipelines):
+    conn.autocommit = True
+    cur = conn.execute("select %s::int", [1], prepare=True)
+    assert len(pipelines) == 1
+    assert cur.fetchone() == (1,)
+    cur = conn.execute("select count(*) from pg_prepared_statements")
+    assert cur.fetchone() == (1,)
+
+
+def test_prepare_error(conn, pipelines):
+    conn.autocommit = True
+    with pytest.raises(e.UndefinedColumn):
+        conn.execute("select wat + %s", [1], prepare=True)
+    assert len(pipelines) == 1
+    assert conn.pgconn.pipeline_status == pq.PipelineStatus.OFF
+    assert not conn._prepared._prepared
+    assert conn.execute("select %s::int", [1]).fetchone() == (1,)
+
+
+def test_deallocate_with_next_query(conn, pipelines):
+    conn.autocommit = True
+    conn.prepared_max = 1
+    conn.execute("select %s::int", [1], prepare=True)
+    conn.execute("select %s::text", ["a"], prepare=True)
+    assert conn._prepared.has_maintenance_commands()
+
+    del pipelines[:]
+    cur = conn.execute("select %s::bigint", [1], prepare=False)
+    assert len(pipelines) == 1
+    assert not conn._prepared.has_maintenance_commands()
+    cur = conn.execute("select statement from pg_prepared_statements")
+    assert cur.fetchall() == [("select $1::text",)]
@@ -0,0 +1,101 @@
+import pytest
+
+from psycopg3 import pq
+from psycopg3 import errors as e
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.libpq(">= 14")]
+
+
+async def test_repr(aconn):
+    async with aconn.pipeline() as p:
+        assert "psycopg3.AsyncPipeline" in repr(p)
+        assert "[IDLE]" in repr(p)
+
+
+async def test_pipeline_status(aconn):
+    assert aconn._pipeline is None
+    async with aconn.pipeline() as p:
+        assert aconn._pipeline is p
+        assert p.status == pq.PipelineStatus.ON
+    assert p.status == pq.PipelineStatus.OFF
+    assert not aconn._pipeline
+
+
+async def test_pipeline_reenter(aconn):
+    async with aconn.pipeline():
+        with pytest.raises(e.ProgrammingError):
+            async with aconn.pipeline():
+                pass
+
+
+async def test_pipeline_exit_results(aconn):
+    async with aconn.pipeline():
+        c1 = await aconn.execute("select 1")
+        c2 = await aconn.execute("select 2")
+
+    assert await c1.fetchone() == (1,)
+    assert await c2.fetchone() == (2,)
+
+
+async def test_pipeline_lazy_fetch(aconn):
+    async with aconn.pipeline() as p:
+        c1 = await aconn.execute("select 1")
+        c2 = await aconn.execute("select %s::text", ["hello"])
+        assert len(p.result_queue) == 3
+        assert await c2.fetchone() == ("hello",)
+        assert not p.result_queue
+        assert await c1.fetchall() == [(1,)]
+
+
+async def test_sync(aconn):
+    async with aconn.pipeline() as p:
+        cur = await aconn.execute("select 1")
+        await p.sync()
+        assert not p.result_queue
+        assert aconn.pgconn.transaction_status == pq.TransactionStatus.INTRANS
+        assert await cur.fetchone() == (1,)
+
+
+async def test_commit(aconn):
+    await aconn.execute("create temp table pltest (n int)")
+    await aconn.commit()
+    async with aconn.pipeline():
+        await aconn.execute("insert into pltest values (1)")
+        await aconn.commit()
+        await aconn.execute("insert into pltest values (2)")
+        await aconn.rollback()
+
+    cur = await aconn.execute("select n from pltest")
+    assert await cur.fetchall() == [(1,)]
+
+
+async def test_error(aconn):
+    with pytest.raises(e.UndefinedTable):
+        async with aconn.pipeline():
+            await aconn.execute("select 1")
+            await aconn.execute("select * from wat")
+            await aconn.execute("select 3")
+
+    assert aconn.pgconn.pipeline_status == pq.PipelineStatus.OFF
+    await aconn.rollback()
+
+
+async def test_error_on_fetch(aconn):
+    async with aconn.pipeline() as p:
+        await aconn.execute("select 1 / 0")
+        c2 = await aconn.execute("select 2")
+        with pytest.raises(e.DivisionByZero):
+            await c2.fetchone()
+
+        await p.sync()
+        await aconn.rollback()
+        c3 = await aconn.execute("select 3")
+        assert await c3.fetchone() == (3,)
+
+
+async def test_transaction(aconn):
+    async with aconn.pipeline():
+        async with aconn.transaction():
+            cur = await aconn.execute("select 'tx'")
+
+        assert await cur.fetchone() == ("tx",)
@@ -1,3 +1,6 @@
+import pytest
+
+import psycopg3
 from psycopg3 import rows
 
 
@@ -53,3 +56,27 @@ def test_namedtuple_row(conn):
     assert r2.number == 1
     assert not cur.nextset()
     assert type(r1) is not type(r2)
+
+
+@pytest.mark.parametrize("factory", ["dict_row", "namedtuple_row"])
+def test_description_once_per_result(conn, monkeypatch, factory):
+    calls = []
+    description = psycopg3.Cursor.description
+
+    def _description(self):
+        calls.append(self)
+        return description.fget(self)
+
+    monkeypatch.setattr(psycopg3.Cursor, "description", property(_description))
+    cur = conn.cursor(row_factory=getattr(rows, factory))
+    cur.execute("select generate_series(1, 10) as n")
+    assert len(cur.fetchall()) == 10
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("factory", ["dict_row", "namedtuple_row"])
+def test_no_result(conn, factory):
+    cur = conn.cursor(row_factory=getattr(rows, factory))
+    cur.execute("set timezone to utc")
+    with pytest.raises(psycopg3.ProgrammingError):
+        cur.fetchone()
@@ -12,6 +12,10 @@ skip_no_epoll = pytest.mark.skipif(
     not hasattr(select, "epoll"), reason="epoll not available"
 )
 
+skip_no_c = pytest.mark.skipif(
+    psycopg3.pq.__impl__ != "c", reason="C implementation not available"
+)
+
 timeouts = [
     {},
     {"timeout": None},
@@ -58,6 +62,79 @@ def test_wait_selector_bad(pgconn):
         waiting.wait_selector(gen, pgconn.socket)
 
 
+@pytest.mark.parametrize("timeout", timeouts)
+def test_wait_poller(pgconn, timeout):
+    poller = waiting.new_poller(pgconn.socket)
+    for i in range(3):
+        pgconn.send_query(b"select 1")
+        gen = generators.execute(pgconn)
+        (res,) = waiting.wait(gen, pgconn.socket, poller=poller, **timeout)
+        assert res.status == ExecStatus.TUPLES_OK
+
+
+def test_wait_selector_poller(pgconn):
+    poller = waiting.new_poller_selector(pgconn.socket)
+    for i in range(3):
+        pgconn.send_query(b"select 1")
+        gen = generators.execute(pgconn)
+        (res,) = waiting.wait_selector(gen, pgconn.socket, poller=poller)
+        assert res.status == ExecStatus.TUPLES_OK
+
+
+def test_wait_selector_poller_interrupted(pgconn):
+    poller = waiting.new_poller_selector(pgconn.socket)
+    select = poller.select
+
+    def interrupt(timeout=None):
+        poller.select = select
+        raise KeyboardInterrupt
+
+    poller.select = interrupt
+    # The result must not be ready before waiting, or there is no wait.
+    pgconn.send_query(b"select pg_sleep(0.1)")
+    gen = generators.execute(pgconn)
+    with pytest.raises(KeyboardInterrupt):
+        waiting.wait_selector(gen, pgconn.socket, poller=poller)
+    assert not poller.get_map()
+
+    gen = generators.execute(pgconn)
+    (res,) = waiting.wait_selector(gen, pgconn.socket, poller=poller)
+    assert res.status == ExecStatus.TUPLES_OK
+
+
+@skip_no_epoll
+def test_wait_epoll_poller(pgconn):
+    poller = waiting.new_poller_epoll(pgconn.socket)
+    for i in range(3):
+        pgconn.send_query(b"select 1")
+        gen = generators.execute(pgconn)
+        (res,) = waiting.wait_epoll(gen, pgconn.socket, poller=poller)
+        assert res.status == ExecStatus.TUPLES_OK
+
+
+@skip_no_c
+@pytest.mark.parametrize("timeout", timeouts)
+def test_wait_c(pgconn, timeout):
+    from psycopg3_c import _psycopg3
+
+    pgconn.send_query(b"select 1")
+    gen = generators.execute(pgconn)
+    (res,) = _psycopg3.wait_c(gen, pgconn.socket, **timeout)
+    assert res.status == ExecStatus.TUPLES_OK
+
+
+@skip_no_c
+def test_wait_c_poller(pgconn):
+    from psycopg3_c import _psycopg3
+
+    poller = _psycopg3.new_poller_c(pgconn.socket)
+    for i in range(3):
+        pgconn.send_query(b"select 1")
+        gen = generators.execute(pgconn)
+        (res,) = _psycopg3.wait_c(gen, pgconn.socket, poller=poller)
+        assert res.status == ExecStatus.TUPLES_OK
+
+
 @skip_no_epoll
 @pytest.mark.parametrize("timeout", timeouts)
 def test_wait_epoll(pgconn, timeout):
@@ -1,3 +1,5 @@
+from array import array
+
 import pytest
 import psycopg3
 from psycopg3 import pq
@@ -43,6 +45,16 @@ def test_load_list_str(conn, obj, want, fmt_out):
     assert cur.fetchone()[0] == want
 
 
+@pytest.mark.parametrize("fmt_in", [Format.TEXT, Format.BINARY])
+@pytest.mark.parametrize("obj", [obj for obj, want in tests_str])
+def test_roundtrip_list_str_no_db(obj, fmt_in):
+    tx = Transformer()
+    dumper = tx.get_dumper(obj, fmt_in)
+    data = dumper.dump(obj)
+    oid = dumper.oid or builtins["text"].array_oid
+    assert tx.get_loader(oid, dumper.format).load(data) == obj
+
+
 @pytest.mark.parametrize("fmt_in", fmts_in)
 @pytest.mark.parametrize("fmt_out", [pq.Format.TEXT, pq.Format.BINARY])
 def test_all_chars(conn, fmt_in, fmt_out):
@@ -77,6 +89,73 @@ def test_dump_list_int(conn, obj, want):
     assert cur.fetchone()[0]
 
 
+@pytest.mark.parametrize(
+    "obj",
+    [
+        [10, 20, -30],
+        [-(1 << 15), (1 << 15) - 1],
+        [-(1 << 31), (1 << 31) - 1],
+        [-(1 << 63), (1 << 63) - 1],
+        [1.5, -2.0, float("inf")],
+        [1.5, 2],
+        [10, None, 30],
+        [10, 1 << 70],
+    ],
+)
+def test_roundtrip_list_number_no_db(obj):
+    tx = Transformer()
+    dumper = tx.get_dumper(obj, Format.BINARY)
+    data = dumper.dump(obj)
+    assert tx.get_loader(dumper.oid, pq.Format.BINARY).load(data) == obj
+
+
+@pytest.mark.parametrize(
+    "typecode, type",
+    [
+        ("b", "int2"),
+        ("B", "int2"),
+        ("h", "int2"),
+        ("H", "int4"),
+        ("i", "int4"),
+        ("I", "int8"),
+        ("q", "int8"),
+        ("Q", "int8"),
+        ("f", "float8"),
+        ("d", "float8"),
+    ],
+)
+@pytest.mark.parametrize("fmt_in", [Format.AUTO, Format.BINARY])
+def test_dump_array_array(conn, typecode, type, fmt_in):
+    obj = array(typecode, [1, 2, 3] if typecode not in "fd" else [1.5, -2])
+    tx = Transformer()
+    dumper = tx.get_dumper(obj, fmt_in)
+    assert dumper.oid == builtins[type].array_oid
+    data = dumper.dump(obj)
+    got = tx.get_loader(dumper.oid, pq.Format.BINARY).load(data)
+    assert got == obj.tolist()
+
+    cur = conn.cursor()
+    cur.execute(f"select pg_typeof(%{fmt_in})::oid, %{fmt_in}", (obj, obj))
+    assert cur.fetchone() == (builtins[type].array_oid, obj.tolist())
+
+
+def test_dump_array_array_empty():
+    obj = array("i")
+    tx = Transformer()
+    dumper = tx.get_dumper(obj, Format.BINARY)
+    data = dumper.dump(obj)
+    assert tx.get_loader(dumper.oid, pq.Format.BINARY).load(data) == []
+
+
+@pytest.mark.parametrize(
+    "obj", [array("u", "abc"), array("Q", [(1 << 64) - 1])]
+)
+def test_dump_array_array_bad(obj):
+    tx = Transformer()
+    with pytest.raises(psycopg3.Error):
+        tx.get_dumper(obj, Format.BINARY).dump(obj)
+
+
 @pytest.mark.parametrize(
     "input",
     [
@@ -3,7 +3,7 @@ import pytest
 from psycopg3 import pq
 from psycopg3.sql import Identifier
 from psycopg3.oids import postgres_types as builtins
-from psycopg3.adapt import Format, global_adapters
+from psycopg3.adapt import Format, Transformer, global_adapters
 from psycopg3.types import CompositeInfo
 
 
@@ -28,6 +28,24 @@ def test_load_record(conn, want, rec):
     assert res == want
 
 
+@pytest.mark.parametrize(
+    "data, want",
+    [
+        (b"()", ()),
+        (b"(,)", (None, None)),
+        (b'(,"")', (None, "")),
+        (
+            b'(42,foo,"ba,r","qu""x","a\\\\b")',
+            ("42", "foo", "ba,r", 'qu"x', "a\\b"),
+        ),
+    ],
+)
+def test_load_record_no_db(data, want):
+    tx = Transformer()
+    loader = tx.get_loader(builtins["record"].oid, pq.Format.TEXT)
+    assert loader.load(data) == want
+
+
 @pytest.mark.parametrize("rec, obj", tests_str)
 def test_dump_tuple(conn, rec, obj):
     cur = conn.cursor()
@@ -35,8 +35,15 @@ def test_dump_date(conn, val, expr):
     assert cur.fetchone()[0] is True
 
 
-@pytest.mark.xfail  # TODO: binary dump
-@pytest.mark.parametrize("val, expr", [("2000,1,1", "2000-01-01")])
+@pytest.mark.parametrize(
+    "val, expr",
+    [
+        ("min", "0001-01-01"),
+        ("2000,1,1", "2000-01-01"),
+        ("2000,12,31", "2000-12-31"),
+        ("max", "9999-12-31"),
+    ],
+)
 def test_dump_date_binary(conn, val, expr):
     cur = conn.cursor()
     cur.execute(f"select '{expr}'::date = %b", (as_date(val),))
@@ -68,8 +75,17 @@ def test_load_date(conn, val, expr):
     assert cur.fetchone()[0] == as_date(val)
 
 
-@pytest.mark.xfail  # TODO: binary load
-@pytest.mark.parametrize("val, expr", [("2000,1,1", "2000-01-01")])
+@pytest.mark.parametrize(
+    "val, expr",
+    [
+        ("min", "0001-01-01"),
+        ("1000,1,1", "1000-01-01"),
+        ("2000,1,1", "2000-01-01"),
+        ("2000,12,31", "2000-12-31"),
+        ("3000,1,1", "3000-01-01"),
+        ("max", "9999-12-31"),
+    ],
+)
 def test_load_date_binary(conn, val, expr):
     cur = conn.cursor(binary=Format.BINARY)
     cur.execute(f"select '{expr}'::date")
@@ -96,6 +112,19 @@ def test_load_date_overflow(conn, val, datestyle_out):
         cur.fetchone()[0]
 
 
+@pytest.mark.parametrize("val", ["min", "max", "infinity", "-infinity"])
+def test_load_date_overflow_binary(conn, val):
+    cur = conn.cursor(binary=True)
+    if val in ("min", "max"):
+        cur.execute(
+            "select %s + %s::int", (as_date(val), -1 if val == "min" else 1)
+        )
+    else:
+        cur.execute(f"select '{val}'::date")
+    with pytest.raises(DataError):
+        cur.fetchone()[0]
+
+
 #
 # datetime tests
 #
@@ -119,15 +148,19 @@ def test_dump_datetime(conn, val, expr):
     assert cur.fetchone()[0] is True
 
 
-@pytest.mark.xfail  # TODO: binary dump
 @pytest.mark.parametrize(
     "val, expr",
-    [("2000,1,1,0,0", "'2000-01-01 00:00'::timestamp")],
+    [
+        ("min", "0001-01-01 00:00"),
+        ("2000,1,1,0,0", "2000-01-01 00:00"),
+        ("2000,12,31,23,59,59,999999", "2000-12-31 23:59:59.999999"),
+        ("max", "9999-12-31 23:59:59.999999"),
+    ],
 )
 def test_dump_datetime_binary(conn, val, expr):
     cur = conn.cursor()
     cur.execute("set timezone to '+02:00'")
-    cur.execute(f"select {expr} = %b", (as_dt(val),))
+    cur.execute(f"select '{expr}'::timestamp = %b", (as_dt(val),))
     assert cur.fetchone()[0] is True
 
 
@@ -179,6 +212,36 @@ def test_load_datetime_overflow(conn, val, datestyle_out):
         cur.fetchone()[0]
 
 
+@pytest.mark.parametrize(
+    "val, expr",
+    [
+        ("min", "0001-01-01"),
+        ("1999,12,31,23,59,59,999999", "1999-12-31 23:59:59.999999"),
+        ("2000,1,2,3,4,5,6", "2000-01-02 03:04:05.000006"),
+        ("max", "9999-12-31 23:59:59.999999"),
+    ],
+)
+def test_load_datetime_binary(conn, val, expr):
+    cur = conn.cursor(binary=True)
+    cur.execute("set timezone to '+02:00'")
+    cur.execute(f"select '{expr}'::timestamp")
+    assert cur.fetchone()[0] == as_dt(val)
+
+
+@pytest.mark.parametrize("val", ["min", "max", "infinity", "-infinity"])
+def test_load_datetime_overflow_binary(conn, val):
+    cur = conn.cursor(binary=True)
+    if val in ("min", "max"):
+        cur.execute(
+            "select %s::timestamp + %s * '1s'::interval",
+            (as_dt(val), -1 if val == "min" else 1),
+        )
+    else:
+        cur.execute(f"select '{val}'::timestamp")
+    with pytest.raises(DataError):
+        cur.fetchone()[0]
+
+
 #
 # datetime+tz tests
 #
@@ -214,8 +277,16 @@ def test_dump_datetimetz(conn, val, expr):
     assert cur.fetchone()[0] is True
 
 
-@pytest.mark.xfail  # TODO: binary dump
-@pytest.mark.parametrize("val, expr", [("2000,1,1,0,0~2", "2000-01-01 00:00")])
+@pytest.mark.parametrize(
+    "val, expr",
+    [
+        ("min~2", "0001-01-01 00:00"),
+        ("2000,1,1,0,0~2", "2000-01-01 00:00"),
+        ("2000,1,1,0,0~-12", "2000-01-01 00:00-12"),
+        ("2000,12,31,23,59,59,999999~2", "2000-12-31 23:59:59.999999+2"),
+        ("max~2", "9999-12-31 23:59:59.999999"),
+    ],
+)
 def test_dump_datetimetz_binary(conn, val, expr):
     cur = conn.cursor()
     cur.execute("set timezone to '-02:00'")
@@ -258,6 +329,25 @@ def test_load_datetimetz(conn, val, expr, timezone, datestyle_out):
     assert cur.fetchone()[0] == as_dt(val)
 
 
+@pytest.mark.parametrize(
+    "val, expr, timezone",
+    [
+        ("1999,12,31,22~0", "2000-01-01", "-02:00"),
+        ("2000,1,2,3,4,5,6~0", "2000-01-02 05:04:05.000006", "-02:00"),
+        ("2000,7,2,3,4,5,678~0", "2000-07-02 05:04:05.000678", "Europe/Rome"),
+        ("1900,1,1~0", "1900-01-01 05:21:10", "Asia/Calcutta"),
+    ],
+)
+def test_load_datetimetz_binary(conn, val, expr, timezone):
+    cur = conn.cursor(binary=True)
+    cur.execute(f"set timezone to '{timezone}'")
+    cur.execute(f"select '{expr}'::timestamptz")
+    rv = cur.fetchone()[0]
+    assert rv == as_dt(val)
+    # The binary format has no timezone information: the value is in UTC
+    assert rv.utcoffset() == dt.timedelta(0)
+
+
 @pytest.mark.xfail  # parse timezone names
 @pytest.mark.parametrize("val, expr", [("2000,1,1~2", "2000-01-01")])
 @pytest.mark.parametrize("datestyle_out", ["SQL", "Postgres", "German"])
@@ -280,8 +370,6 @@ def test_load_datetimetz_tzname(conn, val, expr, datestyle_in, datestyle_out):
 )
 @pytest.mark.parametrize("fmt_in", [Format.AUTO, Format.TEXT, Format.BINARY])
 def test_dump_datetime_tz_or_not_tz(conn, val, type, fmt_in):
-    if fmt_in == Format.BINARY:
-        pytest.xfail("binary datetime not implemented")
     val = as_dt(val)
     cur = conn.cursor()
     cur.execute(
@@ -312,8 +400,14 @@ def test_dump_time(conn, val, expr):
     assert cur.fetchone()[0] is True
 
 
-@pytest.mark.xfail  # TODO: binary dump
-@pytest.mark.parametrize("val, expr", [("0,0", "00:00")])
+@pytest.mark.parametrize(
+    "val, expr",
+    [
+        ("min", "00:00"),
+        ("10,20,30,40", "10:20:30.000040"),
+        ("max", "23:59:59.999999"),
+    ],
+)
 def test_dump_time_binary(conn, val, expr):
     cur = conn.cursor()
     cur.execute(f"select '{expr}'::time = %b", (as_time(val),))
@@ -337,16 +431,23 @@ def test_load_time(conn, val, expr):
     assert cur.fetchone()[0] == as_time(val)
 
 
-@pytest.mark.xfail  # TODO: binary load
-@pytest.mark.parametrize("val, expr", [("0,0", "00:00")])
+@pytest.mark.parametrize(
+    "val, expr",
+    [
+        ("min", "00:00"),
+        ("10,20,30,40", "10:20:30.000040"),
+        ("max", "23:59:59.999999"),
+    ],
+)
 def test_load_time_binary(conn, val, expr):
     cur = conn.cursor(binary=Format.BINARY)
     cur.execute(f"select '{expr}'::time")
     assert cur.fetchone()[0] == as_time(val)
 
 
-def test_load_time_24(conn):
-    cur = conn.cursor()
+@pytest.mark.parametrize("fmt_out", [Format.TEXT, Format.BINARY])
+def test_load_time_24(conn, fmt_out):
+    cur = conn.cursor(binary=fmt_out == Format.BINARY)
     cur.execute("select '24:00'::time")
     with pytest.raises(DataError):
         cur.fetchone()[0]
@@ -376,11 +477,19 @@ def test_dump_timetz(conn, val, expr):
     assert cur.fetchone()[0] is True
 
 
-@pytest.mark.xfail  # TODO: binary dump
-@pytest.mark.parametrize("val, expr", [("0,0~0", "00:00Z")])
+@pytest.mark.parametrize(
+    "val, expr",
+    [
+        ("0,0~0", "00:00Z"),
+        ("10,20,30,40~-2", "10:20:30.000040-02:00"),
+        ("10,20,30,40~+2:30", "10:20:30.000040+02:30"),
+        ("max~+12", "23:59:59.999999+12:00"),
+    ],
+)
 def test_dump_timetz_binary(conn, val, expr):
     cur = conn.cursor()
-    cur.execute(f"select '{expr}'::time = %b", (as_time(val),))
+    cur.execute("set timezone to '-02:00'")
+    cur.execute(f"select '{expr}'::timetz = %b", (as_time(val),))
     assert cur.fetchone()[0] is True
 
 
@@ -402,17 +511,25 @@ def test_load_timetz(conn, val, timezone, expr):
     assert cur.fetchone()[0] == as_time(val)
 
 
-@pytest.mark.xfail  # TODO: binary load
-@pytest.mark.parametrize("val, expr, timezone", [("0,0~2", "00:00", "-02:00")])
+@pytest.mark.parametrize(
+    "val, expr, timezone",
+    [
+        ("0,0~-12", "00:00", "12:00"),
+        ("0,0~12", "00:00", "-12:00"),
+        ("3,4,5,6~7:8", "03:04:05.000006", "-07:08"),
+        ("3,0,0,456789~-2", "03:00:00.456789", "+02:00"),
+    ],
+)
 def test_load_timetz_binary(conn, val, expr, timezone):
     cur = conn.cursor(binary=Format.BINARY)
     cur.execute(f"set timezone to '{timezone}'")
-    cur.execute(f"select '{expr}'::time")
+    cur.execute(f"select '{expr}'::timetz")
     assert cur.fetchone()[0] == as_time(val)
 
 
-def test_load_timetz_24(conn):
-    cur = conn.cursor()
+@pytest.mark.parametrize("fmt_out", [Format.TEXT, Format.BINARY])
+def test_load_timetz_24(conn, fmt_out):
+    cur = conn.cursor(binary=fmt_out == Format.BINARY)
     cur.execute("select '24:00'::timetz")
     with pytest.raises(DataError):
         cur.fetchone()[0]
@@ -428,8 +545,6 @@ def test_load_timetz_24(conn):
 )
 @pytest.mark.parametrize("fmt_in", [Format.AUTO, Format.TEXT, Format.BINARY])
 def test_dump_time_tz_or_not_tz(conn, val, type, fmt_in):
-    if fmt_in == Format.BINARY:
-        pytest.xfail("binary time not implemented")
     val = as_time(val)
     cur = conn.cursor()
     cur.execute(
@@ -470,8 +585,18 @@ def test_dump_interval(conn, val, expr, intervalstyle):
     assert cur.fetchone()[0] is True
 
 
-@pytest.mark.xfail  # TODO: binary dump
-@pytest.mark.parametrize("val, expr", [("1s", "1s")])
+@pytest.mark.parametrize(
+    "val, expr",
+    [
+        ("min", "-999999999 days"),
+        ("1d", "1 day"),
+        ("-1d", "-1 day"),
+        ("1s", "1 s"),
+        ("-1s", "-1 s"),
+        ("-1m", "-0.000001 s"),
+        ("max", "999999999 days 23:59:59.999999"),
+    ],
+)
 def test_dump_interval_binary(conn, val, expr):
     cur = conn.cursor()
     cur.execute(f"select '{expr}'::interval = %b", (as_td(val),))
@@ -503,6 +628,9 @@ def test_dump_interval_binary(conn, val, expr):
         ("-30d", "-1 month"),
         ("60d", "2 month"),
         ("-90d", "-3 month"),
+        ("41666d,57600s", "1000000 hours"),
+        ("-1d,1s", "-1 day +1 sec"),
+        ("1d,-1s", "1 day -1 sec"),
     ],
 )
 def test_load_interval(conn, val, expr):
@@ -511,6 +639,28 @@ def test_load_interval(conn, val, expr):
     assert cur.fetchone()[0] == as_td(val)
 
 
+@pytest.mark.parametrize(
+    "val, expr",
+    [
+        ("1s", "1 sec"),
+        ("-1s", "-1 sec"),
+        ("1s,1m", "1.000001 sec"),
+        ("-86399s,-999999m", "-23:59:59.999999"),
+        ("41666d,57600s", "1000000 hours"),
+        ("-1d,1s", "-1 day +1 sec"),
+        ("365d", "1 year"),
+        ("-730d", "-2 years"),
+        ("425d", "1 year 2 month"),
+        ("-425d", "-1 year -2 month"),
+        ("-90d", "-3 month"),
+    ],
+)
+def test_load_interval_binary(conn, val, expr):
+    cur = conn.cursor(binary=True)
+    cur.execute(f"select '{expr}'::interval")
+    assert cur.fetchone()[0] == as_td(val)
+
+
 @pytest.mark.xfail  # weird interval outputs
 @pytest.mark.parametrize("val, expr", [("1d,1s", "1 day 1 sec")])
 @pytest.mark.parametrize(
@@ -525,8 +675,9 @@ def test_load_interval_intervalstyle(conn, val, expr, intervalstyle):
 
 
 @pytest.mark.parametrize("val", ["min", "max"])
-def test_load_interval_overflow(conn, val):
-    cur = conn.cursor()
+@pytest.mark.parametrize("fmt_out", [Format.TEXT, Format.BINARY])
+def test_load_interval_overflow(conn, val, fmt_out):
+    cur = conn.cursor(binary=fmt_out == Format.BINARY)
     cur.execute(
         "select %s + %s * '1s'::interval",
         (as_td(val), -1 if val == "min" else 1),
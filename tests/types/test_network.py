@@ -6,13 +6,14 @@ import pytest
 
 from psycopg3 import pq
 from psycopg3 import sql
-from psycopg3.adapt import Format
+from psycopg3.oids import postgres_types as builtins
+from psycopg3.adapt import Format, Transformer
+from psycopg3.types import InetPackedBinaryLoader
 
 
 @pytest.mark.parametrize("fmt_in", [Format.AUTO, Format.TEXT, Format.BINARY])
 @pytest.mark.parametrize("val", ["192.168.0.1", "2001:db8::"])
 def test_address_dump(conn, fmt_in, val):
-    binary_check(fmt_in)
     cur = conn.cursor()
     cur.execute(
         f"select %{fmt_in} = %s::inet", (ipaddress.ip_address(val), val)
@@ -28,7 +29,6 @@ def test_address_dump(conn, fmt_in, val):
 @pytest.mark.parametrize("fmt_in", [Format.AUTO, Format.TEXT, Format.BINARY])
 @pytest.mark.parametrize("val", ["127.0.0.1/24", "::ffff:102:300/128"])
 def test_interface_dump(conn, fmt_in, val):
-    binary_check(fmt_in)
     cur = conn.cursor()
     cur.execute(
         f"select %{fmt_in} = %s::inet", (ipaddress.ip_interface(val), val)
@@ -44,7 +44,6 @@ def test_interface_dump(conn, fmt_in, val):
 @pytest.mark.parametrize("fmt_in", [Format.AUTO, Format.TEXT, Format.BINARY])
 @pytest.mark.parametrize("val", ["127.0.0.0/24", "::ffff:102:300/128"])
 def test_network_dump(conn, fmt_in, val):
-    binary_check(fmt_in)
     cur = conn.cursor()
     cur.execute(
         f"select %{fmt_in} = %s::cidr", (ipaddress.ip_network(val), val)
@@ -60,7 +59,6 @@ def test_network_dump(conn, fmt_in, val):
 @pytest.mark.parametrize("fmt_out", [pq.Format.TEXT, pq.Format.BINARY])
 @pytest.mark.parametrize("val", ["127.0.0.1/32", "::ffff:102:300/128"])
 def test_inet_load_address(conn, fmt_out, val):
-    binary_check(fmt_out)
     addr = ipaddress.ip_address(val.split("/", 1)[0])
     cur = conn.cursor(binary=fmt_out)
 
@@ -83,7 +81,6 @@ def test_inet_load_address(conn, fmt_out, val):
 @pytest.mark.parametrize("fmt_out", [pq.Format.TEXT, pq.Format.BINARY])
 @pytest.mark.parametrize("val", ["127.0.0.1/24", "::ffff:102:300/127"])
 def test_inet_load_network(conn, fmt_out, val):
-    binary_check(fmt_out)
     pyval = ipaddress.ip_interface(val)
     cur = conn.cursor(binary=fmt_out)
 
@@ -106,7 +103,6 @@ def test_inet_load_network(conn, fmt_out, val):
 @pytest.mark.parametrize("fmt_out", [pq.Format.TEXT, pq.Format.BINARY])
 @pytest.mark.parametrize("val", ["127.0.0.0/24", "::ffff:102:300/128"])
 def test_cidr_load(conn, fmt_out, val):
-    binary_check(fmt_out)
     pyval = ipaddress.ip_network(val)
     cur = conn.cursor(binary=fmt_out)
 
@@ -126,9 +122,44 @@ def test_cidr_load(conn, fmt_out, val):
     assert got == pyval
 
 
-def binary_check(fmt):
-    if fmt == Format.BINARY or fmt == pq.Format.BINARY:
-        pytest.xfail("inet binary not implemented")
+@pytest.mark.parametrize(
+    "val",
+    [
+        "192.168.0.1",
+        "127.0.0.1/24",
+        "2001:db8::",
+        "::ffff:102:300/127",
+    ],
+)
+def test_inet_roundtrip_binary_no_db(val):
+    if "/" in val:
+        obj = ipaddress.ip_interface(val)
+    else:
+        obj = ipaddress.ip_address(val)
+    tx = Transformer()
+    data = tx.get_dumper(obj, Format.BINARY).dump(obj)
+    loader = tx.get_loader(builtins["inet"].oid, pq.Format.BINARY)
+    got = loader.load(data)
+    assert type(got) is type(obj)
+    assert got == obj
+
+
+@pytest.mark.parametrize("val", ["127.0.0.0/24", "2001:db8::/32"])
+def test_cidr_roundtrip_binary_no_db(val):
+    obj = ipaddress.ip_network(val)
+    tx = Transformer()
+    data = tx.get_dumper(obj, Format.BINARY).dump(obj)
+    loader = tx.get_loader(builtins["cidr"].oid, pq.Format.BINARY)
+    assert loader.load(data) == obj
+
+
+@pytest.mark.parametrize("val", ["127.0.0.1/24", "::ffff:102:300/128"])
+def test_inet_load_packed(conn, val):
+    iface = ipaddress.ip_interface(val)
+    cur = conn.cursor(binary=True)
+    InetPackedBinaryLoader.register("inet", cur)
+    cur.execute("select %s::inet", (val,))
+    assert cur.fetchone()[0] == (iface.packed, iface.network.prefixlen)
 
 
 @pytest.mark.subprocess
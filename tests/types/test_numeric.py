@@ -58,8 +58,6 @@ def test_dump_int(conn, val, expr, fmt_in):
 )
 @pytest.mark.parametrize("fmt_in", [Format.AUTO, Format.TEXT, Format.BINARY])
 def test_dump_int_subtypes(conn, val, expr, fmt_in):
-    if fmt_in in (Format.AUTO, Format.BINARY) and "numeric" in expr:
-        pytest.xfail("binary numeric not implemented")
     cur = conn.cursor()
     cur.execute(f"select pg_typeof({expr}) = pg_typeof(%{fmt_in})", (val,))
     assert cur.fetchone()[0] is True
@@ -288,13 +286,20 @@ def test_load_float_approx(conn, expr, pgtype, want, fmt_out):
         "0.0",
         "0.000000000000000000001",
         "-0.000000000000000000001",
+        "1.2300",
+        "-123456789.000001",
+        "10000",
+        "1E+100",
+        "1E-100",
         "nan",
     ],
 )
-def test_roundtrip_numeric(conn, val):
-    cur = conn.cursor()
+@pytest.mark.parametrize("fmt_in", [Format.AUTO, Format.TEXT, Format.BINARY])
+@pytest.mark.parametrize("fmt_out", [pq.Format.TEXT, pq.Format.BINARY])
+def test_roundtrip_numeric(conn, val, fmt_in, fmt_out):
+    cur = conn.cursor(binary=fmt_out)
     val = Decimal(val)
-    cur.execute("select %s", (val,))
+    cur.execute(f"select %{fmt_in}", (val,))
     result = cur.fetchone()[0]
     assert isinstance(result, Decimal)
     if val.is_nan():
@@ -328,20 +333,56 @@ def test_quote_numeric(conn, val, expr):
         assert r == (val, -val)
 
 
-@pytest.mark.xfail
-def test_dump_numeric_binary():
-    # TODO: numeric binary adaptation
+@pytest.mark.parametrize(
+    "val, want",
+    [
+        ("0", "0000 0000 0000 0000"),
+        ("0.00", "0000 0000 0000 0002"),
+        ("1", "0001 0000 0000 0000 0001"),
+        ("-1", "0001 0000 4000 0000 0001"),
+        ("10000", "0001 0001 0000 0000 0001"),
+        ("12345.6789", "0003 0001 0000 0004 0001 0929 1a85"),
+        ("1.2300", "0002 0000 0000 0004 0001 08fc"),
+        ("0.001", "0001 ffff 0000 0003 000a"),
+        ("1E+5", "0001 0001 0000 0000 000a"),
+        ("nan", "0000 0000 c000 0000"),
+        ("inf", "0000 0000 d000 0000"),
+        ("-inf", "0000 0000 f000 0000"),
+    ],
+)
+def test_dump_numeric_binary(val, want):
     tx = Transformer()
-    n = Decimal(1)
-    tx.get_dumper(n, Format.BINARY).dump(n)
+    n = Decimal(val)
+    dumper = tx.get_dumper(n, Format.BINARY)
+    assert dumper.dump(n) == bytes.fromhex(want.replace(" ", ""))
 
 
-@pytest.mark.xfail
-def test_load_numeric_binary(conn):
-    # TODO: numeric binary casting
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "0",
+        "0.00",
+        "1",
+        "-1",
+        "10000",
+        "12345.6789",
+        "1.2300",
+        "0.001",
+        "-123456789.000001",
+        "1e100",
+        "1e-100",
+        "NaN",
+    ],
+)
+def test_load_numeric_binary(conn, expr):
     cur = conn.cursor(binary=1)
-    res = cur.execute("select 1::numeric").fetchone()[0]
-    assert res == Decimal(1)
+    res = cur.execute(f"select '{expr}'::numeric").fetchone()[0]
+    val = Decimal(expr)
+    if val.is_nan():
+        assert res.is_nan()
+    else:
+        assert res == val
+        assert res.as_tuple().exponent == min(val.as_tuple().exponent, 0)
 
 
 @pytest.mark.parametrize(
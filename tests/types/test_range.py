@@ -4,7 +4,10 @@ from decimal import Decimal
 
 import pytest
 
+from psycopg3 import pq
 from psycopg3.sql import Identifier
+from psycopg3.oids import postgres_types as builtins
+from psycopg3.adapt import Format, Transformer
 from psycopg3.types import Range, RangeInfo
 
 
@@ -42,14 +45,19 @@ samples = [
     ),
 ]
 
+range_names = """
+    int4range int8range numrange daterange tsrange tstzrange
+    """.split()
 
-@pytest.mark.parametrize(
-    "pgtype",
-    "int4range int8range numrange daterange tsrange tstzrange".split(),
-)
-def test_dump_builtin_empty(conn, pgtype):
+fmts_in = [Format.AUTO, Format.TEXT, Format.BINARY]
+fmts_out = [pq.Format.TEXT, pq.Format.BINARY]
+
+
+@pytest.mark.parametrize("pgtype", range_names)
+@pytest.mark.parametrize("fmt_in", fmts_in)
+def test_dump_builtin_empty(conn, pgtype, fmt_in):
     r = Range(empty=True)
-    cur = conn.execute(f"select 'empty'::{pgtype} = %s", (r,))
+    cur = conn.execute(f"select 'empty'::{pgtype} = %{fmt_in}", (r,))
     assert cur.fetchone()[0] is True
 
 
@@ -68,36 +76,35 @@ def test_dump_builtin_array(conn, pgtype):
 
 
 @pytest.mark.parametrize("pgtype, min, max, bounds", samples)
-def test_dump_builtin_range(conn, pgtype, min, max, bounds):
+@pytest.mark.parametrize("fmt_in", fmts_in)
+def test_dump_builtin_range(conn, pgtype, min, max, bounds, fmt_in):
     r = Range(min, max, bounds)
     sub = type2sub[pgtype]
     cur = conn.execute(
-        f"select {pgtype}(%s::{sub}, %s::{sub}, %s) = %s::{pgtype}",
+        f"select {pgtype}(%s::{sub}, %s::{sub}, %s) = %{fmt_in}::{pgtype}",
         (min, max, bounds, r),
     )
     assert cur.fetchone()[0] is True
 
 
-@pytest.mark.parametrize(
-    "pgtype",
-    "int4range int8range numrange daterange tsrange tstzrange".split(),
-)
-def test_load_builtin_empty(conn, pgtype):
+@pytest.mark.parametrize("pgtype", range_names)
+@pytest.mark.parametrize("fmt_out", fmts_out)
+def test_load_builtin_empty(conn, pgtype, fmt_out):
     r = Range(empty=True)
-    (got,) = conn.execute(f"select 'empty'::{pgtype}").fetchone()
+    cur = conn.cursor(binary=fmt_out)
+    (got,) = cur.execute(f"select 'empty'::{pgtype}").fetchone()
     assert type(got) is Range
     assert got == r
     assert not got
     assert got.isempty
 
 
-@pytest.mark.parametrize(
-    "pgtype",
-    "int4range int8range numrange daterange tsrange tstzrange".split(),
-)
-def test_load_builtin_inf(conn, pgtype):
+@pytest.mark.parametrize("pgtype", range_names)
+@pytest.mark.parametrize("fmt_out", fmts_out)
+def test_load_builtin_inf(conn, pgtype, fmt_out):
     r = Range(bounds="()")
-    (got,) = conn.execute(f"select '(,)'::{pgtype}").fetchone()
+    cur = conn.cursor(binary=fmt_out)
+    (got,) = cur.execute(f"select '(,)'::{pgtype}").fetchone()
     assert type(got) is Range
     assert got == r
     assert got
@@ -106,24 +113,25 @@ def test_load_builtin_inf(conn, pgtype):
     assert got.upper_inf
 
 
-@pytest.mark.parametrize(
-    "pgtype",
-    "int4range int8range numrange daterange tsrange tstzrange".split(),
-)
-def test_load_builtin_array(conn, pgtype):
+@pytest.mark.parametrize("pgtype", range_names)
+@pytest.mark.parametrize("fmt_out", fmts_out)
+def test_load_builtin_array(conn, pgtype, fmt_out):
     r1 = Range(empty=True)
     r2 = Range(bounds="()")
-    (got,) = conn.execute(
+    cur = conn.cursor(binary=fmt_out)
+    (got,) = cur.execute(
         f"select array['empty'::{pgtype}, '(,)'::{pgtype}]"
     ).fetchone()
     assert got == [r1, r2]
 
 
 @pytest.mark.parametrize("pgtype, min, max, bounds", samples)
-def test_load_builtin_range(conn, pgtype, min, max, bounds):
+@pytest.mark.parametrize("fmt_out", fmts_out)
+def test_load_builtin_range(conn, pgtype, min, max, bounds, fmt_out):
     r = Range(min, max, bounds)
     sub = type2sub[pgtype]
-    cur = conn.execute(
+    cur = conn.cursor(binary=fmt_out)
+    cur.execute(
         f"select {pgtype}(%s::{sub}, %s::{sub}, %s)", (min, max, bounds)
     )
     # normalise discrete ranges
@@ -133,6 +141,38 @@ def test_load_builtin_range(conn, pgtype, min, max, bounds):
     assert cur.fetchone()[0] == r
 
 
+@pytest.mark.parametrize("pgtype, min, max, bounds", samples)
+@pytest.mark.parametrize("fmt_in", [Format.TEXT, Format.BINARY])
+def test_roundtrip_builtin_range_no_db(pgtype, min, max, bounds, fmt_in):
+    r = Range(min, max, bounds)
+    tx = Transformer()
+    dumper = tx.get_dumper(r, fmt_in)
+    data = dumper.dump(r)
+    oid = builtins[pgtype].oid
+    assert dumper.oid in (oid, 0)
+    assert tx.get_loader(oid, dumper.format).load(data) == r
+
+
+@pytest.mark.parametrize(
+    "data, r",
+    [
+        (b"\x01", Range(empty=True)),
+        (b"\x18", Range(bounds="()")),
+        (b"\x12\0\0\0\4\0\0\0\0", Range(dt.date(2000, 1, 1), None, "[)")),
+        (
+            b"\x04\0\0\0\4\0\0\0\1\0\0\0\4\0\0\0\2",
+            Range(dt.date(2000, 1, 2), dt.date(2000, 1, 3), "(]"),
+        ),
+    ],
+)
+def test_load_binary_no_db(data, r):
+    tx = Transformer()
+    loader = tx.get_loader(builtins["daterange"].oid, pq.Format.BINARY)
+    assert loader.load(data) == r
+    if r.lower is not None:
+        assert tx.get_dumper(r, Format.BINARY).dump(r) == data
+
+
 @pytest.fixture(scope="session")
 def testrange(svcconn):
     svcconn.execute(
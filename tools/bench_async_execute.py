@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+Measure the per-query overhead of `AsyncCursor.execute()`.
+
+Execute a trivial query many times and report the average time per query.
+Connect using the PG* env vars or the dsn passed on the command line.
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import logging
+
+import psycopg3
+
+logger = logging.getLogger()
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s"
+)
+
+
+def main() -> None:
+    opt = parse_cmdline()
+    if opt.uvloop:
+        import uvloop
+
+        uvloop.install()
+
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(run(opt))
+
+
+async def run(opt: argparse.Namespace) -> None:
+    conn = await psycopg3.AsyncConnection.connect(opt.dsn)
+    try:
+        cur = conn.cursor()
+        for i in range(opt.warmup):
+            await cur.execute(opt.query)
+            await cur.fetchall()
+
+        t0 = time.perf_counter()
+        for i in range(opt.queries):
+            await cur.execute(opt.query)
+            await cur.fetchall()
+        t1 = time.perf_counter()
+    finally:
+        await conn.close()
+
+    elapsed = t1 - t0
+    logger.info(
+        "loop: %s, queries: %d, total: %.3f s, per query: %.1f us",
+        type(asyncio.get_event_loop()).__module__,
+        opt.queries,
+        elapsed,
+        elapsed / opt.queries * 1e6,
+    )
+
+
+def parse_cmdline() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "dsn",
+        nargs="?",
+        default="",
+        help="connection string [default: %(default)r]",
+    )
+    parser.add_argument(
+        "-n",
+        "--queries",
+        type=int,
+        default=10000,
+        help="number of queries to time [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=100,
+        help="number of queries to run before timing [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--query",
+        default="select 1",
+        help="the query to execute [default: %(default)r]",
+    )
+    parser.add_argument(
+        "--uvloop", action="store_true", help="run the test using uvloop"
+    )
+    opt = parser.parse_args()
+    if opt.queries <= 0:
+        parser.error("the number of queries must be positive")
+    return opt
+
+
+if __name__ == "__main__":
+    sys.exit(main())